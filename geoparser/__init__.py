@@ -1,3 +1,18 @@
-from geoparser.gazetteer import Gazetteer
-from geoparser.geoparser import Geoparser
-from geoparser.project import Project
+# Use a lazy-loading approach, so that importing the package (e.g. for the
+# CLI or a worker process) does not pull in the database and model libraries
+from importlib import import_module
+
+# Define a mapping of public classes to their import paths
+_CLASS_PATHS = {
+    "Gazetteer": "geoparser.gazetteer",
+    "Geoparser": "geoparser.geoparser",
+    "Project": "geoparser.project",
+}
+
+
+def __getattr__(name):
+    """Lazy-load classes only when they are accessed."""
+    if name in _CLASS_PATHS:
+        module = import_module(_CLASS_PATHS[name])
+        return getattr(module, name)
+    raise AttributeError(f"module 'geoparser' has no attribute '{name}'")
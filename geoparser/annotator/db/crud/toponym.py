@@ -1,7 +1,6 @@
 import typing as t
 import uuid
 
-from pyproj import Transformer
 from sqlmodel import Session as DBSession
 from sqlmodel import select
 
@@ -48,12 +47,6 @@ class ToponymRepository(BaseRepository):
         },
     }
 
-    # Coordinate reference systems for each gazetteer
-    GAZETTEER_CRS = {
-        "geonames": "EPSG:4326",  # WGS84
-        "swissnames3d": "EPSG:2056",  # LV95 Swiss coordinate system
-    }
-
     # Filter attributes for each gazetteer
     GAZETTEER_FILTER_ATTRIBUTES = {
         "geonames": [
@@ -162,44 +155,6 @@ class ToponymRepository(BaseRepository):
                 toponyms.append(new_toponym)
         return sorted(toponyms, key=lambda x: x.start)
 
-    @classmethod
-    def _get_wgs84_coordinates(
-        cls, feature: "Feature", gazetteer_name: str
-    ) -> tuple[float, float]:
-        """
-        Extract WGS84 (lat, lon) coordinates from a feature's geometry.
-
-        Handles coordinate transformation if needed (e.g., Swiss coordinates to WGS84).
-
-        Args:
-            feature: Feature object with geometry
-            gazetteer_name: Name of the gazetteer to determine source CRS
-
-        Returns:
-            Tuple of (latitude, longitude) in WGS84, or (None, None) if unavailable
-        """
-        if not feature.geometry:
-            return None, None
-
-        try:
-            # Get the centroid for point representation
-            centroid = feature.geometry.centroid
-
-            # Get source CRS for this gazetteer
-            source_crs = cls.GAZETTEER_CRS.get(gazetteer_name, "EPSG:4326")
-
-            # If already in WGS84, return as-is
-            if source_crs == "EPSG:4326":
-                return centroid.y, centroid.x  # lat, lon
-
-            # Otherwise, transform to WGS84
-            transformer = Transformer.from_crs(source_crs, "EPSG:4326", always_xy=True)
-            lon, lat = transformer.transform(centroid.x, centroid.y)
-            return lat, lon
-
-        except Exception:
-            return None, None
-
     @classmethod
     def get_candidate_descriptions(
         cls,
@@ -223,16 +178,13 @@ class ToponymRepository(BaseRepository):
             # Generate description using lightweight method
             description = cls._generate_location_description(candidate, gazetteer_name)
 
-            # Get coordinates from geometry (with CRS transformation if needed)
-            lat, lon = cls._get_wgs84_coordinates(candidate, gazetteer_name)
-
             candidate_descriptions.append(
                 {
                     "loc_id": candidate.location_id_value,
                     "description": description,
                     "attributes": candidate.data,  # Include all attributes for filtering
-                    "latitude": lat,
-                    "longitude": lon,
+                    "latitude": candidate.latitude,
+                    "longitude": candidate.longitude,
                 }
             )
 
@@ -251,15 +203,12 @@ class ToponymRepository(BaseRepository):
                     existing_feature, gazetteer_name
                 )
 
-                # Get coordinates from geometry (with CRS transformation if needed)
-                lat, lon = cls._get_wgs84_coordinates(existing_feature, gazetteer_name)
-
                 existing_annotation = {
                     "loc_id": existing_loc_id,
                     "description": existing_description,
                     "attributes": existing_feature.data,
-                    "latitude": lat,
-                    "longitude": lon,
+                    "latitude": existing_feature.latitude,
+                    "longitude": existing_feature.longitude,
                 }
                 candidate_descriptions.append(existing_annotation)
 
@@ -1,6 +1,5 @@
-from geoparser.annotator.app import run
-
-
 def annotator_cli():
     """Launch the Irchel Geoparser Annotator web application."""
+    from geoparser.annotator.app import run
+
     run()
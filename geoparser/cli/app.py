@@ -2,9 +2,15 @@ import typer
 
 from geoparser.cli.annotator import annotator_cli
 from geoparser.cli.download import download_cli
+from geoparser.cli.embedding import embedding_server_cli
+from geoparser.cli.ingest import ingest_cli
 from geoparser.cli.install import install_cli
+from geoparser.cli.serve import serve_cli
 
 app = typer.Typer()
 app.command("annotator")(annotator_cli)
 app.command("install")(install_cli)
+app.command("ingest")(ingest_cli)
+app.command("serve")(serve_cli)
+app.command("embedding-server")(embedding_server_cli)
 app.command("download", deprecated=True)(download_cli)
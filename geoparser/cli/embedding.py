@@ -0,0 +1,29 @@
+import typer
+
+from geoparser.embedding.protocol import DEFAULT_CACHE_SIZE, DEFAULT_SOCKET_PATH
+
+
+def embedding_server_cli(
+    model_name: str = typer.Option(
+        "dguzh/geo-all-MiniLM-L6-v2", help="SentenceTransformer model to serve."
+    ),
+    socket_path: str = typer.Option(
+        DEFAULT_SOCKET_PATH, "--socket", help="Unix socket to listen on."
+    ),
+    cache_size: int = typer.Option(
+        DEFAULT_CACHE_SIZE, help="Maximum number of embeddings kept in the cache."
+    ),
+):
+    """
+    Run an embedding server shared by the resolvers of several processes.
+
+    Resolvers connect to the server when the GEOPARSER_EMBEDDING_SERVER
+    environment variable is set to its socket.
+    """
+    from geoparser.embedding.server import EmbeddingServer
+
+    server = EmbeddingServer(
+        model_name=model_name, socket_path=socket_path, cache_size=cache_size
+    )
+    typer.echo(f"Serving '{model_name}' embeddings on '{socket_path}'")
+    server.serve_forever()
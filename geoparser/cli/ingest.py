@@ -0,0 +1,32 @@
+import typer
+
+
+def ingest_cli(
+    project: str,
+    path: str,
+    batch_size: int = typer.Option(
+        1000, help="Number of documents inserted per transaction."
+    ),
+    text_field: str = typer.Option(
+        "text", help="JSON field or column holding the document text."
+    ),
+    deduplicate: bool = typer.Option(
+        False, help="Skip documents with content already in the project."
+    ),
+):
+    """
+    Load documents into a project from a file or directory.
+
+    Args:
+        project: Name of the project (created if it doesn't exist).
+        path: Path to a JSONL, CSV or Parquet file, or a directory of .txt files.
+    """
+    from geoparser.project import Project
+
+    count = Project(project).ingest_documents(
+        path,
+        batch_size=batch_size,
+        text_field=text_field,
+        deduplicate=deduplicate,
+    )
+    typer.echo(f"Ingested {count} documents into project '{project}'")
@@ -1,7 +1,7 @@
 from importlib.resources import files
 from pathlib import Path
 
-from geoparser.gazetteer.installer.installer import GazetteerInstaller
+import typer
 
 
 def _get_builtin_gazetteers() -> dict[str, Path]:
@@ -23,13 +23,22 @@ def _get_builtin_gazetteers() -> dict[str, Path]:
     return gazetteers
 
 
-def install_cli(config: str):
+def install_cli(
+    config: str,
+    coordinates_only: bool = typer.Option(
+        False,
+        help="Only compute the feature coordinates of an installed gazetteer.",
+    ),
+):
     """
     Install a gazetteer from a configuration file.
 
     Args:
         config: Either a gazetteer name (e.g., 'geonames', 'swissnames3d') or
                 a path to a custom YAML configuration file.
+        coordinates_only: Whether to only compute the feature coordinates of
+                          an installed gazetteer, e.g. after upgrading a
+                          database created by an earlier version.
     """
     # Check if config is a built-in gazetteer name
     config_path = Path(config)
@@ -49,5 +58,10 @@ def install_cli(config: str):
                 f"Available built-in gazetteer configs:\n{available}"
             )
 
+    from geoparser.gazetteer.installer.installer import GazetteerInstaller
+
     installer = GazetteerInstaller()
-    installer.install(config_path)
+    if coordinates_only:
+        installer.backfill_coordinates(config_path)
+    else:
+        installer.install(config_path)
@@ -0,0 +1,33 @@
+import typer
+
+
+def serve_cli(
+    host: str = typer.Option("127.0.0.1", help="Host to bind the server to."),
+    port: int = typer.Option(8000, help="Port to run the server on."),
+    workers: int = typer.Option(
+        1, help="Number of worker processes sharing the loaded models."
+    ),
+    max_batch_size: int = typer.Option(
+        32, help="Maximum number of distinct texts parsed in one batch."
+    ),
+    max_wait_ms: float = typer.Option(
+        10.0, help="Maximum time in milliseconds a text waits for its batch to fill."
+    ),
+):
+    """
+    Run a geoparsing web service with a /parse endpoint.
+
+    The default recognizer and resolver are loaded before the server starts.
+    """
+    from geoparser.geoparser import Geoparser
+    from geoparser.server import serve
+
+    geoparser = Geoparser()
+    serve(
+        geoparser,
+        host=host,
+        port=port,
+        workers=workers,
+        max_batch_size=max_batch_size,
+        max_wait=max_wait_ms / 1000,
+    )
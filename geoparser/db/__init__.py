@@ -0,0 +1,17 @@
+# Use a lazy-loading approach, like the top-level package, so that importing
+# a submodule of geoparser.db does not load the whole database layer
+from importlib import import_module
+
+# Define a mapping of public names to their import paths
+_CLASS_PATHS = {
+    "QueryProfile": "geoparser.db.profiling",
+    "profile": "geoparser.db.db",
+}
+
+
+def __getattr__(name):
+    """Lazy-load classes and functions only when they are accessed."""
+    if name in _CLASS_PATHS:
+        module = import_module(_CLASS_PATHS[name])
+        return getattr(module, name)
+    raise AttributeError(f"module 'geoparser.db' has no attribute '{name}'")
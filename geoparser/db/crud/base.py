@@ -2,10 +2,15 @@ import typing as t
 import uuid
 from typing import Generic, Type, TypeVar, Union
 
+from sqlalchemy import insert
 from sqlmodel import Session, SQLModel, select
 
 T = TypeVar("T", bound=SQLModel)
 
+# Maximum number of values bound in a single IN clause. Larger collections are
+# queried in chunks to stay well below SQLite's limit on bound parameters.
+IN_CLAUSE_CHUNKSIZE = 10000
+
 
 class BaseRepository(Generic[T]):
     """
@@ -35,6 +40,42 @@ class BaseRepository(Generic[T]):
         db.refresh(db_obj)
         return db_obj
 
+    @classmethod
+    def create_many(
+        cls, db: Session, objs_in: t.Sequence[SQLModel], commit: bool = True
+    ) -> None:
+        """
+        Create many records with a single bulk insert.
+
+        Rows are inserted with one executemany statement instead of adding,
+        committing and refreshing each object individually, so the created
+        objects are not returned. Fields with a default factory (such as
+        UUID primary keys) are populated as they would be by create().
+
+        Args:
+            db: Database session
+            objs_in: Objects to create (typically Create models)
+            commit: Whether to commit the transaction after inserting, so that
+                several bulk inserts can be committed together
+        """
+        if objs_in:
+            default_factories = {
+                name: field.default_factory
+                for name, field in cls.model.model_fields.items()
+                if field.default_factory is not None
+            }
+            rows = [
+                {
+                    **{name: factory() for name, factory in default_factories.items()},
+                    **obj_in.model_dump(),
+                }
+                for obj_in in objs_in
+            ]
+            db.execute(insert(cls.model), rows)
+
+        if commit:
+            db.commit()
+
     @classmethod
     def get(cls, db: Session, id: Union[uuid.UUID, str]) -> t.Optional[T]:
         """
@@ -3,7 +3,7 @@ import uuid
 
 from sqlmodel import Session, select
 
-from geoparser.db.crud.base import BaseRepository
+from geoparser.db.crud.base import IN_CLAUSE_CHUNKSIZE, BaseRepository
 from geoparser.db.models import Document
 
 
@@ -28,3 +28,84 @@ class DocumentRepository(BaseRepository[Document]):
         """
         statement = select(Document).where(Document.project_id == project_id)
         return db.exec(statement).unique().all()
+
+    @classmethod
+    def get_by_ids(
+        cls, db: Session, document_ids: t.Sequence[uuid.UUID]
+    ) -> t.List[Document]:
+        """
+        Get documents by their IDs, ordered by ID.
+
+        Args:
+            db: Database session
+            document_ids: IDs of the documents
+
+        Returns:
+            List of documents found
+        """
+        documents = []
+        for i in range(0, len(document_ids), IN_CLAUSE_CHUNKSIZE):
+            statement = select(Document).where(
+                Document.id.in_(document_ids[i : i + IN_CLAUSE_CHUNKSIZE])
+            )
+            documents.extend(db.exec(statement).unique().all())
+        return sorted(documents, key=lambda document: document.id)
+
+    @classmethod
+    def get_page_by_project(
+        cls,
+        db: Session,
+        project_id: uuid.UUID,
+        after_id: t.Optional[uuid.UUID] = None,
+        limit: int = 1000,
+    ) -> t.List[Document]:
+        """
+        Get a page of documents of a project, ordered by ID.
+
+        Pages are addressed by the ID of the last document of the previous
+        page (keyset pagination), so fetching a page costs the same regardless
+        of how far into the project it is.
+
+        Args:
+            db: Database session
+            project_id: Project ID
+            after_id: ID of the last document of the previous page, or None
+                      for the first page
+            limit: Maximum number of documents in the page
+
+        Returns:
+            List of documents
+        """
+        statement = select(Document).where(Document.project_id == project_id)
+        if after_id is not None:
+            statement = statement.where(Document.id > after_id)
+        statement = statement.order_by(Document.id).limit(limit)
+        return db.exec(statement).unique().all()
+
+    @classmethod
+    def get_content_hashes_by_project(
+        cls, db: Session, project_id: uuid.UUID, content_hashes: t.Iterable[str]
+    ) -> t.Set[str]:
+        """
+        Get which of the given content hashes belong to documents of a project.
+
+        Hashes are looked up in chunks using the index on project and content
+        hash, so no document texts are loaded.
+
+        Args:
+            db: Database session
+            project_id: Project ID
+            content_hashes: Content hashes to look up
+
+        Returns:
+            Set of the given hashes that belong to a document of the project
+        """
+        content_hashes = list(content_hashes)
+        found = set()
+        for i in range(0, len(content_hashes), IN_CLAUSE_CHUNKSIZE):
+            statement = select(Document.content_hash).where(
+                Document.project_id == project_id,
+                Document.content_hash.in_(content_hashes[i : i + IN_CLAUSE_CHUNKSIZE]),
+            )
+            found.update(db.exec(statement))
+        return found
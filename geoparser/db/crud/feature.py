@@ -1,9 +1,9 @@
 import typing as t
 
-from sqlalchemy import func, literal_column
+from sqlalchemy import bindparam, func, literal_column, text
 from sqlmodel import Session, select
 
-from geoparser.db.crud.base import BaseRepository
+from geoparser.db.crud.base import IN_CLAUSE_CHUNKSIZE, BaseRepository
 from geoparser.db.models.feature import Feature
 from geoparser.db.models.gazetteer import Gazetteer
 from geoparser.db.models.name import Name, NameFTS, NameSoundex
@@ -84,6 +84,206 @@ class FeatureRepository(BaseRepository[Feature]):
         )
         return db.exec(statement).unique().first()
 
+    @classmethod
+    def get_ids_by_gazetteer_and_identifiers(
+        cls, db: Session, referents: t.Iterable[t.Tuple[str, str]]
+    ) -> t.Dict[t.Tuple[str, str], int]:
+        """
+        Map (gazetteer name, identifier value) pairs to feature IDs.
+
+        Only feature IDs are selected, so no ORM objects or related rows are
+        loaded. Identifiers are looked up with one query per gazetteer (and
+        chunk of identifiers), using the unique index on source and
+        identifier value.
+
+        Args:
+            db: Database session
+            referents: Pairs of gazetteer name and identifier value
+
+        Returns:
+            Dictionary mapping each pair that was found to its feature ID
+        """
+        identifiers_by_gazetteer: t.Dict[str, t.Set[str]] = {}
+        for gazetteer_name, identifier in referents:
+            identifiers_by_gazetteer.setdefault(gazetteer_name, set()).add(identifier)
+
+        feature_ids = {}
+        for gazetteer_name, identifiers in identifiers_by_gazetteer.items():
+            identifiers = list(identifiers)
+            for i in range(0, len(identifiers), IN_CLAUSE_CHUNKSIZE):
+                statement = (
+                    select(Feature.location_id_value, Feature.id)
+                    .join(Source, Feature.source_id == Source.id)
+                    .join(Gazetteer, Source.gazetteer_id == Gazetteer.id)
+                    .where(
+                        Gazetteer.name == gazetteer_name,
+                        Feature.location_id_value.in_(
+                            identifiers[i : i + IN_CLAUSE_CHUNKSIZE]
+                        ),
+                    )
+                    .order_by(Feature.id)
+                )
+                for identifier, feature_id in db.exec(statement).all():
+                    feature_ids.setdefault((gazetteer_name, identifier), feature_id)
+
+        return feature_ids
+
+    @classmethod
+    def get_by_ids(cls, db: Session, ids: t.List[int]) -> t.List[Feature]:
+        """
+        Get all features with the given IDs.
+
+        Args:
+            db: Database session
+            ids: Feature IDs
+
+        Returns:
+            List of features (in no particular order)
+        """
+        ids = list(ids)
+        features = []
+        for i in range(0, len(ids), IN_CLAUSE_CHUNKSIZE):
+            statement = select(Feature).where(
+                Feature.id.in_(ids[i : i + IN_CLAUSE_CHUNKSIZE])
+            )
+            features.extend(db.exec(statement).unique().all())
+        return features
+
+    @classmethod
+    def get_polygons_by_gazetteer(
+        cls, db: Session, gazetteer_name: str
+    ) -> t.List[t.Tuple[int, str]]:
+        """
+        Get the polygonal geometries of all features in a gazetteer.
+
+        Geometries are read as WKT from each registered source table or view.
+        Sources without a geometry column are skipped, as are features whose
+        geometry is not a (multi)polygon, since only areas can contain points.
+
+        Args:
+            db: Database session
+            gazetteer_name: Name of the gazetteer
+
+        Returns:
+            List of (feature_id, geometry_wkt) tuples
+        """
+        statement = (
+            select(Source)
+            .join(Gazetteer, Source.gazetteer_id == Gazetteer.id)
+            .where(Gazetteer.name == gazetteer_name)
+        )
+        sources = db.exec(statement).unique().all()
+
+        polygons = []
+        for source in sources:
+            if not cls._has_geometry_column(db, source.name):
+                continue
+            query = text(
+                f"SELECT feature.id, {source.name}.geometry "
+                f"FROM {source.name} "
+                f"JOIN feature ON feature.source_id = :source_id "
+                f"AND feature.location_id_value = "
+                f"CAST({source.name}.{source.location_id_name} AS TEXT) "
+                f"WHERE {source.name}.geometry LIKE 'POLYGON%' "
+                f"OR {source.name}.geometry LIKE 'MULTIPOLYGON%'"
+            )
+            rows = db.execute(query, {"source_id": source.id}).fetchall()
+            polygons.extend((row[0], row[1]) for row in rows)
+
+        return polygons
+
+    @classmethod
+    def get_coordinates_by_ids(
+        cls, db: Session, ids: t.List[int], native: bool = False
+    ) -> t.List[t.Tuple[int, t.Optional[float], t.Optional[float]]]:
+        """
+        Get the stored representative point coordinates of features.
+
+        Args:
+            db: Database session
+            ids: Feature IDs
+            native: Whether to return coordinates in the native reference
+                system of the gazetteer instead of WGS84 longitude/latitude
+
+        Returns:
+            List of (feature_id, x, y) tuples (in no particular order)
+        """
+        x_column, y_column = (
+            (Feature.x, Feature.y) if native else (Feature.longitude, Feature.latitude)
+        )
+        ids = list(ids)
+        coordinates = []
+        for i in range(0, len(ids), IN_CLAUSE_CHUNKSIZE):
+            statement = select(Feature.id, x_column, y_column).where(
+                Feature.id.in_(ids[i : i + IN_CLAUSE_CHUNKSIZE])
+            )
+            coordinates.extend(tuple(row) for row in db.exec(statement).all())
+        return coordinates
+
+    @classmethod
+    def get_geometries_by_ids(cls, db: Session, ids: t.List[int]) -> t.Dict[int, str]:
+        """
+        Get the WKT geometries of features.
+
+        Features are grouped by source so that each source table or view is
+        queried once per chunk of IDs. Identifiers are compared as text, as
+        during registration, so integer identifier columns match as well.
+
+        Args:
+            db: Database session
+            ids: Feature IDs
+
+        Returns:
+            Dictionary mapping feature IDs to WKT geometries. Features without
+            a geometry are omitted.
+        """
+        ids = list(ids)
+        geometries = {}
+        for i in range(0, len(ids), IN_CLAUSE_CHUNKSIZE):
+            chunk = ids[i : i + IN_CLAUSE_CHUNKSIZE]
+            statement = (
+                select(Source)
+                .join(Feature, Feature.source_id == Source.id)
+                .where(Feature.id.in_(chunk))
+                .distinct()
+            )
+            sources = db.exec(statement).unique().all()
+
+            for source in sources:
+                if not cls._has_geometry_column(db, source.name):
+                    continue
+                query = text(
+                    f"SELECT feature.id, {source.name}.geometry "
+                    f"FROM feature "
+                    f"JOIN {source.name} "
+                    f"ON feature.location_id_value = "
+                    f"CAST({source.name}.{source.location_id_name} AS TEXT) "
+                    f"WHERE feature.source_id = :source_id "
+                    f"AND feature.id IN :ids "
+                    f"AND {source.name}.geometry IS NOT NULL"
+                ).bindparams(bindparam("ids", expanding=True))
+                rows = db.execute(
+                    query, {"source_id": source.id, "ids": chunk}
+                ).fetchall()
+                geometries.update((row[0], row[1]) for row in rows)
+
+        return geometries
+
+    @classmethod
+    def _has_geometry_column(cls, db: Session, source_name: str) -> bool:
+        """
+        Check whether a source table or view has a geometry column.
+
+        Args:
+            db: Database session
+            source_name: Name of the source table or view
+
+        Returns:
+            True if the source has a column named geometry
+        """
+        columns = db.execute(text(f"PRAGMA table_info({source_name})")).fetchall()
+        return any(column[1] == "geometry" for column in columns)
+
     @classmethod
     def get_by_gazetteer_and_name_exact(
         cls, db: Session, gazetteer_name: str, name: str, limit: int = 10000
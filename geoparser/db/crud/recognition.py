@@ -1,10 +1,10 @@
 import typing as t
 import uuid
 
-from sqlalchemy import not_
+from sqlalchemy import exists, not_
 from sqlmodel import Session, select
 
-from geoparser.db.crud.base import BaseRepository
+from geoparser.db.crud.base import IN_CLAUSE_CHUNKSIZE, BaseRepository
 from geoparser.db.models import Document, Recognition
 
 
@@ -101,3 +101,36 @@ class RecognitionRepository(BaseRepository[Recognition]):
             ),
         )
         return db.exec(statement).unique().all()
+
+    @classmethod
+    def get_unprocessed_document_ids(
+        cls, db: Session, document_ids: t.Iterable[uuid.UUID], recognizer_id: str
+    ) -> t.Set[uuid.UUID]:
+        """
+        Get the IDs of the given documents that have not been processed by a recognizer.
+
+        Runs a single anti-join against the recognition table per chunk of
+        documents instead of looking up each document individually.
+
+        Args:
+            db: Database session
+            document_ids: IDs of the documents to check
+            recognizer_id: ID of the recognizer
+
+        Returns:
+            Set of IDs of unprocessed documents
+        """
+        document_ids = list(document_ids)
+        unprocessed_ids = set()
+
+        for i in range(0, len(document_ids), IN_CLAUSE_CHUNKSIZE):
+            statement = select(Document.id).where(
+                Document.id.in_(document_ids[i : i + IN_CLAUSE_CHUNKSIZE]),
+                ~exists().where(
+                    Recognition.document_id == Document.id,
+                    Recognition.recognizer_id == recognizer_id,
+                ),
+            )
+            unprocessed_ids.update(db.exec(statement).all())
+
+        return unprocessed_ids
@@ -44,6 +44,42 @@ class ReferenceRepository(BaseRepository[Reference]):
         # Create the reference with the added text field
         return super().create(db, Reference(**data))
 
+    @classmethod
+    def create_many(
+        cls, db: Session, objs_in: t.Sequence[ReferenceCreate], commit: bool = True
+    ) -> None:
+        """
+        Create many references with a single bulk insert.
+
+        References whose text is already set (e.g., computed from the
+        in-memory document by the caller) are inserted as-is. The text of the
+        remaining references is extracted from their documents, which are
+        loaded with one query rather than once per reference.
+
+        Args:
+            db: Database session
+            objs_in: ReferenceCreate instances with document_id, start and end positions
+            commit: Whether to commit the transaction after inserting
+        """
+        missing_text = {obj_in.document_id for obj_in in objs_in if obj_in.text is None}
+        if missing_text:
+            statement = select(Document.id, Document.text).where(
+                Document.id.in_(missing_text)
+            )
+            document_texts = dict(db.exec(statement).all())
+
+            completed = []
+            for obj_in in objs_in:
+                document_text = document_texts.get(obj_in.document_id)
+                if obj_in.text is None and document_text is not None:
+                    # Extract the text from the document using the span
+                    text = document_text[obj_in.start : obj_in.end]
+                    obj_in = obj_in.model_copy(update={"text": text})
+                completed.append(obj_in)
+            objs_in = completed
+
+        super().create_many(db, objs_in, commit=commit)
+
     @classmethod
     def update(
         cls, db: Session, *, db_obj: Reference, obj_in: ReferenceUpdate
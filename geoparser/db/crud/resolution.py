@@ -1,10 +1,10 @@
 import typing as t
 import uuid
 
-from sqlalchemy import not_
+from sqlalchemy import exists, not_
 from sqlmodel import Session, select
 
-from geoparser.db.crud.base import BaseRepository
+from geoparser.db.crud.base import IN_CLAUSE_CHUNKSIZE, BaseRepository
 from geoparser.db.models import Document, Reference, Resolution
 
 
@@ -102,3 +102,36 @@ class ResolutionRepository(BaseRepository[Resolution]):
             )
         )
         return db.exec(statement).unique().all()
+
+    @classmethod
+    def get_unprocessed_reference_ids(
+        cls, db: Session, reference_ids: t.Iterable[uuid.UUID], resolver_id: str
+    ) -> t.Set[uuid.UUID]:
+        """
+        Get the IDs of the given references that have not been processed by a resolver.
+
+        Runs a single anti-join against the resolution table per chunk of
+        references instead of looking up each reference individually.
+
+        Args:
+            db: Database session
+            reference_ids: IDs of the references to check
+            resolver_id: ID of the resolver
+
+        Returns:
+            Set of IDs of unprocessed references
+        """
+        reference_ids = list(reference_ids)
+        unprocessed_ids = set()
+
+        for i in range(0, len(reference_ids), IN_CLAUSE_CHUNKSIZE):
+            statement = select(Reference.id).where(
+                Reference.id.in_(reference_ids[i : i + IN_CLAUSE_CHUNKSIZE]),
+                ~exists().where(
+                    Resolution.reference_id == Reference.id,
+                    Resolution.resolver_id == resolver_id,
+                ),
+            )
+            unprocessed_ids.update(db.exec(statement).all())
+
+        return unprocessed_ids
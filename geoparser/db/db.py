@@ -1,20 +1,28 @@
 from __future__ import annotations
 
+import logging
 import os
+import re
 import sqlite3
+import threading
+import time
+import warnings
+import weakref
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 from pathlib import Path
-from typing import Iterator
+from typing import Callable, Iterable, Iterator, List, Optional, TypeVar
 
 from appdirs import user_data_dir
 from sqlalchemy import Engine, event, text
 from sqlalchemy.engine import Connection
-from sqlalchemy.pool import NullPool
+from sqlalchemy.pool import NullPool, QueuePool
 from sqlmodel import Session, SQLModel, create_engine
 
-import geoparser.db.models  # noqa: F401
-
 from .functions import levenshtein, soundex
+from .profiling import SLOW_QUERY_MS, QueryProfile, SlowQuery, normalize_statement
+
+logger = logging.getLogger(__name__)
 
 # Database URL configuration (SQLite)
 DATABASE_URL = os.getenv(
@@ -22,15 +30,167 @@ DATABASE_URL = os.getenv(
     f"sqlite:///{Path(user_data_dir('geoparser', '')) / 'geoparser.db'}",
 )
 
-# Ensure parent directory exists
 db_path = DATABASE_URL.replace("sqlite:///", "")
-Path(db_path).parent.mkdir(parents=True, exist_ok=True)
 
-# Whether new connections should be tuned for write throughput. Toggled on only
+# Whether connections should be tuned for write throughput. Toggled on only
 # for the duration of a gazetteer installation via the optimized_writes context
 # manager.
 _optimized_writes_enabled = False
 
+# Upper bound on pooled connections. Reusing connections avoids reopening the
+# database file and re-registering the fuzzy matching functions per session,
+# which costs more than a typical exact-match lookup itself.
+POOL_SIZE = 5
+MAX_OVERFLOW = 10
+
+# Whether the database runs in write-ahead logging mode, which lets readers
+# proceed concurrently with a writer. Opt-in via the GEOPARSER_DB_WAL
+# environment variable or enable_wal(), since it changes the on-disk journal.
+_wal_enabled = False
+
+# Milliseconds a connection waits for a lock held by another connection
+# before failing with "database is locked" when WAL mode is enabled.
+BUSY_TIMEOUT_MS = 30_000
+_busy_timeout_ms = BUSY_TIMEOUT_MS
+
+# Threads of the shared executor for database access, bounded by the size of
+# the connection pool so that queued reads do not wait for a connection.
+DATABASE_WORKERS = POOL_SIZE
+DATABASE_THREAD_NAME_PREFIX = "geoparser-db"
+_database_executor: Optional[ThreadPoolExecutor] = None
+_database_executor_lock = threading.Lock()
+
+# Serializes writers within this process. SQLite only admits one writer at a
+# time, so threads queue here instead of contending for the database lock.
+_write_lock = threading.RLock()
+
+# Gazetteers of a file-backed database are installed into their own SQLite
+# files in this directory next to the main database, and attached read-only
+# and memory-mapped to every connection of the main database.
+GAZETTEER_DIRNAME = "gazetteers"
+GAZETTEER_MMAP_SIZE = 1073741824  # 1 GiB memory-mapped I/O per gazetteer
+
+# Number of databases SQLite attaches to a connection at most, unless it was
+# compiled with a different limit. This bounds the number of gazetteer files.
+DEFAULT_MAX_ATTACHED = 10
+
+# Schema name under which the main database is attached to the connections
+# of a gazetteer installation, so registration can write features and names.
+MAIN_SCHEMA = "geoparser"
+
+# Gazetteer files currently attached to connections of the main database,
+# mapping schema name to file path. The version is bumped whenever the files
+# change so that pooled connections can resynchronize their attachments.
+_gazetteer_files: dict[str, str] = {}
+_gazetteer_files_owner: Optional[str] = None
+_gazetteer_files_version = 0
+
+# Engine of the gazetteer file being installed, if any. While set,
+# get_connection() connects to the gazetteer file instead of the main database.
+_installation_engine: Optional[Engine] = None
+
+# Coordinate columns of the feature table added after its first release, which
+# are added to the tables of older databases by _migrate_database()
+FEATURE_COORDINATE_COLUMNS = ("longitude", "latitude", "x", "y")
+
+# Number of rows read at once when filling in columns added by a migration
+MIGRATION_CHUNKSIZE = 10000
+
+# Profile collecting the statements of all threads, or None while SQL
+# profiling is disabled. Set via the profile context manager.
+_active_profile: Optional[QueryProfile] = None
+_active_profile_lock = threading.Lock()
+
+# PRAGMAs of each connection profile. The default profile restores SQLite's
+# defaults so that pooled connections can switch back from a tuned profile.
+_DEFAULT_PRAGMAS = {
+    "synchronous": "FULL",
+    "temp_store": "DEFAULT",
+    "cache_size": "-2000",
+    "mmap_size": "0",
+    "query_only": "OFF",
+    "busy_timeout": "5000",  # Default of the sqlite3 module
+}
+_WRITE_PRAGMAS = {
+    "synchronous": "OFF",
+    "journal_mode": "MEMORY",
+    "temp_store": "MEMORY",
+    "cache_size": "-1048576",  # Up to ~1 GiB of page cache
+    "mmap_size": "268435456",  # 256 MiB memory-mapped I/O
+}
+_READ_PRAGMAS = {
+    "temp_store": "MEMORY",
+    "cache_size": "-262144",  # Up to ~256 MiB of page cache
+    "mmap_size": "1073741824",  # 1 GiB memory-mapped I/O
+}
+
+
+def _get_connection_profile(base: Optional[str] = None) -> str:
+    """
+    Get the name of a connection profile.
+
+    Args:
+        base: "reads" or "reads-query-only" for the profile of a read session,
+            or None for the profile currently in effect for all other
+            connections ("writes" or "default")
+
+    Returns:
+        Name of the profile, suffixed with "+wal" when WAL mode is enabled
+    """
+    if base is None:
+        base = "writes" if _optimized_writes_enabled else "default"
+
+    return f"{base}+wal" if _wal_enabled else base
+
+
+def _get_profile_pragmas(profile: str) -> dict[str, str]:
+    """
+    Get the PRAGMAs that deviate from the defaults for a connection profile.
+
+    Args:
+        profile: Name of the connection profile
+
+    Returns:
+        Mapping of PRAGMA name to value
+    """
+    base, _, journal = profile.partition("+")
+
+    if base == "writes":
+        pragmas = dict(_WRITE_PRAGMAS)
+    elif base == "reads":
+        pragmas = dict(_READ_PRAGMAS)
+    elif base == "reads-query-only":
+        pragmas = {**_READ_PRAGMAS, "query_only": "ON"}
+    else:
+        pragmas = {}
+
+    if journal == "wal":
+        # Leaving WAL mode requires exclusive access, so profiles keep the
+        # journal in WAL. NORMAL synchronous is durable enough in WAL mode.
+        pragmas.pop("journal_mode", None)
+        pragmas = {
+            "journal_mode": "WAL",
+            "synchronous": "NORMAL",
+            "busy_timeout": str(_busy_timeout_ms),
+            **pragmas,
+        }
+
+    return pragmas
+
+
+def _apply_connection_profile(dbapi_connection, pragmas: dict[str, str]) -> None:
+    """
+    Execute the given PRAGMAs on a raw SQLite connection.
+
+    Args:
+        dbapi_connection: Database API connection object
+        pragmas: Mapping of PRAGMA name to value
+    """
+    cursor = dbapi_connection.cursor()
+    for name, value in pragmas.items():
+        cursor.execute(f"PRAGMA {name}={value}")
+    cursor.close()
+
 
 # Event listener for SQLite foreign keys and fuzzy matching functions
 # This applies to ALL Engine instances (including test engines)
@@ -53,17 +213,14 @@ def _set_sqlite_pragma(dbapi_connection, connection_record):
         # Enable foreign key enforcement
         cursor = dbapi_connection.cursor()
         cursor.execute("PRAGMA foreign_keys=ON")
-
-        # Tune the connection for write throughput when enabled
-        if _optimized_writes_enabled:
-            cursor.execute("PRAGMA synchronous=OFF")
-            cursor.execute("PRAGMA journal_mode=MEMORY")
-            cursor.execute("PRAGMA temp_store=MEMORY")
-            cursor.execute("PRAGMA cache_size=-1048576")  # Up to ~1 GiB of page cache
-            cursor.execute("PRAGMA mmap_size=268435456")  # 256 MiB memory-mapped I/O
-
         cursor.close()
 
+        # Tune the connection for the active profile
+        profile = _get_connection_profile()
+        _apply_connection_profile(dbapi_connection, _get_profile_pragmas(profile))
+        if connection_record is not None:
+            connection_record.info["profile"] = profile
+
         # Register pure-Python fuzzy matching functions
         dbapi_connection.create_function("soundex", 1, soundex, deterministic=True)
         dbapi_connection.create_function(
@@ -71,14 +228,263 @@ def _set_sqlite_pragma(dbapi_connection, connection_record):
         )
 
 
-# Create engine once at module level
-engine: Engine = create_engine(
-    DATABASE_URL,
-    echo=False,  # Set to True for SQL debugging
-    connect_args={"check_same_thread": False},
-    poolclass=NullPool,  # NullPool is recommended for SQLite
-    pool_pre_ping=True,  # Keeps connections fresh for long-lived apps
-)
+@event.listens_for(Engine, "checkout")
+def _sync_connection_profile(dbapi_connection, connection_record, connection_proxy):
+    """
+    Bring pooled SQLite connections in line with the active profile on checkout.
+
+    Pooled connections outlive the optimized_writes contexts and read
+    sessions they were used in, and may predate enable_wal(), so their
+    PRAGMAs are reset to the defaults and the active profile is reapplied
+    whenever the profile has changed since the connection was last configured.
+
+    Args:
+        dbapi_connection: Database API connection object
+        connection_record: SQLAlchemy connection record
+        connection_proxy: SQLAlchemy connection proxy
+    """
+    if not isinstance(dbapi_connection, sqlite3.Connection):
+        return
+
+    _switch_connection_profile(
+        dbapi_connection, connection_record.info, _get_connection_profile()
+    )
+
+
+def _switch_connection_profile(dbapi_connection, info: dict, profile: str) -> None:
+    """
+    Retune a SQLite connection for a profile if it was configured differently.
+
+    Args:
+        dbapi_connection: Database API connection object
+        info: Info dictionary of the connection's pool record
+        profile: Name of the profile to apply
+    """
+    previous_profile = info.get("profile", "default")
+    if previous_profile == profile:
+        return
+
+    pragmas = dict(_DEFAULT_PRAGMAS)
+    if _get_profile_pragmas(previous_profile).get("journal_mode") == "MEMORY":
+        pragmas["journal_mode"] = "DELETE"
+    pragmas.update(_get_profile_pragmas(profile))
+
+    _apply_connection_profile(dbapi_connection, pragmas)
+    info["profile"] = profile
+
+
+@event.listens_for(Engine, "checkout")
+def _sync_gazetteer_attachments(dbapi_connection, connection_record, connection_proxy):
+    """
+    Attach the installed gazetteer files to connections of the main database.
+
+    Gazetteer files are attached read-only and memory-mapped under their
+    schema name (see gazetteer_schema()). Attachments are resynchronized on
+    checkout whenever the set of gazetteer files has changed since the
+    connection was last configured, e.g. after a gazetteer was installed.
+
+    Args:
+        dbapi_connection: Database API connection object
+        connection_record: SQLAlchemy connection record
+        connection_proxy: SQLAlchemy connection proxy
+    """
+    if not isinstance(dbapi_connection, sqlite3.Connection):
+        return
+
+    if (
+        connection_record.info.get("gazetteer_files_version")
+        == _gazetteer_files_version
+    ):
+        return
+
+    if "main_file" not in connection_record.info:
+        databases = dbapi_connection.execute("PRAGMA database_list").fetchall()
+        main_file = next(file for _, name, file in databases if name == "main")
+        connection_record.info["main_file"] = main_file
+
+    # Only connections of the main database get the gazetteers attached
+    is_main = connection_record.info["main_file"] == _gazetteer_files_owner
+    target = _gazetteer_files if is_main else {}
+    attached = connection_record.info.setdefault("gazetteer_attachments", {})
+
+    for schema, path in list(attached.items()):
+        if target.get(schema) != path:
+            dbapi_connection.execute(f"DETACH DATABASE {schema}")
+            del attached[schema]
+
+    max_attached = _get_max_attached(dbapi_connection)
+    if len(target) > max_attached:
+        raise RuntimeError(
+            f"{len(target)} gazetteer files are installed in "
+            f"'{Path(_gazetteer_files_owner).parent / GAZETTEER_DIRNAME}', but "
+            f"SQLite can only attach {max_attached} databases to a connection"
+        )
+
+    for schema, path in target.items():
+        if schema not in attached:
+            dbapi_connection.execute(
+                f"ATTACH DATABASE ? AS {schema}", (f"{Path(path).as_uri()}?mode=ro",)
+            )
+            dbapi_connection.execute(
+                f"PRAGMA {schema}.mmap_size={GAZETTEER_MMAP_SIZE}"
+            ).fetchall()
+            attached[schema] = path
+
+    connection_record.info["gazetteer_files_version"] = _gazetteer_files_version
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _start_statement_timer(
+    conn, cursor, statement, parameters, context, executemany
+) -> None:
+    """
+    Note the start time of a statement while SQL profiling is enabled.
+
+    Args:
+        conn: SQLAlchemy connection executing the statement
+        cursor: Database API cursor
+        statement: SQL statement as sent to the database
+        parameters: Bound parameters of the statement
+        context: SQLAlchemy execution context
+        executemany: Whether the statement is executed for many parameter sets
+    """
+    if _active_profile is not None and context is not None:
+        context._geoparser_start_time = time.perf_counter()
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _record_statement(
+    conn, cursor, statement, parameters, context, executemany
+) -> None:
+    """
+    Record the duration of a statement in the active SQL profile.
+
+    Statements taking at least the profile's slow query threshold are logged
+    and, if requested, the query plan of slow SELECT statements is captured.
+    Slow queries are logged in normalized form with the number of bound
+    values only, since literals and parameters may contain document texts.
+
+    Args:
+        conn: SQLAlchemy connection executing the statement
+        cursor: Database API cursor
+        statement: SQL statement as sent to the database
+        parameters: Bound parameters of the statement
+        context: SQLAlchemy execution context
+        executemany: Whether the statement is executed for many parameter sets
+    """
+    profile = _active_profile
+    start_time = getattr(context, "_geoparser_start_time", None)
+    if profile is None or start_time is None:
+        return
+
+    duration = time.perf_counter() - start_time
+    profile.record(statement, duration)
+
+    if duration * 1000 < profile.slow_query_ms:
+        return
+
+    plan = None
+    if profile.explain and not executemany:
+        plan = _explain_query_plan(conn, statement, parameters)
+
+    if executemany:
+        parameter_count = sum(len(parameter_set) for parameter_set in parameters)
+    else:
+        parameter_count = len(parameters or ())
+
+    normalized = normalize_statement(statement)
+    logger.warning(
+        "Slow query (%.1f ms): %s; %d parameters",
+        duration * 1000,
+        normalized,
+        parameter_count,
+    )
+    profile.record_slow_query(
+        SlowQuery(
+            statement=normalized,
+            parameter_count=parameter_count,
+            duration=duration,
+            plan=plan,
+        )
+    )
+
+
+def _explain_query_plan(
+    conn: Connection, statement: str, parameters
+) -> Optional[List[str]]:
+    """
+    Get the SQLite query plan of a SELECT statement.
+
+    Args:
+        conn: SQLAlchemy connection the statement was executed on
+        statement: SQL statement as sent to the database
+        parameters: Bound parameters of the statement
+
+    Returns:
+        Details of the query plan steps, or None for statements other than
+        SELECT queries on SQLite and statements that cannot be explained
+    """
+    dbapi_connection = conn.connection.driver_connection
+    if not isinstance(dbapi_connection, sqlite3.Connection):
+        return None
+    if not statement.lstrip().upper().startswith(("SELECT", "WITH")):
+        return None
+
+    # Run on the raw connection, so that the plan query is not profiled itself
+    try:
+        rows = dbapi_connection.execute(
+            f"EXPLAIN QUERY PLAN {statement}", parameters
+        ).fetchall()
+    except sqlite3.Error:
+        return None
+    return [row[-1] for row in rows]
+
+
+# Engine of the main database. Created on first use by get_engine(), so that
+# importing the package neither touches the file system nor sets up a pool.
+engine: Optional[Engine] = None
+_engine_lock = threading.Lock()
+
+# Engines whose database passed the compatibility check and has all tables,
+# so that create_db_and_tables() only does this work once per engine.
+_initialized_engines: weakref.WeakSet[Engine] = weakref.WeakSet()
+_initialization_lock = threading.Lock()
+
+
+def get_engine() -> Engine:
+    """
+    Get the engine of the main database, creating it on first use.
+
+    Returns:
+        SQLAlchemy Engine of the main database
+    """
+    global engine
+    if engine is None:
+        with _engine_lock:
+            if engine is None:
+                # Ensure parent directory exists
+                Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+                engine = create_engine(
+                    DATABASE_URL,
+                    echo=False,  # Set to True for SQL debugging
+                    connect_args={"check_same_thread": False, "uri": True},
+                    poolclass=QueuePool,  # Bounded pool of reusable connections
+                    pool_size=POOL_SIZE,
+                    max_overflow=MAX_OVERFLOW,
+                )
+    return engine
+
+
+def dispose_after_fork() -> None:
+    """
+    Drop the pooled connections inherited from the parent process.
+
+    SQLite connections must not be used across a fork, so a forked child has
+    to call this before it accesses the database. The connections are only
+    dereferenced, not closed, since they still belong to the parent process.
+    """
+    if engine is not None:
+        engine.dispose(close=False)
 
 
 def _check_database_compatibility() -> None:
@@ -93,7 +499,7 @@ def _check_database_compatibility() -> None:
     Raises:
         RuntimeError: If a legacy database layout is detected.
     """
-    with engine.connect() as connection:
+    with get_engine().connect() as connection:
 
         def _table_exists(name: str) -> bool:
             result = connection.execute(
@@ -114,16 +520,289 @@ def _check_database_compatibility() -> None:
             )
 
 
+def _migrate_database() -> None:
+    """
+    Upgrade tables created by earlier versions that can be migrated in place.
+
+    The ``feature`` table of earlier versions lacks the coordinate columns of
+    the representative points. They are added empty, and the coordinates of
+    installed gazetteers are filled in by
+    GazetteerInstaller.backfill_coordinates() (``python -m geoparser install
+    <gazetteer> --coordinates-only``). Until then, the coordinates of their
+    features are missing, while all other data remains usable.
+
+    The ``document`` table of earlier versions lacks the content hash used for
+    deduplication, which is added and computed for the existing documents.
+    """
+    with get_engine().connect() as connection:
+        _migrate_feature_coordinates(connection)
+        _migrate_document_content_hash(connection)
+
+
+def _get_table_columns(connection: Connection, table_name: str) -> set[str]:
+    """
+    Get the column names of a table.
+
+    Args:
+        connection: Database connection
+        table_name: Name of the table
+
+    Returns:
+        Set of column names, empty if the table does not exist
+    """
+    return {
+        row[1] for row in connection.execute(text(f"PRAGMA table_info({table_name})"))
+    }
+
+
+def _migrate_feature_coordinates(connection: Connection) -> None:
+    """
+    Add the coordinate columns to a feature table that lacks them.
+
+    Args:
+        connection: Database connection
+    """
+    columns = _get_table_columns(connection, "feature")
+    # A fresh database has no feature table yet
+    if not columns:
+        return
+
+    missing = [column for column in FEATURE_COORDINATE_COLUMNS if column not in columns]
+    if not missing:
+        return
+
+    for column in missing:
+        connection.execute(text(f"ALTER TABLE feature ADD COLUMN {column} FLOAT"))
+    connection.commit()
+
+    if connection.execute(text("SELECT 1 FROM feature LIMIT 1")).first():
+        warnings.warn(
+            "The feature table of your geoparser database was upgraded with "
+            "coordinate columns. Run 'python -m geoparser install <gazetteer> "
+            "--coordinates-only' for each installed gazetteer to compute the "
+            "coordinates of its features.",
+            stacklevel=3,
+        )
+
+
+def _migrate_document_content_hash(connection: Connection) -> None:
+    """
+    Add the content hash column to a document table and fill it in.
+
+    Args:
+        connection: Database connection
+    """
+    from geoparser.db.models.validators import content_hash
+
+    columns = _get_table_columns(connection, "document")
+    if not columns or "content_hash" in columns:
+        return
+
+    connection.execute(text("ALTER TABLE document ADD COLUMN content_hash VARCHAR"))
+
+    # Hash the documents in chunks so the texts are never all in memory
+    update = text("UPDATE document SET content_hash = :content_hash WHERE id = :id")
+    last_rowid = 0
+    while rows := connection.execute(
+        text(
+            "SELECT rowid, id, text FROM document WHERE rowid > :last_rowid "
+            "ORDER BY rowid LIMIT :limit"
+        ),
+        {"last_rowid": last_rowid, "limit": MIGRATION_CHUNKSIZE},
+    ).all():
+        connection.execute(
+            update,
+            [
+                {"id": document_id, "content_hash": content_hash(document_text)}
+                for _, document_id, document_text in rows
+            ],
+        )
+        last_rowid = rows[-1][0]
+    connection.commit()
+
+
 def create_db_and_tables() -> None:
     """
     Create all database tables.
 
-    Make sure all models are imported before calling this function.
-    For this application, tables are created automatically at module import.
-    This function is provided for explicit table creation if needed.
+    Called by the entry points that access the database, e.g. when creating a
+    Project or Gazetteer. The compatibility check and table creation only run
+    on the first call for an engine; later calls just refresh the attached
+    gazetteer files.
+    """
+    engine = get_engine()
+    if engine not in _initialized_engines:
+        with _initialization_lock:
+            if engine not in _initialized_engines:
+                # Register all models with the metadata
+                import geoparser.db.models  # noqa: F401
+
+                _check_database_compatibility()
+                _migrate_database()
+                SQLModel.metadata.create_all(engine)
+
+                # create_all() skips existing tables, so indices added to a table
+                # after the database was created have to be created separately
+                for table in SQLModel.metadata.sorted_tables:
+                    for index in table.indexes:
+                        index.create(engine, checkfirst=True)
+
+                _initialized_engines.add(engine)
+    refresh_gazetteer_files()
+
+
+def _get_database_file() -> Optional[Path]:
+    """
+    Get the file of the main database.
+
+    Returns:
+        Resolved path of the database file, or None for in-memory databases
+    """
+    database = get_engine().url.database
+    if not database or database == ":memory:" or database.startswith("file:"):
+        return None
+    return Path(database).resolve()
+
+
+def _get_max_attached(dbapi_connection: Optional[sqlite3.Connection] = None) -> int:
+    """
+    Get the number of databases SQLite can attach to a connection.
+
+    Args:
+        dbapi_connection: Connection whose limit to read. If None, the limit of
+            a new in-memory connection is read.
+
+    Returns:
+        Maximum number of attached databases
+    """
+    if dbapi_connection is None:
+        dbapi_connection = sqlite3.connect(":memory:")
+        try:
+            return _get_max_attached(dbapi_connection)
+        finally:
+            dbapi_connection.close()
+
+    # Connection limits can only be read from Python 3.11 on
+    getlimit = getattr(dbapi_connection, "getlimit", None)
+    if getlimit is None:
+        return DEFAULT_MAX_ATTACHED
+    return getlimit(sqlite3.SQLITE_LIMIT_ATTACHED)
+
+
+def gazetteer_schema(gazetteer_name: str) -> str:
+    """
+    Get the schema name under which a gazetteer file is attached.
+
+    Args:
+        gazetteer_name: Name of the gazetteer
+
+    Returns:
+        Schema name usable to qualify the gazetteer's tables and views
+    """
+    return "gazetteer_" + re.sub(r"\W", "_", gazetteer_name)
+
+
+def refresh_gazetteer_files() -> None:
+    """
+    Discover the gazetteer files belonging to the main database.
+
+    Connections pick up added or removed gazetteer files the next time they
+    are checked out from the pool.
+    """
+    global _gazetteer_files, _gazetteer_files_owner, _gazetteer_files_version
+
+    database_file = _get_database_file()
+    files = {}
+    if database_file is not None:
+        gazetteer_dir = database_file.parent / GAZETTEER_DIRNAME
+        files = {
+            gazetteer_schema(path.stem): str(path)
+            for path in sorted(gazetteer_dir.glob("*.db"))
+        }
+    owner = str(database_file) if database_file is not None else None
+
+    if files != _gazetteer_files or owner != _gazetteer_files_owner:
+        _gazetteer_files = files
+        _gazetteer_files_owner = owner
+        _gazetteer_files_version += 1
+
+
+@contextmanager
+def gazetteer_installation(gazetteer_name: str) -> Iterator[Optional[str]]:
     """
-    _check_database_compatibility()
-    SQLModel.metadata.create_all(engine)
+    Direct installer connections to a gazetteer's own database file.
+
+    Within the context, get_connection() connects to the gazetteer file, so
+    the installer's tables, views and indices are created there. The main
+    database is attached as ``geoparser``, so features and names are still
+    registered in the main database. Once the context exits, the gazetteer
+    file is attached read-only to the connections of the main database.
+
+    Only the source tables and views are stored in the gazetteer file. The
+    feature and name tables with their search indices remain in the main
+    database, since projects reference features by ID and the full-text
+    search cannot be queried through views. A gazetteer file is therefore
+    only usable together with the main database it was installed with.
+
+    In-memory databases cannot be attached, so gazetteers of an in-memory
+    main database are installed into the main database itself.
+
+    Args:
+        gazetteer_name: Name of the gazetteer being installed
+
+    Yields:
+        Schema name of the gazetteer file, or None if the gazetteer is
+        installed into the main database
+
+    Raises:
+        RuntimeError: If installing another gazetteer file would exceed the
+            number of databases SQLite can attach to a connection
+    """
+    global _installation_engine
+
+    database_file = _get_database_file()
+    if database_file is None:
+        yield None
+        return
+
+    gazetteer_dir = database_file.parent / GAZETTEER_DIRNAME
+    gazetteer_file = gazetteer_dir / f"{gazetteer_name}.db"
+    installed = list(gazetteer_dir.glob("*.db"))
+    max_attached = _get_max_attached()
+    if gazetteer_file not in installed and len(installed) >= max_attached:
+        raise RuntimeError(
+            f"Cannot install gazetteer '{gazetteer_name}': {len(installed)} "
+            f"gazetteer files are already installed in '{gazetteer_dir}', and "
+            f"SQLite can only attach {max_attached} databases to a connection"
+        )
+    gazetteer_dir.mkdir(parents=True, exist_ok=True)
+
+    installation_engine = create_engine(
+        f"sqlite:///{gazetteer_file}",
+        connect_args={"check_same_thread": False},
+        poolclass=NullPool,
+    )
+
+    @event.listens_for(installation_engine, "connect")
+    def _attach_main_database(dbapi_connection, connection_record):
+        dbapi_connection.execute(
+            f"ATTACH DATABASE ? AS {MAIN_SCHEMA}", (str(database_file),)
+        )
+        # Registration writes to the main database, so tune it like the
+        # gazetteer file itself
+        for name, value in _get_profile_pragmas(_get_connection_profile()).items():
+            if name in ("synchronous", "journal_mode", "cache_size"):
+                dbapi_connection.execute(
+                    f"PRAGMA {MAIN_SCHEMA}.{name}={value}"
+                ).fetchall()
+
+    _installation_engine = installation_engine
+    try:
+        yield gazetteer_schema(gazetteer_name)
+    finally:
+        _installation_engine = None
+        installation_engine.dispose()
+        refresh_gazetteer_files()
 
 
 @contextmanager
@@ -137,13 +816,116 @@ def get_session() -> Iterator[Session]:
     Yields:
         SQLModel Session for database operations
     """
-    session = Session(engine, expire_on_commit=False)
+    session = Session(get_engine(), expire_on_commit=False)
     try:
         yield session
     finally:
         session.close()
 
 
+@contextmanager
+def read_session(query_only: bool = False) -> Iterator[Session]:
+    """
+    Get a database session tuned for read-heavy query workloads.
+
+    The session runs on a connection of its own that gets a large page cache,
+    memory-mapped I/O and in-memory temporary storage, which speeds up
+    gazetteer searches and bulk feature lookups. Only this connection is
+    tuned, so sessions of other threads keep their settings. The connection
+    returns to the default profile when it is next checked out for another
+    purpose.
+
+    Args:
+        query_only: Whether the session should additionally reject all writes
+
+    Yields:
+        SQLModel Session for database operations
+    """
+    with get_engine().connect() as connection:
+        dbapi_connection = connection.connection.driver_connection
+        if isinstance(dbapi_connection, sqlite3.Connection):
+            _switch_connection_profile(
+                dbapi_connection,
+                connection.connection.info,
+                _get_connection_profile("reads-query-only" if query_only else "reads"),
+            )
+
+        session = Session(bind=connection, expire_on_commit=False)
+        try:
+            yield session
+        finally:
+            session.close()
+
+
+@contextmanager
+def write_session() -> Iterator[Session]:
+    """
+    Get a database session for writing, holding the process-wide writer lock.
+
+    Only one thread of the process can hold a write session at a time, which
+    keeps writers from contending for SQLite's database lock and leaves other
+    threads free to read. Keep write sessions short: gather data and run
+    predictions beforehand, then write the results in one go. Writers in other
+    processes are serialized by SQLite itself and wait up to the busy timeout.
+
+    Yields:
+        SQLModel Session for database operations
+    """
+    with _write_lock:
+        with get_session() as session:
+            yield session
+
+
+def get_database_executor() -> ThreadPoolExecutor:
+    """
+    Get the shared thread pool for database access.
+
+    The pool is created on first use and has at most DATABASE_WORKERS threads,
+    so blocking SQLite calls can be moved off the calling thread (e.g., an
+    asyncio event loop) without opening more connections than the pool holds.
+
+    Returns:
+        The shared database executor
+    """
+    global _database_executor
+    with _database_executor_lock:
+        if _database_executor is None:
+            _database_executor = ThreadPoolExecutor(
+                max_workers=DATABASE_WORKERS,
+                thread_name_prefix=DATABASE_THREAD_NAME_PREFIX,
+            )
+        return _database_executor
+
+
+_T = TypeVar("_T")
+_R = TypeVar("_R")
+
+
+def map_reads(func: Callable[[_T], _R], items: Iterable[_T]) -> List[_R]:
+    """
+    Apply a reading function to items concurrently on the database executor.
+
+    SQLite releases the GIL while executing queries, so independent lookups,
+    such as gazetteer searches for different names, overlap when run on
+    separate connections. Calls from a thread of the database executor itself
+    run sequentially, since waiting for the executor from one of its own
+    threads could exhaust it.
+
+    Args:
+        func: Function performing its own database reads for one item
+        items: Items to apply the function to
+
+    Returns:
+        Results of the function in the order of the items
+    """
+    items = list(items)
+    if len(items) < 2 or threading.current_thread().name.startswith(
+        DATABASE_THREAD_NAME_PREFIX
+    ):
+        return [func(item) for item in items]
+    return list(get_database_executor().map(func, items))
+
+
 @contextmanager
 def get_connection() -> Iterator[Connection]:
     """
@@ -152,21 +934,23 @@ def get_connection() -> Iterator[Connection]:
     For operations that need direct connection access (like executing
     raw SQL in installer stages). This is the preferred way to get a
     connection as it accesses the engine at runtime, respecting any
-    patches applied during testing.
+    patches applied during testing. During a gazetteer installation,
+    connections go to the gazetteer's own database file (see
+    gazetteer_installation()).
 
     Yields:
         SQLAlchemy Connection for database operations
     """
-    with engine.connect() as connection:
+    with (_installation_engine or get_engine()).connect() as connection:
         yield connection
 
 
 @contextmanager
 def optimized_writes() -> Iterator[None]:
     """
-    Tune new connections for write throughput within the context manager.
+    Tune connections for write throughput within the context manager.
 
-    Connections opened while this context is active apply throughput-oriented
+    Connections used while this context is active apply throughput-oriented
     PRAGMAs instead of the default durable settings. This is intended for
     gazetteer installation, where large volumes of data are written and the
     process can simply be re-run on failure.
@@ -180,3 +964,76 @@ def optimized_writes() -> Iterator[None]:
         yield
     finally:
         _optimized_writes_enabled = False
+
+
+@contextmanager
+def profile(
+    slow_query_ms: float = SLOW_QUERY_MS, explain: bool = False
+) -> Iterator[QueryProfile]:
+    """
+    Profile the SQL statements executed within the context manager.
+
+    The duration of every statement executed by any thread is recorded and
+    grouped by normalized statement, which makes N+1 query patterns easy to
+    spot by their execution counts. Statements taking at least
+    ``slow_query_ms`` milliseconds are logged as warnings of the
+    ``geoparser.db.db`` logger and kept in the profile's slow queries.
+
+    Args:
+        slow_query_ms: Milliseconds from which a statement counts as a slow
+            query (default: SLOW_QUERY_MS)
+        explain: Whether to capture the EXPLAIN QUERY PLAN output of slow
+            SELECT statements (default: False)
+
+    Yields:
+        The profile collecting the statement statistics
+
+    Raises:
+        RuntimeError: If profiling is already enabled
+    """
+    global _active_profile
+
+    with _active_profile_lock:
+        if _active_profile is not None:
+            raise RuntimeError("SQL profiling is already enabled")
+        _active_profile = QueryProfile(slow_query_ms=slow_query_ms, explain=explain)
+        current = _active_profile
+
+    try:
+        yield current
+    finally:
+        with _active_profile_lock:
+            _active_profile = None
+
+
+def enable_wal(busy_timeout_ms: int = BUSY_TIMEOUT_MS) -> None:
+    """
+    Switch the database to write-ahead logging (WAL) mode.
+
+    In WAL mode, readers no longer block behind a writer, so several worker
+    processes can search gazetteers and read project data while one process
+    writes results, and the annotator can be used while a batch job runs.
+    Writers still take turns: a connection waiting for another process's write
+    lock retries for up to ``busy_timeout_ms`` before giving up.
+
+    The journal mode is stored in the database file, so the database remains
+    in WAL mode for all processes once a connection has been configured.
+    WAL mode requires all processes to run on the same host, i.e. it must not
+    be used for databases on network file systems.
+
+    Args:
+        busy_timeout_ms: Milliseconds to wait for locks held by other
+            connections before failing
+    """
+    global _wal_enabled, _busy_timeout_ms
+    _wal_enabled = True
+    _busy_timeout_ms = busy_timeout_ms
+
+    # Configure the database file right away so other processes see WAL mode
+    with get_connection():
+        pass
+
+
+if os.getenv("GEOPARSER_DB_WAL", "").lower() in ("1", "true", "yes"):
+    # Applied by the connect listener once the first connection is opened
+    _wal_enabled = True
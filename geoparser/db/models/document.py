@@ -2,11 +2,11 @@ import typing as t
 import uuid
 from typing import List, Optional
 
-from pydantic import AfterValidator
-from sqlalchemy import UUID, Column, ForeignKey
+from pydantic import AfterValidator, model_validator
+from sqlalchemy import UUID, Column, ForeignKey, Index
 from sqlmodel import Field, Relationship, SQLModel
 
-from geoparser.db.models.validators import normalize_newlines
+from geoparser.db.models.validators import content_hash, normalize_newlines
 
 if t.TYPE_CHECKING:
     from geoparser.db.models.project import Project
@@ -31,12 +31,18 @@ class Document(DocumentBase, table=True):
     A document belongs to a project and can contain multiple references.
     """
 
+    __table_args__ = (
+        Index("ix_document_project_content_hash", "project_id", "content_hash"),
+    )
+
     id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
     project_id: uuid.UUID = Field(
         sa_column=Column(
             UUID, ForeignKey("project.id", ondelete="CASCADE"), nullable=False
         )
     )
+    # SHA-256 digest of the text, used to find duplicate documents
+    content_hash: t.Optional[str] = None
     project: "Project" = Relationship(back_populates="documents")
     references: list["Reference"] = Relationship(
         back_populates="document",
@@ -105,10 +111,17 @@ class DocumentCreate(DocumentBase):
     """
     Model for creating a new document.
 
-    Includes the project_id to associate the document with a project.
+    Includes the project_id to associate the document with a project. The
+    content hash is computed from the text.
     """
 
     project_id: uuid.UUID
+    content_hash: t.Optional[str] = None
+
+    @model_validator(mode="after")
+    def set_content_hash(self) -> "DocumentCreate":
+        self.content_hash = content_hash(self.text)
+        return self
 
 
 class DocumentUpdate(SQLModel):
@@ -117,3 +130,10 @@ class DocumentUpdate(SQLModel):
     id: uuid.UUID
     project_id: t.Optional[uuid.UUID] = None
     text: t.Optional[str] = None
+    content_hash: t.Optional[str] = None
+
+    @model_validator(mode="after")
+    def set_content_hash(self) -> "DocumentUpdate":
+        if self.text is not None:
+            self.content_hash = content_hash(self.text)
+        return self
@@ -34,6 +34,13 @@ class Feature(FeatureBase, table=True):
     id: int = Field(primary_key=True)
     source_id: int = Field(foreign_key="source.id", index=True)
 
+    # Representative point of the geometry, computed at install time both in
+    # WGS84 and in the native reference system of the gazetteer
+    longitude: t.Optional[float] = None
+    latitude: t.Optional[float] = None
+    x: t.Optional[float] = None
+    y: t.Optional[float] = None
+
     source: "Source" = Relationship(
         back_populates="features", sa_relationship_kwargs={"lazy": "joined"}
     )
@@ -1,7 +1,7 @@
 import typing as t
 import uuid
 
-from sqlalchemy import UUID, Column, ForeignKey, String
+from sqlalchemy import UUID, Column, ForeignKey, Index, String
 from sqlmodel import Field, Relationship, SQLModel
 
 if t.TYPE_CHECKING:
@@ -21,6 +21,10 @@ class Recognition(RecognitionBase, table=True):
     even if no names were found.
     """
 
+    __table_args__ = (
+        Index("ix_recognition_document_recognizer", "document_id", "recognizer_id"),
+    )
+
     id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
     document_id: uuid.UUID = Field(
         sa_column=Column(
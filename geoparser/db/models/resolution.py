@@ -1,7 +1,7 @@
 import typing as t
 import uuid
 
-from sqlalchemy import UUID, Column, ForeignKey, String
+from sqlalchemy import UUID, Column, ForeignKey, Index, String
 from sqlmodel import Field, Relationship, SQLModel
 
 if t.TYPE_CHECKING:
@@ -21,6 +21,10 @@ class Resolution(ResolutionBase, table=True):
     even if no locations were found.
     """
 
+    __table_args__ = (
+        Index("ix_resolution_reference_resolver", "reference_id", "resolver_id"),
+    )
+
     id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
     reference_id: uuid.UUID = Field(
         sa_column=Column(
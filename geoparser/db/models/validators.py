@@ -1,2 +1,9 @@
+import hashlib
+
+
 def normalize_newlines(to_normalize: str) -> str:
     return to_normalize.replace("\r\n", "\n").replace("\r", "\n")
+
+
+def content_hash(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
@@ -0,0 +1,184 @@
+import re
+import threading
+from typing import Dict, List, Optional
+
+from pydantic import BaseModel
+
+# Statements taking at least this many milliseconds are logged as slow queries
+SLOW_QUERY_MS = 100.0
+
+# Patterns that normalize a statement, so that executions differing only in
+# their literals or in the number of bound values are grouped together
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"\b\d+(?:\.\d+)?\b")
+_PARAMETER_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+_VALUES_LIST = re.compile(r"(\(\?(?:, \.\.\.)?\))(?:\s*,\s*\(\?(?:, \.\.\.)?\))+")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_statement(statement: str) -> str:
+    """
+    Normalize an SQL statement for grouping.
+
+    Literals are replaced by placeholders, lists of placeholders (e.g. of IN
+    clauses or multi-row inserts) are collapsed and whitespace is squeezed,
+    so that repeated executions of the same query map to the same statement.
+
+    Args:
+        statement: SQL statement as sent to the database
+
+    Returns:
+        Normalized statement
+    """
+    statement = _STRING_LITERAL.sub("?", statement)
+    statement = _NUMBER_LITERAL.sub("?", statement)
+    statement = _WHITESPACE.sub(" ", statement).strip()
+    statement = _PARAMETER_LIST.sub("(?, ...)", statement)
+    return _VALUES_LIST.sub(r"\1, ...", statement)
+
+
+class StatementStats(BaseModel):
+    """
+    Timing of all executions of one normalized statement.
+    """
+
+    statement: str  # Normalized statement
+    count: int = 0  # Number of executions
+    total_time: float = 0.0  # Seconds spent in all executions
+    max_time: float = 0.0  # Seconds of the slowest execution
+
+    @property
+    def mean_time(self) -> float:
+        """
+        Get the mean duration of the statement's executions.
+
+        Returns:
+            Mean duration in seconds
+        """
+        return self.total_time / self.count if self.count else 0.0
+
+
+class SlowQuery(BaseModel):
+    """
+    Execution of a statement that exceeded the slow query threshold.
+    """
+
+    statement: str  # Normalized statement, without literals
+    parameter_count: int  # Number of bound values, which are not kept
+    duration: float  # Seconds the execution took
+    plan: Optional[List[str]] = None  # Rows of EXPLAIN QUERY PLAN, if captured
+
+
+class QueryProfile:
+    """
+    Statistics of the SQL statements executed while profiling was enabled.
+
+    Statements of all threads and engines are collected and grouped by their
+    normalized form, so that N+1 query patterns show up as a single statement
+    with a high execution count.
+    """
+
+    def __init__(self, slow_query_ms: float = SLOW_QUERY_MS, explain: bool = False):
+        """
+        Initialize an empty profile.
+
+        Args:
+            slow_query_ms: Milliseconds from which an execution counts as a
+                           slow query (default: SLOW_QUERY_MS)
+            explain: Whether to capture the query plan of slow SELECT
+                     statements (default: False)
+        """
+        self.slow_query_ms = slow_query_ms
+        self.explain = explain
+        self.statements: Dict[str, StatementStats] = {}
+        self.slow_queries: List[SlowQuery] = []
+        self._lock = threading.Lock()
+
+    @property
+    def count(self) -> int:
+        """Number of statements executed."""
+        with self._lock:
+            return sum(stats.count for stats in self.statements.values())
+
+    @property
+    def total_time(self) -> float:
+        """Seconds spent executing statements."""
+        with self._lock:
+            return sum(stats.total_time for stats in self.statements.values())
+
+    def record(self, statement: str, duration: float) -> None:
+        """
+        Add an execution of a statement to the profile.
+
+        Args:
+            statement: SQL statement as sent to the database
+            duration: Seconds the execution took
+        """
+        normalized = normalize_statement(statement)
+        with self._lock:
+            stats = self.statements.get(normalized)
+            if stats is None:
+                stats = self.statements[normalized] = StatementStats(
+                    statement=normalized
+                )
+            stats.count += 1
+            stats.total_time += duration
+            stats.max_time = max(stats.max_time, duration)
+
+    def record_slow_query(self, slow_query: SlowQuery) -> None:
+        """
+        Add a slow query to the profile.
+
+        Args:
+            slow_query: The slow query
+        """
+        with self._lock:
+            self.slow_queries.append(slow_query)
+
+    def top(self, limit: int = 10, by: str = "total_time") -> List[StatementStats]:
+        """
+        Get the statements that took the most time or were executed most often.
+
+        Args:
+            limit: Maximum number of statements to return (default: 10)
+            by: "total_time", "count", "max_time" or "mean_time"
+                (default: "total_time")
+
+        Returns:
+            List of statement statistics in descending order
+
+        Raises:
+            ValueError: If the sort key is not supported
+        """
+        if by not in ("total_time", "count", "max_time", "mean_time"):
+            raise ValueError(
+                f"Unsupported sort key '{by}'. "
+                "Supported keys: total_time, count, max_time, mean_time"
+            )
+
+        with self._lock:
+            statements = list(self.statements.values())
+        statements.sort(key=lambda stats: getattr(stats, by), reverse=True)
+        return statements[:limit]
+
+    def report(self, limit: int = 10) -> str:
+        """
+        Format the statements that took the most time as a text table.
+
+        Args:
+            limit: Maximum number of statements to include (default: 10)
+
+        Returns:
+            Table with the count, total and mean milliseconds of each statement
+        """
+        lines = [
+            f"{self.count} statements in {self.total_time * 1000:.1f} ms, "
+            f"{len(self.slow_queries)} slow",
+            f"{'count':>8}  {'total ms':>10}  {'mean ms':>8}  statement",
+        ]
+        for stats in self.top(limit):
+            lines.append(
+                f"{stats.count:>8}  {stats.total_time * 1000:>10.1f}  "
+                f"{stats.mean_time * 1000:>8.2f}  {stats.statement}"
+            )
+        return "\n".join(lines)
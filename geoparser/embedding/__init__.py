@@ -0,0 +1,19 @@
+# Use a lazy-loading approach, so that the constants can be imported without
+# loading the SentenceTransformer library needed by the server
+from importlib import import_module
+
+from geoparser.embedding.protocol import DEFAULT_SOCKET_PATH, EMBEDDING_SERVER_ENV
+
+# Define a mapping of public classes to their import paths
+_CLASS_PATHS = {
+    "EmbeddingClient": "geoparser.embedding.client",
+    "EmbeddingServer": "geoparser.embedding.server",
+}
+
+
+def __getattr__(name):
+    """Lazy-load classes only when they are accessed."""
+    if name in _CLASS_PATHS:
+        module = import_module(_CLASS_PATHS[name])
+        return getattr(module, name)
+    raise AttributeError(f"module 'geoparser.embedding' has no attribute '{name}'")
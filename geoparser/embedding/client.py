@@ -0,0 +1,136 @@
+import os
+import socket
+import threading
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from geoparser.embedding.protocol import (
+    DEFAULT_SOCKET_PATH,
+    check_server_socket,
+    receive_message,
+    send_message,
+)
+
+
+class EmbeddingClient:
+    """
+    Client of an EmbeddingServer running on the same host.
+
+    Each thread using the client gets its own connection to the server, so
+    requests of different threads are served concurrently and batched
+    together by the server. A connection that was lost, e.g. because the
+    server was restarted, is reopened once per request. Connections inherited
+    from a parent process are replaced, so forked processes never share a
+    connection with their parent.
+    """
+
+    def __init__(
+        self, socket_path: str = DEFAULT_SOCKET_PATH, timeout: Optional[float] = None
+    ):
+        """
+        Initialize an embedding client.
+
+        Args:
+            socket_path: Path of the Unix socket of the embedding server
+            timeout: Optional timeout in seconds for each request
+        """
+        self.socket_path = socket_path
+        self.timeout = timeout
+        self._local = threading.local()
+
+    def encode(self, texts: List[str]) -> np.ndarray:
+        """
+        Embed texts on the server.
+
+        Args:
+            texts: List of texts to embed
+
+        Returns:
+            Array with one embedding per text
+        """
+        return self._request({"op": "encode", "texts": list(texts)})["embeddings"]
+
+    def info(self) -> Dict[str, Any]:
+        """
+        Get the model and cache information of the server.
+
+        Returns:
+            Dictionary with the model name, maximum sequence length, embedding
+            dimension and cache statistics of the server
+        """
+        return self._request({"op": "info"})["info"]
+
+    def close(self) -> None:
+        """
+        Close the connection of the current thread.
+        """
+        connection = getattr(self._local, "connection", None)
+        if connection is not None:
+            connection.close()
+            self._local.connection = None
+
+    def _connect(self) -> socket.socket:
+        """
+        Get the connection of the current thread, opening it if necessary.
+
+        Returns:
+            Connected socket
+
+        Raises:
+            ConnectionError: If no embedding server is listening on the socket
+            PermissionError: If the server listening on the socket may belong
+                to another user
+        """
+        connection = getattr(self._local, "connection", None)
+        if connection is not None and self._local.pid != os.getpid():
+            # Closing the inherited copy leaves the parent's connection open
+            self.close()
+            connection = None
+        if connection is None:
+            connection = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            connection.settimeout(self.timeout)
+            try:
+                connection.connect(self.socket_path)
+            except OSError as e:
+                connection.close()
+                raise ConnectionError(
+                    f"No embedding server is listening on '{self.socket_path}'. "
+                    "Start one with 'python -m geoparser embedding-server'."
+                ) from e
+            try:
+                check_server_socket(connection, self.socket_path)
+            except PermissionError:
+                connection.close()
+                raise
+            self._local.connection = connection
+            self._local.pid = os.getpid()
+        return connection
+
+    def _request(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Send a request to the server and wait for its response.
+
+        Args:
+            request: Request message
+
+        Returns:
+            Response message
+
+        Raises:
+            RuntimeError: If the server failed to answer the request
+        """
+        for attempt in range(2):
+            connection = self._connect()
+            try:
+                send_message(connection, request)
+                response = receive_message(connection)
+                break
+            except (ConnectionError, BrokenPipeError):
+                self.close()
+                if attempt:
+                    raise
+
+        if "error" in response:
+            raise RuntimeError(f"Embedding server error: {response['error']}")
+        return response
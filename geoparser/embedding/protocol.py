@@ -0,0 +1,208 @@
+import getpass
+import json
+import os
+import socket
+import stat
+import struct
+import tempfile
+from typing import Any, Dict, Optional
+
+# Directory of the embedding server's socket if none is given. It is created
+# with permissions for its owner only, so other users can neither connect to
+# the socket nor replace it with their own.
+DEFAULT_SOCKET_DIR = os.path.join(
+    os.getenv("XDG_RUNTIME_DIR") or tempfile.gettempdir(),
+    f"geoparser-{getpass.getuser()}",
+)
+
+# Socket of the embedding server if none is given
+DEFAULT_SOCKET_PATH = os.path.join(DEFAULT_SOCKET_DIR, "embedding.sock")
+
+# Number of embeddings kept in the server's shared cache by default
+DEFAULT_CACHE_SIZE = 200_000
+
+# Environment variable naming the socket of an embedding server for resolvers
+EMBEDDING_SERVER_ENV = "GEOPARSER_EMBEDDING_SERVER"
+
+# Messages are prefixed with the lengths of their JSON part and of their raw
+# array data as unsigned 64-bit integers
+_HEADER = struct.Struct("!QQ")
+
+# Arrays are sent as raw little-endian float32 values. numpy is only imported
+# by the functions using it, so that the CLI can import the constants above
+# without loading it.
+_ARRAY_DTYPE = "<f4"
+
+# Key of the JSON part listing the shapes of the arrays sent as raw data
+_ARRAYS_KEY = "__arrays__"
+
+# Credentials of the peer of a Unix socket as returned by SO_PEERCRED
+_PEERCRED = struct.Struct("3i")
+
+
+def send_message(sock: socket.socket, message: Dict[str, Any]) -> None:
+    """
+    Send a message over a socket.
+
+    Messages are dictionaries of JSON values and numpy arrays. Arrays are
+    not encoded as JSON but appended as raw float32 data, so embeddings are
+    sent without conversion overhead.
+
+    Args:
+        sock: Connected socket
+        message: Dictionary whose values are JSON serializable or numpy arrays
+    """
+    import numpy as np
+
+    document = {}
+    shapes = {}
+    arrays = []
+    for key, value in message.items():
+        if isinstance(value, np.ndarray):
+            shapes[key] = list(value.shape)
+            arrays.append(np.ascontiguousarray(value, dtype=_ARRAY_DTYPE).tobytes())
+        else:
+            document[key] = value
+    if shapes:
+        document[_ARRAYS_KEY] = shapes
+
+    payload = json.dumps(document).encode("utf-8")
+    data = b"".join(arrays)
+    sock.sendall(_HEADER.pack(len(payload), len(data)) + payload + data)
+
+
+def receive_message(sock: socket.socket) -> Dict[str, Any]:
+    """
+    Receive a message sent with send_message() from a socket.
+
+    Args:
+        sock: Connected socket
+
+    Returns:
+        The message, with arrays restored as float32 numpy arrays
+
+    Raises:
+        ConnectionError: If the peer closed the connection
+        ValueError: If the message is malformed
+    """
+    import numpy as np
+
+    payload_size, data_size = _HEADER.unpack(_receive_exactly(sock, _HEADER.size))
+    message = json.loads(_receive_exactly(sock, payload_size))
+    data = _receive_exactly(sock, data_size)
+
+    dtype = np.dtype(_ARRAY_DTYPE)
+    offset = 0
+    for key, shape in message.pop(_ARRAYS_KEY, {}).items():
+        count = int(np.prod(shape, dtype=np.int64))
+        if offset + count * dtype.itemsize > len(data):
+            raise ValueError("Message is shorter than its arrays")
+        array = np.frombuffer(data, dtype=dtype, count=count, offset=offset)
+        message[key] = array.astype(np.float32).reshape(shape)
+        offset += count * dtype.itemsize
+    return message
+
+
+def peer_uid(sock: socket.socket) -> Optional[int]:
+    """
+    Get the user ID of the process at the other end of a Unix socket.
+
+    Args:
+        sock: Connected Unix socket
+
+    Returns:
+        User ID of the peer, or None if the platform does not report it
+    """
+    if not hasattr(socket, "SO_PEERCRED"):
+        return None
+    credentials = sock.getsockopt(socket.SOL_SOCKET, socket.SO_PEERCRED, _PEERCRED.size)
+    _, uid, _ = _PEERCRED.unpack(credentials)
+    return uid
+
+
+def check_server_socket(sock: socket.socket, socket_path: str) -> None:
+    """
+    Check that a connected embedding server runs as the current user.
+
+    Where the platform reports the credentials of socket peers, the user of
+    the server process is checked. Otherwise the socket must be owned by the
+    current user and must not be accessible by other users.
+
+    Args:
+        sock: Socket connected to the server
+        socket_path: Path of the server's socket
+
+    Raises:
+        PermissionError: If the server may belong to another user
+    """
+    uid = peer_uid(sock)
+    if uid is None:
+        status = os.stat(socket_path)
+        if status.st_uid != os.getuid() or status.st_mode & (
+            stat.S_IRWXG | stat.S_IRWXO
+        ):
+            raise PermissionError(
+                f"Embedding server socket '{socket_path}' is accessible by other users"
+            )
+    elif uid != os.getuid():
+        raise PermissionError(
+            f"Embedding server on '{socket_path}' belongs to another user"
+        )
+
+
+def prepare_socket_directory(socket_path: str) -> None:
+    """
+    Create the directory of a socket that only the current user can access.
+
+    A missing directory is created with permissions for its owner only. The
+    default socket directory must additionally be owned by the current user
+    and inaccessible to others if it already exists, since its path in the
+    shared temporary directory is predictable.
+
+    Args:
+        socket_path: Path of the socket
+
+    Raises:
+        PermissionError: If the default socket directory is not private
+    """
+    directory = os.path.dirname(os.path.abspath(socket_path))
+    os.makedirs(directory, mode=stat.S_IRWXU, exist_ok=True)
+
+    if directory != os.path.abspath(DEFAULT_SOCKET_DIR):
+        return
+
+    status = os.lstat(directory)
+    if (
+        not stat.S_ISDIR(status.st_mode)
+        or status.st_uid != os.getuid()
+        or status.st_mode & (stat.S_IRWXG | stat.S_IRWXO)
+    ):
+        raise PermissionError(
+            f"Socket directory '{directory}' must be a directory that only "
+            "the current user can access"
+        )
+
+
+def _receive_exactly(sock: socket.socket, size: int) -> bytes:
+    """
+    Receive an exact number of bytes from a socket.
+
+    Args:
+        sock: Connected socket
+        size: Number of bytes to receive
+
+    Returns:
+        The received bytes
+
+    Raises:
+        ConnectionError: If the peer closed the connection before all bytes arrived
+    """
+    buffer = bytearray(size)
+    view = memoryview(buffer)
+    received = 0
+    while received < size:
+        count = sock.recv_into(view[received:])
+        if count == 0:
+            raise ConnectionError("Connection closed by peer")
+        received += count
+    return bytes(buffer)
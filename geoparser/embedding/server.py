@@ -0,0 +1,327 @@
+import os
+import queue
+import socket
+import socketserver
+import stat
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+from sentence_transformers import SentenceTransformer
+
+from geoparser.embedding.protocol import (
+    DEFAULT_CACHE_SIZE,
+    DEFAULT_SOCKET_PATH,
+    peer_uid,
+    prepare_socket_directory,
+    receive_message,
+    send_message,
+)
+
+
+class EmbeddingServer:
+    """
+    Local server that computes sentence embeddings for several processes.
+
+    The server loads a SentenceTransformer model once and answers embedding
+    requests of EmbeddingClient instances over a Unix socket, so processes
+    using the same model do not each hold a copy of its weights. Embeddings
+    are kept in a cache shared by all clients, so a text embedded for one
+    process is a cache hit for every other process.
+
+    Each client connection is served by its own thread, while a single model
+    thread encodes the texts of all requests that are waiting at the same
+    time as one batch.
+    """
+
+    def __init__(
+        self,
+        model_name: str = "dguzh/geo-all-MiniLM-L6-v2",
+        socket_path: str = DEFAULT_SOCKET_PATH,
+        cache_size: int = DEFAULT_CACHE_SIZE,
+        batch_size: int = 32,
+    ):
+        """
+        Initialize an embedding server and load its model.
+
+        Args:
+            model_name: HuggingFace model name for SentenceTransformer
+            socket_path: Path of the Unix socket to listen on
+            cache_size: Maximum number of embeddings kept in the shared cache
+            batch_size: Batch size used by the model when encoding
+
+        Raises:
+            ValueError: If cache_size is negative or batch_size is not positive
+        """
+        if cache_size < 0:
+            raise ValueError("cache_size must not be negative")
+        if batch_size < 1:
+            raise ValueError("batch_size must be a positive integer")
+
+        self.model_name = model_name
+        self.socket_path = socket_path
+        self.cache_size = cache_size
+        self.batch_size = batch_size
+
+        self.transformer = SentenceTransformer(model_name)
+        self.dimension = self.transformer.get_sentence_embedding_dimension()
+
+        # Least recently used embeddings are evicted first
+        self._cache: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+        # Texts waiting to be encoded by the model thread, with the future
+        # receiving their embeddings; None stops the model thread
+        self._requests: "queue.Queue[Optional[Tuple[List[str], Future]]]" = (
+            queue.Queue()
+        )
+        self._model_thread: Optional[threading.Thread] = None
+        self._server: Optional[socketserver.ThreadingUnixStreamServer] = None
+        self._server_thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """
+        Start listening on the socket in background threads.
+
+        The socket is created in a directory that only the current user can
+        access, and is itself only accessible by the current user from the
+        moment it is bound. Connections of other users are closed unanswered.
+
+        Raises:
+            ValueError: If another server is already listening on the socket
+            PermissionError: If the default socket directory is not private
+        """
+        prepare_socket_directory(self.socket_path)
+        self._remove_stale_socket()
+
+        # Bind with a umask that leaves the socket readable and writable by
+        # its owner only, rather than restricting it after it was created
+        umask = os.umask(stat.S_IRWXG | stat.S_IRWXO | stat.S_IXUSR)
+        try:
+            self._server = _UnixServer(self.socket_path, _Handler, self)
+        finally:
+            os.umask(umask)
+
+        self._model_thread = threading.Thread(target=self._run_model, daemon=True)
+        self._model_thread.start()
+
+        self._server_thread = threading.Thread(
+            target=self._server.serve_forever, daemon=True
+        )
+        self._server_thread.start()
+
+    def serve_forever(self) -> None:
+        """
+        Start the server and block until it is shut down or interrupted.
+        """
+        self.start()
+        try:
+            self._server_thread.join()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self.shutdown()
+
+    def shutdown(self) -> None:
+        """
+        Stop the server, its threads and remove the socket.
+        """
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+        if self._model_thread is not None:
+            self._requests.put(None)
+            self._model_thread.join()
+            self._model_thread = None
+        if os.path.exists(self.socket_path):
+            os.unlink(self.socket_path)
+
+    def __enter__(self) -> "EmbeddingServer":
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.shutdown()
+
+    def encode(self, texts: List[str]) -> np.ndarray:
+        """
+        Get the embeddings of texts, encoding only those not in the cache.
+
+        Args:
+            texts: List of texts to embed
+
+        Returns:
+            Array with one embedding per text
+        """
+        unique_texts = list(dict.fromkeys(texts))
+        embeddings: Dict[str, np.ndarray] = {}
+        with self._cache_lock:
+            for text in unique_texts:
+                embedding = self._cache.get(text)
+                if embedding is not None:
+                    self._cache.move_to_end(text)
+                    embeddings[text] = embedding
+            missing = [text for text in unique_texts if text not in embeddings]
+            self.cache_hits += len(embeddings)
+            self.cache_misses += len(missing)
+
+        if missing:
+            future = Future()
+            self._requests.put((missing, future))
+            embeddings.update(future.result())
+
+        if not texts:
+            return np.empty((0, self.dimension), dtype=np.float32)
+        return np.stack([embeddings[text] for text in texts])
+
+    def info(self) -> Dict[str, Any]:
+        """
+        Describe the model and cache of the server.
+
+        Returns:
+            Dictionary with the model name, maximum sequence length, embedding
+            dimension and cache statistics
+        """
+        with self._cache_lock:
+            cache_entries = len(self._cache)
+        return {
+            "model_name": self.model_name,
+            "max_seq_length": self.transformer.get_max_seq_length(),
+            "dimension": self.dimension,
+            "cache_entries": cache_entries,
+            "cache_hits": self.cache_hits,
+            "cache_misses": self.cache_misses,
+        }
+
+    def _handle(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Answer a request of a client.
+
+        Args:
+            request: Request with an "op" of "encode" or "info"
+
+        Returns:
+            Response with the result, or with an "error" message
+        """
+        try:
+            if request["op"] == "encode":
+                return {"embeddings": self.encode(request["texts"])}
+            if request["op"] == "info":
+                return {"info": self.info()}
+            return {"error": f"Unknown operation: {request['op']}"}
+        except Exception as e:
+            return {"error": f"{type(e).__name__}: {e}"}
+
+    def _run_model(self) -> None:
+        """
+        Encode waiting texts in batches until the server shuts down.
+
+        All requests waiting when the model becomes free are combined, so
+        concurrent clients share model calls.
+        """
+        while True:
+            request = self._requests.get()
+            if request is None:
+                return
+
+            requests = [request]
+            while True:
+                try:
+                    request = self._requests.get_nowait()
+                except queue.Empty:
+                    break
+                if request is None:
+                    self._requests.put(None)
+                    break
+                requests.append(request)
+
+            texts = list(dict.fromkeys(t for texts, _ in requests for t in texts))
+            try:
+                encoded = self.transformer.encode(
+                    texts,
+                    batch_size=self.batch_size,
+                    convert_to_numpy=True,
+                    show_progress_bar=False,
+                )
+            except Exception as e:
+                for _, future in requests:
+                    future.set_exception(e)
+                continue
+
+            embeddings = dict(zip(texts, encoded))
+            self._store(embeddings)
+            for request_texts, future in requests:
+                future.set_result({text: embeddings[text] for text in request_texts})
+
+    def _store(self, embeddings: Dict[str, np.ndarray]) -> None:
+        """
+        Add embeddings to the cache, evicting the least recently used ones.
+
+        Args:
+            embeddings: Embeddings keyed by text
+        """
+        if self.cache_size == 0:
+            return
+        with self._cache_lock:
+            self._cache.update(embeddings)
+            for text in embeddings:
+                self._cache.move_to_end(text)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
+    def _remove_stale_socket(self) -> None:
+        """
+        Remove a socket file left behind by a server that is no longer running.
+
+        Raises:
+            ValueError: If another server is listening on the socket
+        """
+        if not os.path.exists(self.socket_path):
+            return
+
+        probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            probe.connect(self.socket_path)
+        except OSError:
+            os.unlink(self.socket_path)
+        else:
+            raise ValueError(
+                f"An embedding server is already listening on '{self.socket_path}'"
+            )
+        finally:
+            probe.close()
+
+
+class _UnixServer(socketserver.ThreadingUnixStreamServer):
+    """
+    Threading Unix socket server with access to its embedding server.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, socket_path: str, handler, embedding_server: EmbeddingServer):
+        self.embedding_server = embedding_server
+        super().__init__(socket_path, handler)
+
+
+class _Handler(socketserver.BaseRequestHandler):
+    """
+    Answer the requests of one client connection until it is closed.
+    """
+
+    def handle(self) -> None:
+        uid = peer_uid(self.request)
+        if uid is not None and uid != os.getuid():
+            return
+
+        while True:
+            try:
+                request = receive_message(self.request)
+            except (ConnectionError, OSError, ValueError):
+                return
+            send_message(self.request, self.server.embedding_server._handle(request))
@@ -1,2 +1,17 @@
-from geoparser.gazetteer.gazetteer import Gazetteer
-from geoparser.gazetteer.installer import GazetteerInstaller
+# Use a lazy-loading approach, so that querying gazetteers does not import
+# the data processing libraries needed by the installer
+from importlib import import_module
+
+# Define a mapping of public classes to their import paths
+_CLASS_PATHS = {
+    "Gazetteer": "geoparser.gazetteer.gazetteer",
+    "GazetteerInstaller": "geoparser.gazetteer.installer",
+}
+
+
+def __getattr__(name):
+    """Lazy-load classes only when they are accessed."""
+    if name in _CLASS_PATHS:
+        module = import_module(_CLASS_PATHS[name])
+        return getattr(module, name)
+    raise AttributeError(f"module 'geoparser.gazetteer' has no attribute '{name}'")
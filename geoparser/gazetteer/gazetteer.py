@@ -1,13 +1,27 @@
 from __future__ import annotations
 
 import re
-from typing import List
+import threading
+import uuid
+from datetime import datetime
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
+import shapely
+from shapely import STRtree
 
 from geoparser.db.crud.feature import FeatureRepository
 from geoparser.db.crud.gazetteer import GazetteerRepository
-from geoparser.db.db import create_db_and_tables, get_session
+from geoparser.db.db import create_db_and_tables, get_session, read_session
 from geoparser.db.models.feature import Feature
 
+# Spatial indices over the polygonal features of each gazetteer, built lazily
+# on the first reverse lookup and kept for the lifetime of the process. Keyed
+# by gazetteer record and installation time, so a reinstall gets a fresh index.
+_BoundaryIndex = Tuple[STRtree, List[int], List[float]]
+_boundary_indices: Dict[Tuple[uuid.UUID, datetime], _BoundaryIndex] = {}
+_boundary_indices_lock = threading.Lock()
+
 
 class Gazetteer:
     """
@@ -37,6 +51,8 @@ class Gazetteer:
             if gazetteer_record is None or gazetteer_record.installed_at is None:
                 raise ValueError(f"Gazetteer '{gazetteer_name}' is not installed.")
 
+            self._installation = (gazetteer_record.id, gazetteer_record.installed_at)
+
         self.gazetteer_name = gazetteer_name
 
     def search(
@@ -79,7 +95,7 @@ class Gazetteer:
         if method not in method_map:
             raise ValueError(f"Unknown search method: {method}")
 
-        with get_session() as session:
+        with read_session() as session:
             return method_map[method](session)
 
     def find(self, identifier: str) -> Feature | None:
@@ -96,3 +112,140 @@ class Gazetteer:
             return FeatureRepository.get_by_gazetteer_and_identifier(
                 session, self.gazetteer_name, identifier
             )
+
+    def coordinates(
+        self, feature_ids: Sequence[int], native: bool = False
+    ) -> np.ndarray:
+        """
+        Get the coordinates of multiple features with a single query.
+
+        Coordinates are the representative points of the feature geometries,
+        computed once at install time, so no geometries are parsed or
+        reprojected here.
+
+        Args:
+            feature_ids: IDs of the features
+            native: Whether to return coordinates in the reference system the
+                gazetteer stores its geometries in (e.g. LV95 for SwissNames3D)
+                instead of WGS84 longitude/latitude
+
+        Returns:
+            Array of shape (n, 2) with one (x, y) row per feature ID, i.e.
+            (longitude, latitude) unless native is set. Rows of features
+            without a geometry are NaN.
+        """
+        with get_session() as session:
+            rows = FeatureRepository.get_coordinates_by_ids(
+                session, list(feature_ids), native=native
+            )
+        coordinates_by_id = {feature_id: (x, y) for feature_id, x, y in rows}
+
+        return np.array(
+            [
+                coordinates_by_id.get(feature_id, (None, None))
+                for feature_id in feature_ids
+            ],
+            dtype=float,
+        ).reshape(-1, 2)
+
+    def geometries(self, feature_ids: Sequence[int]) -> np.ndarray:
+        """
+        Get the geometries of multiple features with a single query per source.
+
+        WKT is parsed in one vectorized call, which is considerably faster than
+        accessing ``Feature.geometry`` for each feature individually.
+
+        Args:
+            feature_ids: IDs of the features
+
+        Returns:
+            Array of Shapely geometries aligned with feature_ids, with None for
+            features without a geometry
+        """
+        with get_session() as session:
+            wkt_by_id = FeatureRepository.get_geometries_by_ids(
+                session, list(feature_ids)
+            )
+
+        return shapely.from_wkt(
+            np.array(
+                [wkt_by_id.get(feature_id) for feature_id in feature_ids], dtype=object
+            )
+        )
+
+    def reverse(self, points: Sequence[Sequence[float]]) -> List[List[Feature]]:
+        """
+        Find the features whose areas contain each of the given points.
+
+        Point-in-polygon tests run against an in-memory STRtree over all
+        polygonal features of the gazetteer (e.g. municipalities, districts
+        and cantons), which is built from the stored geometries on first use
+        and then shared by all instances in the process. This allows large
+        batches of coordinates to be annotated with their administrative
+        hierarchy at once.
+
+        Args:
+            points: Sequence of (x, y) coordinates, or an array of shape (n, 2).
+                Coordinates must be in the reference system the gazetteer
+                stores its geometries in (e.g. longitude/latitude for GeoNames,
+                LV95 for SwissNames3D).
+
+        Returns:
+            List with one entry per point, each a list of the features that
+            contain the point, ordered from the smallest to the largest area.
+            Points on the boundary of an area count as contained, so points
+            on a shared border match the features on both sides.
+        """
+        if len(points) == 0:
+            return []
+
+        point_geometries = shapely.points(points)
+        tree, feature_ids, areas = self._get_boundary_index()
+
+        point_indices, tree_indices = tree.query(
+            point_geometries, predicate="covered_by"
+        )
+        matches = sorted(
+            zip(point_indices.tolist(), tree_indices.tolist()),
+            key=lambda match: (match[0], areas[match[1]]),
+        )
+
+        with get_session() as session:
+            features = FeatureRepository.get_by_ids(
+                session, list({feature_ids[tree_index] for _, tree_index in matches})
+            )
+        features_by_id = {feature.id: feature for feature in features}
+
+        results = [[] for _ in range(len(point_geometries))]
+        for point_index, tree_index in matches:
+            results[point_index].append(features_by_id[feature_ids[tree_index]])
+
+        return results
+
+    def _get_boundary_index(self) -> _BoundaryIndex:
+        """
+        Get the spatial index over the polygonal features of this gazetteer.
+
+        Returns:
+            Tuple of (STRtree, feature IDs, areas), where the feature IDs and
+            areas are aligned with the geometries in the tree
+        """
+        # Threads wait for an index being built instead of building it again
+        with _boundary_indices_lock:
+            if self._installation not in _boundary_indices:
+                with read_session() as session:
+                    polygons = FeatureRepository.get_polygons_by_gazetteer(
+                        session, self.gazetteer_name
+                    )
+
+                feature_ids = [feature_id for feature_id, _ in polygons]
+                geometries = shapely.from_wkt([geometry for _, geometry in polygons])
+                areas = shapely.area(geometries).tolist()
+
+                _boundary_indices[self._installation] = (
+                    STRtree(geometries),
+                    feature_ids,
+                    areas,
+                )
+
+            return _boundary_indices[self._installation]
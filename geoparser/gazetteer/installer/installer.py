@@ -1,21 +1,28 @@
 import warnings
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import List, Union
+from typing import List, Optional, Union
 
 from appdirs import user_data_dir
 
 from geoparser.db.crud.feature import FeatureRepository
 from geoparser.db.crud.gazetteer import GazetteerRepository
 from geoparser.db.crud.name import NameRepository
-from geoparser.db.db import create_db_and_tables, get_session, optimized_writes
+from geoparser.db.db import (
+    create_db_and_tables,
+    gazetteer_installation,
+    gazetteer_schema,
+    get_session,
+    optimized_writes,
+)
 from geoparser.db.models.gazetteer import GazetteerCreate, GazetteerUpdate
 from geoparser.gazetteer.installer.model import GazetteerConfig, SourceConfig
 from geoparser.gazetteer.installer.stages.acquisition import AcquisitionStage
+from geoparser.gazetteer.installer.stages.coordinates import CoordinatesStage
 from geoparser.gazetteer.installer.stages.indexing import IndexingStage
 from geoparser.gazetteer.installer.stages.ingestion import IngestionStage
 from geoparser.gazetteer.installer.stages.registration import RegistrationStage
-from geoparser.gazetteer.installer.stages.schema import SchemaStage
+from geoparser.gazetteer.installer.stages.schema import VIEW_SUFFIX, SchemaStage
 from geoparser.gazetteer.installer.stages.spatial import SpatialStage
 from geoparser.gazetteer.installer.stages.transformation import TransformationStage
 from geoparser.gazetteer.installer.stages.view import ViewStage
@@ -53,6 +60,7 @@ class GazetteerInstaller:
     6. View: Create database views
     7. Indexing: Create database indices
     8. Registration: Register features and names
+    9. Coordinates: Store representative point coordinates of features
 
     Each stage is independent and testable, with well-defined
     responsibilities and interfaces.
@@ -100,10 +108,11 @@ class GazetteerInstaller:
         pipeline = self._create_pipeline(config, downloads_dir, chunksize)
 
         # Tune connections for throughput while loading the gazetteer data
-        with optimized_writes():
+        # into the gazetteer's own database file
+        with optimized_writes(), gazetteer_installation(config.name) as schema:
             # Execute pipeline for each source
             for source in ordered_sources:
-                self._execute_pipeline(source, pipeline)
+                self._execute_pipeline(source, pipeline, schema)
 
         feature_count, name_count = self._count_registered_entries(config.name)
         print_gazetteer_summary(feature_count, name_count)
@@ -115,6 +124,58 @@ class GazetteerInstaller:
         if not keep_downloads:
             pipeline[0].cleanup()  # AcquisitionStage has cleanup method
 
+    def backfill_coordinates(
+        self, config_path: Union[str, Path], chunksize: int = CHUNKSIZE
+    ) -> None:
+        """
+        Compute the feature coordinates of an installed gazetteer.
+
+        Databases created before features had coordinates are upgraded with
+        empty coordinate columns. This runs only the coordinates stage on the
+        installed source data, so the gazetteer does not need to be
+        downloaded and installed again.
+
+        Args:
+            config_path: Path to the YAML configuration file of the gazetteer
+            chunksize: Number of features to process at once
+
+        Raises:
+            ValueError: If the gazetteer is not installed
+        """
+        create_db_and_tables()
+
+        config = GazetteerConfig.from_yaml(config_path)
+        source_map = {source.name: source for source in config.sources}
+        stage = CoordinatesStage(source_map, chunksize)
+
+        with get_session() as session:
+            gazetteer_record = GazetteerRepository.get_by_name(session, config.name)
+            if gazetteer_record is None:
+                raise ValueError(f"Gazetteer '{config.name}' is not installed")
+            source_ids = {source.name: source.id for source in gazetteer_record.sources}
+
+        for source in config.sources:
+            if source.features is None:
+                continue
+
+            # Sources are recorded under their view if they have one, qualified
+            # with the schema of the gazetteer file unless they were installed
+            # into the main database
+            table_name = f"{source.name}{VIEW_SUFFIX}" if source.view else source.name
+            for source_name in (
+                f"{gazetteer_schema(config.name)}.{table_name}",
+                table_name,
+            ):
+                if source_name in source_ids:
+                    stage.execute(
+                        source,
+                        {
+                            "table_name": source_name,
+                            "source_id": source_ids[source_name],
+                        },
+                    )
+                    break
+
     def _create_downloads_directory(self, gazetteer_name: str) -> Path:
         """
         Create and return the downloads directory for a gazetteer.
@@ -223,18 +284,22 @@ class GazetteerInstaller:
             ViewStage(),
             IndexingStage(),
             RegistrationStage(config.name, chunksize),
+            CoordinatesStage(source_map, chunksize),
         ]
 
-    def _execute_pipeline(self, source: SourceConfig, pipeline: List) -> None:
+    def _execute_pipeline(
+        self, source: SourceConfig, pipeline: List, schema: Optional[str] = None
+    ) -> None:
         """
         Execute the complete pipeline for a single source.
 
         Args:
             source: Source configuration to process
             pipeline: List of pipeline stages
+            schema: Schema name of the gazetteer's database file, if any
         """
         # Context is shared across all stages for this source
-        context = {}
+        context = {"schema": schema}
 
         # Group all of this source's progress bars under a single source-level
         # bar that tracks how many pipeline steps have completed.
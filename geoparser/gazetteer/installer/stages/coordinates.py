@@ -0,0 +1,214 @@
+from typing import Any, Dict, List, Optional
+
+import pandas as pd
+import shapely
+import sqlalchemy as sa
+from pyproj import Transformer
+
+from geoparser.db.db import get_connection
+from geoparser.gazetteer.installer.model import DataType, SourceConfig
+from geoparser.gazetteer.installer.stages.base import Stage
+from geoparser.gazetteer.installer.utils.chunking import CHUNKSIZE
+from geoparser.gazetteer.installer.utils.progress import create_progress_bar
+
+# Spatial reference system of the stored longitude/latitude columns.
+WGS84_SRID = 4326
+
+
+class CoordinatesStage(Stage):
+    """
+    Stores a representative point for each registered feature.
+
+    The geometry of every feature is parsed once at install time and reduced
+    to a point guaranteed to lie on the geometry (the point itself for point
+    features). Its coordinates are written to numeric columns on the feature
+    table, both in the native reference system of the source and in WGS84,
+    so consumers such as map rendering and distance computations can read
+    coordinates directly instead of parsing and reprojecting WKT per feature.
+    """
+
+    def __init__(self, source_map: Dict[str, SourceConfig], chunksize: int = CHUNKSIZE):
+        """
+        Initialize the coordinates stage.
+
+        Args:
+            source_map: Mapping of source name to its configuration, used to
+                resolve the spatial reference system of each geometry column
+            chunksize: Number of features to process at once
+        """
+        super().__init__(
+            name="Coordinates",
+            description="Compute feature coordinates",
+        )
+        self.source_map = source_map
+        self.chunksize = chunksize
+
+    def execute(self, source: SourceConfig, context: Dict[str, Any]) -> None:
+        """
+        Compute and store the coordinates of a source's features.
+
+        Args:
+            source: Source configuration
+            context: Shared context (must contain 'table_name' and, for
+                sources with features, 'source_id' from registration)
+        """
+        if source.features is None or "source_id" not in context:
+            return
+
+        srid = self._get_geometry_srid(source)
+        if srid is None:
+            return
+
+        # Geometries are read from the same table or view as Feature.geometry
+        registration_table = context.get("view_name") or context["table_name"]
+
+        self._store_coordinates(
+            registration_table,
+            source.features.identifier[0].column.column,
+            context["source_id"],
+            srid,
+        )
+
+    def _get_geometry_srid(self, source: SourceConfig) -> Optional[int]:
+        """
+        Resolve the SRID of the geometry column features are registered with.
+
+        For sources with a view, the geometry column may originate from any of
+        the joined sources, so the view selection is followed to the source
+        that defines it.
+
+        Args:
+            source: Source configuration
+
+        Returns:
+            The SRID of the geometry column, or None if there is none
+        """
+        source_name, column_name = source.name, "geometry"
+
+        if source.view is not None:
+            for select in source.view.select:
+                if (select.alias or select.column.column) == "geometry":
+                    source_name = select.column.source
+                    column_name = select.column.column
+                    break
+            else:
+                return None
+
+        geometry_source = self.source_map.get(source_name, source)
+        attributes = (
+            geometry_source.attributes.original + geometry_source.attributes.derived
+        )
+
+        for attr in attributes:
+            if attr.name == column_name and attr.type == DataType.GEOMETRY:
+                return attr.srid
+
+        return None
+
+    def _store_coordinates(
+        self,
+        table_name: str,
+        identifier_column: str,
+        source_id: int,
+        srid: int,
+    ) -> None:
+        """
+        Compute representative points and write them to the feature table.
+
+        Geometries are read in a single pass over the table, in which each
+        row is matched to its feature through the index on the feature's
+        identifier value. Identifiers are compared as text, as during
+        registration. Comparing the cast identifier cannot use an index on
+        the table, so reading features in id-bounded chunks would scan the
+        whole table once per chunk. Points are computed and reprojected in
+        vectorized calls per chunk of rows, using a single transformer for
+        the whole source.
+
+        Args:
+            table_name: Name of the table or view holding the geometries
+            identifier_column: Name of the location identifier column
+            source_id: ID of the source record
+            srid: SRID of the geometry column
+        """
+        transformer = (
+            Transformer.from_crs(f"EPSG:{srid}", f"EPSG:{WGS84_SRID}", always_xy=True)
+            if srid != WGS84_SRID
+            else None
+        )
+
+        with get_connection() as connection:
+            total = connection.execute(
+                sa.text("SELECT COUNT(*) FROM feature WHERE source_id = :source_id"),
+                {"source_id": source_id},
+            ).scalar()
+
+            if not total:
+                return
+
+            rows = connection.execution_options(
+                stream_results=True, yield_per=self.chunksize
+            ).execute(
+                sa.text(
+                    f"SELECT feature.id AS id, {table_name}.geometry AS geometry "
+                    f"FROM {table_name} JOIN feature "
+                    f"ON feature.source_id = :source_id "
+                    f"AND feature.location_id_value = "
+                    f"CAST({table_name}.{identifier_column} AS TEXT) "
+                    f"WHERE {table_name}.geometry IS NOT NULL"
+                ),
+                {"source_id": source_id},
+            )
+
+            with create_progress_bar(
+                total,
+                f"Locating {table_name}",
+                "features",
+            ) as pbar:
+                for chunk in rows.partitions(self.chunksize):
+                    frame = pd.DataFrame(chunk, columns=["id", "geometry"])
+
+                    updates = self._compute_coordinates(frame, transformer)
+                    if updates:
+                        connection.execute(
+                            sa.text(
+                                "UPDATE feature SET longitude = :longitude, "
+                                "latitude = :latitude, x = :x, y = :y WHERE id = :id"
+                            ),
+                            updates,
+                        )
+                        connection.commit()
+
+                    pbar.update(len(chunk))
+
+    def _compute_coordinates(
+        self, frame: pd.DataFrame, transformer: Optional[Transformer]
+    ) -> List[Dict[str, Any]]:
+        """
+        Compute native and WGS84 coordinates of representative points.
+
+        Args:
+            frame: DataFrame with 'id' and 'geometry' (WKT) columns
+            transformer: Transformer to WGS84, or None if already in WGS84
+
+        Returns:
+            List of parameter dictionaries for the feature update statement
+        """
+        geometries = shapely.from_wkt(frame["geometry"].to_numpy(), on_invalid="ignore")
+        valid = ~(shapely.is_missing(geometries) | shapely.is_empty(geometries))
+
+        points = shapely.point_on_surface(geometries[valid])
+        x, y = shapely.get_x(points), shapely.get_y(points)
+        longitude, latitude = transformer.transform(x, y) if transformer else (x, y)
+
+        return [
+            {
+                "id": feature_id,
+                "longitude": float(lon),
+                "latitude": float(lat),
+                "x": float(px),
+                "y": float(py),
+            }
+            for feature_id, lon, lat, px, py in zip(
+                frame["id"].to_numpy()[valid].tolist(), longitude, latitude, x, y
+            )
+        ]
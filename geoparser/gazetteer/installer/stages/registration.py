@@ -1,11 +1,11 @@
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 import sqlalchemy as sa
 
 from geoparser.db.crud.gazetteer import GazetteerRepository
 from geoparser.db.crud.source import SourceRepository
 from geoparser.db.db import get_connection, get_session
-from geoparser.db.models.source import SourceCreate
+from geoparser.db.models.source import SourceCreate, SourceUpdate
 from geoparser.gazetteer.installer.model import SourceConfig
 from geoparser.gazetteer.installer.queries.dml import FeatureRegistrationBuilder
 from geoparser.gazetteer.installer.stages.base import Stage
@@ -49,7 +49,8 @@ class RegistrationStage(Stage):
 
         Args:
             source: Source configuration
-            context: Shared context (must contain 'table_name' and 'view_name')
+            context: Shared context (must contain 'table_name' and 'view_name',
+                and 'schema' if the gazetteer has its own database file)
         """
         if source.features is None:
             return
@@ -61,24 +62,40 @@ class RegistrationStage(Stage):
         source_record = self._ensure_source_record(
             registration_table,
             source.features.identifier[0].column.column,
+            context.get("schema"),
         )
 
         self._register_features(source, source_record.id)
         self._register_names(source, source_record.id)
 
-    def _ensure_source_record(self, table_name: str, location_id_name: str):
+        context["source_id"] = source_record.id
+
+    def _ensure_source_record(
+        self,
+        table_name: str,
+        location_id_name: str,
+        schema: Optional[str] = None,
+    ):
         """
         Ensure a Source record exists in the database.
 
-        Creates a new source record if it doesn't already exist.
+        Creates a new source record if it doesn't already exist. For gazetteers
+        with their own database file, the recorded name is qualified with the
+        schema the file is attached under. When a gazetteer is reinstalled
+        into a database from a version that kept the source tables in the
+        main database, its unqualified record is renamed, so the features
+        referenced by existing projects are kept.
 
         Args:
             table_name: Name of the table or view
             location_id_name: Name of the location identifier column
+            schema: Schema name of the gazetteer's database file, if any
 
         Returns:
             Source record
         """
+        source_name = f"{schema}.{table_name}" if schema else table_name
+
         with get_session() as session:
             # Get gazetteer record
             gazetteer_record = GazetteerRepository.get_by_name(
@@ -87,12 +104,23 @@ class RegistrationStage(Stage):
 
             # Try to get existing source
             source_record = SourceRepository.get_by_gazetteer_and_name(
-                session, gazetteer_record.id, table_name
+                session, gazetteer_record.id, source_name
             )
 
+            if source_record is None and schema:
+                legacy_record = SourceRepository.get_by_gazetteer_and_name(
+                    session, gazetteer_record.id, table_name
+                )
+                if legacy_record is not None:
+                    source_record = SourceRepository.update(
+                        session,
+                        db_obj=legacy_record,
+                        obj_in=SourceUpdate(id=legacy_record.id, name=source_name),
+                    )
+
             if source_record is None:
                 source_create = SourceCreate(
-                    name=table_name,
+                    name=source_name,
                     location_id_name=location_id_name,
                     gazetteer_id=gazetteer_record.id,
                 )
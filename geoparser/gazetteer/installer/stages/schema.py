@@ -76,6 +76,8 @@ class SchemaStage(Stage):
         view_name = f"{table_name}{VIEW_SUFFIX}"
 
         with get_connection() as connection:
-            connection.execute(sa.text(f"DROP VIEW IF EXISTS {view_name}"))
-            connection.execute(sa.text(f"DROP TABLE IF EXISTS {table_name}"))
+            # Qualify with "main" so that a gazetteer installed into its own
+            # file never drops a same-named table of the attached main database
+            connection.execute(sa.text(f"DROP VIEW IF EXISTS main.{view_name}"))
+            connection.execute(sa.text(f"DROP TABLE IF EXISTS main.{table_name}"))
             connection.commit()
@@ -57,7 +57,7 @@ class ViewStage(Stage):
             create_sql = self.view_builder.build_create_view(source, view_name)
 
             with get_connection() as connection:
-                connection.execute(sa.text(f"DROP VIEW IF EXISTS {view_name}"))
+                connection.execute(sa.text(f"DROP VIEW IF EXISTS main.{view_name}"))
                 connection.execute(sa.text(create_sql))
                 connection.commit()
 
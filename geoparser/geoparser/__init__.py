@@ -1 +1,2 @@
 from geoparser.geoparser.geoparser import Geoparser
+from geoparser.geoparser.results import ParsedDocument, ParsedToponym
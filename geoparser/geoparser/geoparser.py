@@ -1,11 +1,19 @@
 import uuid
 import warnings
-from typing import List, Optional, Union
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from typing import Iterable, Iterator, List, Optional, Tuple, Union
 
 from geoparser.db.models import Document
+from geoparser.db.models.validators import normalize_newlines
+from geoparser.geoparser.results import ParsedDocument, ParsedToponym
 from geoparser.modules.recognizers import Recognizer
 from geoparser.modules.resolvers import Resolver
 from geoparser.project import Project
+from geoparser.project.pipeline import PIPELINE_QUEUE_SIZE, run_pipeline
+from geoparser.services.executors import run_database, run_inference
+from geoparser.tracing import span
 
 # Sentinel value to distinguish "not provided" from "explicitly None"
 _UNSET = object()
@@ -17,6 +25,8 @@ class Geoparser:
 
     Provides a simple parse method for processing texts with configured recognizer and resolver.
     The Geoparser creates a new project for each parse operation, making it stateless by default.
+    In-memory parsing skips the project entirely and only reads from the gazetteer, and
+    a single Geoparser can serve in-memory parse calls from several threads at once.
     """
 
     def __init__(
@@ -25,6 +35,7 @@ class Geoparser:
         resolver: Optional[Resolver] = _UNSET,
         spacy_model: Optional[str] = None,
         transformer_model: Optional[str] = None,
+        workers: int = 1,
     ):
         """
         Initialize a Geoparser instance.
@@ -40,7 +51,16 @@ class Geoparser:
                         Use SpacyRecognizer(model_name='...') instead.
             transformer_model: (Deprecated) Name of transformer model to use.
                               Use SentenceTransformerResolver(model_name='...') instead.
+            workers: Number of threads that in-memory parsing splits the texts of each
+                     call across (default: 1). The recognizer and resolver are shared
+                     by all threads, so the models are only loaded once.
+
+        Raises:
+            ValueError: If workers is not positive
         """
+        if workers < 1:
+            raise ValueError("workers must be a positive integer")
+
         # Handle legacy parameters with deprecation warning
         self._warn_deprecated_parameters(spacy_model, transformer_model)
 
@@ -72,6 +92,35 @@ class Geoparser:
             # Resolver explicitly provided (could be None to skip)
             self.resolver = resolver
 
+        # Thread pool for in-memory parsing; threads are started on first use
+        # and stopped by close() or once the Geoparser is garbage collected
+        self.workers = workers
+        self._executor = None
+        self._shutdown_executor = None
+        if workers > 1:
+            self._executor = ThreadPoolExecutor(max_workers=workers)
+            self._shutdown_executor = weakref.finalize(
+                self, self._executor.shutdown, wait=False
+            )
+
+    def close(self) -> None:
+        """
+        Stop the worker threads of in-memory parsing.
+
+        Waits for running parse calls to finish. Parsing remains possible
+        afterwards, but runs on the calling thread only.
+        """
+        if self._executor is not None:
+            self._shutdown_executor.detach()
+            self._executor.shutdown()
+            self._executor = None
+
+    def __enter__(self) -> "Geoparser":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
     @staticmethod
     def _warn_deprecated_parameters(
         spacy_model: Optional[str], transformer_model: Optional[str]
@@ -139,7 +188,12 @@ class Geoparser:
             warnings.simplefilter("always", DeprecationWarning)
             warnings.warn("\n".join(warning_parts), DeprecationWarning, stacklevel=3)
 
-    def parse(self, texts: Union[str, List[str]], save: bool = False) -> List[Document]:
+    def parse(
+        self,
+        texts: Union[str, List[str]],
+        save: bool = False,
+        in_memory: bool = False,
+    ) -> Union[List[Document], List[ParsedDocument]]:
         """
         Parse one or more texts with the configured recognizer and resolver.
 
@@ -147,41 +201,349 @@ class Geoparser:
         and returns the results. By default, the project is deleted after processing
         to keep the parse method stateless.
 
+        With in_memory=True, the recognizer and resolver are run directly on the
+        texts and no project, documents or results are written to the database.
+        The returned ParsedDocument objects expose the same text, toponyms and
+        location attributes, and resolved features are only read from the
+        gazetteer when their location is accessed.
+
+        Args:
+            texts: Either a single document text or a list of texts
+            save: If True, preserve the project after processing. If False (default),
+                  delete the project to maintain stateless behavior.
+            in_memory: If True, parse without creating a project and return
+                       lightweight ParsedDocument objects.
+
+        Returns:
+            List of Document objects with processed references and referents
+            from the configured recognizer and resolver, or ParsedDocument
+            objects if in_memory is True.
+
+        Raises:
+            ValueError: If both save and in_memory are True
+        """
+        with span("geoparser.parse", texts=_count_texts(texts), in_memory=in_memory):
+            if in_memory:
+                if save:
+                    raise ValueError("In-memory parse results cannot be saved")
+                return self._parse_in_memory(texts)
+
+            # Create a new project for this parse operation
+            project_name = uuid.uuid4().hex[:8]
+            project = Project(project_name)
+
+            try:
+                # Create documents in the project
+                project.create_documents(texts)
+
+                # Run the recognizer on all documents (if provided)
+                if self.recognizer is not None:
+                    project.run_recognizer(self.recognizer)
+
+                # Run the resolver on all documents (if provided)
+                if self.resolver is not None:
+                    project.run_resolver(self.resolver)
+
+                # Get all documents with results from our specific recognizer and resolver
+                documents = project.get_documents()
+
+                # If save is True, inform the user about the project name
+                if save:
+                    print(f"Results saved under project name: {project_name}")
+
+                return documents
+
+            finally:
+                # Clean up the project unless the user wants to save it
+                if not save:
+                    project.delete()
+
+    async def aparse(
+        self,
+        texts: Union[str, List[str]],
+        save: bool = False,
+        in_memory: bool = False,
+    ) -> Union[List[Document], List[ParsedDocument]]:
+        """
+        Parse one or more texts without blocking the event loop.
+
+        Works like parse(), but can be awaited from asyncio applications such
+        as web frameworks. Model inference runs on a shared, bounded inference
+        executor and database access on a shared, bounded database executor,
+        so the event loop stays free to serve other requests. Gazetteer
+        lookups for different references of a call overlap on the database
+        executor.
+
         Args:
             texts: Either a single document text or a list of texts
             save: If True, preserve the project after processing. If False (default),
                   delete the project to maintain stateless behavior.
+            in_memory: If True, parse without creating a project and return
+                       lightweight ParsedDocument objects.
 
         Returns:
             List of Document objects with processed references and referents
-            from the configured recognizer and resolver.
+            from the configured recognizer and resolver, or ParsedDocument
+            objects if in_memory is True.
+
+        Raises:
+            ValueError: If both save and in_memory are True
+        """
+        with span("geoparser.aparse", texts=_count_texts(texts), in_memory=in_memory):
+            if in_memory:
+                if save:
+                    raise ValueError("In-memory parse results cannot be saved")
+                return await self._aparse_in_memory(texts)
+
+            # Create a new project for this parse operation
+            project_name = uuid.uuid4().hex[:8]
+            project = await run_database(Project, project_name)
+
+            try:
+                await run_database(project.create_documents, texts)
+
+                if self.recognizer is not None:
+                    await project.arun_recognizer(self.recognizer)
+
+                if self.resolver is not None:
+                    await project.arun_resolver(self.resolver)
+
+                documents = await run_database(project.get_documents)
+
+                if save:
+                    print(f"Results saved under project name: {project_name}")
+
+                return documents
+
+            finally:
+                if not save:
+                    await run_database(project.delete)
+
+    def parse_stream(
+        self,
+        texts: Iterable[str],
+        batch_size: int = 1000,
+        pipelined: bool = False,
+        queue_size: int = PIPELINE_QUEUE_SIZE,
+    ) -> Iterator[ParsedDocument]:
         """
-        # Create a new project for this parse operation
-        project_name = uuid.uuid4().hex[:8]
-        project = Project(project_name)
+        Parse a stream of texts in batches, yielding results as each batch finishes.
+
+        Texts are consumed lazily from any iterable, such as a generator over a
+        large file, and parsed in memory like parse(..., in_memory=True). Only
+        one batch of texts and results is held at a time, so memory stays
+        bounded regardless of the number of texts.
 
-        try:
-            # Create documents in the project
-            project.create_documents(texts)
+        With pipelined=True, reading, recognition and resolution run as
+        concurrent stages, so the recognizer processes batch k+1 while the
+        resolver works on batch k. At most ``queue_size`` batches are then
+        buffered between stages.
+
+        Args:
+            texts: Iterable of document texts
+            batch_size: Number of texts to run through the recognizer and
+                        resolver at once
+            pipelined: If True, overlap recognition and resolution of
+                       consecutive batches
+            queue_size: Maximum number of batches buffered between pipeline stages
 
-            # Run the recognizer on all documents (if provided)
-            if self.recognizer is not None:
-                project.run_recognizer(self.recognizer)
+        Yields:
+            ParsedDocument objects in the order of the input texts
 
-            # Run the resolver on all documents (if provided)
-            if self.resolver is not None:
-                project.run_resolver(self.resolver)
+        Raises:
+            ValueError: If batch_size is not positive
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be a positive integer")
 
-            # Get all documents with results from our specific recognizer and resolver
-            documents = project.get_documents()
+        iterator = iter(texts)
+        batches = iter(lambda: list(islice(iterator, batch_size)), [])
 
-            # If save is True, inform the user about the project name
-            if save:
-                print(f"Results saved under project name: {project_name}")
+        if pipelined:
+            results = run_pipeline(
+                batches, [self._recognize, self._resolve], queue_size=queue_size
+            )
+        else:
+            results = (self._parse_in_memory(batch) for batch in batches)
 
-            return documents
+        for documents in results:
+            yield from documents
 
-        finally:
-            # Clean up the project unless the user wants to save it
-            if not save:
-                project.delete()
+    def _parse_in_memory(self, texts: Union[str, List[str]]) -> List[ParsedDocument]:
+        """
+        Run the recognizer and resolver directly on texts, bypassing the database.
+
+        If the Geoparser has several workers, the texts are split across its
+        thread pool.
+
+        Args:
+            texts: Either a single document text or a list of texts
+
+        Returns:
+            List of ParsedDocument objects in the order of the input texts
+        """
+        if isinstance(texts, str):
+            texts = [texts]
+
+        if self._executor is None or len(texts) < 2:
+            return self._resolve(self._recognize(texts))
+
+        # Split the texts into one contiguous shard per thread
+        shard_size = -(-len(texts) // self.workers)
+        shards = [texts[i : i + shard_size] for i in range(0, len(texts), shard_size)]
+        documents = []
+        for shard_documents in self._executor.map(
+            lambda shard: self._resolve(self._recognize(shard)), shards
+        ):
+            documents.extend(shard_documents)
+        return documents
+
+    async def _aparse_in_memory(
+        self, texts: Union[str, List[str]]
+    ) -> List[ParsedDocument]:
+        """
+        Run the recognizer and resolver on texts without blocking the event loop.
+
+        Recognition runs on the inference executor. Resolution goes through
+        the resolver's apredict(), which keeps gazetteer searches on the
+        database executor and submits only model calls to the inference
+        executor, so other calls can use the model in the meantime.
+
+        Args:
+            texts: Either a single document text or a list of texts
+
+        Returns:
+            List of ParsedDocument objects in the order of the input texts
+        """
+        if isinstance(texts, str):
+            texts = [texts]
+
+        texts, references = await run_inference(self._recognize, texts)
+
+        predicted_referents = [[None] * len(spans) for spans in references]
+        indices = self._resolvable_indices(references)
+        if indices:
+            with span("geoparser.resolve", texts=len(indices)):
+                referents = await self.resolver.apredict(
+                    [texts[i] for i in indices], [references[i] for i in indices]
+                )
+            for i, document_referents in zip(indices, referents):
+                predicted_referents[i] = document_referents
+
+        return self._build_documents(texts, references, predicted_referents)
+
+    def _recognize(
+        self, texts: List[str]
+    ) -> Tuple[List[str], List[List[Tuple[int, int]]]]:
+        """
+        Run the recognizer (if provided) on texts.
+
+        Args:
+            texts: List of document texts
+
+        Returns:
+            Tuple of the normalized texts and the reference spans of each text
+        """
+        # Normalize texts the same way Document does, so that offsets match
+        texts = [normalize_newlines(text) for text in texts]
+
+        with span("geoparser.recognize", texts=len(texts)) as recognize_span:
+            # None means that predictions are not available for a text
+            if self.recognizer is not None and texts:
+                predicted_references = self.recognizer.predict(texts)
+            else:
+                predicted_references = [None] * len(texts)
+            references = [spans or [] for spans in predicted_references]
+            recognize_span.set("references", sum(map(len, references)))
+
+        return texts, references
+
+    def _resolve(
+        self, recognized: Tuple[List[str], List[List[Tuple[int, int]]]]
+    ) -> List[ParsedDocument]:
+        """
+        Run the resolver (if provided) on recognized texts and build the results.
+
+        Args:
+            recognized: Tuple of texts and their reference spans, as returned
+                        by _recognize()
+
+        Returns:
+            List of ParsedDocument objects in the order of the texts
+        """
+        texts, references = recognized
+
+        predicted_referents = [[None] * len(spans) for spans in references]
+        indices = self._resolvable_indices(references)
+        if indices:
+            with span("geoparser.resolve", texts=len(indices)):
+                referents = self.resolver.predict(
+                    [texts[i] for i in indices], [references[i] for i in indices]
+                )
+            for i, document_referents in zip(indices, referents):
+                predicted_referents[i] = document_referents
+
+        return self._build_documents(texts, references, predicted_referents)
+
+    def _resolvable_indices(self, references: List[List[Tuple[int, int]]]) -> List[int]:
+        """
+        Get the indices of the texts to pass to the resolver.
+
+        Only documents that have references are passed to the resolver, and
+        none are if no resolver is provided.
+
+        Args:
+            references: Reference spans of each text
+
+        Returns:
+            Indices of the texts to resolve
+        """
+        if self.resolver is None:
+            return []
+        return [i for i, spans in enumerate(references) if spans]
+
+    @staticmethod
+    def _build_documents(
+        texts: List[str],
+        references: List[List[Tuple[int, int]]],
+        predicted_referents: List[List[Optional[Tuple[str, str]]]],
+    ) -> List[ParsedDocument]:
+        """
+        Build the results of parsing texts in memory.
+
+        Args:
+            texts: List of document texts
+            references: Reference spans of each text
+            predicted_referents: Referents of the references of each text
+
+        Returns:
+            List of ParsedDocument objects in the order of the texts
+        """
+        return [
+            ParsedDocument(
+                text=text,
+                toponyms=[
+                    ParsedToponym(
+                        start=start,
+                        end=end,
+                        text=text[start:end],
+                        referent=tuple(referent) if referent is not None else None,
+                    )
+                    for (start, end), referent in zip(spans, referents)
+                ],
+            )
+            for text, spans, referents in zip(texts, references, predicted_referents)
+        ]
+
+
+def _count_texts(texts: Union[str, List[str]]) -> int:
+    """
+    Count the texts passed to a parse method.
+
+    Args:
+        texts: Either a single document text or a list of texts
+
+    Returns:
+        Number of texts
+    """
+    return 1 if isinstance(texts, str) else len(texts)
@@ -0,0 +1,99 @@
+import typing as t
+from typing import List, Optional, Tuple
+
+from pydantic import BaseModel, PrivateAttr
+
+from geoparser.db.crud import FeatureRepository
+from geoparser.db.db import get_session
+
+if t.TYPE_CHECKING:
+    from geoparser.db.models import Feature
+
+
+class ParsedToponym(BaseModel):
+    """
+    Lightweight toponym produced by an in-memory parse.
+
+    Mirrors the attributes of a Reference without being stored in the
+    database. The resolved feature is only looked up in the gazetteer when
+    its location is first accessed.
+    """
+
+    start: int
+    end: int
+    text: str
+    referent: Optional[Tuple[str, str]] = None  # (gazetteer_name, identifier)
+
+    _feature: Optional["Feature"] = PrivateAttr(default=None)
+    _feature_loaded: bool = PrivateAttr(default=False)
+
+    @property
+    def location(self) -> Optional["Feature"]:
+        """
+        Return the gazetteer feature this toponym was resolved to.
+
+        The feature is loaded from the gazetteer on first access and cached.
+
+        Returns:
+            Referent feature object, or None if the toponym is unresolved
+            or the feature does not exist in the gazetteer
+        """
+        if self.referent is None:
+            return None
+
+        if not self._feature_loaded:
+            gazetteer_name, identifier = self.referent
+            with get_session() as session:
+                self._feature = FeatureRepository.get_by_gazetteer_and_identifier(
+                    session, gazetteer_name, identifier
+                )
+            self._feature_loaded = True
+
+        return self._feature
+
+    def __str__(self) -> str:
+        """
+        Return a string representation of the toponym.
+
+        Returns:
+            String with reference indicator and text content
+        """
+        return f'Reference("{self.text}")'
+
+    def __repr__(self) -> str:
+        """
+        Return a developer representation of the toponym.
+
+        Returns:
+            Same as __str__ method
+        """
+        return self.__str__()
+
+
+class ParsedDocument(BaseModel):
+    """
+    Lightweight document produced by an in-memory parse.
+
+    Mirrors the attributes of a Document without being stored in the database.
+    """
+
+    text: str
+    toponyms: List[ParsedToponym] = []
+
+    def __str__(self) -> str:
+        """
+        Return a string representation of the document.
+
+        Returns:
+            String with document indicator and text content
+        """
+        return f'Document("{self.text}")'
+
+    def __repr__(self) -> str:
+        """
+        Return a developer representation of the document.
+
+        Returns:
+            Same as __str__ method
+        """
+        return self.__str__()
@@ -1,4 +1,6 @@
 import random
+import threading
+import weakref
 from pathlib import Path
 from typing import List, Tuple, Union
 
@@ -6,6 +8,7 @@ import spacy
 from spacy.training import Example
 
 from geoparser.modules.recognizers import Recognizer
+from geoparser.modules.registry import model_registry
 
 
 class SpacyRecognizer(Recognizer):
@@ -14,6 +17,10 @@ class SpacyRecognizer(Recognizer):
 
     This module identifies location-based named entities like GPE (geopolitical entity),
     LOC (location), and FAC (facility) as potential references.
+
+    A recognizer instance can be shared between threads, which then take turns
+    running the spaCy pipeline. Recognizers using the same spaCy model share one
+    loaded pipeline through the process-wide model registry.
     """
 
     NAME = "SpacyRecognizer"
@@ -39,8 +46,17 @@ class SpacyRecognizer(Recognizer):
         # Convert entity_types to set for efficient lookups
         self.entity_types = set(entity_types)
 
-        # Load spaCy model with optimized pipeline
-        self.nlp = self._load_spacy_model()
+        # Get the spaCy model with optimized pipeline from the registry, and
+        # release it once this recognizer is garbage collected
+        self._model_key = ("spacy-ner", model_name)
+        self.nlp = model_registry.acquire(self._model_key, self._load_spacy_model)
+        self._release_model = weakref.finalize(
+            self, model_registry.release, self._model_key, self.nlp
+        )
+
+        # spaCy pipelines are not guaranteed to be thread-safe, so all
+        # recognizers sharing the pipeline take turns
+        self._nlp_lock = model_registry.lock(self._model_key)
 
     def _load_spacy_model(self) -> spacy.language.Language:
         """
@@ -89,7 +105,8 @@ class SpacyRecognizer(Recognizer):
         results = []
 
         # Process documents in batches using spaCy's nlp.pipe for efficiency
-        docs = list(self.nlp.pipe(texts))
+        with self._nlp_lock:
+            docs = list(self.nlp.pipe(texts))
 
         # Extract reference offsets for each document
         for doc in docs:
@@ -132,6 +149,9 @@ class SpacyRecognizer(Recognizer):
         """
         print("Preparing training data from reference annotations...")
 
+        # Train a private copy, since the shared pipeline is used by other recognizers
+        self._detach_model()
+
         # Prepare training data
         examples = self._prepare_training_data(texts, references)
 
@@ -166,6 +186,19 @@ class SpacyRecognizer(Recognizer):
 
         print(f"Model fine-tuning completed and saved to: {output_path}")
 
+    def _detach_model(self) -> None:
+        """
+        Replace the shared spaCy pipeline with a private copy of the model.
+
+        Modifying a pipeline, e.g. by training it, would affect all recognizers
+        sharing it, so the recognizer releases the shared pipeline and loads
+        its own copy first.
+        """
+        if self._release_model.alive:
+            self._release_model()
+            self.nlp = self._load_spacy_model()
+            self._nlp_lock = threading.Lock()
+
     def _get_distilled_label(
         self, start: int, end: int, base_doc: spacy.tokens.Doc
     ) -> str:
@@ -210,9 +243,30 @@ class SpacyRecognizer(Recognizer):
         Returns:
             List of spaCy Example objects for training
         """
-        # Load frozen base pipeline for label distillation
-        base_nlp = self._load_spacy_model()
+        # Use the shared, unmodified pipeline for label distillation
+        base_nlp = model_registry.acquire(self._model_key, self._load_spacy_model)
+        try:
+            return self._create_examples(texts, references, base_nlp)
+        finally:
+            model_registry.release(self._model_key, base_nlp)
 
+    def _create_examples(
+        self,
+        texts: List[str],
+        references: List[List[Tuple[int, int]]],
+        base_nlp: spacy.language.Language,
+    ) -> List[Example]:
+        """
+        Create spaCy training examples with labels distilled from a base pipeline.
+
+        Args:
+            texts: List of document text strings
+            references: List of lists of (start, end) position tuples
+            base_nlp: Frozen base pipeline used for label distillation
+
+        Returns:
+            List of spaCy Example objects for training
+        """
         examples = []
 
         for text, doc_references in zip(texts, references):
@@ -0,0 +1,157 @@
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable
+
+# Number of models kept loaded after their last user released them
+MAX_UNUSED_MODELS = 2
+
+
+class ModelRegistry:
+    """
+    Keyed, reference-counted registry of loaded models shared within a process.
+
+    Modules acquire their models from the registry under a key describing the
+    model, e.g. its type and name. The first acquisition loads the model, and
+    later acquisitions of the same key return the already loaded model, so
+    module instances sharing a model name share its weights and constructing
+    further instances is nearly free.
+
+    Each acquisition must be released once the model is no longer used, e.g.
+    with a weakref.finalize callback of the module holding it. Models
+    without users are kept for reuse, and the least recently used of them are
+    evicted once more than ``max_unused`` unused models are loaded.
+    """
+
+    def __init__(self, max_unused: int = MAX_UNUSED_MODELS):
+        """
+        Initialize a model registry.
+
+        Args:
+            max_unused: Maximum number of models kept loaded without users
+
+        Raises:
+            ValueError: If max_unused is negative
+        """
+        if max_unused < 0:
+            raise ValueError("max_unused must not be negative")
+
+        self.max_unused = max_unused
+        self._models: Dict[Hashable, Any] = {}
+        self._references: Dict[Hashable, int] = {}
+        self._unused: "OrderedDict[Hashable, None]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        # Per-key locks, so that a model is only loaded once while models of
+        # other keys can be acquired in the meantime
+        self._load_locks: Dict[Hashable, threading.Lock] = {}
+
+        # Per-key locks for the users of a model, see lock()
+        self._model_locks: Dict[Hashable, threading.Lock] = {}
+
+    def acquire(self, key: Hashable, load: Callable[[], Any]) -> Any:
+        """
+        Get the model of a key, loading it if it is not loaded yet.
+
+        Args:
+            key: Key identifying the model
+            load: Function loading the model, called only if it is not loaded
+
+        Returns:
+            The shared model
+        """
+        with self._lock:
+            load_lock = self._load_locks.setdefault(key, threading.Lock())
+
+        with load_lock:
+            with self._lock:
+                if key in self._models:
+                    self._references[key] += 1
+                    self._unused.pop(key, None)
+                    return self._models[key]
+
+            model = load()
+
+            with self._lock:
+                self._models[key] = model
+                self._references[key] = 1
+                return model
+
+    def release(self, key: Hashable, model: Any) -> None:
+        """
+        Release an acquisition of a key's model.
+
+        Releasing a model that is no longer registered under the key, e.g.
+        after clear(), has no effect, so that late releases of earlier
+        acquisitions never count against a model loaded afterwards.
+
+        Args:
+            key: Key identifying the model
+            model: The model returned by the acquisition
+        """
+        with self._lock:
+            if self._models.get(key) is not model:
+                return
+
+            self._references[key] -= 1
+            if self._references[key] > 0:
+                return
+
+            self._unused[key] = None
+            while len(self._unused) > self.max_unused:
+                evicted, _ = self._unused.popitem(last=False)
+                del self._models[evicted]
+                del self._references[evicted]
+
+    def lock(self, key: Hashable) -> threading.Lock:
+        """
+        Get the lock that users of a key's model hold while calling it.
+
+        Models that are not thread-safe are shared by all modules acquiring
+        them, so a lock of the modules themselves would not keep modules in
+        different threads from calling the same model at once.
+
+        Args:
+            key: Key identifying the model
+
+        Returns:
+            The lock shared by all users of the key
+        """
+        with self._lock:
+            return self._model_locks.setdefault(key, threading.Lock())
+
+    def references(self, key: Hashable) -> int:
+        """
+        Get the number of current acquisitions of a key's model.
+
+        Args:
+            key: Key identifying the model
+
+        Returns:
+            Number of acquisitions that have not been released
+        """
+        with self._lock:
+            return self._references.get(key, 0)
+
+    def clear(self) -> None:
+        """
+        Drop all models from the registry, whether they are used or not.
+
+        Modules holding a model keep using it, but it is no longer shared with
+        modules created afterwards.
+        """
+        with self._lock:
+            self._models.clear()
+            self._references.clear()
+            self._unused.clear()
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            return key in self._models
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._models)
+
+
+# Registry shared by all modules of the process
+model_registry = ModelRegistry()
@@ -47,3 +47,26 @@ class Resolver(Module):
             etc.). The gazetteer_name identifies which gazetteer the identifier refers to, and the
             identifier is the value used to identify the referent in that gazetteer.
         """
+
+    async def apredict(
+        self, texts: t.List[str], references: t.List[t.List[t.Tuple[int, int]]]
+    ) -> t.List[t.List[t.Union[t.Tuple[str, str], None]]]:
+        """
+        Predict referents without blocking the event loop.
+
+        By default, predict() runs on the shared inference executor. Resolvers
+        that query the database while predicting can override this to run
+        their queries on the shared database executor instead, so that the
+        inference executor only runs model calls.
+
+        Args:
+            texts: List of document text strings
+            references: List of lists of tuples containing (start, end) positions of references
+
+        Returns:
+            Nested list of referents as returned by predict()
+        """
+        # Imported here, so that modules can be imported without the services
+        from geoparser.services.executors import run_inference
+
+        return await run_inference(self.predict, texts, references)
@@ -1,17 +1,28 @@
+import asyncio
+import os
+import threading
 import typing as t
+import weakref
 from pathlib import Path
-from typing import Dict, List, Tuple, Union
+from typing import Dict, List, Optional, Tuple, Union
 
 import spacy
 import torch
-from datasets import Dataset
-from sentence_transformers import SentenceTransformer, SentenceTransformerTrainer
-from sentence_transformers.losses import ContrastiveLoss
-from sentence_transformers.training_args import SentenceTransformerTrainingArguments
-from transformers import AutoTokenizer, logging
+from sentence_transformers import SentenceTransformer
+from transformers import logging
 
+from geoparser.db.db import map_reads
+from geoparser.embedding.client import EmbeddingClient
+from geoparser.embedding.protocol import EMBEDDING_SERVER_ENV
 from geoparser.gazetteer.gazetteer import Gazetteer
+from geoparser.modules.registry import model_registry
 from geoparser.modules.resolvers import Resolver
+from geoparser.services.executors import (
+    run_database,
+    run_inference,
+    submit_inference,
+)
+from geoparser.tracing import span
 
 if t.TYPE_CHECKING:
     from geoparser.db.models.feature import Feature
@@ -27,6 +38,15 @@ class SentenceTransformerResolver(Resolver):
     This resolver extracts contextual information around each reference, generates embeddings
     for the context, retrieves candidate features from the gazetteer, generates location
     descriptions and embeddings for candidates, and finds the best match using cosine similarity.
+
+    A resolver instance can be shared between threads: its caches are protected by a lock,
+    calls into the transformer and spaCy models are serialized, and gazetteer queries use a
+    separate database session per call. Resolvers using the same models share the loaded
+    transformer and spaCy pipeline through the process-wide model registry.
+
+    Instead of loading the transformer itself, the resolver can compute embeddings with a
+    local EmbeddingServer, so that several processes share one copy of the model and one
+    embedding cache.
     """
 
     NAME = "SentenceTransformerResolver"
@@ -63,6 +83,7 @@ class SentenceTransformerResolver(Resolver):
         min_similarity: float = 0.6,
         max_tiers: int = 3,
         attribute_map: dict = None,
+        embedding_server: Optional[str] = None,
     ):
         """
         Initialize the SentenceTransformerResolver.
@@ -76,6 +97,14 @@ class SentenceTransformerResolver(Resolver):
                           If None, will look up gazetteer_name in GAZETTEER_ATTRIBUTE_MAP.
                           If provided, will be used directly.
                           Should have keys: "name", "type", "level1", "level2", "level3"
+            embedding_server: Optional path of the Unix socket of an EmbeddingServer
+                              serving the same model. Defaults to the
+                              GEOPARSER_EMBEDDING_SERVER environment variable. The
+                              server only changes where embeddings are computed, so
+                              it is not part of the resolver's config and ID.
+
+        Raises:
+            ValueError: If the embedding server serves a different model
         """
         # Initialize parent with the parameters
         super().__init__(
@@ -97,12 +126,51 @@ class SentenceTransformerResolver(Resolver):
             gazetteer_name, attribute_map
         )
 
-        # Initialize transformer and tokenizer
-        self.transformer = SentenceTransformer(model_name)
-        self.tokenizer = AutoTokenizer.from_pretrained(model_name)
+        # Get the models from the process-wide registry, so that resolvers
+        # using the same models share them, and release them once this
+        # resolver is garbage collected
+        embedding_server = embedding_server or os.getenv(EMBEDDING_SERVER_ENV)
+        if embedding_server:
+            # Embeddings are computed by the server, which must serve the same
+            # model. Tokens are still counted locally to split long contexts,
+            # so a standalone tokenizer is loaded instead of the transformer.
+            # It is imported here, since only this case needs it.
+            from transformers import AutoTokenizer
+
+            self.transformer = None
+            self.embedding_client = EmbeddingClient(embedding_server)
+            self.embedding_server_info = self.embedding_client.info()
+            if self.embedding_server_info["model_name"] != model_name:
+                raise ValueError(
+                    f"Embedding server at '{embedding_server}' serves model "
+                    f"'{self.embedding_server_info['model_name']}' instead of '{model_name}'"
+                )
+            transformer_key = ("tokenizer", model_name)
+            self.tokenizer = model_registry.acquire(
+                transformer_key, lambda: AutoTokenizer.from_pretrained(model_name)
+            )
+            shared_model = self.tokenizer
+        else:
+            # The tokenizer of the transformer is used to count tokens
+            self.embedding_client = None
+            transformer_key = ("sentence-transformer", model_name)
+            self.transformer = model_registry.acquire(
+                transformer_key, lambda: SentenceTransformer(model_name)
+            )
+            self.tokenizer = self.transformer.tokenizer
+            shared_model = self.transformer
+        self._release_transformer = weakref.finalize(
+            self, model_registry.release, transformer_key, shared_model
+        )
 
-        # Initialize spaCy model for sentence splitting
-        self.nlp = self._load_spacy_model("xx_sent_ud_sm")
+        # spaCy model for sentence splitting
+        nlp_key = ("spacy", "xx_sent_ud_sm")
+        self.nlp = model_registry.acquire(
+            nlp_key, lambda: self._load_spacy_model("xx_sent_ud_sm")
+        )
+        self._release_nlp = weakref.finalize(
+            self, model_registry.release, nlp_key, self.nlp
+        )
 
         # Initialize gazetteer
         self.gazetteer = Gazetteer(gazetteer_name)
@@ -117,6 +185,16 @@ class SentenceTransformerResolver(Resolver):
             {}
         )  # feature_id -> embedding
 
+        # Locks for sharing the resolver between threads. Models are called by
+        # one thread at a time (fast tokenizers fail on concurrent use, and
+        # torch parallelizes each call internally), while candidate search and
+        # context extraction of other threads proceed in the meantime. The
+        # model locks come from the registry, since other resolvers may share
+        # the same models.
+        self._cache_lock = threading.Lock()
+        self._transformer_lock = model_registry.lock(transformer_key)
+        self._nlp_lock = model_registry.lock(nlp_key)
+
     def _validate_and_set_attribute_map(
         self, gazetteer_name: str, attribute_map: dict = None
     ) -> dict:
@@ -187,35 +265,59 @@ class SentenceTransformerResolver(Resolver):
         if not texts:
             return []
 
+        with span(
+            "resolver.predict",
+            texts=len(texts),
+            references=sum(map(len, references)),
+        ) as predict_span:
+            results = self._search(texts, references)
+            predict_span.set(
+                "resolved",
+                sum(r is not None for doc_results in results for r in doc_results),
+            )
+
+        return results
+
+    def _search(
+        self, texts: t.List[str], references: t.List[t.List[t.Tuple[int, int]]]
+    ) -> t.List[t.List[t.Union[t.Tuple[str, str], None]]]:
+        """
+        Resolve references by searching with increasingly permissive methods.
+
+        Args:
+            texts: List of document text strings
+            references: List of lists of tuples containing (start, end) positions of references
+
+        Returns:
+            Nested list of referents as returned by predict()
+        """
         # Step 1: Extract contexts for all references
         contexts = self._extract_contexts(texts, references)
 
-        # Step 2: Embed all contexts
-        self._embed_contexts(contexts)
-
         # Initialize tracking structures (nested by document)
         results = [[None for _ in doc_refs] for doc_refs in references]
         candidates = [[[] for _ in doc_refs] for doc_refs in references]
 
-        # Define search methods in order of preference
-        search_methods = [
-            "exact",
-            "phrase",
-            "partial",
-            "fuzzy",
-        ]
-
-        # Iterative search strategy with increasing tiers
-        for tiers in range(1, self.max_tiers + 1):
-            for method in search_methods:
-                # Skip exact method for tiers > 1
-                if method == "exact" and tiers > 1:
-                    continue
-
-                # Step 3: Gather candidates for unresolved references
-                self._gather_candidates(
-                    texts, references, candidates, results, method, tiers
-                )
+        # Step 2: Embed all contexts on the inference executor, overlapping the
+        # encoding with fetching the first candidates from the gazetteer
+        context_embedding = submit_inference(self._embed_contexts, contexts)
+        self._gather_candidates(
+            texts, references, candidates, results, "exact", tiers=1
+        )
+        context_embedding.result()
+        prefetched = True
+
+        # Iterative search strategy with increasingly permissive steps
+        for method, tiers in self._search_steps():
+            with span("resolver.search", method=method, tiers=tiers):
+                # Step 3: Gather candidates for unresolved references (the
+                # candidates of the first search were fetched in step 2)
+                if prefetched:
+                    prefetched = False
+                else:
+                    self._gather_candidates(
+                        texts, references, candidates, results, method, tiers
+                    )
 
                 # Step 4: Embed new candidates
                 self._embed_candidates(candidates, results)
@@ -225,18 +327,114 @@ class SentenceTransformerResolver(Resolver):
                     contexts, candidates, results, self.min_similarity
                 )
 
-                # If all references resolved, we can stop
-                if all(
-                    all(r is not None for r in doc_results) for doc_results in results
-                ):
-                    break
-
             # If all references resolved, we can stop
             if all(all(r is not None for r in doc_results) for doc_results in results):
                 break
 
         return results
 
+    def _search_steps(self) -> t.Iterator[t.Tuple[str, int]]:
+        """
+        Get the search methods and tiers in the order they are tried.
+
+        Searches start with restrictive methods and expand to less restrictive
+        ones, then repeat the methods with more rank tiers. Exact search is
+        only used with a single tier.
+
+        Yields:
+            Tuples of search method and number of tiers
+        """
+        for tiers in range(1, self.max_tiers + 1):
+            for method in ("exact", "phrase", "partial", "fuzzy"):
+                if method == "exact" and tiers > 1:
+                    continue
+                yield method, tiers
+
+    async def apredict(
+        self, texts: t.List[str], references: t.List[t.List[t.Tuple[int, int]]]
+    ) -> t.List[t.List[t.Union[t.Tuple[str, str], None]]]:
+        """
+        Predict referents without blocking the event loop.
+
+        Works like predict(), but only context extraction and the model calls
+        run on the shared inference executor. Gazetteer searches and the
+        candidate descriptions run concurrently on the shared database
+        executor, so they do not occupy the inference thread.
+
+        Args:
+            texts: List of document text strings
+            references: List of lists of tuples containing (start, end) positions of references
+
+        Returns:
+            Nested list of referents as returned by predict()
+        """
+        if not texts:
+            return []
+
+        with span(
+            "resolver.predict",
+            texts=len(texts),
+            references=sum(map(len, references)),
+        ) as predict_span:
+            results = await self._asearch(texts, references)
+            predict_span.set(
+                "resolved",
+                sum(r is not None for doc_results in results for r in doc_results),
+            )
+
+        return results
+
+    async def _asearch(
+        self, texts: t.List[str], references: t.List[t.List[t.Tuple[int, int]]]
+    ) -> t.List[t.List[t.Union[t.Tuple[str, str], None]]]:
+        """
+        Resolve references like _search(), dispatching each step to its executor.
+
+        Args:
+            texts: List of document text strings
+            references: List of lists of tuples containing (start, end) positions of references
+
+        Returns:
+            Nested list of referents as returned by predict()
+        """
+        contexts = await run_inference(self._extract_contexts, texts, references)
+
+        results = [[None for _ in doc_refs] for doc_refs in references]
+        candidates = [[[] for _ in doc_refs] for doc_refs in references]
+
+        # Embed the contexts while the first candidates are fetched
+        await asyncio.gather(
+            run_inference(self._embed_contexts, contexts),
+            self._agather_candidates(
+                texts, references, candidates, results, "exact", tiers=1
+            ),
+        )
+        prefetched = True
+
+        for method, tiers in self._search_steps():
+            with span("resolver.search", method=method, tiers=tiers):
+                if prefetched:
+                    prefetched = False
+                else:
+                    await self._agather_candidates(
+                        texts, references, candidates, results, method, tiers
+                    )
+
+                await self._aembed_candidates(candidates, results)
+
+                await run_inference(
+                    self._evaluate_candidates,
+                    contexts,
+                    candidates,
+                    results,
+                    self.min_similarity,
+                )
+
+            if all(all(r is not None for r in doc_results) for doc_results in results):
+                break
+
+        return results
+
     def _extract_contexts(
         self, texts: List[str], references: List[List[Tuple[int, int]]]
     ) -> List[List[str]]:
@@ -250,13 +448,15 @@ class SentenceTransformerResolver(Resolver):
         Returns:
             List of lists of context strings, matching the structure of references
         """
-        contexts = []
-        for text, doc_references in zip(texts, references):
-            doc_contexts = []
-            for start, end in doc_references:
-                context = self._extract_context(text, start, end)
-                doc_contexts.append(context)
-            contexts.append(doc_contexts)
+        with span("resolver.extract_contexts") as extract_span:
+            contexts = []
+            for text, doc_references in zip(texts, references):
+                doc_contexts = []
+                for start, end in doc_references:
+                    context = self._extract_context(text, start, end)
+                    doc_contexts.append(context)
+                contexts.append(doc_contexts)
+            extract_span.set("references", sum(map(len, contexts)))
         return contexts
 
     def _embed_contexts(self, contexts: List[List[str]]) -> None:
@@ -266,27 +466,28 @@ class SentenceTransformerResolver(Resolver):
         Args:
             contexts: List of lists of context strings
         """
-        # Collect unique contexts that need encoding
-        contexts_to_encode = set()
-        for doc_contexts in contexts:
-            for context in doc_contexts:
-                # Only encode contexts we haven't seen before
-                if context not in self.context_embeddings:
-                    contexts_to_encode.add(context)
-
-        # Encode unique contexts in batch
-        if contexts_to_encode:
-            unique_contexts = list(contexts_to_encode)
-            embeddings = self.transformer.encode(
-                unique_contexts,
-                convert_to_tensor=True,
-                batch_size=32,
-                show_progress_bar=True,
-            )
-
-            # Store embeddings in cache with context as key
-            for context, embedding in zip(unique_contexts, embeddings):
-                self.context_embeddings[context] = embedding
+        with span("resolver.embed_contexts") as embed_span:
+            # Collect unique contexts that need encoding
+            contexts_to_encode = set()
+            with self._cache_lock:
+                unique_contexts = {c for doc_contexts in contexts for c in doc_contexts}
+                for context in unique_contexts:
+                    # Only encode contexts we haven't seen before
+                    if context not in self.context_embeddings:
+                        contexts_to_encode.add(context)
+            embed_span.set("contexts", len(unique_contexts))
+            embed_span.set("cache_hits", len(unique_contexts) - len(contexts_to_encode))
+            embed_span.set("encoded", len(contexts_to_encode))
+
+            # Encode unique contexts in batch
+            if contexts_to_encode:
+                unique_contexts = list(contexts_to_encode)
+                embeddings = self._encode(unique_contexts)
+
+                # Store embeddings in cache with context as key
+                with self._cache_lock:
+                    for context, embedding in zip(unique_contexts, embeddings):
+                        self.context_embeddings[context] = embedding
 
     def _gather_candidates(
         self,
@@ -300,6 +501,48 @@ class SentenceTransformerResolver(Resolver):
         """
         Gather candidates for unresolved references using the specified search method.
 
+        Each distinct reference text is searched once, and the searches for
+        different texts run concurrently on the shared database executor.
+
+        Args:
+            texts: List of document text strings
+            references: List of lists of tuples containing (start, end) positions of references
+            candidates: Nested list of candidate lists for each reference (modified in-place)
+            results: Nested list of current results to determine which references need candidates
+            method: Search method to use
+            tiers: Number of rank tiers to include
+        """
+        with span(
+            "resolver.gather_candidates", method=method, tiers=tiers
+        ) as gather_span:
+            unresolved = self._collect_unresolved(
+                texts, references, candidates, results
+            )
+
+            # Search each distinct reference text once, overlapping the lookups
+            reference_texts = list(dict.fromkeys(text for text, _ in unresolved))
+            found = map_reads(
+                lambda reference_text: self.gazetteer.search(
+                    reference_text, method, tiers=tiers
+                ),
+                reference_texts,
+            )
+            self._merge_candidates(
+                unresolved, dict(zip(reference_texts, found)), gather_span
+            )
+
+    async def _agather_candidates(
+        self,
+        texts: List[str],
+        references: List[List[Tuple[int, int]]],
+        candidates: List[List[List["Feature"]]],
+        results: List[List[Tuple[str, str]]],
+        method: str,
+        tiers: int,
+    ) -> None:
+        """
+        Gather candidates like _gather_candidates(), without blocking the event loop.
+
         Args:
             texts: List of document text strings
             references: List of lists of tuples containing (start, end) positions of references
@@ -308,25 +551,83 @@ class SentenceTransformerResolver(Resolver):
             method: Search method to use
             tiers: Number of rank tiers to include
         """
-        for doc_idx, (text, doc_references, doc_candidates, doc_results) in enumerate(
-            zip(texts, references, candidates, results)
+        with span(
+            "resolver.gather_candidates", method=method, tiers=tiers
+        ) as gather_span:
+            unresolved = self._collect_unresolved(
+                texts, references, candidates, results
+            )
+
+            reference_texts = list(dict.fromkeys(text for text, _ in unresolved))
+            found = await asyncio.gather(
+                *(
+                    run_database(
+                        self.gazetteer.search, reference_text, method, tiers=tiers
+                    )
+                    for reference_text in reference_texts
+                )
+            )
+            self._merge_candidates(
+                unresolved, dict(zip(reference_texts, found)), gather_span
+            )
+
+    @staticmethod
+    def _collect_unresolved(
+        texts: List[str],
+        references: List[List[Tuple[int, int]]],
+        candidates: List[List[List["Feature"]]],
+        results: List[List[Tuple[str, str]]],
+    ) -> List[Tuple[str, List["Feature"]]]:
+        """
+        Collect the texts and candidate lists of unresolved references.
+
+        Args:
+            texts: List of document text strings
+            references: List of lists of tuples containing (start, end) positions of references
+            candidates: Nested list of candidate lists for each reference
+            results: Nested list of current results
+
+        Returns:
+            List of the text and candidate list of each unresolved reference
+        """
+        unresolved = []
+        for text, doc_references, doc_candidates, doc_results in zip(
+            texts, references, candidates, results
         ):
             for ref_idx, ((start, end), result) in enumerate(
                 zip(doc_references, doc_results)
             ):
-                # Skip already resolved references
-                if result is not None:
-                    continue
+                if result is None:
+                    unresolved.append((text[start:end], doc_candidates[ref_idx]))
+        return unresolved
+
+    @staticmethod
+    def _merge_candidates(
+        unresolved: List[Tuple[str, List["Feature"]]],
+        found: Dict[str, List["Feature"]],
+        gather_span,
+    ) -> None:
+        """
+        Add the found candidates to the candidate lists, avoiding duplicates.
 
-                # Search for new candidates and merge with existing ones, avoiding duplicates
-                reference_text = text[start:end]
-                new_candidates = self.gazetteer.search(
-                    reference_text, method, tiers=tiers
-                )
-                existing_ids = {c.id for c in doc_candidates[ref_idx]}
-                for candidate in new_candidates:
-                    if candidate.id not in existing_ids:
-                        doc_candidates[ref_idx].append(candidate)
+        Args:
+            unresolved: Text and candidate list (modified in-place) of each
+                        unresolved reference
+            found: Candidates found for each distinct reference text
+            gather_span: Span of the gathering step
+        """
+        gather_span.set("references", len(unresolved))
+        gather_span.set("searches", len(found))
+
+        added = 0
+        for reference_text, reference_candidates in unresolved:
+            existing_ids = {c.id for c in reference_candidates}
+            for candidate in found[reference_text]:
+                if candidate.id not in existing_ids:
+                    reference_candidates.append(candidate)
+                    existing_ids.add(candidate.id)
+                    added += 1
+        gather_span.set("candidates", added)
 
     def _embed_candidates(
         self,
@@ -340,44 +641,160 @@ class SentenceTransformerResolver(Resolver):
             candidates: Nested list of candidate lists for each reference
             results: Nested list of current results to determine which candidates need embedding
         """
-        # Collect unique candidates that need embedding
-        candidates_to_embed = {}  # Use dict to avoid duplicates: id -> candidate
+        with span("resolver.embed_candidates") as embed_span:
+            candidates_list = self._collect_candidates_to_embed(
+                candidates, results, embed_span
+            )
+            if not candidates_list:
+                return
 
-        for doc_candidates, doc_results in zip(candidates, results):
-            for candidate_list, result in zip(doc_candidates, doc_results):
-                # Skip already resolved references
-                if result is not None:
-                    continue
+            # Generate descriptions and embed them in batch
+            embeddings = self._encode(self._describe_candidates(candidates_list))
+            self._store_candidate_embeddings(candidates_list, embeddings)
+
+    async def _aembed_candidates(
+        self,
+        candidates: List[List[List["Feature"]]],
+        results: List[List[Tuple[str, str]]],
+    ) -> None:
+        """
+        Embed candidates like _embed_candidates(), without blocking the event loop.
 
-                # Add candidates that don't have embeddings yet
-                for candidate in candidate_list:
-                    if candidate.id not in self.candidate_embeddings:
-                        candidates_to_embed[candidate.id] = candidate
-
-        if not candidates_to_embed:
-            return
-
-        # Convert to list for consistent ordering
-        candidates_list = list(candidates_to_embed.values())
-
-        # Generate descriptions for candidates
-        descriptions = [
-            self._generate_description(candidate) for candidate in candidates_list
-        ]
-
-        # Generate embeddings in batch
-        if descriptions:
-            embeddings = self.transformer.encode(
-                descriptions,
-                convert_to_tensor=True,
-                batch_size=32,
-                show_progress_bar=True,
+        The descriptions read the gazetteer data of the candidates on the
+        database executor, and only their encoding runs on the inference
+        executor.
+
+        Args:
+            candidates: Nested list of candidate lists for each reference
+            results: Nested list of current results to determine which candidates need embedding
+        """
+        with span("resolver.embed_candidates") as embed_span:
+            candidates_list = self._collect_candidates_to_embed(
+                candidates, results, embed_span
+            )
+            if not candidates_list:
+                return
+
+            descriptions = await run_database(
+                self._describe_candidates, candidates_list
             )
+            embeddings = await run_inference(self._encode, descriptions)
+            self._store_candidate_embeddings(candidates_list, embeddings)
+
+    def _collect_candidates_to_embed(
+        self,
+        candidates: List[List[List["Feature"]]],
+        results: List[List[Tuple[str, str]]],
+        embed_span,
+    ) -> List["Feature"]:
+        """
+        Collect the distinct candidates of unresolved references without an embedding.
+
+        Args:
+            candidates: Nested list of candidate lists for each reference
+            results: Nested list of current results
+            embed_span: Span of the embedding step
+
+        Returns:
+            List of candidates that need to be embedded
+        """
+        candidates_to_embed = {}  # Use dict to avoid duplicates: id -> candidate
+        cached_ids = set()
+
+        with self._cache_lock:
+            for doc_candidates, doc_results in zip(candidates, results):
+                for candidate_list, result in zip(doc_candidates, doc_results):
+                    # Skip already resolved references
+                    if result is not None:
+                        continue
+
+                    # Add candidates that don't have embeddings yet
+                    for candidate in candidate_list:
+                        if candidate.id in self.candidate_embeddings:
+                            cached_ids.add(candidate.id)
+                        else:
+                            candidates_to_embed[candidate.id] = candidate
+
+        embed_span.set("candidates", len(cached_ids) + len(candidates_to_embed))
+        embed_span.set("cache_hits", len(cached_ids))
+        embed_span.set("encoded", len(candidates_to_embed))
+        return list(candidates_to_embed.values())
+
+    def _describe_candidates(self, candidates: List["Feature"]) -> List[str]:
+        """
+        Generate the descriptions of candidates from their gazetteer data.
+
+        Args:
+            candidates: Candidates to describe
+
+        Returns:
+            Description of each candidate
+        """
+        return [self._generate_description(candidate) for candidate in candidates]
+
+    def _store_candidate_embeddings(
+        self, candidates: List["Feature"], embeddings: torch.Tensor
+    ) -> None:
+        """
+        Add the embeddings of candidates to the cache.
 
-            # Store embeddings in cache
-            for candidate, embedding in zip(candidates_list, embeddings):
+        Args:
+            candidates: Embedded candidates
+            embeddings: Embedding of each candidate
+        """
+        with self._cache_lock:
+            for candidate, embedding in zip(candidates, embeddings):
                 self.candidate_embeddings[candidate.id] = embedding
 
+    def _encode(self, texts: List[str]) -> torch.Tensor:
+        """
+        Encode texts with the transformer, one thread at a time.
+
+        With an embedding server, texts are encoded by the server instead.
+
+        Args:
+            texts: List of texts to encode
+
+        Returns:
+            Tensor with one embedding per text
+        """
+        if self.embedding_client is not None:
+            with span("resolver.encode", texts=len(texts), backend="server"):
+                return torch.from_numpy(self.embedding_client.encode(texts))
+
+        with span("resolver.encode", texts=len(texts), backend="local"):
+            with self._transformer_lock:
+                return self.transformer.encode(
+                    texts,
+                    convert_to_tensor=True,
+                    batch_size=32,
+                    show_progress_bar=True,
+                )
+
+    def _max_seq_length(self) -> int:
+        """
+        Get the maximum number of tokens the transformer accepts.
+
+        Returns:
+            Maximum sequence length of the transformer
+        """
+        if self.embedding_client is not None:
+            return self.embedding_server_info["max_seq_length"]
+        return self.transformer.get_max_seq_length()
+
+    def _count_tokens(self, text: str) -> int:
+        """
+        Count the transformer tokens of a text, one thread at a time.
+
+        Args:
+            text: Text to tokenize
+
+        Returns:
+            Number of tokens
+        """
+        with self._transformer_lock:
+            return len(self.tokenizer.tokenize(text))
+
     def _evaluate_candidates(
         self,
         contexts: List[List[str]],
@@ -394,45 +811,53 @@ class SentenceTransformerResolver(Resolver):
             results: Nested list of current results (modified in-place)
             min_similarity: Minimum similarity threshold (default: 0.0)
         """
-        for doc_idx, (doc_contexts, doc_candidates, doc_results) in enumerate(
-            zip(contexts, candidates, results)
-        ):
-            for ref_idx, (context, candidate_list, result) in enumerate(
-                zip(doc_contexts, doc_candidates, doc_results)
+        with span(
+            "resolver.evaluate_candidates", references=0, resolved=0
+        ) as evaluate_span:
+            for doc_idx, (doc_contexts, doc_candidates, doc_results) in enumerate(
+                zip(contexts, candidates, results)
             ):
-                # Skip already resolved references
-                if result is not None:
-                    continue
+                for ref_idx, (context, candidate_list, result) in enumerate(
+                    zip(doc_contexts, doc_candidates, doc_results)
+                ):
+                    # Skip already resolved references
+                    if result is not None:
+                        continue
 
-                # Skip if no candidates
-                if not candidate_list:
-                    continue
+                    # Skip if no candidates
+                    if not candidate_list:
+                        continue
 
-                # Get reference context embedding using context as key
-                context_embedding = self.context_embeddings[context]
+                    evaluate_span.add("references")
 
-                # Get candidate embeddings
-                candidate_embeddings = [
-                    self.candidate_embeddings[candidate.id]
-                    for candidate in candidate_list
-                ]
+                    # Get reference context embedding using context as key
+                    context_embedding = self.context_embeddings[context]
 
-                # Calculate similarities
-                similarities = self._calculate_similarities(
-                    context_embedding, candidate_embeddings
-                )
+                    # Get candidate embeddings
+                    candidate_embeddings = [
+                        self.candidate_embeddings[candidate.id]
+                        for candidate in candidate_list
+                    ]
 
-                # Find best candidate
-                best_idx = max(range(len(similarities)), key=lambda j: similarities[j])
-                best_similarity = similarities[best_idx]
-                best_candidate = candidate_list[best_idx]
+                    # Calculate similarities
+                    similarities = self._calculate_similarities(
+                        context_embedding, candidate_embeddings
+                    )
 
-                # Check if similarity meets threshold
-                if best_similarity >= min_similarity:
-                    doc_results[ref_idx] = (
-                        self.gazetteer_name,
-                        best_candidate.location_id_value,
+                    # Find best candidate
+                    best_idx = max(
+                        range(len(similarities)), key=lambda j: similarities[j]
                     )
+                    best_similarity = similarities[best_idx]
+                    best_candidate = candidate_list[best_idx]
+
+                    # Check if similarity meets threshold
+                    if best_similarity >= min_similarity:
+                        doc_results[ref_idx] = (
+                            self.gazetteer_name,
+                            best_candidate.location_id_value,
+                        )
+                        evaluate_span.add("resolved")
 
     def _extract_context(self, text: str, start: int, end: int) -> str:
         """
@@ -446,24 +871,29 @@ class SentenceTransformerResolver(Resolver):
         Returns:
             Context string for the reference
         """
-        max_seq_length = self.transformer.get_max_seq_length()
+        max_seq_length = self._max_seq_length()
         # Reserve space for special tokens ([CLS] and [SEP] for BERT-like models)
         token_limit = max_seq_length - 2
 
         # Check if entire document fits within token limit
         # Use cached token count if available
-        if text not in self.doc_tokens:
-            self.doc_tokens[text] = len(self.tokenizer.tokenize(text))
-        doc_tokens = self.doc_tokens[text]
+        doc_tokens = self.doc_tokens.get(text)
+        if doc_tokens is None:
+            doc_tokens = self._count_tokens(text)
+            with self._cache_lock:
+                self.doc_tokens[text] = doc_tokens
 
         if doc_tokens <= token_limit:
             return text
 
         # Use spaCy to get sentence boundaries
         # Use cached spaCy doc if available
-        if text not in self.doc_objects:
-            self.doc_objects[text] = self.nlp(text)
-        doc = self.doc_objects[text]
+        doc = self.doc_objects.get(text)
+        if doc is None:
+            with self._nlp_lock:
+                doc = self.nlp(text)
+            with self._cache_lock:
+                self.doc_objects[text] = doc
         sentences = list(doc.sents)
 
         # Find the sentence containing the reference
@@ -478,7 +908,7 @@ class SentenceTransformerResolver(Resolver):
         context_sentences = [target_sentence]
 
         # Calculate tokens for target sentence
-        tokens_count = len(self.tokenizer.tokenize(target_sentence.text))
+        tokens_count = self._count_tokens(target_sentence.text)
 
         # Expand context bidirectionally while respecting token limit
         i, j = target_idx, target_idx
@@ -489,7 +919,7 @@ class SentenceTransformerResolver(Resolver):
             # Try to add previous sentence
             if i > 0:
                 prev_sentence = sentences[i - 1]
-                prev_tokens = len(self.tokenizer.tokenize(prev_sentence.text))
+                prev_tokens = self._count_tokens(prev_sentence.text)
                 if tokens_count + prev_tokens <= token_limit:
                     context_sentences.insert(0, prev_sentence)
                     tokens_count += prev_tokens
@@ -499,7 +929,7 @@ class SentenceTransformerResolver(Resolver):
             # Try to add next sentence
             if j < len(sentences) - 1:
                 next_sentence = sentences[j + 1]
-                next_tokens = len(self.tokenizer.tokenize(next_sentence.text))
+                next_tokens = self._count_tokens(next_sentence.text)
                 if tokens_count + next_tokens <= token_limit:
                     context_sentences.append(next_sentence)
                     tokens_count += next_tokens
@@ -620,10 +1050,20 @@ class SentenceTransformerResolver(Resolver):
             save_strategy: When to save the model during training (default: "epoch")
 
         Raises:
-            ValueError: If no training examples can be created from the provided documents
+            ValueError: If the resolver uses an embedding server, or if no training
+                        examples can be created from the provided documents
         """
+        if self.embedding_client is not None:
+            raise ValueError(
+                "A resolver using an embedding server cannot be trained. "
+                "Create the resolver without an embedding server to fine-tune its model."
+            )
+
         print("Preparing training data from referent annotations...")
 
+        # Train a private copy, since the shared transformer is used by other resolvers
+        self._detach_model()
+
         # Step 1: Gather training data from resolved references
         training_data = self._prepare_training_data(texts, references, referents)
 
@@ -634,44 +1074,36 @@ class SentenceTransformerResolver(Resolver):
 
         print(f"Created {len(training_data['sentence1'])} training examples")
 
-        # Step 2: Create training dataset
-        train_dataset = Dataset.from_dict(training_data)
-
-        # Step 3: Setup training loss
-        train_loss = ContrastiveLoss(self.transformer)
+        # Step 2: Fine-tune and save the model. The training libraries are imported
+        # here, so that resolvers used only for inference never load them.
+        from geoparser.modules.resolvers.training import train_sentence_transformer
 
-        # Step 4: Configure training arguments
-        training_args = SentenceTransformerTrainingArguments(
-            output_dir=str(output_path),
-            num_train_epochs=epochs,
-            per_device_train_batch_size=batch_size,
+        train_sentence_transformer(
+            self.transformer,
+            training_data,
+            output_path,
+            epochs=epochs,
+            batch_size=batch_size,
             learning_rate=learning_rate,
             warmup_ratio=warmup_ratio,
             save_strategy=save_strategy,
-            logging_strategy="steps",
-            logging_steps=max(1, len(training_data["sentence1"]) // (batch_size * 10)),
-            eval_strategy="no",  # No evaluation for now
-            save_total_limit=2,  # Keep only 2 checkpoints
-            load_best_model_at_end=False,
         )
 
-        # Step 5: Create trainer
-        trainer = SentenceTransformerTrainer(
-            model=self.transformer,
-            args=training_args,
-            train_dataset=train_dataset,
-            loss=train_loss,
-        )
-
-        print("Starting model fine-tuning...")
-
-        # Step 6: Train the model
-        trainer.train()
+        print(f"Model fine-tuning completed and saved to: {output_path}")
 
-        # Step 7: Save the final model
-        self.transformer.save_pretrained(str(output_path))
+    def _detach_model(self) -> None:
+        """
+        Replace the shared transformer with a private copy of the model.
 
-        print(f"Model fine-tuning completed and saved to: {output_path}")
+        Modifying the transformer, e.g. by training it, would affect all
+        resolvers sharing it, so the resolver releases the shared transformer
+        and loads its own copy first.
+        """
+        if self.transformer is not None and self._release_transformer.alive:
+            self._release_transformer()
+            self.transformer = SentenceTransformer(self.model_name)
+            self.tokenizer = self.transformer.tokenizer
+            self._transformer_lock = threading.Lock()
 
     def _prepare_training_data(
         self,
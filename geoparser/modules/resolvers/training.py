@@ -0,0 +1,71 @@
+from pathlib import Path
+from typing import Dict, List, Union
+
+from datasets import Dataset
+from sentence_transformers import SentenceTransformer, SentenceTransformerTrainer
+from sentence_transformers.losses import ContrastiveLoss
+from sentence_transformers.training_args import SentenceTransformerTrainingArguments
+
+
+def train_sentence_transformer(
+    transformer: SentenceTransformer,
+    training_data: Dict[str, List],
+    output_path: Union[str, Path],
+    epochs: int = 1,
+    batch_size: int = 8,
+    learning_rate: float = 2e-5,
+    warmup_ratio: float = 0.1,
+    save_strategy: str = "epoch",
+) -> None:
+    """
+    Fine-tune a SentenceTransformer model with ContrastiveLoss and save it.
+
+    The training libraries are only needed for fine-tuning, so they are kept
+    out of the resolver module and imported when a resolver is trained.
+
+    Args:
+        transformer: SentenceTransformer model to fine-tune in place
+        training_data: Dictionary with sentence1, sentence2, and label lists
+        output_path: Directory path to save the fine-tuned model
+        epochs: Number of training epochs (default: 1)
+        batch_size: Training batch size (default: 8)
+        learning_rate: Learning rate for training (default: 2e-5)
+        warmup_ratio: Warmup ratio for learning rate scheduler (default: 0.1)
+        save_strategy: When to save the model during training (default: "epoch")
+    """
+    # Step 1: Create training dataset
+    train_dataset = Dataset.from_dict(training_data)
+
+    # Step 2: Setup training loss
+    train_loss = ContrastiveLoss(transformer)
+
+    # Step 3: Configure training arguments
+    training_args = SentenceTransformerTrainingArguments(
+        output_dir=str(output_path),
+        num_train_epochs=epochs,
+        per_device_train_batch_size=batch_size,
+        learning_rate=learning_rate,
+        warmup_ratio=warmup_ratio,
+        save_strategy=save_strategy,
+        logging_strategy="steps",
+        logging_steps=max(1, len(training_data["sentence1"]) // (batch_size * 10)),
+        eval_strategy="no",  # No evaluation for now
+        save_total_limit=2,  # Keep only 2 checkpoints
+        load_best_model_at_end=False,
+    )
+
+    # Step 4: Create trainer
+    trainer = SentenceTransformerTrainer(
+        model=transformer,
+        args=training_args,
+        train_dataset=train_dataset,
+        loss=train_loss,
+    )
+
+    print("Starting model fine-tuning...")
+
+    # Step 5: Train the model
+    trainer.train()
+
+    # Step 6: Save the final model
+    transformer.save_pretrained(str(output_path))
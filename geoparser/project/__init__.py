@@ -1 +1,2 @@
+from geoparser.project.progress import ChunkProgress
 from geoparser.project.project import Project
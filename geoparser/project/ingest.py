@@ -0,0 +1,157 @@
+import json
+from pathlib import Path
+from typing import Iterator, Union
+
+# Number of rows read at once from CSV and Parquet files
+READ_CHUNKSIZE = 10000
+
+
+def iter_texts(
+    path: Union[str, Path], text_field: str = "text", encoding: str = "utf-8"
+) -> Iterator[str]:
+    """
+    Stream document texts from a file or directory.
+
+    Texts are read lazily, so arbitrarily large corpora can be ingested
+    without holding them in memory. The format is inferred from the path:
+
+    - A directory yields the content of each ``.txt`` file in it (recursively,
+      in sorted order), one document per file.
+    - ``.jsonl``/``.ndjson`` files yield the text field of each JSON line.
+    - ``.csv`` files yield the text column of each row.
+    - ``.parquet`` files yield the text column of each row.
+
+    Args:
+        path: Path to a file or a directory of text files
+        text_field: Name of the JSON field or column holding the text
+        encoding: Encoding of text, JSONL and CSV files
+
+    Yields:
+        Document texts
+
+    Raises:
+        FileNotFoundError: If the path does not exist
+        ValueError: If the file format is not supported, or if a JSONL line or
+            Parquet row has no text
+    """
+    path = Path(path)
+
+    if not path.exists():
+        raise FileNotFoundError(f"No such file or directory: {path}")
+
+    if path.is_dir():
+        yield from _iter_text_files(path, encoding)
+        return
+
+    suffix = path.suffix.lower()
+    if suffix in (".jsonl", ".ndjson"):
+        yield from _iter_jsonl(path, text_field, encoding)
+    elif suffix == ".csv":
+        yield from _iter_csv(path, text_field, encoding)
+    elif suffix == ".parquet":
+        yield from _iter_parquet(path, text_field)
+    else:
+        raise ValueError(
+            f"Unsupported file format: {path.suffix}. "
+            "Use a .jsonl, .ndjson, .csv or .parquet file, or a directory of .txt files."
+        )
+
+
+def _iter_text_files(directory: Path, encoding: str) -> Iterator[str]:
+    """
+    Stream the contents of the text files in a directory.
+
+    Args:
+        directory: Directory to search for .txt files
+        encoding: Encoding of the text files
+
+    Yields:
+        Content of each text file
+    """
+    for file in sorted(directory.rglob("*.txt")):
+        yield file.read_text(encoding=encoding)
+
+
+def _iter_jsonl(path: Path, text_field: str, encoding: str) -> Iterator[str]:
+    """
+    Stream a text field from a JSON Lines file.
+
+    Args:
+        path: Path to the JSONL file
+        text_field: Name of the field holding the text
+        encoding: Encoding of the file
+
+    Yields:
+        Value of the text field of each non-empty line
+
+    Raises:
+        ValueError: If a line has no text field or its value is null
+    """
+    with open(path, "r", encoding=encoding) as f:
+        for line_number, line in enumerate(f, start=1):
+            if line.strip():
+                text = json.loads(line).get(text_field)
+                if text is None:
+                    raise ValueError(
+                        f"Line {line_number} of {path} has no '{text_field}' field"
+                    )
+                yield text
+
+
+def _iter_csv(path: Path, text_field: str, encoding: str) -> Iterator[str]:
+    """
+    Stream a column from a CSV file.
+
+    Args:
+        path: Path to the CSV file
+        text_field: Name of the column holding the text
+        encoding: Encoding of the file
+
+    Yields:
+        Value of the text column of each row
+    """
+    # pandas is only needed for this format and slow to import
+    import pandas as pd
+
+    with pd.read_csv(
+        path,
+        usecols=[text_field],
+        dtype=str,
+        keep_default_na=False,
+        encoding=encoding,
+        chunksize=READ_CHUNKSIZE,
+    ) as reader:
+        for chunk in reader:
+            yield from chunk[text_field].tolist()
+
+
+def _iter_parquet(path: Path, text_field: str) -> Iterator[str]:
+    """
+    Stream a column from a Parquet file, one record batch at a time.
+
+    Args:
+        path: Path to the Parquet file
+        text_field: Name of the column holding the text
+
+    Yields:
+        Value of the text column of each row
+
+    Raises:
+        ValueError: If the text column of a row is null
+    """
+    # pyarrow is the Parquet engine of pandas and only needed for this format
+    import pyarrow.parquet as pq
+
+    parquet_file = pq.ParquetFile(path)
+    row_number = 0
+    for batch in parquet_file.iter_batches(
+        batch_size=READ_CHUNKSIZE, columns=[text_field]
+    ):
+        for text in batch.column(text_field).to_pylist():
+            row_number += 1
+            if text is None:
+                raise ValueError(
+                    f"Row {row_number} of {path} has no value in column "
+                    f"'{text_field}'"
+                )
+            yield text
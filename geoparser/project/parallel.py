@@ -0,0 +1,168 @@
+import inspect
+import multiprocessing
+import typing as t
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, List, Optional, Type
+
+if t.TYPE_CHECKING:
+    from geoparser.modules.module import Module
+
+# Module instance of the current worker process, built by _init_worker
+_worker_module: Optional["Module"] = None
+
+
+class ModulePool:
+    """
+    Run the predictions of a module in a pool of worker processes.
+
+    Each worker process builds its own instance of the module from the
+    module's class and config, so the module itself is never pickled. The
+    pool exposes the id, name, config and predict method of the module it
+    was created from, so it can be used in place of the module wherever
+    predictions are requested, e.g., by the recognition and resolution
+    services. Since module IDs are derived from name and config, results
+    are recorded under the same ID as the original module.
+
+    Each call to predict splits the documents into one shard per worker,
+    predicts the shards in parallel and returns the combined predictions in
+    the original order.
+    """
+
+    def __init__(self, module: "Module", workers: int):
+        """
+        Initialize a module pool.
+
+        Args:
+            module: The module whose predictions are distributed
+            workers: Number of worker processes
+
+        Raises:
+            ValueError: If workers is not positive or the module cannot be
+                        rebuilt from its config
+        """
+        if workers < 1:
+            raise ValueError("workers must be a positive integer")
+
+        _check_rebuildable(module)
+
+        self.module = module
+        self.id = module.id
+        self.name = module.name
+        self.config = module.config
+        self.workers = workers
+
+        # Workers are spawned rather than forked, since forking a process that
+        # has loaded models and started threads is not safe
+        self._executor = ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(type(module), module.config, module.id),
+        )
+
+    def predict(self, texts: List[str], *args: List[Any]) -> List[Any]:
+        """
+        Predict with the module in the worker processes.
+
+        Args:
+            texts: List of document texts
+            *args: Further per-document arguments of the module's predict
+                   method (e.g., the references for a resolver)
+
+        Returns:
+            Predictions for all documents, in the order of the input texts
+        """
+        futures = [
+            self._executor.submit(
+                _predict_in_worker, texts[shard], *[arg[shard] for arg in args]
+            )
+            for shard in _shard(len(texts), self.workers)
+        ]
+
+        predictions = []
+        for future in futures:
+            predictions.extend(future.result())
+        return predictions
+
+    def close(self) -> None:
+        """
+        Shut down the worker processes.
+        """
+        self._executor.shutdown(cancel_futures=True)
+
+    def __enter__(self) -> "ModulePool":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+
+def _check_rebuildable(module: "Module") -> None:
+    """
+    Check that a module can be constructed from its config.
+
+    Args:
+        module: The module to check
+
+    Raises:
+        ValueError: If the module's constructor does not accept its config
+    """
+    try:
+        inspect.signature(type(module)).bind(**module.config)
+    except TypeError as e:
+        raise ValueError(
+            f"Module '{module.name}' cannot be rebuilt from its config "
+            f"and cannot be run in worker processes: {e}"
+        ) from e
+
+
+def _shard(size: int, shards: int) -> List[slice]:
+    """
+    Split a range of items into contiguous, nearly equal shards.
+
+    Args:
+        size: Number of items
+        shards: Maximum number of shards
+
+    Returns:
+        List of non-empty slices covering all items in order
+    """
+    shards = min(shards, size)
+    bounds = [size * i // shards for i in range(shards + 1)] if shards else [0]
+    return [slice(start, end) for start, end in zip(bounds, bounds[1:])]
+
+
+def _init_worker(module_class: Type["Module"], config: dict, module_id: str) -> None:
+    """
+    Build the module of a worker process from its class and config.
+
+    Args:
+        module_class: Class of the module
+        config: Config of the module
+        module_id: ID of the original module
+
+    Raises:
+        ValueError: If the rebuilt module has a different ID than the original
+    """
+    global _worker_module
+    _worker_module = module_class(**config)
+
+    if _worker_module.id != module_id:
+        raise ValueError(
+            f"Module '{_worker_module.name}' rebuilt from its config has ID "
+            f"'{_worker_module.id}' instead of '{module_id}'"
+        )
+
+
+def _predict_in_worker(texts: List[str], *args: List[Any]) -> List[Any]:
+    """
+    Predict with the module of the current worker process.
+
+    Args:
+        texts: List of document texts
+        *args: Further per-document arguments of the module's predict method
+
+    Returns:
+        Predictions of the module
+    """
+    return _worker_module.predict(texts, *args)
@@ -0,0 +1,181 @@
+import threading
+from queue import Empty, Full, Queue
+from typing import Any, Callable, Iterable, Iterator, Sequence
+
+# Default number of batches buffered between two pipeline stages
+PIPELINE_QUEUE_SIZE = 2
+
+# Seconds a blocked worker waits before checking whether the pipeline stopped
+_POLL_INTERVAL = 0.1
+
+# Marker passed down the pipeline after the last batch
+_DONE = object()
+
+
+class _StageError:
+    """Wrapper for an exception raised in a pipeline stage."""
+
+    def __init__(self, exception: BaseException):
+        self.exception = exception
+
+
+def run_pipeline(
+    batches: Iterable[Any],
+    stages: Sequence[Callable[[Any], Any]],
+    queue_size: int = PIPELINE_QUEUE_SIZE,
+) -> Iterator[Any]:
+    """
+    Pass batches through a sequence of stages that run concurrently.
+
+    Reading the input and each stage run in their own thread and are
+    connected by bounded queues, so while stage 2 works on batch k, stage 1
+    can already work on batch k+1. Throughput is then limited by the slowest
+    stage instead of the sum of all stages, while at most ``queue_size``
+    batches are buffered between two stages. Batches keep their order.
+
+    Threads are effective here because the heavy lifting of the stages
+    (model inference and SQLite queries) releases the GIL.
+
+    If a stage raises an exception, the pipeline is stopped and the exception
+    is re-raised to the caller once all earlier batches have been yielded.
+
+    Args:
+        batches: Iterable of input batches, consumed lazily in a worker thread
+        stages: Functions applied in order, each receiving the output of the
+                previous stage
+        queue_size: Maximum number of batches buffered between two stages
+
+    Yields:
+        Output of the last stage for each input batch, in input order
+
+    Raises:
+        ValueError: If queue_size is not positive
+    """
+    if queue_size < 1:
+        raise ValueError("queue_size must be a positive integer")
+
+    stop = threading.Event()
+    queues = [Queue(maxsize=queue_size) for _ in range(len(stages) + 1)]
+
+    threads = [
+        threading.Thread(target=_feed, args=(batches, queues[0], stop), daemon=True)
+    ]
+    for i, stage in enumerate(stages):
+        threads.append(
+            threading.Thread(
+                target=_work,
+                args=(stage, queues[i], queues[i + 1], stop),
+                daemon=True,
+            )
+        )
+
+    for thread in threads:
+        thread.start()
+
+    try:
+        while True:
+            item = queues[-1].get()
+            if item is _DONE:
+                return
+            if isinstance(item, _StageError):
+                raise item.exception
+            yield item
+    finally:
+        # Stop the workers, e.g. if the caller stopped iterating early, and
+        # wait for batches that are still being processed
+        stop.set()
+        for thread in threads:
+            thread.join()
+
+
+def _feed(batches: Iterable[Any], outbox: Queue, stop: threading.Event) -> None:
+    """
+    Read input batches into the first queue of the pipeline.
+
+    Args:
+        batches: Iterable of input batches
+        outbox: Queue of the first stage
+        stop: Event signalling that the pipeline was stopped
+    """
+    try:
+        for batch in batches:
+            if not _put(outbox, batch, stop):
+                return
+    except BaseException as e:
+        _put(outbox, _StageError(e), stop)
+        return
+
+    _put(outbox, _DONE, stop)
+
+
+def _work(
+    stage: Callable[[Any], Any],
+    inbox: Queue,
+    outbox: Queue,
+    stop: threading.Event,
+) -> None:
+    """
+    Apply a stage to batches from one queue and pass the results to the next.
+
+    Args:
+        stage: Function applied to each batch
+        inbox: Queue to read batches from
+        outbox: Queue to write results to
+        stop: Event signalling that the pipeline was stopped
+    """
+    while True:
+        item = _get(inbox, stop)
+
+        # Forward the end marker and errors of earlier stages unchanged
+        if item is _DONE or isinstance(item, _StageError):
+            _put(outbox, item, stop)
+            return
+
+        try:
+            result = stage(item)
+        except BaseException as e:
+            _put(outbox, _StageError(e), stop)
+            return
+
+        if not _put(outbox, result, stop):
+            return
+
+
+def _put(queue: Queue, item: Any, stop: threading.Event) -> bool:
+    """
+    Put an item into a bounded queue, giving up if the pipeline is stopped.
+
+    Args:
+        queue: Queue to put the item into
+        item: Item to put
+        stop: Event signalling that the pipeline was stopped
+
+    Returns:
+        True if the item was put, False if the pipeline was stopped
+    """
+    while not stop.is_set():
+        try:
+            queue.put(item, timeout=_POLL_INTERVAL)
+            return True
+        except Full:
+            continue
+    return False
+
+
+def _get(queue: Queue, stop: threading.Event) -> Any:
+    """
+    Get an item from a queue, giving up if the pipeline is stopped.
+
+    Args:
+        queue: Queue to get the item from
+        stop: Event signalling that the pipeline was stopped
+
+    Returns:
+        The next item, or the end marker if the pipeline was stopped
+    """
+    while not stop.is_set():
+        try:
+            return queue.get(timeout=_POLL_INTERVAL)
+        except Empty:
+            continue
+    return _DONE
@@ -0,0 +1,25 @@
+from pydantic import BaseModel
+
+
+class ChunkProgress(BaseModel):
+    """
+    Progress report for a chunk of documents processed by a project run.
+
+    Passed to the callback of Project.run_recognizer() and
+    Project.run_resolver() after the results of each chunk are committed.
+    """
+
+    chunk: int  # Zero-based index of the chunk within the run
+    documents: int  # Number of documents in the chunk
+    total_documents: int  # Number of documents processed so far in the run
+    seconds: float  # Time taken to process and commit the chunk
+
+    @property
+    def documents_per_second(self) -> float:
+        """
+        Return the throughput of the chunk.
+
+        Returns:
+            Number of documents processed per second
+        """
+        return self.documents / self.seconds if self.seconds > 0 else 0.0
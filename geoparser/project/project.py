@@ -1,15 +1,23 @@
 import json
+import os
+import time
 import typing as t
 import uuid
+from itertools import islice
 from pathlib import Path
-from typing import List, Union
+from typing import Iterable, Iterator, List, Union
 
 from geoparser.context import Context
 from geoparser.db.crud import DocumentRepository, ProjectRepository
-from geoparser.db.db import create_db_and_tables, get_session
+from geoparser.db.db import create_db_and_tables, get_session, write_session
 from geoparser.db.models import Document, DocumentCreate, ProjectCreate
 from geoparser.modules.recognizers.manual import ManualRecognizer
 from geoparser.modules.resolvers.manual import ManualResolver
+from geoparser.project.ingest import iter_texts
+from geoparser.project.parallel import ModulePool
+from geoparser.project.pipeline import PIPELINE_QUEUE_SIZE, run_pipeline
+from geoparser.project.progress import ChunkProgress
+from geoparser.services.executors import run_database
 from geoparser.services.recognition import RecognitionService
 from geoparser.services.resolution import ResolutionService
 
@@ -75,10 +83,88 @@ class Project:
         if isinstance(texts, str):
             texts = [texts]
 
-        with get_session() as session:
-            for text in texts:
-                document_create = DocumentCreate(text=text, project_id=self.id)
-                DocumentRepository.create(session, document_create)
+        self.ingest_documents(texts)
+
+    def ingest_documents(
+        self,
+        source: Union[str, Path, Iterable[str]],
+        batch_size: int = 1000,
+        text_field: str = "text",
+        deduplicate: bool = False,
+    ) -> int:
+        """
+        Stream documents into the project with bulk inserts.
+
+        Texts are consumed lazily and inserted in batches, one transaction
+        per batch, so corpora of any size can be loaded without building a
+        list of texts first.
+
+        Args:
+            source: Either an iterable of document texts, or a path to a JSONL,
+                    CSV or Parquet file or a directory of .txt files
+                    (see geoparser.project.ingest.iter_texts)
+            batch_size: Number of documents inserted per transaction (default: 1000)
+            text_field: Name of the JSON field or column holding the text when
+                        reading from a file (default: "text")
+            deduplicate: Whether to skip texts whose content is identical to a
+                         document already in the project or earlier in the
+                         source (default: False)
+
+        Returns:
+            Number of documents created
+        """
+        if isinstance(source, (str, Path)):
+            source = iter_texts(source, text_field=text_field)
+
+        document_creates = (
+            DocumentCreate(text=text, project_id=self.id) for text in source
+        )
+
+        if deduplicate:
+            document_creates = self._deduplicate(document_creates, batch_size)
+
+        count = 0
+        while batch := list(islice(document_creates, batch_size)):
+            with write_session() as session:
+                DocumentRepository.create_many(session, batch)
+            count += len(batch)
+
+        return count
+
+    def _deduplicate(
+        self, document_creates: Iterable[DocumentCreate], batch_size: int = 1000
+    ) -> t.Iterator[DocumentCreate]:
+        """
+        Skip documents whose text is already in the project or was seen before.
+
+        Texts are compared by their content hash. Each batch of documents is
+        checked against the project with one indexed lookup of its hashes, so
+        the texts of the project are neither loaded nor hashed again.
+
+        Args:
+            document_creates: Documents to filter
+            batch_size: Number of documents checked per lookup (default: 1000)
+
+        Yields:
+            Documents with previously unseen content
+        """
+        document_creates = iter(document_creates)
+        seen = set()
+
+        while batch := list(islice(document_creates, batch_size)):
+            with get_session() as session:
+                seen.update(
+                    DocumentRepository.get_content_hashes_by_project(
+                        session,
+                        self.id,
+                        {document.content_hash for document in batch} - seen,
+                    )
+                )
+
+            for document_create in batch:
+                if document_create.content_hash not in seen:
+                    seen.add(document_create.content_hash)
+                    yield document_create
 
     def create_references(
         self, texts: List[str], references: List[List[tuple]], tag: str
@@ -133,63 +219,390 @@ class Project:
         with get_session() as session:
             # Retrieve all documents for the project
             documents = DocumentRepository.get_by_project(session, self.id)
+            self._set_document_contexts(documents, recognizer_id, resolver_id)
+
+            return documents
 
-            # Always set context on each document (even if None)
-            for doc in documents:
-                doc._set_recognizer_context(recognizer_id)
+    def iter_documents(
+        self, tag: str = "latest", batch_size: int = 1000
+    ) -> Iterator[Document]:
+        """
+        Iterate over the documents in the project with context set for the specified tag.
 
-                # Always set context on each reference (even if None)
-                for ref in doc.references:
-                    ref._set_resolver_context(resolver_id)
+        Unlike get_documents(), documents are loaded page by page, so memory use
+        stays constant regardless of the size of the project.
 
-            return documents
+        Args:
+            tag: Tag identifier to determine which recognizer/resolver context to use
+                 (default: "latest")
+            batch_size: Number of documents loaded at a time (default: 1000)
+
+        Yields:
+            Document objects with context set for filtering.
+        """
+        for documents in self._iter_document_batches(tag, batch_size):
+            yield from documents
 
-    def run_recognizer(self, recognizer: "Recognizer", tag: str = "latest") -> None:
+    def _iter_document_batches(
+        self, tag: str = "latest", batch_size: int = 1000
+    ) -> Iterator[List[Document]]:
+        """
+        Iterate over the documents in the project in batches, paging by document ID.
+
+        Each page is loaded in its own session, which is closed before the page
+        is yielded, so no ORM state accumulates across pages.
+
+        Args:
+            tag: Tag identifier to determine which recognizer/resolver context to use
+            batch_size: Maximum number of documents per batch
+
+        Yields:
+            Lists of Document objects with context set for filtering. The first
+            list is empty if the project has no documents.
+        """
+        recognizer_id = self.context.get_recognizer_context(tag)
+        resolver_id = self.context.get_resolver_context(tag)
+
+        after_id = None
+        while True:
+            with get_session() as session:
+                documents = DocumentRepository.get_page_by_project(
+                    session, self.id, after_id=after_id, limit=batch_size
+                )
+                self._set_document_contexts(documents, recognizer_id, resolver_id)
+
+            # The first batch is yielded even if empty, so that modules run on
+            # an empty project are still registered
+            if documents or after_id is None:
+                yield documents
+
+            if len(documents) < batch_size:
+                return
+
+            after_id = documents[-1].id
+
+    def _set_document_contexts(
+        self,
+        documents: List[Document],
+        recognizer_id: t.Optional[str],
+        resolver_id: t.Optional[str],
+    ) -> None:
+        """
+        Set the recognizer and resolver context on documents and their references.
+
+        Args:
+            documents: Documents to set the context on
+            recognizer_id: ID of the recognizer to filter references by
+            resolver_id: ID of the resolver to filter referents by
+        """
+        # Always set context on each document (even if None)
+        for doc in documents:
+            doc._set_recognizer_context(recognizer_id)
+
+            # Always set context on each reference (even if None)
+            for ref in doc.references:
+                ref._set_resolver_context(resolver_id)
+
+    def run_recognizer(
+        self,
+        recognizer: "Recognizer",
+        tag: str = "latest",
+        batch_size: int = 1000,
+        callback: t.Optional[t.Callable[[ChunkProgress], None]] = None,
+    ) -> None:
         """
         Run a recognizer module on all documents in this project.
 
         This is a convenience method that simplifies the workflow for advanced users
         by handling service initialization and document retrieval internally.
 
+        Documents are processed in chunks of ``batch_size``, and the results of
+        each chunk are committed before the next chunk is loaded. Documents
+        already processed by the recognizer are skipped, so an interrupted run
+        resumes where it left off when started again.
+
         Args:
             recognizer: The recognizer module to run on all project documents
             tag: Tag to associate with this recognizer run (default: "latest")
+            batch_size: Number of documents processed per chunk (default: 1000)
+            callback: Optional function called with a ChunkProgress after each chunk
         """
-        # Get all documents in the project
-        documents = self.get_documents()
-
         # Initialize the recognition service with the recognizer
         recognition_service = RecognitionService(recognizer)
 
-        # Run the recognizer on all documents
-        recognition_service.predict(documents)
+        # Run the recognizer on all documents, one chunk at a time
+        self._run_in_chunks(recognition_service.predict, batch_size, callback)
 
         # Update the context with this recognizer for the specified tag
         self.context.update_recognizer_context(tag, recognizer.id)
 
-    def run_resolver(self, resolver: "Resolver", tag: str = "latest") -> None:
+    def run_resolver(
+        self,
+        resolver: "Resolver",
+        tag: str = "latest",
+        batch_size: int = 1000,
+        callback: t.Optional[t.Callable[[ChunkProgress], None]] = None,
+    ) -> None:
         """
         Run a resolver module on all documents in this project.
 
         This is a convenience method that simplifies the workflow for advanced users
         by handling service initialization and document retrieval internally.
 
+        Documents are processed in chunks of ``batch_size``, and the results of
+        each chunk are committed before the next chunk is loaded. References
+        already processed by the resolver are skipped, so an interrupted run
+        resumes where it left off when started again.
+
         Args:
             resolver: The resolver module to run on all project documents
             tag: Tag to associate with this resolver run (default: "latest")
+            batch_size: Number of documents processed per chunk (default: 1000)
+            callback: Optional function called with a ChunkProgress after each chunk
         """
-        # Get all documents in the project
-        documents = self.get_documents()
-
         # Initialize the resolution service with the resolver
         resolution_service = ResolutionService(resolver)
 
-        # Run the resolver on all documents
-        resolution_service.predict(documents)
+        # Run the resolver on all documents, one chunk at a time
+        self._run_in_chunks(resolution_service.predict, batch_size, callback)
 
         # Update the context with this resolver for the specified tag
         self.context.update_resolver_context(tag, resolver.id)
 
+    async def arun_recognizer(
+        self,
+        recognizer: "Recognizer",
+        tag: str = "latest",
+        batch_size: int = 1000,
+        callback: t.Optional[t.Callable[[ChunkProgress], None]] = None,
+    ) -> None:
+        """
+        Run a recognizer module on all documents without blocking the event loop.
+
+        Works like run_recognizer(), but loads and stores data on the shared
+        database executor and runs the recognizer on the shared inference
+        executor, so it can be awaited from asyncio applications.
+
+        Args:
+            recognizer: The recognizer module to run on all project documents
+            tag: Tag to associate with this recognizer run (default: "latest")
+            batch_size: Number of documents processed per chunk (default: 1000)
+            callback: Optional function called with a ChunkProgress after each chunk
+        """
+        recognition_service = RecognitionService(recognizer)
+        await self._arun_in_chunks(recognition_service.apredict, batch_size, callback)
+        await run_database(self.context.update_recognizer_context, tag, recognizer.id)
+
+    async def arun_resolver(
+        self,
+        resolver: "Resolver",
+        tag: str = "latest",
+        batch_size: int = 1000,
+        callback: t.Optional[t.Callable[[ChunkProgress], None]] = None,
+    ) -> None:
+        """
+        Run a resolver module on all documents without blocking the event loop.
+
+        Works like run_resolver(), but loads and stores data on the shared
+        database executor and runs the resolver on the shared inference
+        executor, so it can be awaited from asyncio applications.
+
+        Args:
+            resolver: The resolver module to run on all project documents
+            tag: Tag to associate with this resolver run (default: "latest")
+            batch_size: Number of documents processed per chunk (default: 1000)
+            callback: Optional function called with a ChunkProgress after each chunk
+        """
+        resolution_service = ResolutionService(resolver)
+        await self._arun_in_chunks(resolution_service.apredict, batch_size, callback)
+        await run_database(self.context.update_resolver_context, tag, resolver.id)
+
+    def run_pipeline(
+        self,
+        recognizer: "Recognizer",
+        resolver: "Resolver",
+        tag: str = "latest",
+        batch_size: int = 1000,
+        queue_size: int = PIPELINE_QUEUE_SIZE,
+        callback: t.Optional[t.Callable[[ChunkProgress], None]] = None,
+    ) -> None:
+        """
+        Run a recognizer and a resolver on all documents, overlapping the two.
+
+        Produces the same results as run_recognizer() followed by run_resolver(),
+        but loading, recognition and resolution run as concurrent pipeline
+        stages: while the resolver works on chunk k, the recognizer already
+        processes chunk k+1 and the next chunk is loaded from the database.
+        Throughput is then limited by the slowest stage instead of the sum of
+        all stages. At most ``queue_size`` chunks are buffered between stages.
+
+        Args:
+            recognizer: The recognizer module to run on all project documents
+            resolver: The resolver module to run on the recognized references
+            tag: Tag to associate with this run (default: "latest")
+            batch_size: Number of documents processed per chunk (default: 1000)
+            queue_size: Maximum number of chunks buffered between stages
+            callback: Optional function called with a ChunkProgress after each chunk
+                      has been resolved. Since chunks are processed concurrently,
+                      seconds is the time since the previous chunk finished.
+        """
+        recognition_service = RecognitionService(recognizer)
+        resolution_service = ResolutionService(resolver)
+
+        def recognize(documents: List[Document]) -> List[uuid.UUID]:
+            recognition_service.predict(documents)
+            return [document.id for document in documents]
+
+        def resolve(document_ids: List[uuid.UUID]) -> int:
+            # Reload the documents so that they include the new references
+            with get_session() as session:
+                documents = DocumentRepository.get_by_ids(session, document_ids)
+            resolution_service.predict(documents)
+            return len(documents)
+
+        total_documents = 0
+        start = time.perf_counter()
+        for chunk, documents in enumerate(
+            run_pipeline(
+                self._iter_document_batches(batch_size=batch_size),
+                [recognize, resolve],
+                queue_size=queue_size,
+            )
+        ):
+            end = time.perf_counter()
+            total_documents += documents
+            if callback is not None and documents:
+                callback(
+                    ChunkProgress(
+                        chunk=chunk,
+                        documents=documents,
+                        total_documents=total_documents,
+                        seconds=end - start,
+                    )
+                )
+            start = end
+
+        # Update the context with both modules for the specified tag
+        self.context.update_recognizer_context(tag, recognizer.id)
+        self.context.update_resolver_context(tag, resolver.id)
+
+    def run_parallel(
+        self,
+        recognizer: "Recognizer",
+        resolver: "Resolver",
+        workers: t.Optional[int] = None,
+        tag: str = "latest",
+        batch_size: int = 1000,
+        callback: t.Optional[t.Callable[[ChunkProgress], None]] = None,
+    ) -> None:
+        """
+        Run a recognizer and a resolver on all documents using multiple processes.
+
+        Produces the same results as run_recognizer() followed by run_resolver(),
+        but the predictions of each chunk are sharded across ``workers`` worker
+        processes. Each worker builds its own instance of the module from the
+        module's class and config, so the modules must be constructible from
+        their config. The results are written by this process alone, which
+        performs one batched insert per chunk.
+
+        Since the worker processes are started with the "spawn" method, scripts
+        calling this method must guard their entry point with
+        ``if __name__ == "__main__":``.
+
+        Args:
+            recognizer: The recognizer module to run on all project documents
+            resolver: The resolver module to run on the recognized references
+            workers: Number of worker processes (default: number of CPUs)
+            tag: Tag to associate with this run (default: "latest")
+            batch_size: Number of documents processed per chunk (default: 1000)
+            callback: Optional function called with a ChunkProgress after each chunk,
+                      first for all recognition chunks and then for all resolution chunks
+
+        Raises:
+            ValueError: If a module cannot be rebuilt from its config
+        """
+        workers = workers or os.cpu_count() or 1
+
+        # Both pools are created up front so that both modules are validated
+        # before any work is done; worker processes only start on first use
+        with ModulePool(recognizer, workers) as recognizer_pool, ModulePool(
+            resolver, workers
+        ) as resolver_pool:
+            self.run_recognizer(recognizer_pool, tag, batch_size, callback)
+
+            # Release the recognizer workers before the resolver workers start
+            recognizer_pool.close()
+
+            self.run_resolver(resolver_pool, tag, batch_size, callback)
+
+    def _run_in_chunks(
+        self,
+        predict: t.Callable[[List[Document]], None],
+        batch_size: int,
+        callback: t.Optional[t.Callable[[ChunkProgress], None]],
+    ) -> None:
+        """
+        Apply a service's predict method to the project documents chunk by chunk.
+
+        Args:
+            predict: Service method that processes and commits a list of documents
+            batch_size: Number of documents per chunk
+            callback: Optional function called with a ChunkProgress after each chunk
+        """
+        total_documents = 0
+        for chunk, documents in enumerate(
+            self._iter_document_batches(batch_size=batch_size)
+        ):
+            start = time.perf_counter()
+            predict(documents)
+            seconds = time.perf_counter() - start
+
+            total_documents += len(documents)
+            if callback is not None and documents:
+                callback(
+                    ChunkProgress(
+                        chunk=chunk,
+                        documents=len(documents),
+                        total_documents=total_documents,
+                        seconds=seconds,
+                    )
+                )
+
+    async def _arun_in_chunks(
+        self,
+        apredict: t.Callable[[List[Document]], t.Awaitable[None]],
+        batch_size: int,
+        callback: t.Optional[t.Callable[[ChunkProgress], None]],
+    ) -> None:
+        """
+        Apply a service's async predict method to the project documents chunk by chunk.
+
+        Args:
+            apredict: Async service method that processes and commits a list of documents
+            batch_size: Number of documents per chunk
+            callback: Optional function called with a ChunkProgress after each chunk
+        """
+        batches = self._iter_document_batches(batch_size=batch_size)
+
+        total_documents = 0
+        chunk = 0
+        while (documents := await run_database(next, batches, None)) is not None:
+            start = time.perf_counter()
+            await apredict(documents)
+            seconds = time.perf_counter() - start
+
+            total_documents += len(documents)
+            if callback is not None and documents:
+                callback(
+                    ChunkProgress(
+                        chunk=chunk,
+                        documents=len(documents),
+                        total_documents=total_documents,
+                        seconds=seconds,
+                    )
+                )
+            chunk += 1
+
     def train_recognizer(self, recognizer: "Recognizer", tag: str, **kwargs) -> None:
         """
         Train a recognizer module using documents with reference annotations from this project.
@@ -0,0 +1,3 @@
+from geoparser.server.app import create_app, serve
+from geoparser.server.batching import MicroBatcher
+from geoparser.server.metrics import ServerMetrics
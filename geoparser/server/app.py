@@ -0,0 +1,242 @@
+import asyncio
+import gc
+import os
+import signal
+import socket
+import time
+import typing as t
+from contextlib import asynccontextmanager
+from typing import List
+
+import uvicorn
+from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse
+from pydantic import BaseModel
+
+from geoparser.db.db import dispose_after_fork
+from geoparser.geoparser.results import ParsedDocument
+from geoparser.server.batching import MicroBatcher
+from geoparser.server.metrics import ServerMetrics
+
+if t.TYPE_CHECKING:
+    from geoparser.geoparser import Geoparser
+
+# Text parsed by each worker before it accepts requests
+WARM_UP_TEXT = "The geoparsing service in Zurich is warming up."
+
+
+class ParseRequest(BaseModel):
+    """Request body of the parse endpoint."""
+
+    texts: List[str]
+
+
+class ParseResponse(BaseModel):
+    """Response body of the parse endpoint."""
+
+    documents: List[ParsedDocument]
+
+
+def create_app(
+    geoparser: "Geoparser", max_batch_size: int = 32, max_wait: float = 0.01
+) -> FastAPI:
+    """
+    Create the geoparsing web service for a geoparser.
+
+    The service offers a ``/parse`` endpoint that parses texts in memory.
+    Texts of concurrent requests are coalesced into micro-batches, and
+    identical texts being parsed at the same time are only parsed once. Metrics
+    in the Prometheus text format are available at ``/metrics``.
+
+    Args:
+        geoparser: Geoparser with loaded recognizer and resolver
+        max_batch_size: Maximum number of distinct texts per micro-batch
+        max_wait: Maximum time in seconds a text waits for its batch to fill
+
+    Returns:
+        FastAPI application
+    """
+    metrics = ServerMetrics()
+
+    @asynccontextmanager
+    async def lifespan(app: FastAPI):
+        app.state.batcher = MicroBatcher(
+            lambda texts: geoparser.parse(texts, in_memory=True),
+            max_batch_size=max_batch_size,
+            max_wait=max_wait,
+            metrics=metrics,
+        )
+        try:
+            yield
+        finally:
+            app.state.batcher.close()
+
+    app = FastAPI(
+        title="Irchel Geoparser",
+        summary="Geoparsing service of the Irchel Geoparser.",
+        lifespan=lifespan,
+    )
+    app.state.metrics = metrics
+
+    @app.post("/parse", response_model=ParseResponse)
+    async def parse(request: ParseRequest) -> ParseResponse:
+        """Parse texts and return their toponyms with resolved referents."""
+        start = time.perf_counter()
+        documents = await asyncio.gather(
+            *(app.state.batcher.parse(text) for text in request.texts)
+        )
+        metrics.requests.inc()
+        metrics.texts.inc(len(request.texts))
+        metrics.request_latency.observe(time.perf_counter() - start)
+        return ParseResponse(documents=documents)
+
+    @app.get("/metrics", response_class=PlainTextResponse)
+    async def get_metrics() -> PlainTextResponse:
+        """Return the metrics of this worker in the Prometheus text format."""
+        return PlainTextResponse(
+            metrics.render(), media_type="text/plain; version=0.0.4"
+        )
+
+    @app.get("/health")
+    async def health() -> dict:
+        """Report that the service is ready."""
+        return {"status": "ok"}
+
+    return app
+
+
+def serve(
+    geoparser: "Geoparser",
+    host: str = "127.0.0.1",
+    port: int = 8000,
+    workers: int = 1,
+    max_batch_size: int = 32,
+    max_wait: float = 0.01,
+) -> None:  # pragma: no cover
+    """
+    Run the geoparsing web service.
+
+    The geoparser's models must already be loaded. With several workers, the
+    listening socket is opened here and the process is forked once per
+    worker, so all workers share the loaded models copy-on-write instead of
+    loading their own. Each worker drops the database connections inherited
+    from the main process and parses a warm-up text before it starts
+    accepting requests. Interrupting or terminating the main process with
+    SIGTERM terminates the workers.
+
+    Args:
+        geoparser: Geoparser with loaded recognizer and resolver
+        host: Host to bind the server to (default: "127.0.0.1")
+        port: Port to run the server on (default: 8000)
+        workers: Number of worker processes (default: 1)
+        max_batch_size: Maximum number of distinct texts per micro-batch
+        max_wait: Maximum time in seconds a text waits for its batch to fill
+
+    Raises:
+        ValueError: If workers is not positive, or greater than one on a
+                    platform without fork
+    """
+    if workers < 1:
+        raise ValueError("workers must be a positive integer")
+
+    config = uvicorn.Config(
+        create_app(geoparser, max_batch_size=max_batch_size, max_wait=max_wait),
+        host=host,
+        port=port,
+    )
+
+    if workers == 1:
+        geoparser.parse(WARM_UP_TEXT, in_memory=True)
+        uvicorn.Server(config).run()
+        return
+
+    if not hasattr(os, "fork"):
+        raise ValueError("Multiple workers require a platform that supports fork")
+
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind((host, port))
+    sock.listen(2048)
+    sock.set_inheritable(True)
+
+    # Keep the garbage collector from touching the loaded objects, which
+    # would copy the shared memory pages into each worker
+    gc.freeze()
+
+    children = []
+    for _ in range(workers):
+        pid = os.fork()
+        if pid == 0:
+            try:
+                _run_worker(geoparser, config, sock)
+            finally:
+                os._exit(0)
+        children.append(pid)
+
+    # Forward termination requests, e.g. from a process manager, to the workers
+    previous_handler = signal.signal(
+        signal.SIGTERM, lambda signum, frame: _stop_workers(children)
+    )
+    try:
+        _wait_for_workers(children)
+    except KeyboardInterrupt:
+        _stop_workers(children)
+        _wait_for_workers(children)
+    finally:
+        signal.signal(signal.SIGTERM, previous_handler)
+        sock.close()
+
+
+def _run_worker(
+    geoparser: "Geoparser", config: uvicorn.Config, sock: socket.socket
+) -> None:
+    """
+    Serve requests in a forked worker process.
+
+    Args:
+        geoparser: Geoparser with loaded recognizer and resolver
+        config: Server configuration shared by all workers
+        sock: Listening socket opened before forking
+    """
+    # Database connections opened by the parent, e.g. while loading the
+    # gazetteer, must not be shared with the parent and the other workers
+    dispose_after_fork()
+
+    # The same holds for the connection of a resolver to an embedding server
+    embedding_client = getattr(geoparser.resolver, "embedding_client", None)
+    if embedding_client is not None:
+        embedding_client.close()
+
+    # Inference runs only after forking, since thread pools of the model
+    # libraries do not survive a fork
+    geoparser.parse(WARM_UP_TEXT, in_memory=True)
+    uvicorn.Server(config).run(sockets=[sock])
+
+
+def _stop_workers(children: List[int]) -> None:
+    """
+    Ask worker processes to terminate.
+
+    Args:
+        children: Process IDs of the workers
+    """
+    for pid in children:
+        try:
+            os.kill(pid, signal.SIGTERM)
+        except ProcessLookupError:
+            pass
+
+
+def _wait_for_workers(children: List[int]) -> None:
+    """
+    Wait until all worker processes have exited.
+
+    Args:
+        children: Process IDs of the workers
+    """
+    for pid in children:
+        try:
+            os.waitpid(pid, 0)
+        except ChildProcessError:
+            # Already reaped
+            pass
@@ -0,0 +1,150 @@
+import asyncio
+import time
+import typing as t
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Set
+
+if t.TYPE_CHECKING:
+    from geoparser.geoparser.results import ParsedDocument
+    from geoparser.server.metrics import ServerMetrics
+
+
+class MicroBatcher:
+    """
+    Coalesce concurrent parse requests into micro-batches.
+
+    Texts submitted while no batch is due are collected and parsed together
+    as soon as either ``max_batch_size`` distinct texts are waiting or the
+    oldest waiting text has waited ``max_wait`` seconds. Batches are parsed
+    one at a time in a background thread, so the event loop is never blocked
+    and texts arriving during a batch form the next one.
+
+    Identical texts that are waiting or being parsed are only parsed once, and
+    all requests for them receive the same result.
+    """
+
+    def __init__(
+        self,
+        parse: Callable[[List[str]], List["ParsedDocument"]],
+        max_batch_size: int = 32,
+        max_wait: float = 0.01,
+        metrics: Optional["ServerMetrics"] = None,
+    ):
+        """
+        Initialize a micro-batcher.
+
+        Args:
+            parse: Function parsing a list of texts into documents in input order
+            max_batch_size: Maximum number of distinct texts per batch
+            max_wait: Maximum time in seconds a text waits for its batch to fill
+            metrics: Optional server metrics to record batch sizes and latencies
+
+        Raises:
+            ValueError: If max_batch_size is not positive or max_wait is negative
+        """
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be a positive integer")
+        if max_wait < 0:
+            raise ValueError("max_wait must not be negative")
+
+        self.parse_batch = parse
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self.metrics = metrics
+
+        # Futures of texts waiting for the next batch and of texts being parsed
+        self._pending: Dict[str, asyncio.Future] = {}
+        self._in_flight: Dict[str, asyncio.Future] = {}
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._tasks: Set[asyncio.Task] = set()
+
+        # A single thread runs the batches in submission order
+        self._executor = ThreadPoolExecutor(max_workers=1)
+
+    async def parse(self, text: str) -> "ParsedDocument":
+        """
+        Parse a text as part of the next micro-batch.
+
+        Args:
+            text: Document text
+
+        Returns:
+            Parsed document for the text
+        """
+        future = self._pending.get(text) or self._in_flight.get(text)
+
+        if future is not None:
+            if self.metrics is not None:
+                self.metrics.deduplicated_texts.inc()
+        else:
+            loop = asyncio.get_running_loop()
+            future = loop.create_future()
+            self._pending[text] = future
+
+            if len(self._pending) >= self.max_batch_size:
+                self._flush()
+            elif self._flush_handle is None:
+                self._flush_handle = loop.call_later(self.max_wait, self._flush)
+
+        # Shield the shared future, so that a cancelled request does not
+        # cancel the result for other requests with the same text
+        return await asyncio.shield(future)
+
+    def close(self) -> None:
+        """
+        Stop accepting batches and shut down the background thread.
+        """
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        self._executor.shutdown(wait=True)
+
+    def _flush(self) -> None:
+        """
+        Start parsing the waiting texts as a batch.
+        """
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        batch, self._pending = self._pending, {}
+        if not batch:
+            return
+
+        self._in_flight.update(batch)
+        task = asyncio.ensure_future(self._run_batch(batch))
+
+        # Keep a reference to the task until it is done
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run_batch(self, batch: Dict[str, asyncio.Future]) -> None:
+        """
+        Parse a batch in the background thread and resolve its futures.
+
+        Args:
+            batch: Futures of the texts in the batch, keyed by text
+        """
+        texts = list(batch)
+        loop = asyncio.get_running_loop()
+        start = time.perf_counter()
+
+        try:
+            documents = await loop.run_in_executor(
+                self._executor, self.parse_batch, texts
+            )
+        except Exception as e:
+            for future in batch.values():
+                if not future.done():
+                    future.set_exception(e)
+        else:
+            for text, document in zip(texts, documents):
+                if not batch[text].done():
+                    batch[text].set_result(document)
+        finally:
+            for text in texts:
+                self._in_flight.pop(text, None)
+
+        if self.metrics is not None:
+            self.metrics.batch_size.observe(len(texts))
+            self.metrics.batch_latency.observe(time.perf_counter() - start)
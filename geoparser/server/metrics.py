@@ -0,0 +1,173 @@
+import bisect
+from typing import List, Sequence
+
+# Upper bounds of the request and batch latency buckets, in seconds
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Upper bounds of the batch size buckets, in texts
+BATCH_SIZE_BUCKETS = (1, 2, 4, 8, 16, 32, 64, 128, 256)
+
+
+class Counter:
+    """
+    Monotonically increasing metric in the Prometheus exposition format.
+    """
+
+    def __init__(self, name: str, description: str):
+        """
+        Initialize a counter.
+
+        Args:
+            name: Metric name
+            description: Help text of the metric
+        """
+        self.name = name
+        self.description = description
+        self.value = 0.0
+
+    def inc(self, amount: float = 1.0) -> None:
+        """
+        Increase the counter.
+
+        Args:
+            amount: Amount to add (default: 1)
+        """
+        self.value += amount
+
+    def render(self) -> List[str]:
+        """
+        Render the counter in the Prometheus text format.
+
+        Returns:
+            Lines describing the counter
+        """
+        return [
+            f"# HELP {self.name} {self.description}",
+            f"# TYPE {self.name} counter",
+            f"{self.name} {_format(self.value)}",
+        ]
+
+
+class Histogram:
+    """
+    Distribution of observed values in the Prometheus exposition format.
+    """
+
+    def __init__(self, name: str, description: str, buckets: Sequence[float]):
+        """
+        Initialize a histogram.
+
+        Args:
+            name: Metric name
+            description: Help text of the metric
+            buckets: Sorted upper bounds of the buckets; a +Inf bucket is added
+        """
+        self.name = name
+        self.description = description
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        """
+        Record an observed value.
+
+        Args:
+            value: The observed value
+        """
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def render(self) -> List[str]:
+        """
+        Render the histogram in the Prometheus text format.
+
+        Returns:
+            Lines describing the histogram with cumulative bucket counts
+        """
+        lines = [
+            f"# HELP {self.name} {self.description}",
+            f"# TYPE {self.name} histogram",
+        ]
+        cumulative = 0
+        for bound, count in zip(self.buckets + (float("inf"),), self.counts):
+            cumulative += count
+            le = "+Inf" if bound == float("inf") else _format(bound)
+            lines.append(f'{self.name}_bucket{{le="{le}"}} {cumulative}')
+        lines.append(f"{self.name}_sum {_format(self.sum)}")
+        lines.append(f"{self.name}_count {self.count}")
+        return lines
+
+
+class ServerMetrics:
+    """
+    Metrics of a geoparsing server process.
+
+    Metrics are updated from the event loop of the server only, so no locking
+    is required. With several worker processes, each worker reports its own
+    metrics.
+    """
+
+    def __init__(self):
+        """
+        Initialize the server metrics.
+        """
+        self.requests = Counter(
+            "geoparser_requests_total", "Number of parse requests handled."
+        )
+        self.texts = Counter(
+            "geoparser_texts_total", "Number of texts received in parse requests."
+        )
+        self.deduplicated_texts = Counter(
+            "geoparser_deduplicated_texts_total",
+            "Number of texts served by an identical text already being parsed.",
+        )
+        self.request_latency = Histogram(
+            "geoparser_request_latency_seconds",
+            "Latency of parse requests in seconds.",
+            LATENCY_BUCKETS,
+        )
+        self.batch_latency = Histogram(
+            "geoparser_batch_latency_seconds",
+            "Time spent parsing a micro-batch in seconds.",
+            LATENCY_BUCKETS,
+        )
+        self.batch_size = Histogram(
+            "geoparser_batch_size",
+            "Number of distinct texts per micro-batch.",
+            BATCH_SIZE_BUCKETS,
+        )
+
+    def render(self) -> str:
+        """
+        Render all metrics in the Prometheus text exposition format.
+
+        Returns:
+            Metrics as text
+        """
+        lines = []
+        for metric in (
+            self.requests,
+            self.texts,
+            self.deduplicated_texts,
+            self.request_latency,
+            self.batch_latency,
+            self.batch_size,
+        ):
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+def _format(value: float) -> str:
+    """
+    Format a metric value, omitting the decimal part of whole numbers.
+
+    Args:
+        value: The value to format
+
+    Returns:
+        Formatted value
+    """
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
@@ -0,0 +1,110 @@
+import asyncio
+import contextvars
+import functools
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Optional, TypeVar
+
+from geoparser.db.db import get_database_executor
+
+# Threads of the shared executor for model inference. Modules are not
+# required to be thread-safe, so model calls run one at a time by default.
+INFERENCE_WORKERS = 1
+INFERENCE_THREAD_NAME_PREFIX = "geoparser-inference"
+_inference_executor: Optional[ThreadPoolExecutor] = None
+_inference_executor_lock = threading.Lock()
+
+_R = TypeVar("_R")
+
+
+def get_inference_executor() -> ThreadPoolExecutor:
+    """
+    Get the shared thread pool for model inference.
+
+    The pool is created on first use and has at most INFERENCE_WORKERS threads.
+
+    Returns:
+        The shared inference executor
+    """
+    global _inference_executor
+    with _inference_executor_lock:
+        if _inference_executor is None:
+            _inference_executor = ThreadPoolExecutor(
+                max_workers=INFERENCE_WORKERS,
+                thread_name_prefix=INFERENCE_THREAD_NAME_PREFIX,
+            )
+        return _inference_executor
+
+
+def submit_inference(func: Callable[..., _R], *args: Any, **kwargs: Any) -> Future:
+    """
+    Submit a blocking function that calls a model to the inference executor.
+
+    This lets synchronous code overlap model inference with other work, such
+    as database reads. The function runs in a copy of the caller's context.
+    Calls from a thread of the inference executor itself run the function
+    immediately, since waiting for the executor from its own thread would
+    deadlock it.
+
+    Args:
+        func: Function to run
+        *args: Positional arguments of the function
+        **kwargs: Keyword arguments of the function
+
+    Returns:
+        Future holding the result of the function
+    """
+    context = contextvars.copy_context()
+    if not threading.current_thread().name.startswith(INFERENCE_THREAD_NAME_PREFIX):
+        return get_inference_executor().submit(context.run, func, *args, **kwargs)
+
+    future: Future = Future()
+    try:
+        future.set_result(context.run(func, *args, **kwargs))
+    except BaseException as error:
+        future.set_exception(error)
+    return future
+
+
+async def run_inference(func: Callable[..., _R], *args: Any, **kwargs: Any) -> _R:
+    """
+    Run a blocking function that calls a model on the inference executor.
+
+    The function runs in a copy of the caller's context, so context variables
+    such as the open tracing span carry over to the executor thread.
+
+    Args:
+        func: Function to run
+        *args: Positional arguments of the function
+        **kwargs: Keyword arguments of the function
+
+    Returns:
+        Result of the function
+    """
+    loop = asyncio.get_running_loop()
+    context = contextvars.copy_context()
+    return await loop.run_in_executor(
+        get_inference_executor(), functools.partial(context.run, func, *args, **kwargs)
+    )
+
+
+async def run_database(func: Callable[..., _R], *args: Any, **kwargs: Any) -> _R:
+    """
+    Run a blocking function that accesses the database on the database executor.
+
+    The function runs in a copy of the caller's context, so context variables
+    such as the open tracing span carry over to the executor thread.
+
+    Args:
+        func: Function to run
+        *args: Positional arguments of the function
+        **kwargs: Keyword arguments of the function
+
+    Returns:
+        Result of the function
+    """
+    loop = asyncio.get_running_loop()
+    context = contextvars.copy_context()
+    return await loop.run_in_executor(
+        get_database_executor(), functools.partial(context.run, func, *args, **kwargs)
+    )
@@ -9,8 +9,10 @@ from geoparser.db.crud import (
     RecognizerRepository,
     ReferenceRepository,
 )
-from geoparser.db.db import get_session
+from geoparser.db.db import get_session, write_session
 from geoparser.db.models import RecognitionCreate, RecognizerCreate, ReferenceCreate
+from geoparser.services.executors import run_database, run_inference
+from geoparser.tracing import span
 
 if t.TYPE_CHECKING:
     from geoparser.db.models import Document
@@ -46,7 +48,7 @@ class RecognitionService:
         Returns:
             The recognizer ID from the database
         """
-        with get_session() as session:
+        with write_session() as session:
             recognizer_record = RecognizerRepository.get(session, id=recognizer.id)
             if recognizer_record is None:
                 recognizer_create = RecognizerCreate(
@@ -66,34 +68,109 @@ class RecognitionService:
         Args:
             documents: List of Document objects to process
         """
-        # Ensure recognizer record exists in database and get the ID
-        recognizer_id = self._ensure_recognizer_record(self.recognizer)
+        with span("recognition.predict", documents=len(documents)) as predict_span:
+            # Ensure recognizer record exists in database and get the ID
+            recognizer_id = self._ensure_recognizer_record(self.recognizer)
 
-        if not documents:
-            return
+            if not documents:
+                return
 
-        with get_session() as session:
             # Filter out documents that have already been processed by this recognizer
-            unprocessed_documents = self._filter_unprocessed_documents(
-                session, documents, recognizer_id
+            unprocessed_documents = self._get_unprocessed_documents(
+                documents, recognizer_id
             )
+            predict_span.set("unprocessed", len(unprocessed_documents))
 
             if not unprocessed_documents:
                 return
 
-            # Extract text from documents for prediction
-            texts = [doc.text for doc in unprocessed_documents]
+            # Get predictions from recognizer using raw text
+            with span("recognition.inference", documents=len(unprocessed_documents)):
+                predicted_references = self.recognizer.predict(
+                    [doc.text for doc in unprocessed_documents]
+                )
+
+            # Process predictions and update database
+            self._store_reference_predictions(
+                unprocessed_documents, predicted_references, recognizer_id
+            )
+
+    async def apredict(self, documents: List["Document"]) -> None:
+        """
+        Run the recognizer on the provided documents without blocking the event loop.
+
+        Works like predict(), but runs database access on the shared database
+        executor and the recognizer on the shared inference executor.
+
+        Args:
+            documents: List of Document objects to process
+        """
+        with span("recognition.predict", documents=len(documents)) as predict_span:
+            recognizer_id = await run_database(
+                self._ensure_recognizer_record, self.recognizer
+            )
+
+            if not documents:
+                return
+
+            unprocessed_documents = await run_database(
+                self._get_unprocessed_documents, documents, recognizer_id
+            )
+            predict_span.set("unprocessed", len(unprocessed_documents))
 
-            # Only call predict if there are texts to process
-            if texts:
-                # Get predictions from recognizer using raw text
-                predicted_references = self.recognizer.predict(texts)
+            if not unprocessed_documents:
+                return
 
-                # Process predictions and update database
-                self._record_reference_predictions(
-                    session, unprocessed_documents, predicted_references, recognizer_id
+            with span("recognition.inference", documents=len(unprocessed_documents)):
+                predicted_references = await run_inference(
+                    self.recognizer.predict, [doc.text for doc in unprocessed_documents]
                 )
 
+            await run_database(
+                self._store_reference_predictions,
+                unprocessed_documents,
+                predicted_references,
+                recognizer_id,
+            )
+
+    def _get_unprocessed_documents(
+        self, documents: List["Document"], recognizer_id: str
+    ) -> List["Document"]:
+        """
+        Get the documents that have not been processed by the recognizer yet.
+
+        Args:
+            documents: List of all documents to check
+            recognizer_id: ID of the recognizer to check for
+
+        Returns:
+            List of documents that haven't been processed by this recognizer
+        """
+        with get_session() as session:
+            return self._filter_unprocessed_documents(session, documents, recognizer_id)
+
+    def _store_reference_predictions(
+        self,
+        documents: List["Document"],
+        predicted_references: List[t.Union[List[Tuple[int, int]], None]],
+        recognizer_id: str,
+    ) -> None:
+        """
+        Store reference predictions, holding the writer lock only for the writes.
+
+        Args:
+            documents: List of document objects
+            predicted_references: Predicted references of each document, or None
+                                  for documents where predictions are not available
+            recognizer_id: ID of the recognizer that made the predictions
+        """
+        with span("recognition.store", documents=len(documents)) as store_span:
+            with write_session() as session:
+                rows = self._record_reference_predictions(
+                    session, documents, predicted_references, recognizer_id
+                )
+            store_span.set("rows", rows)
+
     def fit(self, documents: List["Document"], **kwargs) -> None:
         """
         Train the recognizer using the provided documents.
@@ -134,17 +211,27 @@ class RecognitionService:
         documents: List["Document"],
         predicted_references: List[t.Union[List[Tuple[int, int]], None]],
         recognizer_id: uuid.UUID,
-    ) -> None:
+    ) -> int:
         """
         Process reference predictions and update the database.
 
+        All references and recognitions of the batch are written with bulk
+        inserts and committed together, with reference texts taken from the
+        in-memory documents.
+
         Args:
             session: Database session
             documents: List of document objects
             predicted_references: List where each element is either a list of predicted references
                                  or None for documents where predictions are not available
             recognizer_id: ID of the recognizer that made the predictions
+
+        Returns:
+            Number of reference and recognition rows written
         """
+        reference_creates = []
+        recognition_creates = []
+
         # Process each document with its predicted references
         for document, references in zip(documents, predicted_references):
             # Skip documents where predictions are not available
@@ -154,52 +241,25 @@ class RecognitionService:
 
             # Create references with recognizer ID
             for start, end in references:
-                self._create_reference_record(
-                    session, document.id, start, end, recognizer_id
+                reference_creates.append(
+                    ReferenceCreate(
+                        start=start,
+                        end=end,
+                        text=document.text[start:end],
+                        document_id=document.id,
+                        recognizer_id=recognizer_id,
+                    )
                 )
 
             # Mark document as processed
-            self._create_recognition_record(session, document.id, recognizer_id)
-
-    def _create_reference_record(
-        self,
-        session: Session,
-        document_id: uuid.UUID,
-        start: int,
-        end: int,
-        recognizer_id: uuid.UUID,
-    ) -> None:
-        """
-        Create a reference record with the recognizer ID.
+            recognition_creates.append(
+                RecognitionCreate(document_id=document.id, recognizer_id=recognizer_id)
+            )
 
-        Args:
-            session: Database session
-            document_id: ID of the document containing the reference
-            start: Start position of the reference
-            end: End position of the reference
-            recognizer_id: ID of the recognizer
-        """
-        # Create the reference with recognizer ID directly
-        reference_create = ReferenceCreate(
-            start=start, end=end, document_id=document_id, recognizer_id=recognizer_id
-        )
-        ReferenceRepository.create(session, reference_create)
+        ReferenceRepository.create_many(session, reference_creates, commit=False)
+        RecognitionRepository.create_many(session, recognition_creates)
 
-    def _create_recognition_record(
-        self, session: Session, document_id: uuid.UUID, recognizer_id: uuid.UUID
-    ) -> None:
-        """
-        Create a recognition record for a document processed by a specific recognizer.
-
-        Args:
-            session: Database session
-            document_id: ID of the document that was processed
-            recognizer_id: ID of the recognizer that processed it
-        """
-        recognition_create = RecognitionCreate(
-            document_id=document_id, recognizer_id=recognizer_id
-        )
-        RecognitionRepository.create(session, recognition_create)
+        return len(reference_creates) + len(recognition_creates)
 
     def _filter_unprocessed_documents(
         self, session: Session, documents: List["Document"], recognizer_id: str
@@ -215,12 +275,7 @@ class RecognitionService:
         Returns:
             List of documents that haven't been processed by this recognizer
         """
-        unprocessed_documents = []
-        for doc in documents:
-            # Check if this document has already been processed by this recognizer
-            existing_recognition = RecognitionRepository.get_by_document_and_recognizer(
-                session, doc.id, recognizer_id
-            )
-            if not existing_recognition:
-                unprocessed_documents.append(doc)
-        return unprocessed_documents
+        unprocessed_ids = RecognitionRepository.get_unprocessed_document_ids(
+            session, [doc.id for doc in documents], recognizer_id
+        )
+        return [doc for doc in documents if doc.id in unprocessed_ids]
@@ -10,8 +10,10 @@ from geoparser.db.crud import (
     ResolutionRepository,
     ResolverRepository,
 )
-from geoparser.db.db import get_session
+from geoparser.db.db import get_session, write_session
 from geoparser.db.models import ReferentCreate, ResolutionCreate, ResolverCreate
+from geoparser.services.executors import run_database
+from geoparser.tracing import span
 
 if t.TYPE_CHECKING:
     from geoparser.db.models import Document, Reference
@@ -47,7 +49,7 @@ class ResolutionService:
         Returns:
             The resolver ID from the database
         """
-        with get_session() as session:
+        with write_session() as session:
             resolver_record = ResolverRepository.get(session, id=resolver.id)
             if resolver_record is None:
                 resolver_create = ResolverCreate(
@@ -65,24 +67,103 @@ class ResolutionService:
         Args:
             documents: List of Document objects containing references to process
         """
-        # Ensure resolver record exists in database and get the ID
-        resolver_id = self._ensure_resolver_record(self.resolver)
+        with span("resolution.predict", documents=len(documents)):
+            # Ensure resolver record exists in database and get the ID
+            resolver_id = self._ensure_resolver_record(self.resolver)
 
-        if not documents:
-            return
+            if not documents:
+                return
 
-        with get_session() as session:
-            # Collect data for prediction
-            texts = []
-            reference_boundaries = []
-            reference_objects = []
+            # Collect the unprocessed references of all documents
+            texts, reference_boundaries, reference_objects = (
+                self._collect_unprocessed_references(documents, resolver_id)
+            )
 
-            for doc in documents:
-                # Filter to unprocessed references only
-                unprocessed_references = self._filter_unprocessed_references(
-                    session, doc.references, resolver_id
+            # Only call predict if there are documents with unprocessed references
+            if not texts:
+                return
+
+            # Get predictions from resolver using raw data
+            with span("resolution.inference", documents=len(texts)):
+                predicted_referents = self.resolver.predict(texts, reference_boundaries)
+
+            # Record predictions
+            self._store_referent_predictions(
+                reference_objects, predicted_referents, resolver_id
+            )
+
+    async def apredict(self, documents: List["Document"]) -> None:
+        """
+        Run the resolver on the provided documents without blocking the event loop.
+
+        Works like predict(), but runs database access on the shared database
+        executor and the resolver through its apredict() method, which runs
+        model calls on the shared inference executor. Resolvers that search
+        the gazetteer run these searches on the database executor, so the
+        inference executor is not blocked by them.
+
+        Args:
+            documents: List of Document objects containing references to process
+        """
+        with span("resolution.predict", documents=len(documents)):
+            resolver_id = await run_database(
+                self._ensure_resolver_record, self.resolver
+            )
+
+            if not documents:
+                return
+
+            texts, reference_boundaries, reference_objects = await run_database(
+                self._collect_unprocessed_references, documents, resolver_id
+            )
+
+            if not texts:
+                return
+
+            with span("resolution.inference", documents=len(texts)):
+                predicted_referents = await self.resolver.apredict(
+                    texts, reference_boundaries
                 )
 
+            await run_database(
+                self._store_referent_predictions,
+                reference_objects,
+                predicted_referents,
+                resolver_id,
+            )
+
+    def _collect_unprocessed_references(
+        self, documents: List["Document"], resolver_id: str
+    ) -> Tuple[List[str], List[List[Tuple[int, int]]], List[List["Reference"]]]:
+        """
+        Collect the references of documents that the resolver has not processed yet.
+
+        Args:
+            documents: List of Document objects containing references
+            resolver_id: ID of the resolver to check for
+
+        Returns:
+            Tuple of the texts of documents with unprocessed references, the
+            boundaries of these references, and the reference objects
+        """
+        texts = []
+        reference_boundaries = []
+        reference_objects = []
+
+        with span("resolution.collect") as collect_span, get_session() as session:
+            # Filter to unprocessed references of all documents at once
+            unprocessed_references = self._filter_unprocessed_references(
+                session,
+                [ref for doc in documents for ref in doc.references],
+                resolver_id,
+            )
+            unprocessed_ids = {ref.id for ref in unprocessed_references}
+
+            for doc in documents:
+                unprocessed_references = [
+                    ref for ref in doc.references if ref.id in unprocessed_ids
+                ]
+
                 # Only add to lists if there are unprocessed references
                 if unprocessed_references:
                     texts.append(doc.text)
@@ -91,18 +172,40 @@ class ResolutionService:
                     )
                     reference_objects.append(unprocessed_references)
 
-            # Only call predict if there are documents with unprocessed references
-            if texts:
-                # Get predictions from resolver using raw data
-                predicted_referents = self.resolver.predict(texts, reference_boundaries)
+            collect_span.set("references", len(unprocessed_ids))
 
-                # Record predictions for each document
-                for unprocessed_references, doc_referents in zip(
-                    reference_objects, predicted_referents
-                ):
-                    self._record_referent_predictions(
-                        session, unprocessed_references, doc_referents, resolver_id
-                    )
+        return texts, reference_boundaries, reference_objects
+
+    def _store_referent_predictions(
+        self,
+        reference_objects: List[List["Reference"]],
+        predicted_referents: List[List[t.Union[Tuple[str, str], None]]],
+        resolver_id: str,
+    ) -> None:
+        """
+        Store referent predictions, holding the writer lock only for the writes.
+
+        Args:
+            reference_objects: References of each document
+            predicted_referents: Predicted referents of each document's references
+            resolver_id: ID of the resolver that made the predictions
+        """
+        # Pair each reference with its prediction across all documents
+        references = []
+        referents = []
+        for doc_references, doc_referents in zip(
+            reference_objects, predicted_referents
+        ):
+            for reference, referent in zip(doc_references, doc_referents):
+                references.append(reference)
+                referents.append(referent)
+
+        with span("resolution.store", references=len(references)) as store_span:
+            with write_session() as session:
+                rows = self._record_referent_predictions(
+                    session, references, referents, resolver_id
+                )
+            store_span.set("rows", rows)
 
     def fit(self, documents: List["Document"], **kwargs) -> None:
         """
@@ -161,77 +264,73 @@ class ResolutionService:
         unprocessed_references: List["Reference"],
         predicted_referents: List[t.Union[Tuple[str, str], None]],
         resolver_id: uuid.UUID,
-    ) -> None:
+    ) -> int:
         """
         Process referent predictions and update the database.
 
+        The predicted identifiers of the batch are resolved to feature IDs
+        with a single lookup, and all referents and resolutions are written
+        with bulk inserts and committed together.
+
         Args:
             session: Database session
             unprocessed_references: List of references to process
             predicted_referents: List where each element is either a (gazetteer_name, identifier) tuple
                                 or None for references where predictions are not available
             resolver_id: ID of the resolver that made the predictions
+
+        Returns:
+            Number of referent and resolution rows written
+
+        Raises:
+            ValueError: If a predicted feature does not exist in its gazetteer
         """
+        # Resolvers may return referents as lists or with non-string
+        # identifiers, so key them the way identifiers are stored
+        referent_keys = [
+            (str(referent[0]), str(referent[1])) if referent is not None else None
+            for referent in predicted_referents
+        ]
+
+        # Resolve all predicted identifiers to feature IDs at once
+        feature_ids = FeatureRepository.get_ids_by_gazetteer_and_identifiers(
+            session, [key for key in referent_keys if key is not None]
+        )
+
+        referent_creates = []
+        resolution_creates = []
+
         # Process each reference with its predicted referent
-        for reference, referent in zip(unprocessed_references, predicted_referents):
+        for reference, referent in zip(unprocessed_references, referent_keys):
             # Skip references where predictions are not available
             # (None indicates the resolver couldn't process this reference)
             if referent is None:
                 continue
 
+            if referent not in feature_ids:
+                gazetteer_name, identifier = referent
+                raise ValueError(
+                    f"Feature '{identifier}' not found in gazetteer '{gazetteer_name}'"
+                )
+
             # Create referent record for the single prediction with resolver ID
-            gazetteer_name, identifier = referent
-            self._create_referent_record(
-                session, reference.id, gazetteer_name, identifier, resolver_id
+            referent_creates.append(
+                ReferentCreate(
+                    reference_id=reference.id,
+                    feature_id=feature_ids[referent],
+                    resolver_id=resolver_id,
+                )
             )
 
             # Mark reference as processed
-            self._create_resolution_record(session, reference.id, resolver_id)
-
-    def _create_referent_record(
-        self,
-        session: Session,
-        reference_id: uuid.UUID,
-        gazetteer_name: str,
-        identifier: str,
-        resolver_id: uuid.UUID,
-    ) -> None:
-        """
-        Create a referent record with the resolver ID.
-
-        Args:
-            session: Database session
-            reference_id: ID of the reference
-            gazetteer_name: Name of the gazetteer
-            identifier: Identifier value in the gazetteer
-            resolver_id: ID of the resolver
-        """
-        # Look up the feature by gazetteer and identifier
-        feature = FeatureRepository.get_by_gazetteer_and_identifier(
-            session, gazetteer_name, identifier
-        )
-
-        # Create the referent with resolver ID directly
-        referent_create = ReferentCreate(
-            reference_id=reference_id, feature_id=feature.id, resolver_id=resolver_id
-        )
-        ReferentRepository.create(session, referent_create)
+            resolution_creates.append(
+                ResolutionCreate(reference_id=reference.id, resolver_id=resolver_id)
+            )
 
-    def _create_resolution_record(
-        self, session: Session, reference_id: uuid.UUID, resolver_id: uuid.UUID
-    ) -> None:
-        """
-        Create a resolution record for a reference processed by a specific resolver.
+        ReferentRepository.create_many(session, referent_creates, commit=False)
+        ResolutionRepository.create_many(session, resolution_creates)
 
-        Args:
-            session: Database session
-            reference_id: ID of the reference that was processed
-            resolver_id: ID of the resolver that processed it
-        """
-        resolution_create = ResolutionCreate(
-            reference_id=reference_id, resolver_id=resolver_id
-        )
-        ResolutionRepository.create(session, resolution_create)
+        return len(referent_creates) + len(resolution_creates)
 
     def _filter_unprocessed_references(
         self, session: Session, references: List["Reference"], resolver_id: str
@@ -247,12 +346,7 @@ class ResolutionService:
         Returns:
             List of references that haven't been processed by this resolver.
         """
-        unprocessed_references = []
-        for ref in references:
-            # Check if this reference has already been processed by this resolver
-            existing_resolution = ResolutionRepository.get_by_reference_and_resolver(
-                session, ref.id, resolver_id
-            )
-            if not existing_resolution:
-                unprocessed_references.append(ref)
-        return unprocessed_references
+        unprocessed_ids = ResolutionRepository.get_unprocessed_reference_ids(
+            session, [ref.id for ref in references], resolver_id
+        )
+        return [ref for ref in references if ref.id in unprocessed_ids]
@@ -0,0 +1 @@
+from geoparser.tracing.tracer import Span, Trace, span, trace
@@ -0,0 +1,302 @@
+import contextvars
+import itertools
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Union
+
+# Formats in which a trace can be written to a file
+TRACE_FORMATS = ("json", "chrome")
+
+# Trace collecting the spans of all threads, or None while tracing is disabled
+_active_trace: Optional["Trace"] = None
+_active_trace_lock = threading.Lock()
+
+# Span that is currently open in this thread or task, used as parent of new spans
+_current_span: contextvars.ContextVar[Optional["Span"]] = contextvars.ContextVar(
+    "geoparser_current_span", default=None
+)
+
+
+class Span:
+    """
+    A timed section of work within a trace.
+
+    Spans are opened with span() and closed when their with-block exits. Counts
+    describing the work, such as the number of candidates or rows written, are
+    recorded as attributes with set() and add().
+    """
+
+    __slots__ = (
+        "trace",
+        "id",
+        "parent_id",
+        "name",
+        "attributes",
+        "thread_id",
+        "start",
+        "end",
+        "_token",
+    )
+
+    def __init__(self, trace: "Trace", name: str, attributes: Dict[str, Any]):
+        """
+        Initialize a span.
+
+        Args:
+            trace: Trace the span is recorded in
+            name: Name of the span, e.g. "resolver.gather_candidates"
+            attributes: Initial attributes of the span
+        """
+        self.trace = trace
+        self.id = next(trace._ids)
+        self.parent_id: Optional[int] = None
+        self.name = name
+        self.attributes = attributes
+        self.thread_id = threading.get_ident()
+        self.start = 0
+        self.end = 0
+        self._token = None
+
+    def set(self, key: str, value: Any) -> None:
+        """
+        Set an attribute of the span.
+
+        Args:
+            key: Attribute name
+            value: JSON-serializable attribute value
+        """
+        self.attributes[key] = value
+
+    def add(self, key: str, amount: int = 1) -> None:
+        """
+        Add to a counting attribute of the span.
+
+        Args:
+            key: Attribute name
+            amount: Amount to add (default: 1)
+        """
+        self.attributes[key] = self.attributes.get(key, 0) + amount
+
+    @property
+    def duration(self) -> float:
+        """Duration of the span in seconds."""
+        return (self.end - self.start) / 1e9
+
+    def __enter__(self) -> "Span":
+        parent = _current_span.get()
+        if parent is not None and parent.trace is self.trace:
+            self.parent_id = parent.id
+        self._token = _current_span.set(self)
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.end = time.perf_counter_ns()
+        _current_span.reset(self._token)
+        if exc_type is not None:
+            self.attributes["error"] = exc_type.__name__
+        self.trace._record(self)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert the span to a dictionary.
+
+        Returns:
+            Dictionary with the span's name, IDs, thread, start time and
+            duration in seconds relative to the start of the trace, and attributes
+        """
+        return {
+            "id": self.id,
+            "parent_id": self.parent_id,
+            "name": self.name,
+            "thread_id": self.thread_id,
+            "start": (self.start - self.trace.start) / 1e9,
+            "duration": self.duration,
+            "attributes": self.attributes,
+        }
+
+
+class _DisabledSpan:
+    """
+    Span returned while tracing is disabled, which records nothing.
+    """
+
+    __slots__ = ()
+
+    def set(self, key: str, value: Any) -> None:
+        pass
+
+    def add(self, key: str, amount: int = 1) -> None:
+        pass
+
+    def __enter__(self) -> "_DisabledSpan":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        pass
+
+
+_DISABLED_SPAN = _DisabledSpan()
+
+
+class Trace:
+    """
+    Collection of the spans recorded while tracing was enabled.
+
+    Spans of all threads are collected, so the work of thread pools, such as
+    concurrent gazetteer lookups, appears in the same trace.
+    """
+
+    def __init__(self):
+        """
+        Initialize an empty trace starting now.
+        """
+        self.start = time.perf_counter_ns()
+        self.spans: List[Span] = []
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+
+    def _record(self, span: Span) -> None:
+        """
+        Add a finished span to the trace.
+
+        Args:
+            span: The finished span
+        """
+        with self._lock:
+            self.spans.append(span)
+
+    def to_dicts(self) -> List[Dict[str, Any]]:
+        """
+        Convert the recorded spans to dictionaries, ordered by start time.
+
+        Returns:
+            List of span dictionaries as returned by Span.to_dict()
+        """
+        with self._lock:
+            spans = sorted(self.spans, key=lambda span: span.start)
+        return [span.to_dict() for span in spans]
+
+    def to_chrome_trace(self) -> Dict[str, Any]:
+        """
+        Convert the recorded spans to the Chrome trace event format.
+
+        The result can be opened in chrome://tracing or Perfetto, which show the
+        spans of each thread on a timeline.
+
+        Returns:
+            Dictionary with one complete event per span
+        """
+        pid = os.getpid()
+        return {
+            "traceEvents": [
+                {
+                    "name": span["name"],
+                    "cat": "geoparser",
+                    "ph": "X",
+                    "ts": span["start"] * 1e6,
+                    "dur": span["duration"] * 1e6,
+                    "pid": pid,
+                    "tid": span["thread_id"],
+                    "args": span["attributes"],
+                }
+                for span in self.to_dicts()
+            ],
+            "displayTimeUnit": "ms",
+        }
+
+    def export(self, path: Union[str, Path], format: str = "json") -> None:
+        """
+        Write the trace to a file.
+
+        Args:
+            path: Path of the file to write
+            format: "json" for a list of spans, or "chrome" for the Chrome trace
+                    event format (default: "json")
+
+        Raises:
+            ValueError: If the format is not supported
+        """
+        _check_format(format)
+
+        data = self.to_chrome_trace() if format == "chrome" else self.to_dicts()
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f, default=str)
+
+
+def span(name: str, **attributes: Any) -> Union[Span, _DisabledSpan]:
+    """
+    Open a span around a section of work, if tracing is enabled.
+
+    While tracing is disabled, a shared span that records nothing is returned,
+    so instrumented code costs next to nothing.
+
+    Args:
+        name: Name of the span, e.g. "resolver.gather_candidates"
+        **attributes: Initial attributes of the span
+
+    Returns:
+        Span to be used as a context manager
+    """
+    active = _active_trace
+    if active is None:
+        return _DISABLED_SPAN
+    return Span(active, name, attributes)
+
+
+@contextmanager
+def trace(
+    path: Optional[Union[str, Path]] = None, format: str = "json"
+) -> Iterator[Trace]:
+    """
+    Record the spans of all threads while the with-block runs.
+
+    Args:
+        path: Optional path of a file the trace is written to when the block exits
+        format: Format of the file, "json" or "chrome" (default: "json")
+
+    Yields:
+        The trace collecting the spans
+
+    Raises:
+        ValueError: If the format is not supported
+        RuntimeError: If tracing is already enabled
+    """
+    global _active_trace
+
+    _check_format(format)
+
+    with _active_trace_lock:
+        if _active_trace is not None:
+            raise RuntimeError("Tracing is already enabled")
+        _active_trace = Trace()
+        current = _active_trace
+
+    try:
+        yield current
+    finally:
+        with _active_trace_lock:
+            _active_trace = None
+        if path is not None:
+            current.export(path, format=format)
+
+
+def _check_format(format: str) -> None:
+    """
+    Check that a trace file format is supported.
+
+    Args:
+        format: Name of the format
+
+    Raises:
+        ValueError: If the format is not supported
+    """
+    if format not in TRACE_FORMATS:
+        raise ValueError(
+            f"Unsupported trace format '{format}'. "
+            f"Supported formats: {', '.join(TRACE_FORMATS)}"
+        )
@@ -12,6 +12,8 @@ pytest_plugins = [
     "tests.fixtures.models",
     "tests.fixtures.modules",
     "tests.fixtures.gazetteer",
+    "tests.fixtures.embedding",
+    "tests.fixtures.interpreter",
 ]
 
 
@@ -84,3 +84,32 @@ def patch_db(test_engine: Engine):
     """
     with patch("geoparser.db.db.engine", test_engine):
         yield
+
+
+@pytest.fixture(scope="function")
+def file_db(tmp_path) -> Engine:
+    """
+    Redirect database access to a file database with one connection per thread.
+
+    The in-memory test database shares a single connection between all
+    sessions, so concurrent sessions in different threads would interfere
+    with each other's transactions. Tests that run database work in several
+    threads use this fixture instead, which behaves like production.
+
+    Args:
+        tmp_path: Temporary directory for the database file
+
+    Yields:
+        SQLAlchemy Engine instance with a file database
+    """
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'geoparser.db'}",
+        echo=False,
+        connect_args={"check_same_thread": False},
+    )
+    SQLModel.metadata.create_all(engine)
+    try:
+        with patch("geoparser.db.db.engine", engine):
+            yield engine
+    finally:
+        engine.dispose()
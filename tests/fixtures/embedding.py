@@ -0,0 +1,44 @@
+"""
+Embedding server fixtures for testing.
+
+This module provides an embedding server with a mocked transformer that
+listens on a temporary Unix socket.
+"""
+
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from geoparser.embedding import EmbeddingServer
+
+
+def fake_encode(texts, **kwargs):
+    """Embed each text as its length and a constant."""
+    return np.array([[len(text), 1.0] for text in texts], dtype=np.float32)
+
+
+@pytest.fixture
+def embedding_server(tmp_path):
+    """
+    Start an embedding server with a mocked transformer.
+
+    Args:
+        tmp_path: Temporary directory for the socket
+
+    Yields:
+        Running EmbeddingServer whose transformer is a mock
+    """
+    with patch("geoparser.embedding.server.SentenceTransformer") as mock_transformer:
+        mock_transformer.return_value.get_sentence_embedding_dimension.return_value = 2
+        mock_transformer.return_value.get_max_seq_length.return_value = 256
+        mock_transformer.return_value.encode.side_effect = fake_encode
+
+        server = EmbeddingServer(
+            model_name="test-model", socket_path=str(tmp_path / "e.sock")
+        )
+        server.start()
+        try:
+            yield server
+        finally:
+            server.shutdown()
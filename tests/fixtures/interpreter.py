@@ -0,0 +1,63 @@
+"""
+Fresh interpreter fixtures for testing.
+
+This module provides fixtures that run code in a new Python interpreter, for
+tests of import side effects and import time that the already initialized
+test process cannot observe.
+"""
+
+import subprocess
+import sys
+
+import pytest
+
+# Number of fresh interpreters whose fastest import is compared to a budget.
+# Taking the fastest run discards delays caused by other load on the machine.
+IMPORT_TIME_RUNS = 5
+
+
+@pytest.fixture
+def run_python():
+    """
+    Factory fixture for running Python code in a fresh interpreter.
+
+    Returns:
+        Function that runs code, optionally with the given environment
+        variables, and returns the interpreter's standard output
+    """
+
+    def _run_python(code: str, env: dict = None) -> str:
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            timeout=60,
+            check=True,
+            env=env,
+        )
+        return result.stdout.strip()
+
+    return _run_python
+
+
+@pytest.fixture
+def import_time(run_python):
+    """
+    Factory fixture for measuring the time of importing a module.
+
+    Args:
+        run_python: Fixture running code in a fresh interpreter
+
+    Returns:
+        Function that imports a module in IMPORT_TIME_RUNS fresh interpreters
+        and returns the fastest import time in seconds
+    """
+
+    def _import_time(module: str) -> float:
+        code = (
+            f"import time; start = time.perf_counter(); import {module}; "
+            "print(time.perf_counter() - start)"
+        )
+        return min(float(run_python(code)) for _ in range(IMPORT_TIME_RUNS))
+
+    return _import_time
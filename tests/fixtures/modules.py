@@ -13,11 +13,26 @@ import pytest
 
 from geoparser.modules.recognizers.manual import ManualRecognizer
 from geoparser.modules.recognizers.spacy import SpacyRecognizer
+from geoparser.modules.registry import model_registry
 from geoparser.modules.resolvers.manual import ManualResolver
 from geoparser.modules.resolvers.sentencetransformer import (
     SentenceTransformerResolver,
 )
 
+
+@pytest.fixture(autouse=True)
+def clear_model_registry():
+    """
+    Automatically clear the shared model registry around every test.
+
+    Modules acquire their models from the process-wide registry, so models
+    (or mocks of them) loaded by one test must not be reused by the next.
+    """
+    model_registry.clear()
+    yield
+    model_registry.clear()
+
+
 # Mock Recognizers for Unit Tests
 
 
@@ -293,3 +293,44 @@ class TestGazetteerIntegration:
         assert hasattr(feature.source, "gazetteer")
         assert feature.source.gazetteer is not None
         assert feature.source.gazetteer.name == "andorranames"
+
+    def test_feature_has_stored_coordinates(self, andorra_gazetteer):
+        """Test that installation stores representative point coordinates."""
+        # Arrange
+        gazetteer = Gazetteer("andorranames")
+
+        # Act
+        feature = gazetteer.find("3041563")
+
+        # Assert
+        assert feature.longitude == pytest.approx(feature.geometry.x)
+        assert feature.latitude == pytest.approx(feature.geometry.y)
+        assert (feature.x, feature.y) == (feature.longitude, feature.latitude)
+
+    def test_coordinates_returns_array_aligned_with_ids(self, andorra_gazetteer):
+        """Test that coordinates are returned in the order of the given IDs."""
+        # Arrange
+        gazetteer = Gazetteer("andorranames")
+        features = gazetteer.search("Andorra", method="partial")[:5]
+
+        # Act
+        coordinates = gazetteer.coordinates([feature.id for feature in features])
+
+        # Assert
+        assert coordinates.shape == (len(features), 2)
+        for row, feature in zip(coordinates, features):
+            assert tuple(row) == pytest.approx((feature.longitude, feature.latitude))
+
+    def test_geometries_match_feature_geometries(self, andorra_gazetteer):
+        """Test that bulk geometries equal the per-feature geometries."""
+        # Arrange
+        gazetteer = Gazetteer("andorranames")
+        features = gazetteer.search("Andorra", method="partial")[:5]
+
+        # Act
+        geometries = gazetteer.geometries([feature.id for feature in features])
+
+        # Assert
+        assert len(geometries) == len(features)
+        for geometry, feature in zip(geometries, features):
+            assert geometry.equals(feature.geometry)
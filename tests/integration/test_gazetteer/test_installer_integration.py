@@ -6,7 +6,7 @@ Tests gazetteer installation with real Andorra data files.
 
 import pytest
 from sqlalchemy import text
-from sqlmodel import select
+from sqlmodel import SQLModel, create_engine, select
 
 from geoparser.db.models import Feature, Gazetteer, Name, Source
 from geoparser.gazetteer.installer.installer import GazetteerInstaller
@@ -343,3 +343,51 @@ class TestGazetteerInstallerIntegration:
         sources = test_session.exec(statement).all()
         # Andorra config should have at least one source table
         assert len(sources) >= 1
+
+
+@pytest.mark.integration
+class TestGazetteerFileInstallationIntegration:
+    """Integration tests for installing gazetteers into their own files."""
+
+    @pytest.fixture
+    def file_engine(self, tmp_path, monkeypatch):
+        """Point the module engine at a file database and restore attachments."""
+        import geoparser.db.db as db
+
+        engine = create_engine(
+            f"sqlite:///{tmp_path / 'geoparser.db'}", connect_args={"uri": True}
+        )
+        SQLModel.metadata.create_all(engine)
+        monkeypatch.setattr(db, "engine", engine)
+        monkeypatch.setattr(db, "_gazetteer_files", {})
+        monkeypatch.setattr(db, "_gazetteer_files_owner", None)
+        monkeypatch.setattr(db, "_gazetteer_files_version", 0)
+        yield engine
+        engine.dispose()
+
+    def test_installs_andorra_into_gazetteer_file(
+        self, file_engine, tmp_path, andorra_config_path
+    ):
+        """Test that source tables live in the gazetteer file, not the main one."""
+        # Arrange
+        from geoparser.gazetteer import Gazetteer as GazetteerAPI
+
+        installer = GazetteerInstaller()
+
+        # Act
+        installer.install(andorra_config_path, chunksize=5000, keep_downloads=False)
+
+        # Assert
+        assert (tmp_path / "gazetteers" / "andorranames.db").exists()
+        with file_engine.connect() as connection:
+            main_tables = connection.execute(
+                text("SELECT name FROM main.sqlite_master WHERE type='table'")
+            ).scalars()
+            assert "andorra" not in list(main_tables)
+
+        gazetteer = GazetteerAPI("andorranames")
+        results = gazetteer.search("Andorra la Vella", method="exact")
+        assert len(results) > 0
+        feature = gazetteer.find(str(results[0].location_id_value))
+        assert feature.data["name"] == "Andorra la Vella"
+        assert feature.geometry is not None
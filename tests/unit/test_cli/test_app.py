@@ -6,6 +6,11 @@ Tests the CLI application setup.
 
 import pytest
 
+# Seconds that the fastest of several imports of the CLI in a fresh
+# interpreter may take. Importing the subcommand implementations eagerly
+# takes several seconds.
+STARTUP_TIME_BUDGET = 0.5
+
 
 @pytest.mark.unit
 class TestCliApp:
@@ -42,6 +47,39 @@ class TestCliApp:
         # Assert
         assert "install" in commands
 
+    def test_app_has_ingest_command(self):
+        """Test that app has ingest command registered."""
+        # Arrange
+        from geoparser.cli.app import app
+
+        # Act - Get registered commands
+        commands = {cmd.name: cmd for cmd in app.registered_commands}
+
+        # Assert
+        assert "ingest" in commands
+
+    def test_app_has_serve_command(self):
+        """Test that app has serve command registered."""
+        # Arrange
+        from geoparser.cli.app import app
+
+        # Act - Get registered commands
+        commands = {cmd.name: cmd for cmd in app.registered_commands}
+
+        # Assert
+        assert "serve" in commands
+
+    def test_app_has_embedding_server_command(self):
+        """Test that app has embedding-server command registered."""
+        # Arrange
+        from geoparser.cli.app import app
+
+        # Act - Get registered commands
+        commands = {cmd.name: cmd for cmd in app.registered_commands}
+
+        # Assert
+        assert "embedding-server" in commands
+
     def test_app_has_download_command_as_deprecated_alias(self):
         """Test that app keeps download registered as deprecated."""
         # Arrange
@@ -53,3 +91,29 @@ class TestCliApp:
         # Assert
         assert "download" in commands
         assert commands["download"].deprecated is True
+
+
+@pytest.mark.unit
+class TestCliStartup:
+    """Test that starting the CLI does not import the subcommand implementations."""
+
+    def test_import_does_not_load_subcommand_dependencies(self, run_python):
+        """Test that importing the CLI loads none of the heavy dependencies."""
+        # Act
+        output = run_python(
+            "import sys, geoparser.cli.app; "
+            "print(','.join(m for m in ('fastapi', 'pyproj', 'spacy', 'torch', "
+            "'sentence_transformers', 'pandas', 'sqlalchemy', 'numpy') "
+            "if m in sys.modules))"
+        )
+
+        # Assert
+        assert output == ""
+
+    def test_startup_stays_within_budget(self, import_time):
+        """Test that importing the CLI stays within the startup time budget."""
+        # Act
+        seconds = import_time("geoparser.cli.app")
+
+        # Assert
+        assert seconds < STARTUP_TIME_BUDGET
@@ -0,0 +1,44 @@
+"""
+Unit tests for geoparser/cli/embedding.py
+
+Tests the embedding server CLI functionality.
+"""
+
+from unittest.mock import patch
+
+import pytest
+from typer.testing import CliRunner
+
+from geoparser.cli.app import app
+
+
+@pytest.mark.unit
+class TestEmbeddingServerCli:
+    """Test embedding_server_cli() function."""
+
+    @patch("geoparser.embedding.server.EmbeddingServer")
+    def test_starts_server_with_options(self, mock_server):
+        """Test that the server is created with the given options and started."""
+        # Act
+        result = CliRunner().invoke(
+            app,
+            [
+                "embedding-server",
+                "--model-name",
+                "dguzh/geo-all-distilroberta-v1",
+                "--socket",
+                "/tmp/e.sock",
+                "--cache-size",
+                "1000",
+            ],
+        )
+
+        # Assert
+        assert result.exit_code == 0
+        mock_server.assert_called_once_with(
+            model_name="dguzh/geo-all-distilroberta-v1",
+            socket_path="/tmp/e.sock",
+            cache_size=1000,
+        )
+        mock_server.return_value.serve_forever.assert_called_once()
+        assert "/tmp/e.sock" in result.output
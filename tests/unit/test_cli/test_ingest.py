@@ -0,0 +1,44 @@
+"""
+Unit tests for geoparser/cli/ingest.py
+
+Tests the ingest CLI functionality.
+"""
+
+from unittest.mock import patch
+
+import pytest
+from typer.testing import CliRunner
+
+from geoparser.cli.app import app
+
+
+@pytest.mark.unit
+class TestIngestCli:
+    """Test ingest_cli() function."""
+
+    @patch("geoparser.project.Project")
+    def test_ingests_path_into_project(self, mock_project):
+        """Test that the path is ingested into the named project."""
+        # Arrange
+        mock_project.return_value.ingest_documents.return_value = 3
+
+        # Act
+        result = CliRunner().invoke(
+            app,
+            [
+                "ingest",
+                "news",
+                "articles.jsonl",
+                "--batch-size",
+                "500",
+                "--deduplicate",
+            ],
+        )
+
+        # Assert
+        assert result.exit_code == 0
+        mock_project.assert_called_once_with("news")
+        mock_project.return_value.ingest_documents.assert_called_once_with(
+            "articles.jsonl", batch_size=500, text_field="text", deduplicate=True
+        )
+        assert "Ingested 3 documents into project 'news'" in result.output
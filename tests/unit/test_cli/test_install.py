@@ -81,7 +81,7 @@ class TestGetBuiltinGazetteers:
 class TestInstallCli:
     """Test install_cli() function."""
 
-    @patch("geoparser.cli.install.GazetteerInstaller")
+    @patch("geoparser.gazetteer.installer.installer.GazetteerInstaller")
     @patch("geoparser.cli.install.Path")
     def test_installs_from_existing_file_path(self, mock_path_class, mock_installer):
         """Test that gazetteer is installed when config file exists."""
@@ -96,12 +96,12 @@ class TestInstallCli:
         mock_installer.return_value = mock_installer_instance
 
         # Act
-        install_cli("path/to/config.yaml")
+        install_cli("path/to/config.yaml", coordinates_only=False)
 
         # Assert
         mock_installer_instance.install.assert_called_once_with(mock_path)
 
-    @patch("geoparser.cli.install.GazetteerInstaller")
+    @patch("geoparser.gazetteer.installer.installer.GazetteerInstaller")
     @patch("geoparser.cli.install._get_builtin_gazetteers")
     @patch("geoparser.cli.install.Path")
     def test_uses_builtin_gazetteer_when_name_matches(
@@ -122,11 +122,33 @@ class TestInstallCli:
         mock_installer.return_value = mock_installer_instance
 
         # Act
-        install_cli("geonames")
+        install_cli("geonames", coordinates_only=False)
 
         # Assert
         mock_installer_instance.install.assert_called_once_with(builtin_path)
 
+    @patch("geoparser.gazetteer.installer.installer.GazetteerInstaller")
+    @patch("geoparser.cli.install.Path")
+    def test_only_backfills_coordinates_when_requested(
+        self, mock_path_class, mock_installer
+    ):
+        """Test that --coordinates-only backfills coordinates instead of installing."""
+        # Arrange
+        from geoparser.cli.install import install_cli
+
+        mock_path = Mock()
+        mock_path.exists.return_value = True
+        mock_path_class.return_value = mock_path
+
+        # Act
+        install_cli("path/to/config.yaml", coordinates_only=True)
+
+        # Assert
+        mock_installer.return_value.backfill_coordinates.assert_called_once_with(
+            mock_path
+        )
+        mock_installer.return_value.install.assert_not_called()
+
     @patch("geoparser.cli.install._get_builtin_gazetteers")
     @patch("geoparser.cli.install.Path")
     def test_raises_error_when_config_not_found(
@@ -173,7 +195,7 @@ class TestInstallCli:
         assert "swissnames3d" in error_message
         assert "Available built-in gazetteer configs" in error_message
 
-    @patch("geoparser.cli.install.GazetteerInstaller")
+    @patch("geoparser.gazetteer.installer.installer.GazetteerInstaller")
     @patch("geoparser.cli.install._get_builtin_gazetteers")
     @patch("geoparser.cli.install.Path")
     def test_creates_installer_instance(
@@ -191,7 +213,7 @@ class TestInstallCli:
         mock_installer.return_value = mock_installer_instance
 
         # Act
-        install_cli("path/to/config.yaml")
+        install_cli("path/to/config.yaml", coordinates_only=False)
 
         # Assert
         mock_installer.assert_called_once()
@@ -0,0 +1,67 @@
+"""
+Unit tests for geoparser/cli/serve.py
+
+Tests the serve CLI functionality.
+"""
+
+from unittest.mock import patch
+
+import pytest
+from typer.testing import CliRunner
+
+from geoparser.cli.app import app
+
+
+@pytest.mark.unit
+class TestServeCli:
+    """Test serve_cli() function."""
+
+    @patch("geoparser.server.serve")
+    @patch("geoparser.geoparser.Geoparser")
+    def test_loads_geoparser_and_serves(self, mock_geoparser, mock_serve):
+        """Test that the geoparser is loaded and served with the given options."""
+        # Act
+        result = CliRunner().invoke(
+            app,
+            [
+                "serve",
+                "--port",
+                "9000",
+                "--workers",
+                "4",
+                "--max-batch-size",
+                "64",
+                "--max-wait-ms",
+                "25",
+            ],
+        )
+
+        # Assert
+        assert result.exit_code == 0
+        mock_geoparser.assert_called_once_with()
+        mock_serve.assert_called_once_with(
+            mock_geoparser.return_value,
+            host="127.0.0.1",
+            port=9000,
+            workers=4,
+            max_batch_size=64,
+            max_wait=0.025,
+        )
+
+    @patch("geoparser.server.serve")
+    @patch("geoparser.geoparser.Geoparser")
+    def test_uses_defaults(self, mock_geoparser, mock_serve):
+        """Test that default options are passed to serve."""
+        # Act
+        result = CliRunner().invoke(app, ["serve"])
+
+        # Assert
+        assert result.exit_code == 0
+        mock_serve.assert_called_once_with(
+            mock_geoparser.return_value,
+            host="127.0.0.1",
+            port=8000,
+            workers=1,
+            max_batch_size=32,
+            max_wait=0.01,
+        )
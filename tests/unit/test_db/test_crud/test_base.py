@@ -44,6 +44,43 @@ class TestBaseRepositoryCreate:
         assert retrieved_project.name == "Persistent Project"
 
 
+@pytest.mark.unit
+class TestBaseRepositoryCreateMany:
+    """Test the create_many method of BaseRepository."""
+
+    def test_creates_all_records(self, test_session: Session):
+        """Test that create_many inserts every record with generated IDs."""
+        # Arrange
+        projects = [ProjectCreate(name="Project A"), ProjectCreate(name="Project B")]
+
+        # Act
+        ProjectRepository.create_many(test_session, projects)
+
+        # Assert
+        created = ProjectRepository.get_all(test_session)
+        assert sorted(project.name for project in created) == ["Project A", "Project B"]
+        assert all(isinstance(project.id, uuid.UUID) for project in created)
+
+    def test_defers_commit(self, test_session: Session):
+        """Test that create_many leaves the transaction open without commit."""
+        # Act
+        ProjectRepository.create_many(
+            test_session, [ProjectCreate(name="Project A")], commit=False
+        )
+        test_session.rollback()
+
+        # Assert
+        assert ProjectRepository.get_all(test_session) == []
+
+    def test_handles_empty_input(self, test_session: Session):
+        """Test that create_many accepts an empty list."""
+        # Act
+        ProjectRepository.create_many(test_session, [])
+
+        # Assert
+        assert ProjectRepository.get_all(test_session) == []
+
+
 @pytest.mark.unit
 class TestBaseRepositoryGet:
     """Test the get method of BaseRepository."""
@@ -72,3 +72,97 @@ class TestDocumentRepositoryGetByProject:
         assert len(documents) == 1
         assert documents[0].id == doc1_proj1.id
         assert documents[0].text == "Doc in Project 1"
+
+
+@pytest.mark.unit
+class TestDocumentRepositoryGetContentHashesByProject:
+    """Test the get_content_hashes_by_project method of DocumentRepository."""
+
+    def test_returns_hashes_of_project_documents(
+        self,
+        test_session: Session,
+        project_factory,
+        document_factory,
+    ):
+        """Test that only hashes of documents in the given project are returned."""
+        # Arrange
+        project = project_factory()
+        other_project = project_factory(name="Other Project")
+        document_1 = document_factory(text="Document 1", project_id=project.id)
+        document_2 = document_factory(text="Document 2", project_id=other_project.id)
+
+        # Act
+        found = DocumentRepository.get_content_hashes_by_project(
+            test_session,
+            project.id,
+            [document_1.content_hash, document_2.content_hash, "unknown"],
+        )
+
+        # Assert
+        assert found == {document_1.content_hash}
+
+
+@pytest.mark.unit
+class TestDocumentRepositoryGetByIds:
+    """Test the get_by_ids method of DocumentRepository."""
+
+    def test_returns_requested_documents_in_id_order(
+        self,
+        test_session: Session,
+        project_factory,
+        document_factory,
+    ):
+        """Test that only the requested documents are returned, ordered by ID."""
+        # Arrange
+        project = project_factory()
+        documents = [
+            document_factory(text=f"Document {i}", project_id=project.id)
+            for i in range(3)
+        ]
+        requested = [documents[2].id, documents[0].id]
+
+        # Act
+        result = DocumentRepository.get_by_ids(test_session, requested)
+
+        # Assert
+        assert [doc.id for doc in result] == sorted(requested)
+
+    def test_returns_empty_list_for_no_ids(self, test_session: Session):
+        """Test that an empty list of IDs returns no documents."""
+        # Act
+        result = DocumentRepository.get_by_ids(test_session, [])
+
+        # Assert
+        assert result == []
+
+
+@pytest.mark.unit
+class TestDocumentRepositoryGetPageByProject:
+    """Test the get_page_by_project method of DocumentRepository."""
+
+    def test_pages_by_id(
+        self,
+        test_session: Session,
+        project_factory,
+        document_factory,
+    ):
+        """Test that pages continue after the given ID in ID order."""
+        # Arrange
+        project = project_factory()
+        documents = [
+            document_factory(text=f"Document {i}", project_id=project.id)
+            for i in range(3)
+        ]
+        ids = sorted(doc.id for doc in documents)
+
+        # Act
+        first_page = DocumentRepository.get_page_by_project(
+            test_session, project.id, limit=2
+        )
+        second_page = DocumentRepository.get_page_by_project(
+            test_session, project.id, after_id=first_page[-1].id, limit=2
+        )
+
+        # Assert
+        assert [doc.id for doc in first_page] == ids[:2]
+        assert [doc.id for doc in second_page] == ids[2:]
@@ -7,6 +7,8 @@ Tests the FeatureRepository with focus on FTS search methods.
 from unittest.mock import Mock
 
 import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
 
 from geoparser.db.crud.feature import FeatureRepository
 
@@ -51,6 +53,321 @@ class TestFeatureRepositoryGetByGazetteerAndIdentifier:
         test_session.exec.assert_called_once()
 
 
+@pytest.mark.unit
+class TestFeatureRepositoryGetIdsByGazetteerAndIdentifiers:
+    """Test FeatureRepository.get_ids_by_gazetteer_and_identifiers() method."""
+
+    def test_maps_pairs_to_feature_ids(
+        self, test_session, gazetteer_factory, source_factory, feature_factory
+    ):
+        """Test that identifiers are mapped to IDs within their gazetteer."""
+        # Arrange
+        gazetteer1 = gazetteer_factory(name="gaz1")
+        gazetteer2 = gazetteer_factory(name="gaz2")
+        source1 = source_factory(name="source1", gazetteer_id=gazetteer1.id)
+        source2 = source_factory(name="source2", gazetteer_id=gazetteer2.id)
+        feature1 = feature_factory(location_id_value="1", source_id=source1.id)
+        feature2 = feature_factory(location_id_value="2", source_id=source1.id)
+        feature3 = feature_factory(location_id_value="1", source_id=source2.id)
+
+        # Act
+        result = FeatureRepository.get_ids_by_gazetteer_and_identifiers(
+            test_session, [("gaz1", "1"), ("gaz1", "2"), ("gaz2", "1"), ("gaz1", "1")]
+        )
+
+        # Assert
+        assert result == {
+            ("gaz1", "1"): feature1.id,
+            ("gaz1", "2"): feature2.id,
+            ("gaz2", "1"): feature3.id,
+        }
+
+    def test_omits_unknown_pairs(self, test_session, feature_factory):
+        """Test that pairs without a matching feature are left out."""
+        # Arrange
+        feature_factory(location_id_value="1")
+
+        # Act
+        result = FeatureRepository.get_ids_by_gazetteer_and_identifiers(
+            test_session, [("missing_gazetteer", "1")]
+        )
+
+        # Assert
+        assert result == {}
+
+
+@pytest.mark.unit
+class TestFeatureRepositoryGetByIds:
+    """Test FeatureRepository.get_by_ids() method."""
+
+    def test_returns_features_with_given_ids(self, test_session, feature_factory):
+        """Test that all requested features are returned."""
+        # Arrange
+        feature1 = feature_factory(location_id_value="1")
+        feature2 = feature_factory(location_id_value="2")
+        feature_factory(location_id_value="3")
+
+        # Act
+        result = FeatureRepository.get_by_ids(test_session, [feature1.id, feature2.id])
+
+        # Assert
+        assert {feature.id for feature in result} == {feature1.id, feature2.id}
+
+    def test_queries_ids_in_chunks(self, test_session, feature_factory, monkeypatch):
+        """Test that large ID lists are split across several queries."""
+        # Arrange
+        import geoparser.db.crud.feature as feature_module
+
+        monkeypatch.setattr(feature_module, "IN_CLAUSE_CHUNKSIZE", 2)
+        features = [feature_factory(location_id_value=str(i)) for i in range(5)]
+
+        # Act
+        result = FeatureRepository.get_by_ids(test_session, [f.id for f in features])
+
+        # Assert
+        assert {feature.id for feature in result} == {f.id for f in features}
+
+    def test_returns_empty_list_without_querying_for_no_ids(self, test_session):
+        """Test that an empty ID list short-circuits the query."""
+        # Arrange
+        test_session.exec = Mock()
+
+        # Act
+        result = FeatureRepository.get_by_ids(test_session, [])
+
+        # Assert
+        assert result == []
+        test_session.exec.assert_not_called()
+
+
+@pytest.mark.unit
+class TestFeatureRepositoryGetPolygonsByGazetteer:
+    """Test FeatureRepository.get_polygons_by_gazetteer() method."""
+
+    def test_returns_only_polygonal_geometries(
+        self, test_session, gazetteer_factory, source_factory, feature_factory
+    ):
+        """Test that point geometries are excluded."""
+        # Arrange
+        gazetteer = gazetteer_factory(name="test_gaz")
+        source = source_factory(
+            name="test_boundaries", location_id_name="id", gazetteer_id=gazetteer.id
+        )
+        test_session.exec(
+            text("CREATE TABLE test_boundaries (id INTEGER PRIMARY KEY, geometry TEXT)")
+        )
+        test_session.exec(
+            text(
+                "INSERT INTO test_boundaries VALUES "
+                "(1, 'POLYGON ((0 0, 1 0, 1 1, 0 0))'), "
+                "(2, 'MULTIPOLYGON (((0 0, 1 0, 1 1, 0 0)))'), "
+                "(3, 'POINT (0 0)')"
+            )
+        )
+        polygon = feature_factory(location_id_value="1", source_id=source.id)
+        multipolygon = feature_factory(location_id_value="2", source_id=source.id)
+        feature_factory(location_id_value="3", source_id=source.id)
+
+        # Act
+        result = FeatureRepository.get_polygons_by_gazetteer(test_session, "test_gaz")
+
+        # Assert
+        assert sorted(result) == [
+            (polygon.id, "POLYGON ((0 0, 1 0, 1 1, 0 0))"),
+            (multipolygon.id, "MULTIPOLYGON (((0 0, 1 0, 1 1, 0 0)))"),
+        ]
+
+    def test_skips_sources_without_geometry(
+        self, test_session, gazetteer_factory, source_factory, feature_factory
+    ):
+        """Test that sources lacking a geometry column are ignored."""
+        # Arrange
+        gazetteer = gazetteer_factory(name="test_gaz")
+        source = source_factory(
+            name="test_names", location_id_name="id", gazetteer_id=gazetteer.id
+        )
+        test_session.exec(
+            text("CREATE TABLE test_names (id INTEGER PRIMARY KEY, name TEXT)")
+        )
+        feature_factory(location_id_value="1", source_id=source.id)
+
+        # Act
+        result = FeatureRepository.get_polygons_by_gazetteer(test_session, "test_gaz")
+
+        # Assert
+        assert result == []
+
+    def test_raises_for_missing_source_table(
+        self, test_session, gazetteer_factory, source_factory, feature_factory
+    ):
+        """Test that database errors other than a missing geometry column propagate."""
+        # Arrange
+        gazetteer = gazetteer_factory(name="test_gaz")
+        source = source_factory(
+            name="test_missing", location_id_name="id", gazetteer_id=gazetteer.id
+        )
+        test_session.exec(text("CREATE VIEW test_missing AS SELECT * FROM test_gone"))
+        feature_factory(location_id_value="1", source_id=source.id)
+
+        # Act & Assert
+        with pytest.raises(OperationalError):
+            FeatureRepository.get_polygons_by_gazetteer(test_session, "test_gaz")
+
+
+@pytest.mark.unit
+class TestFeatureRepositoryGetCoordinatesByIds:
+    """Test FeatureRepository.get_coordinates_by_ids() method."""
+
+    def test_returns_wgs84_coordinates_by_default(self, test_session, feature_factory):
+        """Test that longitude/latitude are returned by default."""
+        # Arrange
+        feature = feature_factory(location_id_value="1")
+        feature.longitude, feature.latitude, feature.x, feature.y = 7.4, 46.9, 2.6, 1.2
+        test_session.add(feature)
+        test_session.commit()
+
+        # Act
+        result = FeatureRepository.get_coordinates_by_ids(test_session, [feature.id])
+
+        # Assert
+        assert result == [(feature.id, 7.4, 46.9)]
+
+    def test_returns_native_coordinates(self, test_session, feature_factory):
+        """Test that native coordinates are returned when requested."""
+        # Arrange
+        feature = feature_factory(location_id_value="1")
+        feature.longitude, feature.latitude, feature.x, feature.y = 7.4, 46.9, 2.6, 1.2
+        test_session.add(feature)
+        test_session.commit()
+
+        # Act
+        result = FeatureRepository.get_coordinates_by_ids(
+            test_session, [feature.id], native=True
+        )
+
+        # Assert
+        assert result == [(feature.id, 2.6, 1.2)]
+
+    def test_queries_ids_in_chunks(self, test_session, feature_factory, monkeypatch):
+        """Test that large ID lists are split across several queries."""
+        # Arrange
+        import geoparser.db.crud.feature as feature_module
+
+        monkeypatch.setattr(feature_module, "IN_CLAUSE_CHUNKSIZE", 2)
+        features = [feature_factory(location_id_value=str(i)) for i in range(5)]
+        for i, feature in enumerate(features):
+            feature.longitude, feature.latitude = float(i), 0.0
+            test_session.add(feature)
+        test_session.commit()
+
+        # Act
+        result = FeatureRepository.get_coordinates_by_ids(
+            test_session, [f.id for f in features]
+        )
+
+        # Assert
+        assert sorted(result) == [(f.id, float(i), 0.0) for i, f in enumerate(features)]
+
+
+@pytest.mark.unit
+class TestFeatureRepositoryGetGeometriesByIds:
+    """Test FeatureRepository.get_geometries_by_ids() method."""
+
+    def test_returns_geometries_by_feature_id(
+        self, test_session, gazetteer_factory, source_factory, feature_factory
+    ):
+        """Test that WKT geometries are returned keyed by feature ID."""
+        # Arrange
+        gazetteer = gazetteer_factory(name="test_gaz")
+        source = source_factory(
+            name="test_places", location_id_name="id", gazetteer_id=gazetteer.id
+        )
+        test_session.exec(
+            text("CREATE TABLE test_places (id INTEGER PRIMARY KEY, geometry TEXT)")
+        )
+        test_session.exec(
+            text(
+                "INSERT INTO test_places VALUES "
+                "(1, 'POINT (1 2)'), (2, 'POINT (3 4)'), (3, NULL)"
+            )
+        )
+        feature1 = feature_factory(location_id_value="1", source_id=source.id)
+        feature_factory(location_id_value="2", source_id=source.id)
+        feature3 = feature_factory(location_id_value="3", source_id=source.id)
+
+        # Act
+        result = FeatureRepository.get_geometries_by_ids(
+            test_session, [feature1.id, feature3.id]
+        )
+
+        # Assert
+        assert result == {feature1.id: "POINT (1 2)"}
+
+    def test_skips_sources_without_geometry(
+        self, test_session, gazetteer_factory, source_factory, feature_factory
+    ):
+        """Test that sources lacking a geometry column are ignored."""
+        # Arrange
+        gazetteer = gazetteer_factory(name="test_gaz")
+        source = source_factory(
+            name="test_names", location_id_name="id", gazetteer_id=gazetteer.id
+        )
+        test_session.exec(
+            text("CREATE TABLE test_names (id INTEGER PRIMARY KEY, name TEXT)")
+        )
+        feature = feature_factory(location_id_value="1", source_id=source.id)
+
+        # Act
+        result = FeatureRepository.get_geometries_by_ids(test_session, [feature.id])
+
+        # Assert
+        assert result == {}
+
+    def test_matches_integer_identifiers_in_chunks(
+        self,
+        test_session,
+        gazetteer_factory,
+        source_factory,
+        feature_factory,
+        monkeypatch,
+    ):
+        """Test that integer identifiers match and large ID lists are chunked."""
+        # Arrange
+        import geoparser.db.crud.feature as feature_module
+
+        monkeypatch.setattr(feature_module, "IN_CLAUSE_CHUNKSIZE", 2)
+        gazetteer = gazetteer_factory(name="test_gaz")
+        source = source_factory(
+            name="test_numbered", location_id_name="id", gazetteer_id=gazetteer.id
+        )
+        test_session.exec(
+            text(
+                "CREATE VIEW test_numbered AS "
+                "SELECT value AS id, 'POINT (' || value || ' 0)' AS geometry "
+                "FROM json_each('[1, 2, 3, 4, 5]')"
+            )
+        )
+        features = [
+            feature_factory(location_id_value=str(i), source_id=source.id)
+            for i in range(1, 6)
+        ]
+
+        # Act
+        result = FeatureRepository.get_geometries_by_ids(
+            test_session, [f.id for f in features]
+        )
+
+        # Assert
+        assert result == {
+            f.id: f"POINT ({i} 0)" for i, f in enumerate(features, start=1)
+        }
+
+    def test_returns_empty_dict_for_no_ids(self, test_session):
+        """Test that an empty ID list returns an empty dictionary."""
+        # Act & Assert
+        assert FeatureRepository.get_geometries_by_ids(test_session, []) == {}
+
+
 @pytest.mark.unit
 class TestFeatureRepositoryGetByGazetteerAndNameExact:
     """Test FeatureRepository.get_by_gazetteer_and_name_exact() method."""
@@ -280,3 +280,69 @@ class TestRecognitionRepositoryGetUnprocessedDocuments:
         # Assert - Should only contain doc from project1
         assert len(unprocessed) == 1
         assert unprocessed[0].id == doc1_proj1.id
+
+
+@pytest.mark.unit
+class TestRecognitionRepositoryGetUnprocessedDocumentIds:
+    """Test the get_unprocessed_document_ids method of RecognitionRepository."""
+
+    def test_returns_ids_not_processed_by_recognizer(
+        self,
+        test_session: Session,
+        document_factory,
+        recognizer_factory,
+    ):
+        """Test that only IDs of unprocessed documents are returned."""
+        # Arrange
+        recognizer_factory(id="rec1")
+        recognizer_factory(id="rec2")
+        doc1 = document_factory()
+        doc2 = document_factory()
+
+        RecognitionRepository.create(
+            test_session,
+            RecognitionCreate(document_id=doc1.id, recognizer_id="rec1"),
+        )
+        RecognitionRepository.create(
+            test_session,
+            RecognitionCreate(document_id=doc2.id, recognizer_id="rec2"),
+        )
+
+        # Act
+        unprocessed_ids = RecognitionRepository.get_unprocessed_document_ids(
+            test_session, [doc1.id, doc2.id], "rec1"
+        )
+
+        # Assert
+        assert unprocessed_ids == {doc2.id}
+
+    def test_queries_in_chunks(
+        self,
+        test_session: Session,
+        document_factory,
+        recognizer_factory,
+        monkeypatch,
+    ):
+        """Test that document IDs are checked in chunks."""
+        # Arrange
+        import geoparser.db.crud.recognition as recognition_module
+
+        monkeypatch.setattr(recognition_module, "IN_CLAUSE_CHUNKSIZE", 2)
+        recognizer_factory(id="rec1")
+        documents = [document_factory() for _ in range(5)]
+
+        # Act
+        unprocessed_ids = RecognitionRepository.get_unprocessed_document_ids(
+            test_session, [doc.id for doc in documents], "rec1"
+        )
+
+        # Assert
+        assert unprocessed_ids == {doc.id for doc in documents}
+
+    def test_returns_empty_set_for_no_documents(self, test_session: Session):
+        """Test that an empty input yields an empty set."""
+        # Act & Assert
+        assert (
+            RecognitionRepository.get_unprocessed_document_ids(test_session, [], "rec1")
+            == set()
+        )
@@ -8,7 +8,7 @@ import pytest
 from sqlmodel import Session
 
 from geoparser.db.crud import ReferenceRepository
-from geoparser.db.models import ReferenceUpdate
+from geoparser.db.models import ReferenceCreate, ReferenceUpdate
 
 
 @pytest.mark.unit
@@ -71,6 +71,62 @@ class TestReferenceRepositoryUpdate:
         assert updated_ref.document_id == doc2.id
 
 
+@pytest.mark.unit
+class TestReferenceRepositoryCreateMany:
+    """Test the create_many method of ReferenceRepository."""
+
+    def test_extracts_missing_text_from_document(
+        self, test_session: Session, document_factory, recognizer_factory
+    ):
+        """Test that references without text get it from their document."""
+        # Arrange
+        document = document_factory(text="Visit Paris and London.")
+        recognizer_factory(id="rec1")
+
+        # Act
+        ReferenceRepository.create_many(
+            test_session,
+            [
+                ReferenceCreate(
+                    start=6, end=11, document_id=document.id, recognizer_id="rec1"
+                ),
+                ReferenceCreate(
+                    start=16, end=22, document_id=document.id, recognizer_id="rec1"
+                ),
+            ],
+        )
+
+        # Assert
+        references = ReferenceRepository.get_by_document(test_session, document.id)
+        assert sorted(ref.text for ref in references) == ["London", "Paris"]
+
+    def test_keeps_provided_text(
+        self, test_session: Session, document_factory, recognizer_factory
+    ):
+        """Test that a provided text is stored as-is."""
+        # Arrange
+        document = document_factory(text="Visit Paris.")
+        recognizer_factory(id="rec1")
+
+        # Act
+        ReferenceRepository.create_many(
+            test_session,
+            [
+                ReferenceCreate(
+                    start=6,
+                    end=11,
+                    text="Paris",
+                    document_id=document.id,
+                    recognizer_id="rec1",
+                )
+            ],
+        )
+
+        # Assert
+        (reference,) = ReferenceRepository.get_by_document(test_session, document.id)
+        assert reference.text == "Paris"
+
+
 @pytest.mark.unit
 class TestReferenceRepositoryGetByDocument:
     """Test the get_by_document method of ReferenceRepository."""
@@ -289,3 +289,46 @@ class TestResolutionRepositoryGetUnprocessedReferences:
         # Assert - Should only contain ref from project1
         assert len(unprocessed) == 1
         assert unprocessed[0].id == ref1_proj1.id
+
+
+@pytest.mark.unit
+class TestResolutionRepositoryGetUnprocessedReferenceIds:
+    """Test the get_unprocessed_reference_ids method of ResolutionRepository."""
+
+    def test_returns_ids_not_processed_by_resolver(
+        self,
+        test_session: Session,
+        reference_factory,
+        resolver_factory,
+    ):
+        """Test that only IDs of unprocessed references are returned."""
+        # Arrange
+        resolver_factory(id="res1")
+        resolver_factory(id="res2")
+        ref1 = reference_factory()
+        ref2 = reference_factory()
+
+        ResolutionRepository.create(
+            test_session,
+            ResolutionCreate(reference_id=ref1.id, resolver_id="res1"),
+        )
+        ResolutionRepository.create(
+            test_session,
+            ResolutionCreate(reference_id=ref2.id, resolver_id="res2"),
+        )
+
+        # Act
+        unprocessed_ids = ResolutionRepository.get_unprocessed_reference_ids(
+            test_session, [ref1.id, ref2.id], "res1"
+        )
+
+        # Assert
+        assert unprocessed_ids == {ref2.id}
+
+    def test_returns_empty_set_for_no_references(self, test_session: Session):
+        """Test that an empty input yields an empty set."""
+        # Act & Assert
+        assert (
+            ResolutionRepository.get_unprocessed_reference_ids(test_session, [], "res1")
+            == set()
+        )
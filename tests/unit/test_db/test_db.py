@@ -7,7 +7,7 @@ test fixtures that redirect database operations to test databases.
 
 import pytest
 from sqlalchemy import Engine
-from sqlmodel import Session, create_engine, text
+from sqlmodel import Session, SQLModel, create_engine, text
 
 
 @pytest.mark.unit
@@ -116,6 +116,107 @@ class TestDatabaseCompatibilityCheck:
             with pytest.raises(RuntimeError):
                 db.create_db_and_tables()
 
+    def _make_database_without_coordinates(self):
+        """Create a database as written by versions without feature coordinates."""
+        import geoparser.db.db as db
+
+        legacy_engine = self._make_engine()
+        SQLModel.metadata.create_all(legacy_engine)
+        with legacy_engine.connect() as connection:
+            for column in db.FEATURE_COORDINATE_COLUMNS:
+                connection.execute(text(f"ALTER TABLE feature DROP COLUMN {column}"))
+            connection.commit()
+        return legacy_engine
+
+    def test_migrates_feature_table_without_coordinates(self):
+        """A `feature` table lacking coordinate columns is upgraded in place."""
+        from unittest.mock import patch
+
+        import geoparser.db.db as db
+
+        legacy_engine = self._make_database_without_coordinates()
+        with legacy_engine.connect() as connection:
+            connection.execute(text("PRAGMA foreign_keys=OFF"))
+            connection.execute(
+                text(
+                    "INSERT INTO feature (id, source_id, location_id_value) "
+                    "VALUES (1, 1, '123')"
+                )
+            )
+            connection.commit()
+
+        with patch.object(db, "engine", legacy_engine):
+            with pytest.warns(UserWarning, match="--coordinates-only"):
+                db.create_db_and_tables()
+
+        with legacy_engine.connect() as connection:
+            row = connection.execute(
+                text(
+                    "SELECT location_id_value, longitude, latitude, x, y "
+                    "FROM feature WHERE id = 1"
+                )
+            ).one()
+        assert tuple(row) == ("123", None, None, None, None)
+
+    def test_migrates_empty_feature_table_without_warning(self):
+        """An empty legacy `feature` table is upgraded without a backfill warning."""
+        import warnings
+        from unittest.mock import patch
+
+        import geoparser.db.db as db
+
+        legacy_engine = self._make_database_without_coordinates()
+
+        with patch.object(db, "engine", legacy_engine), warnings.catch_warnings():
+            warnings.simplefilter("error")
+            db.create_db_and_tables()
+
+        with legacy_engine.connect() as connection:
+            columns = {
+                row[1] for row in connection.execute(text("PRAGMA table_info(feature)"))
+            }
+        assert set(db.FEATURE_COORDINATE_COLUMNS) <= columns
+
+    def test_adds_content_hash_to_existing_documents(self):
+        """Documents of a database without content hashes get them computed."""
+        from unittest.mock import patch
+
+        import geoparser.db.db as db
+        from geoparser.db.models.validators import content_hash
+
+        legacy_engine = self._make_engine()
+        SQLModel.metadata.create_all(legacy_engine)
+        with legacy_engine.connect() as connection:
+            connection.execute(text("DROP INDEX ix_document_project_content_hash"))
+            connection.execute(text("ALTER TABLE document DROP COLUMN content_hash"))
+            connection.execute(text("PRAGMA foreign_keys=OFF"))
+            connection.execute(
+                text(
+                    "INSERT INTO document (id, project_id, text) "
+                    "VALUES ('a', 'p', 'Paris'), ('b', 'p', 'Rome')"
+                )
+            )
+            connection.commit()
+
+        with patch.object(db, "engine", legacy_engine), patch.object(
+            db, "MIGRATION_CHUNKSIZE", 1
+        ):
+            db.create_db_and_tables()
+
+        with legacy_engine.connect() as connection:
+            rows = connection.execute(
+                text("SELECT id, content_hash FROM document ORDER BY id")
+            ).all()
+            indices = {
+                row[1]
+                for row in connection.execute(text("PRAGMA index_list(document)"))
+            }
+        assert [tuple(row) for row in rows] == [
+            ("a", content_hash("Paris")),
+            ("b", content_hash("Rome")),
+        ]
+        assert "ix_document_project_content_hash" in indices
+
     def test_allows_fresh_database(self):
         """An empty database is fine and gets its tables created."""
         from unittest.mock import patch
@@ -232,3 +333,597 @@ class TestOptimizedWrites:
             cursor.close()
         finally:
             connection.close()
+
+
+@pytest.mark.unit
+class TestReadSession:
+    """Test the read_session context manager and its PRAGMAs."""
+
+    def test_applies_read_pragmas(self):
+        """Test that the session's connection is tuned for reads."""
+        from geoparser.db.db import read_session
+
+        with read_session() as session:
+            assert session.exec(text("PRAGMA temp_store")).scalar() == 2
+            assert session.exec(text("PRAGMA cache_size")).scalar() == -262144
+            assert session.exec(text("PRAGMA query_only")).scalar() == 0
+
+    def test_query_only_rejects_writes(self):
+        """Test that query-only sessions refuse to write."""
+        from sqlalchemy.exc import OperationalError
+
+        from geoparser.db.db import read_session
+
+        with read_session(query_only=True) as session:
+            with pytest.raises(OperationalError):
+                session.exec(text("CREATE TABLE t (id INTEGER)"))
+
+    def test_does_not_affect_other_threads(self, file_db):
+        """Test that a query-only session leaves writes of other threads working."""
+        import threading
+
+        from geoparser.db.db import get_connection, read_session
+
+        # Arrange
+        def write():
+            with get_connection() as connection:
+                connection.execute(text("CREATE TABLE t (id INTEGER)"))
+                connection.commit()
+
+        # Act
+        with read_session(query_only=True) as session:
+            session.exec(text("SELECT 1"))
+            thread = threading.Thread(target=write)
+            thread.start()
+            thread.join()
+
+        # Assert
+        with get_connection() as connection:
+            assert connection.execute(text("SELECT COUNT(*) FROM t")).scalar() == 0
+
+
+@pytest.mark.unit
+class TestConnectionProfileSync:
+    """Test that pooled connections follow the active connection profile."""
+
+    @staticmethod
+    def _pragma(name: str):
+        from geoparser.db.db import get_connection
+
+        with get_connection() as connection:
+            return connection.execute(text(f"PRAGMA {name}")).scalar()
+
+    def test_reused_connection_switches_profiles(self):
+        """Test that a pooled connection is retuned when the profile changes."""
+        from geoparser.db.db import optimized_writes, read_session
+
+        with optimized_writes():
+            assert self._pragma("synchronous") == 0
+        with read_session(query_only=True) as session:
+            assert session.exec(text("PRAGMA synchronous")).scalar() == 2
+            assert session.exec(text("PRAGMA query_only")).scalar() == 1
+        assert self._pragma("query_only") == 0
+        assert self._pragma("cache_size") == -2000
+
+
+@pytest.mark.unit
+class TestEnableWal:
+    """Test the opt-in WAL mode."""
+
+    @pytest.fixture
+    def file_engine(self, tmp_path, monkeypatch):
+        """Point the module engine at a file database and restore WAL flags."""
+        import geoparser.db.db as db
+
+        engine = create_engine(f"sqlite:///{tmp_path / 'wal.db'}")
+        monkeypatch.setattr(db, "engine", engine)
+        monkeypatch.setattr(db, "_wal_enabled", False)
+        monkeypatch.setattr(db, "_busy_timeout_ms", db.BUSY_TIMEOUT_MS)
+        yield engine
+        engine.dispose()
+
+    def test_switches_database_to_wal(self, file_engine):
+        """Test that enabling WAL mode converts the database file."""
+        import geoparser.db.db as db
+
+        # Act
+        db.enable_wal(busy_timeout_ms=1234)
+
+        # Assert
+        with db.get_connection() as connection:
+            journal_mode = connection.execute(text("PRAGMA journal_mode")).scalar()
+            busy_timeout = connection.execute(text("PRAGMA busy_timeout")).scalar()
+            synchronous = connection.execute(text("PRAGMA synchronous")).scalar()
+
+        assert journal_mode == "wal"
+        assert busy_timeout == 1234
+        assert synchronous == 1  # NORMAL
+
+    def test_optimized_writes_keep_wal_journal(self, file_engine):
+        """Test that write tuning does not leave WAL mode."""
+        import geoparser.db.db as db
+
+        db.enable_wal()
+
+        with db.optimized_writes():
+            with db.get_connection() as connection:
+                assert connection.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+                assert connection.execute(text("PRAGMA synchronous")).scalar() == 0
+
+
+@pytest.mark.unit
+class TestWriteSession:
+    """Test the write_session context manager."""
+
+    def test_holds_writer_lock(self):
+        """Test that the writer lock is held for the duration of the session."""
+        import threading
+
+        import geoparser.db.db as db
+
+        acquired = []
+
+        def try_acquire():
+            acquired.append(db._write_lock.acquire(blocking=False))
+
+        with db.write_session():
+            thread = threading.Thread(target=try_acquire)
+            thread.start()
+            thread.join()
+
+        assert acquired == [False]
+        assert db._write_lock.acquire(blocking=False)
+        db._write_lock.release()
+
+    def test_yields_usable_session(self):
+        """Test that the yielded session can execute statements."""
+        from geoparser.db.db import write_session
+
+        with write_session() as session:
+            assert session.exec(text("SELECT 1")).scalar() == 1
+
+
+@pytest.mark.unit
+class TestMapReads:
+    """Test the map_reads function."""
+
+    def test_returns_results_in_order(self):
+        """Test that results are returned in the order of the items."""
+        from geoparser.db.db import map_reads
+
+        assert map_reads(lambda x: x * 2, [3, 1, 2]) == [6, 2, 4]
+
+    def test_runs_items_concurrently(self):
+        """Test that items are processed on concurrent threads."""
+        import threading
+
+        from geoparser.db.db import map_reads
+
+        barrier = threading.Barrier(2, timeout=5)
+
+        def read(item):
+            barrier.wait()
+            return item
+
+        assert map_reads(read, ["a", "b"]) == ["a", "b"]
+
+    def test_runs_sequentially_on_database_executor(self):
+        """Test that calls from the database executor do not wait for it."""
+        import threading
+
+        from geoparser.db.db import get_database_executor, map_reads
+
+        threads = []
+
+        def read(item):
+            threads.append(threading.current_thread())
+            return item
+
+        result = get_database_executor().submit(map_reads, read, ["a", "b"]).result(5)
+
+        assert result == ["a", "b"]
+        assert threads[0] is threads[1]
+
+
+@pytest.mark.unit
+class TestGazetteerSchema:
+    """Test the gazetteer_schema function."""
+
+    def test_prefixes_gazetteer_name(self):
+        """Test that the schema name is derived from the gazetteer name."""
+        from geoparser.db.db import gazetteer_schema
+
+        assert gazetteer_schema("geonames") == "gazetteer_geonames"
+
+    def test_replaces_non_identifier_characters(self):
+        """Test that characters invalid in identifiers are replaced."""
+        from geoparser.db.db import gazetteer_schema
+
+        assert gazetteer_schema("swiss-names 2") == "gazetteer_swiss_names_2"
+
+
+@pytest.mark.unit
+class TestGazetteerInstallation:
+    """Test the gazetteer_installation context manager."""
+
+    @pytest.fixture
+    def file_engine(self, tmp_path, monkeypatch):
+        """Point the module engine at a file database and restore attachments."""
+        import geoparser.db.db as db
+
+        engine = create_engine(
+            f"sqlite:///{tmp_path / 'main.db'}", connect_args={"uri": True}
+        )
+        monkeypatch.setattr(db, "engine", engine)
+        monkeypatch.setattr(db, "_gazetteer_files", {})
+        monkeypatch.setattr(db, "_gazetteer_files_owner", None)
+        monkeypatch.setattr(db, "_gazetteer_files_version", 0)
+        with engine.begin() as connection:
+            connection.execute(text("CREATE TABLE feature (id INTEGER)"))
+        yield engine
+        engine.dispose()
+
+    def test_yields_none_for_in_memory_database(self):
+        """Test that in-memory databases install gazetteers into themselves."""
+        import geoparser.db.db as db
+
+        with db.gazetteer_installation("places") as schema:
+            assert schema is None
+            assert db._installation_engine is None
+
+    def test_creates_gazetteer_file(self, file_engine, tmp_path):
+        """Test that installer connections write to the gazetteer file."""
+        import geoparser.db.db as db
+
+        # Act
+        with db.gazetteer_installation("places") as schema:
+            with db.get_connection() as connection:
+                connection.execute(text("CREATE TABLE places (id INTEGER)"))
+                connection.execute(text("INSERT INTO places VALUES (1)"))
+                # Unqualified main database tables resolve to the attached file
+                connection.execute(text("INSERT INTO feature VALUES (1)"))
+                connection.commit()
+
+        # Assert
+        assert schema == "gazetteer_places"
+        assert (tmp_path / "gazetteers" / "places.db").exists()
+        with db.get_connection() as connection:
+            tables = connection.execute(
+                text("SELECT name FROM sqlite_master WHERE type='table'")
+            ).scalars()
+            assert "places" not in list(tables)
+            assert connection.execute(text("SELECT id FROM feature")).scalar() == 1
+
+    def test_attaches_gazetteer_file_read_only(self, file_engine):
+        """Test that the installed file is attached to main connections."""
+        import geoparser.db.db as db
+
+        # Arrange
+        with db.gazetteer_installation("places"):
+            with db.get_connection() as connection:
+                connection.execute(text("CREATE TABLE places (id INTEGER)"))
+                connection.execute(text("INSERT INTO places VALUES (1)"))
+                connection.commit()
+
+        # Act & Assert
+        with db.get_connection() as connection:
+            query = text("SELECT id FROM gazetteer_places.places")
+            assert connection.execute(query).scalar() == 1
+            with pytest.raises(Exception, match="readonly"):
+                connection.execute(
+                    text("INSERT INTO gazetteer_places.places VALUES (2)")
+                )
+
+    def test_rejects_gazetteer_files_beyond_attach_limit(
+        self, file_engine, tmp_path, monkeypatch
+    ):
+        """Test that installing more files than SQLite can attach fails early."""
+        import geoparser.db.db as db
+
+        # Arrange
+        monkeypatch.setattr(db, "_get_max_attached", lambda *args: 1)
+        with db.gazetteer_installation("places"):
+            with db.get_connection() as connection:
+                connection.execute(text("CREATE TABLE places (id INTEGER)"))
+                connection.commit()
+
+        # Act & Assert
+        with pytest.raises(RuntimeError, match="can only attach 1 databases"):
+            with db.gazetteer_installation("streets"):
+                pass
+        assert not (tmp_path / "gazetteers" / "streets.db").exists()
+
+        # Reinstalling an existing gazetteer file stays possible
+        with db.gazetteer_installation("places") as schema:
+            assert schema == "gazetteer_places"
+
+    def test_raises_when_attachments_exceed_attach_limit(
+        self, file_engine, tmp_path, monkeypatch
+    ):
+        """Test that connections fail clearly if too many files are installed."""
+        import geoparser.db.db as db
+
+        # Arrange
+        for name in ("places", "streets"):
+            with db.gazetteer_installation(name):
+                with db.get_connection() as connection:
+                    connection.execute(text(f"CREATE TABLE {name} (id INTEGER)"))
+                    connection.commit()
+        file_engine.dispose()
+        monkeypatch.setattr(db, "_get_max_attached", lambda *args: 1)
+
+        # Act & Assert
+        with pytest.raises(RuntimeError, match="2 gazetteer files are installed"):
+            with db.get_connection():
+                pass
+
+    def test_reads_attach_limit_from_connection(self):
+        """Test that the attach limit falls back to SQLite's default."""
+        import sqlite3
+
+        from geoparser.db.db import DEFAULT_MAX_ATTACHED, _get_max_attached
+
+        # Act
+        limit = _get_max_attached()
+
+        # Assert
+        if hasattr(sqlite3.Connection, "getlimit"):
+            connection = sqlite3.connect(":memory:")
+            assert limit == connection.getlimit(sqlite3.SQLITE_LIMIT_ATTACHED)
+            connection.close()
+        else:
+            assert limit == DEFAULT_MAX_ATTACHED
+
+
+@pytest.mark.unit
+class TestCreateDbAndTables:
+    """Test the create_db_and_tables function."""
+
+    def test_creates_indices_missing_from_existing_tables(self, test_engine):
+        """Test that indices added to existing tables are created."""
+        from geoparser.db.db import create_db_and_tables
+
+        # Arrange
+        with test_engine.begin() as connection:
+            connection.execute(text("DROP INDEX ix_recognition_document_recognizer"))
+
+        # Act
+        create_db_and_tables()
+
+        # Assert
+        with test_engine.connect() as connection:
+            index = connection.execute(
+                text(
+                    "SELECT name FROM sqlite_master WHERE type='index' "
+                    "AND name='ix_recognition_document_recognizer'"
+                )
+            ).scalar()
+        assert index == "ix_recognition_document_recognizer"
+
+    def test_checks_compatibility_once_per_engine(self):
+        """Test that repeated calls skip the compatibility check and table creation."""
+        from unittest.mock import patch
+
+        import geoparser.db.db as db
+
+        # Arrange
+        with patch.object(
+            db, "_check_database_compatibility"
+        ) as mock_check, patch.object(db, "refresh_gazetteer_files") as mock_refresh:
+            # Act
+            db.create_db_and_tables()
+            db.create_db_and_tables()
+
+        # Assert
+        mock_check.assert_called_once()
+        assert mock_refresh.call_count == 2
+
+
+@pytest.mark.unit
+class TestGetEngine:
+    """Test the lazily created engine of the main database."""
+
+    def test_returns_patched_engine(self, test_engine):
+        """Test that an engine set on the module is returned as is."""
+        from geoparser.db.db import get_engine
+
+        # Act & Assert
+        assert get_engine() is test_engine
+
+    def test_creates_engine_and_directory_on_first_use(self, tmp_path):
+        """Test that the engine and database directory are created on first use."""
+        from unittest.mock import patch
+
+        import geoparser.db.db as db
+
+        # Arrange
+        database_path = tmp_path / "data" / "geoparser.db"
+        with patch.object(db, "engine", None), patch.object(
+            db, "DATABASE_URL", f"sqlite:///{database_path}"
+        ), patch.object(db, "db_path", str(database_path)):
+            # Act
+            engine = db.get_engine()
+            second = db.get_engine()
+
+            try:
+                # Assert
+                assert second is engine
+                assert engine.url.database == str(database_path)
+                assert database_path.parent.is_dir()
+            finally:
+                engine.dispose()
+
+
+@pytest.mark.unit
+class TestProfile:
+    """Test profiling the SQL statements executed within the profile context."""
+
+    def test_groups_statements_by_normalized_form(self, test_session):
+        """Test that repeated queries with different parameters are grouped."""
+        from geoparser.db import profile
+
+        # Act
+        with profile() as query_profile:
+            for value in range(3):
+                test_session.exec(text("SELECT :value"), params={"value": value})
+
+        # Assert
+        stats = query_profile.statements["SELECT ?"]
+        assert stats.count == 3
+        assert stats.total_time >= stats.max_time > 0
+        assert query_profile.count == 3
+
+    def test_records_statements_of_other_threads(self, test_engine):
+        """Test that statements executed on other threads are recorded."""
+        import threading
+
+        from geoparser.db import profile
+
+        # Arrange
+        def query():
+            with test_engine.connect() as connection:
+                connection.execute(text("SELECT 1"))
+
+        # Act
+        with profile() as query_profile:
+            thread = threading.Thread(target=query)
+            thread.start()
+            thread.join()
+
+        # Assert
+        assert query_profile.statements["SELECT ?"].count == 1
+
+    def test_records_nothing_outside_context(self, test_session):
+        """Test that statements after the context are not recorded."""
+        from geoparser.db import profile
+
+        # Arrange
+        with profile() as query_profile:
+            pass
+
+        # Act
+        test_session.exec(text("SELECT 1"))
+
+        # Assert
+        assert query_profile.statements == {}
+
+    def test_logs_slow_queries(self, test_session, caplog):
+        """Test that statements reaching the threshold are logged and kept."""
+        import logging
+
+        from geoparser.db import profile
+
+        # Act
+        with caplog.at_level(logging.WARNING, logger="geoparser.db.db"):
+            with profile(slow_query_ms=0) as query_profile:
+                test_session.exec(text("SELECT :value"), params={"value": 1})
+
+        # Assert
+        (slow_query,) = query_profile.slow_queries
+        assert slow_query.statement == "SELECT ?"
+        assert slow_query.parameter_count == 1
+        assert slow_query.plan is None
+        assert "Slow query" in caplog.text
+
+    def test_does_not_log_literals_or_parameters_of_slow_queries(
+        self, test_session, caplog
+    ):
+        """Test that slow queries leak neither bound values nor literals."""
+        import logging
+
+        from geoparser.db import profile
+
+        # Act
+        with caplog.at_level(logging.WARNING, logger="geoparser.db.db"):
+            with profile(slow_query_ms=0) as query_profile:
+                test_session.exec(
+                    text("SELECT 'Secret place' || :text, :number"),
+                    params={"text": "Secret document", "number": 42},
+                )
+
+        # Assert
+        (slow_query,) = query_profile.slow_queries
+        assert slow_query.statement == "SELECT ? || ?, ?"
+        assert slow_query.parameter_count == 2
+        assert "Secret" not in caplog.text
+        assert "42" not in caplog.text
+        assert "2 parameters" in caplog.text
+
+    def test_captures_query_plan_of_slow_queries(self, test_session):
+        """Test that explain=True captures the query plan of slow SELECTs."""
+        from geoparser.db import profile
+
+        # Arrange
+        test_session.exec(text("CREATE TABLE item (value INTEGER)"))
+
+        # Act
+        with profile(slow_query_ms=0, explain=True) as query_profile:
+            test_session.exec(
+                text("SELECT * FROM item WHERE value = :value"), params={"value": 1}
+            )
+
+        # Assert
+        (slow_query,) = query_profile.slow_queries
+        assert slow_query.plan == ["SCAN item"]
+
+    def test_does_not_explain_other_statements(self, test_session):
+        """Test that no query plan is captured for statements other than SELECTs."""
+        from geoparser.db import profile
+
+        # Act
+        with profile(slow_query_ms=0, explain=True) as query_profile:
+            test_session.exec(text("CREATE TABLE item (value INTEGER)"))
+
+        # Assert
+        assert query_profile.slow_queries[0].plan is None
+
+    def test_rejects_nested_profiles(self):
+        """Test that enabling profiling twice raises RuntimeError."""
+        from geoparser.db import profile
+
+        # Act & Assert
+        with profile():
+            with pytest.raises(RuntimeError, match="already enabled"):
+                with profile():
+                    pass
+
+
+@pytest.mark.unit
+class TestDisposeAfterFork:
+    """Test dropping the connections inherited by a forked process."""
+
+    def test_drops_pooled_connections_without_closing_them(self, tmp_path):
+        """Test that pooled connections are dereferenced but left open."""
+        from unittest.mock import patch
+
+        from sqlalchemy.pool import QueuePool
+
+        import geoparser.db.db as db
+
+        # Arrange
+        engine = create_engine(f"sqlite:///{tmp_path / 'g.db'}", poolclass=QueuePool)
+        with engine.connect() as connection:
+            inherited = connection.connection.driver_connection
+        assert engine.pool.checkedin() == 1
+
+        with patch.object(db, "engine", engine):
+            # Act
+            db.dispose_after_fork()
+
+            # Assert
+            assert engine.pool.checkedin() == 0
+            assert inherited.execute("SELECT 1").fetchone() == (1,)
+            with engine.connect() as connection:
+                assert connection.connection.driver_connection is not inherited
+
+        engine.dispose()
+
+    def test_ignores_missing_engine(self):
+        """Test that nothing happens before the engine was created."""
+        from unittest.mock import patch
+
+        import geoparser.db.db as db
+
+        # Act & Assert
+        with patch.object(db, "engine", None):
+            db.dispose_after_fork()
@@ -188,6 +188,17 @@ class TestDocumentCreate:
         # Assert
         assert document_create.text == "Line1\nLine2\nLine3"
 
+    def test_hashes_normalized_text(self):
+        """Test that the content hash is computed from the normalized text."""
+        # Arrange
+        from geoparser.db.models.validators import content_hash
+
+        # Act
+        document_create = DocumentCreate(text="Line1\r\nLine2", project_id=uuid.uuid4())
+
+        # Assert
+        assert document_create.content_hash == content_hash("Line1\nLine2")
+
 
 @pytest.mark.unit
 class TestDocumentUpdate:
@@ -221,3 +232,16 @@ class TestDocumentUpdate:
         assert document_update.id == doc_id
         assert document_update.text is None
         assert document_update.project_id is None
+        assert "content_hash" not in document_update.model_dump(exclude_unset=True)
+
+    def test_rehashes_updated_text(self):
+        """Test that updating the text also updates the content hash."""
+        # Arrange
+        from geoparser.db.models.validators import content_hash
+
+        # Act
+        document_update = DocumentUpdate(id=uuid.uuid4(), text="Updated text")
+
+        # Assert
+        update_data = document_update.model_dump(exclude_unset=True)
+        assert update_data["content_hash"] == content_hash("Updated text")
@@ -101,3 +101,21 @@ class TestNormalizeNewlines:
 
         # Assert
         assert normalized == "Line1\n\nLine2\n\nLine3"
+
+
+@pytest.mark.unit
+class TestContentHash:
+    """Test the content_hash function."""
+
+    def test_returns_sha256_hex_digest(self):
+        """Test that the content hash is the SHA-256 hex digest of the text."""
+        # Arrange
+        import hashlib
+
+        from geoparser.db.models.validators import content_hash
+
+        # Act
+        digest = content_hash("Paris")
+
+        # Assert
+        assert digest == hashlib.sha256(b"Paris").hexdigest()
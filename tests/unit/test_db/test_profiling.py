@@ -0,0 +1,106 @@
+"""
+Unit tests for geoparser/db/profiling.py
+
+Tests the normalization and aggregation of profiled SQL statements.
+"""
+
+import pytest
+
+from geoparser.db.profiling import QueryProfile, SlowQuery, normalize_statement
+
+
+@pytest.mark.unit
+class TestNormalizeStatement:
+    """Test normalizing SQL statements for grouping."""
+
+    @pytest.mark.parametrize(
+        "statement, expected",
+        [
+            ("SELECT * FROM t WHERE a = 'x'", "SELECT * FROM t WHERE a = ?"),
+            ("SELECT * FROM t WHERE a = 'it''s'", "SELECT * FROM t WHERE a = ?"),
+            ("SELECT * FROM t LIMIT 10 OFFSET 2.5", "SELECT * FROM t LIMIT ? OFFSET ?"),
+            ("SELECT *\n  FROM t\n WHERE a = ?", "SELECT * FROM t WHERE a = ?"),
+            (
+                "SELECT * FROM t WHERE a IN (?, ?, ?)",
+                "SELECT * FROM t WHERE a IN (?, ...)",
+            ),
+            ("SELECT * FROM t WHERE a IN (1,2)", "SELECT * FROM t WHERE a IN (?, ...)"),
+            (
+                "INSERT INTO t (a) VALUES (?), (?), (?)",
+                "INSERT INTO t (a) VALUES (?), ...",
+            ),
+        ],
+    )
+    def test_normalizes_statement(self, statement, expected):
+        """Test that literals, placeholder lists and whitespace are normalized."""
+        # Act & Assert
+        assert normalize_statement(statement) == expected
+
+    def test_keeps_digits_in_identifiers(self):
+        """Test that digits within identifiers are not treated as literals."""
+        # Act & Assert
+        assert normalize_statement("SELECT admin1_code FROM t") == (
+            "SELECT admin1_code FROM t"
+        )
+
+
+@pytest.mark.unit
+class TestQueryProfile:
+    """Test aggregating statement statistics in a QueryProfile."""
+
+    def test_aggregates_executions_of_statement(self):
+        """Test that executions of the same normalized statement are aggregated."""
+        # Arrange
+        profile = QueryProfile()
+
+        # Act
+        profile.record("SELECT * FROM t WHERE a = 1", 0.01)
+        profile.record("SELECT * FROM t WHERE a = 2", 0.03)
+
+        # Assert
+        stats = profile.statements["SELECT * FROM t WHERE a = ?"]
+        assert stats.count == 2
+        assert stats.total_time == pytest.approx(0.04)
+        assert stats.max_time == pytest.approx(0.03)
+        assert stats.mean_time == pytest.approx(0.02)
+        assert profile.count == 2
+        assert profile.total_time == pytest.approx(0.04)
+
+    def test_top_orders_statements(self):
+        """Test that top returns statements in descending order of the sort key."""
+        # Arrange
+        profile = QueryProfile()
+        profile.record("SELECT a FROM t", 0.5)
+        for _ in range(3):
+            profile.record("SELECT b FROM t", 0.01)
+
+        # Act
+        by_time = profile.top()
+        by_count = profile.top(limit=1, by="count")
+
+        # Assert
+        assert [s.statement for s in by_time] == ["SELECT a FROM t", "SELECT b FROM t"]
+        assert [s.statement for s in by_count] == ["SELECT b FROM t"]
+
+    def test_top_rejects_unsupported_sort_key(self):
+        """Test that an unsupported sort key raises ValueError."""
+        # Act & Assert
+        with pytest.raises(ValueError, match="Unsupported sort key"):
+            QueryProfile().top(by="statement")
+
+    def test_report_lists_statements_and_slow_queries(self):
+        """Test that the report summarizes the profile and lists statements."""
+        # Arrange
+        profile = QueryProfile()
+        profile.record("SELECT a FROM t", 0.002)
+        profile.record_slow_query(
+            SlowQuery(statement="SELECT a FROM t", parameter_count=0, duration=0.2)
+        )
+
+        # Act
+        report = profile.report()
+
+        # Assert
+        lines = report.splitlines()
+        assert lines[0] == "1 statements in 2.0 ms, 1 slow"
+        assert lines[-1].split() == ["1", "2.0", "2.00", "SELECT", "a", "FROM", "t"]
@@ -0,0 +1,120 @@
+"""
+Unit tests for geoparser/embedding/client.py
+
+Tests the EmbeddingClient against an embedding server with a mocked transformer.
+"""
+
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from geoparser.embedding import EmbeddingClient
+
+
+@pytest.mark.unit
+class TestEmbeddingClient:
+    """Test EmbeddingClient class."""
+
+    def test_raises_without_server(self, tmp_path):
+        """Test that a missing server raises ConnectionError."""
+        # Arrange
+        client = EmbeddingClient(str(tmp_path / "missing.sock"))
+
+        # Act & Assert
+        with pytest.raises(ConnectionError, match="No embedding server"):
+            client.info()
+
+    def test_uses_one_connection_per_thread(self, embedding_server):
+        """Test that threads use separate connections to the server."""
+        # Arrange
+        client = EmbeddingClient(embedding_server.socket_path)
+        connections = []
+        lock = threading.Lock()
+
+        barrier = threading.Barrier(2, timeout=5)
+
+        def encode(text):
+            # Both threads must be connected at the same time
+            embeddings = client.encode([text])
+            with lock:
+                connections.append(client._local.connection)
+            barrier.wait()
+            return embeddings
+
+        # Act
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            results = list(executor.map(encode, ["a", "bb"]))
+
+        # Assert
+        assert [result[0, 0] for result in results] == [1, 2]
+        assert connections[0] is not connections[1]
+
+    def test_reconnects_after_lost_connection(self, embedding_server):
+        """Test that a closed connection is reopened for the next request."""
+        # Arrange
+        client = EmbeddingClient(embedding_server.socket_path)
+        client.encode(["a"])
+        client._local.connection.close()
+        client._local.connection = None
+
+        # Act
+        embeddings = client.encode(["abc"])
+
+        # Assert
+        np.testing.assert_array_equal(embeddings, [[3, 1]])
+
+    def test_reconnects_after_fork(self, embedding_server):
+        """Test that a forked child opens its own connection to the server."""
+        # Arrange
+        client = EmbeddingClient(embedding_server.socket_path)
+        client.info()
+        inherited = client._local.connection
+        read_end, write_end = os.pipe()
+
+        # Act
+        pid = os.fork()
+        if pid == 0:
+            try:
+                embeddings = client.encode(["abc"])
+                reconnected = client._local.connection is not inherited
+                os.write(
+                    write_end, b"1" if reconnected and embeddings[0, 0] == 3 else b"0"
+                )
+            finally:
+                os._exit(0)
+        os.close(write_end)
+        os.waitpid(pid, 0)
+        result = os.read(read_end, 1)
+        os.close(read_end)
+
+        # Assert
+        assert result == b"1"
+        assert client._local.connection is inherited
+        np.testing.assert_array_equal(client.encode(["ab"]), [[2, 1]])
+
+    def test_raises_server_errors(self, embedding_server):
+        """Test that errors on the server are raised as RuntimeError."""
+        # Arrange
+        embedding_server.transformer.encode.side_effect = RuntimeError("CUDA failed")
+        client = EmbeddingClient(embedding_server.socket_path)
+
+        # Act & Assert
+        with pytest.raises(RuntimeError, match="CUDA failed"):
+            client.encode(["Paris"])
+
+    def test_rejects_server_of_other_user(self, embedding_server):
+        """Test that a server run by another user is not sent any request."""
+        # Arrange
+        client = EmbeddingClient(embedding_server.socket_path)
+
+        # Act & Assert
+        with patch(
+            "geoparser.embedding.protocol.peer_uid", return_value=os.getuid() + 1
+        ):
+            with pytest.raises(PermissionError, match="another user"):
+                client.info()
+        assert getattr(client._local, "connection", None) is None
@@ -0,0 +1,179 @@
+"""
+Unit tests for geoparser/embedding/protocol.py
+
+Tests the message framing between embedding server and clients.
+"""
+
+import os
+import socket
+import struct
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from geoparser.embedding.protocol import (
+    check_server_socket,
+    peer_uid,
+    prepare_socket_directory,
+    receive_message,
+    send_message,
+)
+
+
+@pytest.mark.unit
+class TestMessages:
+    """Test send_message() and receive_message() functions."""
+
+    def test_round_trips_messages(self):
+        """Test that sent messages are received unchanged and in order."""
+        # Arrange
+        left, right = socket.socketpair()
+        embeddings = np.arange(6, dtype=np.float32).reshape(3, 2)
+
+        # Act
+        with left, right:
+            send_message(left, {"op": "info"})
+            send_message(left, {"embeddings": embeddings})
+            first = receive_message(right)
+            second = receive_message(right)
+
+        # Assert
+        assert first == {"op": "info"}
+        np.testing.assert_array_equal(second["embeddings"], embeddings)
+        assert second["embeddings"].dtype == np.float32
+
+    def test_sends_json_and_raw_float32_data(self):
+        """Test that messages are JSON followed by the raw array values."""
+        # Arrange
+        left, right = socket.socketpair()
+        embeddings = np.array([[1.5, 2.0]], dtype=np.float64)
+
+        # Act
+        with left, right:
+            send_message(left, {"embeddings": embeddings})
+            left.close()
+            data = right.recv(1024)
+
+        # Assert
+        payload_size, data_size = struct.unpack("!QQ", data[:16])
+        assert data[16 : 16 + payload_size] == b'{"__arrays__": {"embeddings": [1, 2]}}'
+        assert data[16 + payload_size :] == np.array([1.5, 2.0], "<f4").tobytes()
+        assert data_size == 8
+
+    def test_rejects_arrays_exceeding_the_data(self):
+        """Test that array shapes larger than the sent data raise ValueError."""
+        # Arrange
+        left, right = socket.socketpair()
+        payload = b'{"__arrays__": {"embeddings": [2, 2]}}'
+
+        # Act & Assert
+        with left, right:
+            left.sendall(struct.pack("!QQ", len(payload), 4) + payload + bytes(4))
+            with pytest.raises(ValueError, match="shorter"):
+                receive_message(right)
+
+    def test_raises_when_peer_closes(self):
+        """Test that a closed connection raises ConnectionError."""
+        # Arrange
+        left, right = socket.socketpair()
+        left.close()
+
+        # Act & Assert
+        with right:
+            with pytest.raises(ConnectionError):
+                receive_message(right)
+
+
+@pytest.mark.unit
+class TestPeerChecks:
+    """Test peer_uid() and check_server_socket() functions."""
+
+    def test_reports_uid_of_peer(self):
+        """Test that the peer of a socket of this process has the current uid."""
+        # Arrange
+        left, right = socket.socketpair()
+
+        # Act
+        with left, right:
+            uid = peer_uid(left)
+
+        # Assert
+        assert uid in (None, os.getuid())
+
+    def test_accepts_server_of_current_user(self):
+        """Test that a server of the current user passes the check."""
+        # Arrange
+        left, right = socket.socketpair()
+
+        # Act & Assert
+        with left, right:
+            with patch(
+                "geoparser.embedding.protocol.peer_uid", return_value=os.getuid()
+            ):
+                check_server_socket(left, "unused.sock")
+
+    def test_rejects_server_of_other_user(self):
+        """Test that a server of another user raises PermissionError."""
+        # Arrange
+        left, right = socket.socketpair()
+
+        # Act & Assert
+        with left, right:
+            with patch(
+                "geoparser.embedding.protocol.peer_uid", return_value=os.getuid() + 1
+            ):
+                with pytest.raises(PermissionError, match="another user"):
+                    check_server_socket(left, "unused.sock")
+
+    def test_checks_socket_mode_without_peer_credentials(self, tmp_path):
+        """Test that sockets accessible by others are rejected as a fallback."""
+        # Arrange
+        socket_path = tmp_path / "e.sock"
+        socket_path.touch(mode=0o666)
+        os.chmod(socket_path, 0o666)
+        left, right = socket.socketpair()
+
+        # Act & Assert
+        with left, right:
+            with patch("geoparser.embedding.protocol.peer_uid", return_value=None):
+                with pytest.raises(PermissionError, match="other users"):
+                    check_server_socket(left, str(socket_path))
+
+
+@pytest.mark.unit
+class TestPrepareSocketDirectory:
+    """Test prepare_socket_directory() function."""
+
+    def test_creates_private_directory(self, tmp_path):
+        """Test that a missing directory is created for the owner only."""
+        # Arrange
+        directory = tmp_path / "sockets"
+
+        # Act
+        prepare_socket_directory(str(directory / "e.sock"))
+
+        # Assert
+        assert directory.stat().st_mode & 0o777 == 0o700
+
+    def test_rejects_shared_default_directory(self, tmp_path):
+        """Test that a default directory accessible by others is rejected."""
+        # Arrange
+        directory = tmp_path / "geoparser-user"
+        directory.mkdir()
+        os.chmod(directory, 0o777)
+
+        # Act & Assert
+        with patch("geoparser.embedding.protocol.DEFAULT_SOCKET_DIR", str(directory)):
+            with pytest.raises(PermissionError, match="only the current user"):
+                prepare_socket_directory(str(directory / "embedding.sock"))
+
+    def test_accepts_private_default_directory(self, tmp_path):
+        """Test that an existing private default directory is accepted."""
+        # Arrange
+        directory = tmp_path / "geoparser-user"
+        directory.mkdir(mode=0o700)
+
+        # Act & Assert
+        with patch("geoparser.embedding.protocol.DEFAULT_SOCKET_DIR", str(directory)):
+            prepare_socket_directory(str(directory / "embedding.sock"))
@@ -0,0 +1,194 @@
+"""
+Unit tests for geoparser/embedding/server.py
+
+Tests the EmbeddingServer with a mocked transformer.
+"""
+
+import os
+import socket
+from concurrent.futures import Future
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from geoparser.embedding import EmbeddingClient, EmbeddingServer
+
+
+@pytest.mark.unit
+class TestEmbeddingServerInitialization:
+    """Test EmbeddingServer initialization."""
+
+    @patch("geoparser.embedding.server.SentenceTransformer")
+    def test_rejects_negative_cache_size(self, mock_transformer):
+        """Test that a negative cache size raises ValueError."""
+        # Act & Assert
+        with pytest.raises(ValueError, match="cache_size"):
+            EmbeddingServer(cache_size=-1)
+
+    @patch("geoparser.embedding.server.SentenceTransformer")
+    def test_rejects_invalid_batch_size(self, mock_transformer):
+        """Test that a non-positive batch size raises ValueError."""
+        # Act & Assert
+        with pytest.raises(ValueError, match="batch_size"):
+            EmbeddingServer(batch_size=0)
+
+
+@pytest.mark.unit
+class TestEmbeddingServerEncode:
+    """Test EmbeddingServer encode method."""
+
+    def test_encodes_texts_in_order(self, embedding_server):
+        """Test that embeddings are returned in the order of the texts."""
+        # Act
+        embeddings = embedding_server.encode(["abc", "a", "abc"])
+
+        # Assert
+        np.testing.assert_array_equal(embeddings[:, 0], [3, 1, 3])
+
+    def test_returns_empty_array_without_texts(self, embedding_server):
+        """Test that no texts give an empty array with the embedding dimension."""
+        # Act
+        embeddings = embedding_server.encode([])
+
+        # Assert
+        assert embeddings.shape == (0, 2)
+
+    def test_serves_cached_embeddings(self, embedding_server):
+        """Test that cached texts are not encoded again."""
+        # Arrange
+        embedding_server.encode(["Paris", "Rome"])
+
+        # Act
+        embedding_server.encode(["Paris", "Rome", "Bern"])
+
+        # Assert
+        encode = embedding_server.transformer.encode
+        assert [call[0][0] for call in encode.call_args_list] == [
+            ["Paris", "Rome"],
+            ["Bern"],
+        ]
+        assert embedding_server.cache_hits == 2
+        assert embedding_server.cache_misses == 3
+
+    def test_evicts_least_recently_used_embeddings(self, embedding_server):
+        """Test that the cache keeps at most cache_size embeddings."""
+        # Arrange
+        embedding_server.cache_size = 2
+        embedding_server.encode(["a", "b"])
+        embedding_server.encode(["a"])
+
+        # Act
+        embedding_server.encode(["c"])
+
+        # Assert
+        assert list(embedding_server._cache) == ["a", "c"]
+
+    def test_combines_waiting_requests_into_one_batch(self, embedding_server):
+        """Test that requests waiting for the model are encoded together."""
+        # Arrange
+        embedding_server.shutdown()
+        embedding_server.transformer.encode.reset_mock()
+        first, second = Future(), Future()
+        embedding_server._requests.put((["a", "b"], first))
+        embedding_server._requests.put((["b", "cc"], second))
+        embedding_server._requests.put(None)
+
+        # Act
+        embedding_server._run_model()
+
+        # Assert
+        embedding_server.transformer.encode.assert_called_once()
+        assert embedding_server.transformer.encode.call_args[0][0] == ["a", "b", "cc"]
+        assert set(first.result()) == {"a", "b"}
+        assert second.result()["cc"][0] == 2
+
+
+@pytest.mark.unit
+class TestEmbeddingServerSocket:
+    """Test serving EmbeddingServer requests over its socket."""
+
+    def test_restricts_socket_to_owner(self, embedding_server):
+        """Test that only the owner can connect to the socket."""
+        # Act
+        mode = os.stat(embedding_server.socket_path).st_mode & 0o777
+
+        # Assert
+        assert mode == 0o600
+
+    def test_creates_socket_directory_for_owner_only(self, tmp_path):
+        """Test that a missing socket directory is created privately."""
+        # Arrange
+        socket_path = tmp_path / "sockets" / "e.sock"
+        with patch("geoparser.embedding.server.SentenceTransformer"):
+            server = EmbeddingServer(socket_path=str(socket_path))
+
+        # Act
+        with server:
+            mode = os.stat(socket_path.parent).st_mode & 0o777
+
+        # Assert
+        assert mode == 0o700
+
+    def test_closes_connections_of_other_users(self, embedding_server):
+        """Test that clients of another user receive no answer."""
+        # Arrange
+        client = EmbeddingClient(embedding_server.socket_path)
+
+        # Act & Assert
+        with patch("geoparser.embedding.server.peer_uid", return_value=os.getuid() + 1):
+            with pytest.raises(ConnectionError):
+                client.info()
+
+    def test_answers_client_requests(self, embedding_server):
+        """Test that clients receive embeddings and server information."""
+        # Arrange
+        client = EmbeddingClient(embedding_server.socket_path)
+
+        # Act
+        embeddings = client.encode(["Paris"])
+        info = client.info()
+        client.close()
+
+        # Assert
+        np.testing.assert_array_equal(embeddings, [[5, 1]])
+        assert info["model_name"] == "test-model"
+        assert info["max_seq_length"] == 256
+        assert info["cache_entries"] == 1
+
+    def test_refuses_to_start_twice_on_socket(self, embedding_server):
+        """Test that a second server cannot take over a live socket."""
+        # Arrange
+        with patch("geoparser.embedding.server.SentenceTransformer"):
+            server = EmbeddingServer(socket_path=embedding_server.socket_path)
+
+        # Act & Assert
+        with pytest.raises(ValueError, match="already listening"):
+            server.start()
+
+    def test_removes_stale_socket(self, tmp_path):
+        """Test that a socket file without a server is replaced."""
+        # Arrange
+        socket_path = str(tmp_path / "e.sock")
+        stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        stale.bind(socket_path)
+        stale.close()
+
+        with patch(
+            "geoparser.embedding.server.SentenceTransformer"
+        ) as mock_transformer:
+            mock_transformer.return_value.get_sentence_embedding_dimension.return_value = (
+                2
+            )
+            mock_transformer.return_value.get_max_seq_length.return_value = 256
+            server = EmbeddingServer(socket_path=socket_path)
+
+        # Act
+        with server:
+            client = EmbeddingClient(socket_path)
+            info = client.info()
+            client.close()
+
+        # Assert
+        assert info["cache_entries"] == 0
+        assert not os.path.exists(socket_path)
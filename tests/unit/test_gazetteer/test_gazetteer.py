@@ -7,6 +7,7 @@ Tests the Gazetteer class with mocked FeatureRepository.
 from unittest.mock import ANY, Mock, patch
 
 import pytest
+from sqlalchemy import text
 
 from geoparser.gazetteer.gazetteer import Gazetteer
 
@@ -68,6 +69,24 @@ class TestGazetteerSearch:
             ANY, "geonames", "Paris", 10000
         )
 
+    @patch("geoparser.gazetteer.gazetteer.FeatureRepository")
+    def test_search_uses_read_session(self, mock_feature_repo):
+        """Test that searches run on a connection tuned for reads."""
+        # Arrange
+        cache_sizes = []
+        mock_feature_repo.get_by_gazetteer_and_name_exact.side_effect = (
+            lambda session, *args: cache_sizes.append(
+                session.exec(text("PRAGMA cache_size")).scalar()
+            )
+        )
+        gazetteer = Gazetteer("geonames")
+
+        # Act
+        gazetteer.search("Paris", method="exact")
+
+        # Assert
+        assert cache_sizes == [-262144]
+
     @patch("geoparser.gazetteer.gazetteer.FeatureRepository")
     def test_search_with_phrase_method(self, mock_feature_repo):
         """Test that search calls phrase method correctly."""
@@ -263,3 +282,179 @@ class TestGazetteerFind:
 
         # Assert
         assert result is None
+
+
+@pytest.mark.unit
+class TestGazetteerCoordinates:
+    """Test Gazetteer coordinates method."""
+
+    @patch("geoparser.gazetteer.gazetteer.FeatureRepository")
+    def test_coordinates_are_aligned_with_ids(self, mock_feature_repo):
+        """Test that rows follow the order of the requested IDs."""
+        # Arrange
+        mock_feature_repo.get_coordinates_by_ids.return_value = [
+            (2, 3.0, 4.0),
+            (1, 1.0, 2.0),
+        ]
+        gazetteer = Gazetteer("geonames")
+
+        # Act
+        result = gazetteer.coordinates([1, 2])
+
+        # Assert
+        assert result.tolist() == [[1.0, 2.0], [3.0, 4.0]]
+        mock_feature_repo.get_coordinates_by_ids.assert_called_once_with(
+            ANY, [1, 2], native=False
+        )
+
+    @patch("geoparser.gazetteer.gazetteer.FeatureRepository")
+    def test_coordinates_are_nan_for_missing_features(self, mock_feature_repo):
+        """Test that features without coordinates yield NaN rows."""
+        # Arrange
+        mock_feature_repo.get_coordinates_by_ids.return_value = [(1, None, None)]
+        gazetteer = Gazetteer("geonames")
+
+        # Act
+        result = gazetteer.coordinates([1, 2])
+
+        # Assert
+        assert result.shape == (2, 2)
+        assert all(value != value for value in result.flatten())
+
+    @patch("geoparser.gazetteer.gazetteer.FeatureRepository")
+    def test_coordinates_for_no_ids_has_two_columns(self, mock_feature_repo):
+        """Test that an empty request returns an empty (0, 2) array."""
+        # Arrange
+        mock_feature_repo.get_coordinates_by_ids.return_value = []
+        gazetteer = Gazetteer("geonames")
+
+        # Act & Assert
+        assert gazetteer.coordinates([]).shape == (0, 2)
+
+
+@pytest.mark.unit
+class TestGazetteerGeometries:
+    """Test Gazetteer geometries method."""
+
+    @patch("geoparser.gazetteer.gazetteer.FeatureRepository")
+    def test_geometries_are_parsed_and_aligned_with_ids(self, mock_feature_repo):
+        """Test that WKT is parsed into geometries in the order of the IDs."""
+        # Arrange
+        mock_feature_repo.get_geometries_by_ids.return_value = {
+            1: "POINT (1 2)",
+            3: "POINT (5 6)",
+        }
+        gazetteer = Gazetteer("geonames")
+
+        # Act
+        result = gazetteer.geometries([3, 2, 1])
+
+        # Assert
+        assert result[0].wkt == "POINT (5 6)"
+        assert result[1] is None
+        assert result[2].wkt == "POINT (1 2)"
+
+
+@pytest.mark.unit
+class TestGazetteerReverse:
+    """Test Gazetteer reverse method."""
+
+    @pytest.fixture(autouse=True)
+    def clear_boundary_indices(self):
+        """Isolate the process-wide spatial index cache between tests."""
+        with patch.dict("geoparser.gazetteer.gazetteer._boundary_indices", clear=True):
+            yield
+
+    @pytest.fixture
+    def mock_feature_repo(self):
+        """Mock FeatureRepository with a nested pair of square polygons."""
+        with patch("geoparser.gazetteer.gazetteer.FeatureRepository") as mock_repo:
+            mock_repo.get_polygons_by_gazetteer.return_value = [
+                (1, "POLYGON ((0 0, 10 0, 10 10, 0 10, 0 0))"),
+                (2, "POLYGON ((0 0, 2 0, 2 2, 0 2, 0 0))"),
+            ]
+            mock_repo.get_by_ids.side_effect = lambda session, ids: [
+                Mock(id=feature_id) for feature_id in ids
+            ]
+            yield mock_repo
+
+    def test_reverse_returns_containing_features(self, mock_feature_repo):
+        """Test that reverse returns the features containing each point."""
+        # Arrange
+        gazetteer = Gazetteer("geonames")
+
+        # Act
+        result = gazetteer.reverse([(5, 5), (20, 20)])
+
+        # Assert
+        assert [[feature.id for feature in match] for match in result] == [[1], []]
+
+    def test_reverse_orders_features_by_area(self, mock_feature_repo):
+        """Test that smaller (more specific) areas are returned first."""
+        # Arrange
+        gazetteer = Gazetteer("geonames")
+
+        # Act
+        result = gazetteer.reverse([(1, 1)])
+
+        # Assert
+        assert [feature.id for feature in result[0]] == [2, 1]
+
+    def test_reverse_matches_points_on_boundaries(self, mock_feature_repo):
+        """Test that points on the boundary of an area are contained in it."""
+        # Arrange
+        gazetteer = Gazetteer("geonames")
+
+        # Act
+        result = gazetteer.reverse([(10, 5), (2, 1)])
+
+        # Assert
+        assert [[feature.id for feature in match] for match in result] == [
+            [1],
+            [2, 1],
+        ]
+
+    def test_reverse_loads_features_in_single_query(self, mock_feature_repo):
+        """Test that matched features are loaded with one bulk lookup."""
+        # Arrange
+        gazetteer = Gazetteer("geonames")
+
+        # Act
+        gazetteer.reverse([(1, 1), (1.5, 1.5), (5, 5)])
+
+        # Assert
+        mock_feature_repo.get_by_ids.assert_called_once()
+        _, ids = mock_feature_repo.get_by_ids.call_args.args
+        assert sorted(ids) == [1, 2]
+
+    def test_reverse_builds_index_once(self, mock_feature_repo):
+        """Test that the spatial index is shared across calls and instances."""
+        # Act
+        Gazetteer("geonames").reverse([(1, 1)])
+        Gazetteer("geonames").reverse([(5, 5)])
+
+        # Assert
+        mock_feature_repo.get_polygons_by_gazetteer.assert_called_once_with(
+            ANY, "geonames"
+        )
+
+    def test_reverse_with_no_points_returns_empty_list(self, mock_feature_repo):
+        """Test that reverse handles an empty input."""
+        # Arrange
+        gazetteer = Gazetteer("geonames")
+
+        # Act & Assert
+        assert gazetteer.reverse([]) == []
+        mock_feature_repo.get_polygons_by_gazetteer.assert_not_called()
+
+    def test_reverse_without_polygons_returns_no_matches(self, mock_feature_repo):
+        """Test that gazetteers without polygonal features yield empty matches."""
+        # Arrange
+        mock_feature_repo.get_polygons_by_gazetteer.return_value = []
+        gazetteer = Gazetteer("geonames")
+
+        # Act
+        result = gazetteer.reverse([(1, 1)])
+
+        # Assert
+        assert result == [[]]
@@ -158,6 +158,7 @@ class TestGazetteerInstallerCountRegisteredEntries:
 class TestGazetteerInstallerCreatePipeline:
     """Test _create_pipeline method."""
 
+    @patch("geoparser.gazetteer.installer.installer.CoordinatesStage")
     @patch("geoparser.gazetteer.installer.installer.RegistrationStage")
     @patch("geoparser.gazetteer.installer.installer.IndexingStage")
     @patch("geoparser.gazetteer.installer.installer.ViewStage")
@@ -176,6 +177,7 @@ class TestGazetteerInstallerCreatePipeline:
         mock_view,
         mock_indexing,
         mock_registration,
+        mock_coordinates,
     ):
         """Test that all pipeline stages are created."""
         # Arrange
@@ -189,7 +191,7 @@ class TestGazetteerInstallerCreatePipeline:
         pipeline = installer._create_pipeline(config, downloads_dir, 10000)
 
         # Assert
-        assert len(pipeline) == 8
+        assert len(pipeline) == 9
         mock_acquisition.assert_called_once_with(downloads_dir)
         mock_schema.assert_called_once()
         mock_ingestion.assert_called_once_with(10000)
@@ -198,7 +200,9 @@ class TestGazetteerInstallerCreatePipeline:
         mock_view.assert_called_once()
         mock_indexing.assert_called_once()
         mock_registration.assert_called_once_with("test_gaz", 10000)
+        mock_coordinates.assert_called_once_with({}, 10000)
 
+    @patch("geoparser.gazetteer.installer.installer.CoordinatesStage")
     @patch("geoparser.gazetteer.installer.installer.RegistrationStage")
     @patch("geoparser.gazetteer.installer.installer.IndexingStage")
     @patch("geoparser.gazetteer.installer.installer.ViewStage")
@@ -217,6 +221,7 @@ class TestGazetteerInstallerCreatePipeline:
         mock_view,
         mock_indexing,
         mock_registration,
+        mock_coordinates,
     ):
         """Test that pipeline stages are in correct order."""
         # Arrange
@@ -231,7 +236,7 @@ class TestGazetteerInstallerCreatePipeline:
 
         # Assert
         # Order: Acquisition, Schema, Ingestion, Transformation,
-        # Spatial, View, Indexing, Registration
+        # Spatial, View, Indexing, Registration, Coordinates
         assert pipeline[0] == mock_acquisition.return_value
         assert pipeline[1] == mock_schema.return_value
         assert pipeline[2] == mock_ingestion.return_value
@@ -240,6 +245,7 @@ class TestGazetteerInstallerCreatePipeline:
         assert pipeline[5] == mock_view.return_value
         assert pipeline[6] == mock_indexing.return_value
         assert pipeline[7] == mock_registration.return_value
+        assert pipeline[8] == mock_coordinates.return_value
 
 
 @pytest.mark.unit
@@ -549,3 +555,87 @@ class TestGazetteerInstallerInstall:
 
             # Assert
             mock_stage.cleanup.assert_called_once()
+
+
+@pytest.mark.unit
+class TestGazetteerInstallerBackfillCoordinates:
+    """Test backfill_coordinates method."""
+
+    @staticmethod
+    def _source(name: str, features: bool = True, view: bool = False) -> Mock:
+        """Create a mock source configuration."""
+        source = Mock()
+        source.name = name
+        source.features = Mock() if features else None
+        source.view = Mock() if view else None
+        return source
+
+    @staticmethod
+    def _source_record(name: str, source_id: int) -> Mock:
+        """Create a mock source record."""
+        record = Mock()
+        record.name = name
+        record.id = source_id
+        return record
+
+    @patch("geoparser.gazetteer.installer.installer.create_db_and_tables")
+    @patch("geoparser.gazetteer.installer.installer.CoordinatesStage")
+    @patch("geoparser.gazetteer.installer.installer.GazetteerRepository")
+    @patch("geoparser.gazetteer.installer.installer.GazetteerConfig")
+    def test_runs_coordinates_stage_for_registered_sources(
+        self, mock_config_class, mock_repo, mock_stage_class, mock_create_db
+    ):
+        """Test that the coordinates stage runs for each recorded source."""
+        # Arrange
+        places = self._source("places", view=True)
+        legacy = self._source("legacy")
+        admin = self._source("admin", features=False)
+        missing = self._source("missing")
+
+        mock_config = Mock()
+        mock_config.name = "test_gaz"
+        mock_config.sources = [places, legacy, admin, missing]
+        mock_config_class.from_yaml.return_value = mock_config
+
+        mock_gazetteer = _mock_gazetteer_record()
+        mock_gazetteer.sources = [
+            self._source_record("gazetteer_test_gaz.places_view", 1),
+            self._source_record("legacy", 2),
+        ]
+        mock_repo.get_by_name.return_value = mock_gazetteer
+
+        # Act
+        GazetteerInstaller().backfill_coordinates("config.yaml", chunksize=10)
+
+        # Assert
+        mock_create_db.assert_called_once_with()
+        mock_stage_class.assert_called_once_with(
+            {source.name: source for source in mock_config.sources}, 10
+        )
+        assert mock_stage_class.return_value.execute.call_args_list == [
+            (
+                (
+                    places,
+                    {"table_name": "gazetteer_test_gaz.places_view", "source_id": 1},
+                ),
+            ),
+            ((legacy, {"table_name": "legacy", "source_id": 2}),),
+        ]
+
+    @patch("geoparser.gazetteer.installer.installer.create_db_and_tables")
+    @patch("geoparser.gazetteer.installer.installer.GazetteerRepository")
+    @patch("geoparser.gazetteer.installer.installer.GazetteerConfig")
+    def test_raises_for_gazetteer_not_installed(
+        self, mock_config_class, mock_repo, mock_create_db
+    ):
+        """Test that ValueError is raised if the gazetteer is not installed."""
+        # Arrange
+        mock_config = Mock()
+        mock_config.name = "test_gaz"
+        mock_config.sources = []
+        mock_config_class.from_yaml.return_value = mock_config
+        mock_repo.get_by_name.return_value = None
+
+        # Act & Assert
+        with pytest.raises(ValueError, match="not installed"):
+            GazetteerInstaller().backfill_coordinates("config.yaml")
@@ -0,0 +1,243 @@
+"""
+Unit tests for geoparser/gazetteer/installer/stages/coordinates.py
+
+Tests the CoordinatesStage class.
+"""
+
+from unittest.mock import patch
+
+import pandas as pd
+import pytest
+from pyproj import Transformer
+from sqlalchemy import text
+
+from geoparser.gazetteer.installer.model import (
+    AttributesConfig,
+    DataType,
+    FeatureConfig,
+    OriginalAttributeConfig,
+    SelectConfig,
+    SourceConfig,
+    SourceKind,
+    ViewConfig,
+)
+from geoparser.gazetteer.installer.stages.coordinates import CoordinatesStage
+
+
+def _build_feature_source(name: str, srid: int = 4326) -> SourceConfig:
+    return SourceConfig(
+        name=name,
+        url=f"http://example.com/{name}.shp",
+        file=f"{name}.shp",
+        kind=SourceKind.SPATIAL,
+        attributes=AttributesConfig(
+            original=[
+                OriginalAttributeConfig(name="id", type=DataType.INTEGER),
+                OriginalAttributeConfig(name="name", type=DataType.TEXT),
+                OriginalAttributeConfig(
+                    name="geometry", type=DataType.GEOMETRY, srid=srid
+                ),
+            ]
+        ),
+        features=FeatureConfig(
+            identifier=[{"column": f"{name}.id"}],
+            names=[{"column": f"{name}.name"}],
+        ),
+    )
+
+
+@pytest.mark.unit
+class TestCoordinatesStageInit:
+    """Test CoordinatesStage initialization."""
+
+    def test_sets_name_and_description(self):
+        """Test that stage name and description are set."""
+        # Act
+        stage = CoordinatesStage(source_map={})
+
+        # Assert
+        assert stage.name == "Coordinates"
+        assert stage.description == "Compute feature coordinates"
+
+    def test_initializes_with_custom_chunksize(self):
+        """Test that a custom chunksize is stored."""
+        # Act
+        stage = CoordinatesStage(source_map={}, chunksize=500)
+
+        # Assert
+        assert stage.chunksize == 500
+
+
+@pytest.mark.unit
+class TestCoordinatesStageExecute:
+    """Test CoordinatesStage.execute() method."""
+
+    def test_skips_source_without_features(self):
+        """Test that sources without features are skipped."""
+        # Arrange
+        source = _build_feature_source("places")
+        source.features = None
+        stage = CoordinatesStage(source_map={"places": source})
+
+        # Act
+        with patch.object(stage, "_store_coordinates") as mock_store:
+            stage.execute(source, {"table_name": "places", "source_id": 1})
+
+        # Assert
+        mock_store.assert_not_called()
+
+    def test_stores_coordinates_from_registration_table(self):
+        """Test that coordinates are read from the view when one exists."""
+        # Arrange
+        source = _build_feature_source("places", srid=2056)
+        stage = CoordinatesStage(source_map={"places": source})
+        context = {"table_name": "places", "view_name": "places_view", "source_id": 7}
+
+        # Act
+        with patch.object(stage, "_store_coordinates") as mock_store:
+            stage.execute(source, context)
+
+        # Assert
+        mock_store.assert_called_once_with("places_view", "id", 7, 2056)
+
+
+@pytest.mark.unit
+class TestCoordinatesStageGetGeometrySrid:
+    """Test CoordinatesStage._get_geometry_srid() method."""
+
+    def test_returns_srid_of_source_geometry(self):
+        """Test that the SRID of the source's own geometry is returned."""
+        # Arrange
+        source = _build_feature_source("places", srid=2056)
+        stage = CoordinatesStage(source_map={"places": source})
+
+        # Act & Assert
+        assert stage._get_geometry_srid(source) == 2056
+
+    def test_follows_view_selection_to_geometry_source(self):
+        """Test that the SRID is resolved from the source the view selects."""
+        # Arrange
+        shapes = _build_feature_source("shapes", srid=2056)
+        source = _build_feature_source("places", srid=4326)
+        source.view = ViewConfig(
+            select=[
+                SelectConfig(column="places.id"),
+                SelectConfig(column="shapes.geometry"),
+            ]
+        )
+        stage = CoordinatesStage(source_map={"places": source, "shapes": shapes})
+
+        # Act & Assert
+        assert stage._get_geometry_srid(source) == 2056
+
+    def test_returns_none_when_view_has_no_geometry(self):
+        """Test that views without a geometry column yield None."""
+        # Arrange
+        source = _build_feature_source("places")
+        source.view = ViewConfig(select=[SelectConfig(column="places.id")])
+        stage = CoordinatesStage(source_map={"places": source})
+
+        # Act & Assert
+        assert stage._get_geometry_srid(source) is None
+
+
+@pytest.mark.unit
+class TestCoordinatesStageStoreCoordinates:
+    """Test CoordinatesStage._store_coordinates() method."""
+
+    def test_stores_coordinates_of_integer_identifiers(
+        self, test_session, source_factory, feature_factory
+    ):
+        """Test that features are matched to integer identifiers in every chunk."""
+        # Arrange
+        source = source_factory(name="places", location_id_name="id")
+        test_session.exec(
+            text(
+                "CREATE VIEW places AS "
+                "SELECT value AS id, CASE WHEN value < 4 "
+                "THEN 'POINT (' || (2 * value - 1) || ' ' || (2 * value) || ')' "
+                "END AS geometry FROM json_each('[1, 2, 3, 4]')"
+            )
+        )
+        features = [
+            feature_factory(location_id_value=str(i), source_id=source.id)
+            for i in range(1, 5)
+        ]
+        test_session.commit()
+        stage = CoordinatesStage(source_map={}, chunksize=2)
+
+        # Act
+        stage._store_coordinates("places", "id", source.id, 4326)
+
+        # Assert
+        for feature in features:
+            test_session.refresh(feature)
+        assert [(f.longitude, f.latitude) for f in features] == [
+            (1, 2),
+            (3, 4),
+            (5, 6),
+            (None, None),
+        ]
+
+
+@pytest.mark.unit
+class TestCoordinatesStageComputeCoordinates:
+    """Test CoordinatesStage._compute_coordinates() method."""
+
+    def test_uses_point_coordinates_without_transformer(self):
+        """Test that WGS84 point geometries are stored as-is."""
+        # Arrange
+        stage = CoordinatesStage(source_map={})
+        frame = pd.DataFrame({"id": [1], "geometry": ["POINT (1.5 42.5)"]})
+
+        # Act
+        updates = stage._compute_coordinates(frame, None)
+
+        # Assert
+        assert updates == [
+            {"id": 1, "longitude": 1.5, "latitude": 42.5, "x": 1.5, "y": 42.5}
+        ]
+
+    def test_uses_point_on_surface_for_polygons(self):
+        """Test that polygons are reduced to a point lying inside them."""
+        # Arrange
+        stage = CoordinatesStage(source_map={})
+        frame = pd.DataFrame(
+            {"id": [1], "geometry": ["POLYGON ((0 0, 4 0, 4 2, 0 2, 0 0))"]}
+        )
+
+        # Act
+        (update,) = stage._compute_coordinates(frame, None)
+
+        # Assert
+        assert 0 < update["x"] < 4
+        assert 0 < update["y"] < 2
+
+    def test_transforms_native_coordinates_to_wgs84(self):
+        """Test that native coordinates are kept and reprojected to WGS84."""
+        # Arrange
+        stage = CoordinatesStage(source_map={})
+        transformer = Transformer.from_crs("EPSG:2056", "EPSG:4326", always_xy=True)
+        frame = pd.DataFrame({"id": [1], "geometry": ["POINT (2600000 1200000)"]})
+
+        # Act
+        (update,) = stage._compute_coordinates(frame, transformer)
+
+        # Assert
+        assert (update["x"], update["y"]) == (2600000, 1200000)
+        assert update["longitude"] == pytest.approx(7.4386, abs=1e-3)
+        assert update["latitude"] == pytest.approx(46.9511, abs=1e-3)
+
+    def test_skips_invalid_and_empty_geometries(self):
+        """Test that unparseable or empty geometries produce no update."""
+        # Arrange
+        stage = CoordinatesStage(source_map={})
+        frame = pd.DataFrame(
+            {"id": [1, 2, 3], "geometry": ["POINT (1 2)", "NOT WKT", "POINT EMPTY"]}
+        )
+
+        # Act
+        updates = stage._compute_coordinates(frame, None)
+
+        # Assert
+        assert [update["id"] for update in updates] == [1]
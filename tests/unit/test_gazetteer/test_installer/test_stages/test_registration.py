@@ -6,6 +6,8 @@ Tests the RegistrationStage class.
 
 import pytest
 
+from geoparser.db.crud import GazetteerRepository
+from geoparser.db.models import GazetteerCreate
 from geoparser.gazetteer.installer.stages.registration import RegistrationStage
 
 
@@ -54,3 +56,69 @@ class TestRegistrationStageInit:
 
         # Assert
         assert stage.chunksize == 5000
+
+
+@pytest.mark.unit
+class TestRegistrationStageEnsureSourceRecord:
+    """Test RegistrationStage._ensure_source_record() method."""
+
+    @pytest.fixture
+    def stage(self, test_session):
+        """Create a stage for a registered gazetteer."""
+        GazetteerRepository.create(test_session, GazetteerCreate(name="places"))
+        return RegistrationStage(gazetteer_name="places")
+
+    def test_uses_table_name_without_schema(self, stage):
+        """Test that sources of the main database use the bare table name."""
+        # Act
+        source_record = stage._ensure_source_record("cities", "id")
+
+        # Assert
+        assert source_record.name == "cities"
+
+    def test_qualifies_name_with_schema(self, stage):
+        """Test that sources of a gazetteer file are qualified by its schema."""
+        # Act
+        source_record = stage._ensure_source_record("cities", "id", "gazetteer_places")
+
+        # Assert
+        assert source_record.name == "gazetteer_places.cities"
+
+    def test_reuses_existing_record(self, stage):
+        """Test that reinstalling reuses the existing source record."""
+        # Arrange
+        first = stage._ensure_source_record("cities", "id", "gazetteer_places")
+
+        # Act
+        second = stage._ensure_source_record("cities", "id", "gazetteer_places")
+
+        # Assert
+        assert second.id == first.id
+
+    def test_renames_legacy_record(self, stage):
+        """Test that a record of a main database install is renamed."""
+        # Arrange
+        legacy = stage._ensure_source_record("cities", "id")
+
+        # Act
+        source_record = stage._ensure_source_record("cities", "id", "gazetteer_places")
+
+        # Assert
+        assert source_record.id == legacy.id
+        assert source_record.name == "gazetteer_places.cities"
+
+    def test_keeps_features_of_legacy_record(
+        self, stage, feature_factory, test_session
+    ):
+        """Test that features of a main database install keep their source."""
+        # Arrange
+        legacy = stage._ensure_source_record("cities", "id")
+        feature = feature_factory(location_id_value="1", source_id=legacy.id)
+
+        # Act
+        source_record = stage._ensure_source_record("cities", "id", "gazetteer_places")
+
+        # Assert
+        test_session.refresh(feature)
+        assert feature.source_id == source_record.id
+        assert feature.source.name == "gazetteer_places.cities"
@@ -73,8 +73,8 @@ class TestSchemaStageDropExisting:
 
         # Assert
         assert len(execute_calls) == 2
-        assert "DROP VIEW IF EXISTS test_table_view" in execute_calls[0]
-        assert "DROP TABLE IF EXISTS test_table" in execute_calls[1]
+        assert "DROP VIEW IF EXISTS main.test_table_view" in execute_calls[0]
+        assert "DROP TABLE IF EXISTS main.test_table" in execute_calls[1]
         assert "DropTable" not in execute_calls[0]
         assert "DropTable" not in execute_calls[1]
         assert mock_connection.commit.call_count == 1
@@ -81,7 +81,7 @@ class TestViewStageExecute:
 
         # Assert
         assert context["view_name"] == "test_source_view"
-        assert any("DROP VIEW IF EXISTS test_source_view" in c for c in executed)
+        assert any("DROP VIEW IF EXISTS main.test_source_view" in c for c in executed)
         assert any("CREATE VIEW test_source_view" in c for c in executed)
 
     def test_sets_none_view_name_when_no_view(self):
@@ -4,11 +4,14 @@ Unit tests for geoparser/geoparser/geoparser.py
 Tests the Geoparser class with mocked dependencies.
 """
 
-from unittest.mock import Mock, patch
+import asyncio
+import threading
+from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 
 from geoparser.geoparser.geoparser import Geoparser
+from geoparser.services.executors import INFERENCE_THREAD_NAME_PREFIX
 
 
 @pytest.mark.unit
@@ -391,3 +394,424 @@ class TestGeoparserParse:
 
         # Project should still be deleted in finally block
         mock_project_instance.delete.assert_called_once()
+
+
+@pytest.mark.unit
+class TestGeoparserAparse:
+    """Test Geoparser aparse method."""
+
+    @patch("geoparser.geoparser.geoparser.Project")
+    def test_runs_modules_and_deletes_project(self, mock_project_class):
+        """Test that aparse runs both modules asynchronously and cleans up."""
+        # Arrange
+        mock_recognizer = Mock()
+        mock_resolver = Mock()
+        mock_project_instance = mock_project_class.return_value
+        mock_project_instance.arun_recognizer = AsyncMock()
+        mock_project_instance.arun_resolver = AsyncMock()
+        mock_project_instance.get_documents.return_value = ["doc"]
+        geoparser = Geoparser(mock_recognizer, mock_resolver)
+
+        # Act
+        documents = asyncio.run(geoparser.aparse("Test text"))
+
+        # Assert
+        assert documents == ["doc"]
+        mock_project_instance.create_documents.assert_called_once_with("Test text")
+        mock_project_instance.arun_recognizer.assert_awaited_once_with(mock_recognizer)
+        mock_project_instance.arun_resolver.assert_awaited_once_with(mock_resolver)
+        mock_project_instance.delete.assert_called_once()
+
+    @patch("geoparser.geoparser.geoparser.Project")
+    def test_keeps_project_when_saving(self, mock_project_class, capsys):
+        """Test that aparse keeps the project with save=True."""
+        # Arrange
+        mock_project_instance = mock_project_class.return_value
+        mock_project_instance.get_documents.return_value = []
+        geoparser = Geoparser(None, None)
+
+        # Act
+        asyncio.run(geoparser.aparse("Test text", save=True))
+
+        # Assert
+        mock_project_instance.delete.assert_not_called()
+        assert "Results saved under project name" in capsys.readouterr().out
+
+    def test_in_memory_runs_recognizer_on_inference_executor(self):
+        """Test that in-memory aparse runs the recognizer off the event loop."""
+        # Arrange
+        threads = []
+
+        def recognize(texts):
+            threads.append(threading.current_thread().name)
+            return [[(0, 5)]]
+
+        mock_recognizer = Mock()
+        mock_recognizer.predict.side_effect = recognize
+        mock_resolver = Mock()
+        mock_resolver.apredict = AsyncMock(return_value=[[("geonames", "1")]])
+        geoparser = Geoparser(mock_recognizer, mock_resolver)
+
+        # Act
+        documents = asyncio.run(geoparser.aparse("Paris is nice.", in_memory=True))
+
+        # Assert
+        assert documents[0].toponyms[0].referent == ("geonames", "1")
+        assert len(threads) == 1
+        assert threads[0].startswith(INFERENCE_THREAD_NAME_PREFIX)
+
+    def test_in_memory_resolves_with_async_resolver(self):
+        """Test that in-memory aparse awaits the resolver instead of blocking on predict."""
+        # Arrange
+        mock_recognizer = Mock()
+        mock_recognizer.predict.return_value = [[(0, 5)], []]
+        mock_resolver = Mock()
+        mock_resolver.apredict = AsyncMock(return_value=[[("geonames", "1")]])
+        geoparser = Geoparser(mock_recognizer, mock_resolver)
+
+        # Act
+        documents = asyncio.run(
+            geoparser.aparse(["Paris is nice.", "Nothing here."], in_memory=True)
+        )
+
+        # Assert
+        mock_resolver.apredict.assert_awaited_once_with(["Paris is nice."], [[(0, 5)]])
+        mock_resolver.predict.assert_not_called()
+        assert documents[0].toponyms[0].referent == ("geonames", "1")
+        assert documents[1].toponyms == []
+
+    def test_in_memory_rejects_save(self):
+        """Test that in-memory aparse cannot save results."""
+        # Arrange
+        geoparser = Geoparser(None, None)
+
+        # Act & Assert
+        with pytest.raises(ValueError, match="cannot be saved"):
+            asyncio.run(geoparser.aparse("Test text", save=True, in_memory=True))
+
+
+@pytest.mark.unit
+class TestGeoparserParseInMemory:
+    """Test Geoparser parse method with in_memory=True."""
+
+    @patch("geoparser.geoparser.geoparser.Project")
+    def test_does_not_create_project(self, mock_project_class):
+        """Test that in-memory parsing does not create a project."""
+        # Arrange
+        mock_recognizer = Mock()
+        mock_recognizer.predict.return_value = [[]]
+        geoparser = Geoparser(mock_recognizer, None)
+
+        # Act
+        geoparser.parse("Test text", in_memory=True)
+
+        # Assert
+        mock_project_class.assert_not_called()
+
+    def test_returns_parsed_documents_with_toponyms(self):
+        """Test that in-memory parsing returns documents with recognized toponyms."""
+        # Arrange
+        mock_recognizer = Mock()
+        mock_recognizer.predict.return_value = [[(0, 5)], [(4, 10)]]
+        mock_resolver = Mock()
+        mock_resolver.predict.return_value = [[("geonames", "1")], [None]]
+        geoparser = Geoparser(mock_recognizer, mock_resolver)
+
+        # Act
+        documents = geoparser.parse(["Paris is nice.", "Not Berlin"], in_memory=True)
+
+        # Assert
+        assert [doc.text for doc in documents] == ["Paris is nice.", "Not Berlin"]
+        assert [t.text for t in documents[0].toponyms] == ["Paris"]
+        assert documents[0].toponyms[0].referent == ("geonames", "1")
+        assert documents[1].toponyms[0].text == "Berlin"
+        assert documents[1].toponyms[0].referent is None
+
+    def test_resolves_only_documents_with_references(self):
+        """Test that the resolver only receives documents that have references."""
+        # Arrange
+        mock_recognizer = Mock()
+        mock_recognizer.predict.return_value = [[], None, [(0, 5)]]
+        mock_resolver = Mock()
+        mock_resolver.predict.return_value = [[("geonames", "1")]]
+        geoparser = Geoparser(mock_recognizer, mock_resolver)
+
+        # Act
+        documents = geoparser.parse(["None", "Skipped", "Paris"], in_memory=True)
+
+        # Assert
+        mock_resolver.predict.assert_called_once_with(["Paris"], [[(0, 5)]])
+        assert documents[0].toponyms == []
+        assert documents[1].toponyms == []
+        assert documents[2].toponyms[0].referent == ("geonames", "1")
+
+    def test_skips_resolution_without_resolver(self):
+        """Test that toponyms are unresolved when no resolver is configured."""
+        # Arrange
+        mock_recognizer = Mock()
+        mock_recognizer.predict.return_value = [[(0, 5)]]
+        geoparser = Geoparser(mock_recognizer, None)
+
+        # Act
+        documents = geoparser.parse("Paris", in_memory=True)
+
+        # Assert
+        assert documents[0].toponyms[0].referent is None
+        assert documents[0].toponyms[0].location is None
+
+    def test_returns_documents_without_toponyms_without_recognizer(self):
+        """Test that documents have no toponyms when no recognizer is configured."""
+        # Arrange
+        mock_resolver = Mock()
+        geoparser = Geoparser(None, mock_resolver)
+
+        # Act
+        documents = geoparser.parse("Paris", in_memory=True)
+
+        # Assert
+        assert documents[0].toponyms == []
+        mock_resolver.predict.assert_not_called()
+
+    def test_normalizes_newlines(self):
+        """Test that texts are normalized like stored documents."""
+        # Arrange
+        mock_recognizer = Mock()
+        mock_recognizer.predict.return_value = [[]]
+        geoparser = Geoparser(mock_recognizer, None)
+
+        # Act
+        documents = geoparser.parse("Line 1\r\nLine 2", in_memory=True)
+
+        # Assert
+        mock_recognizer.predict.assert_called_once_with(["Line 1\nLine 2"])
+        assert documents[0].text == "Line 1\nLine 2"
+
+    def test_raises_error_when_saving(self):
+        """Test that in-memory results cannot be saved."""
+        # Arrange
+        geoparser = Geoparser(Mock(), Mock())
+
+        # Act & Assert
+        with pytest.raises(ValueError, match="cannot be saved"):
+            geoparser.parse("Test text", save=True, in_memory=True)
+
+
+@pytest.mark.unit
+class TestGeoparserParseStream:
+    """Test Geoparser parse_stream method."""
+
+    def test_yields_documents_in_input_order(self):
+        """Test that parse_stream yields one document per text in order."""
+        # Arrange
+        mock_recognizer = Mock()
+        mock_recognizer.predict.side_effect = lambda texts: [[] for _ in texts]
+        geoparser = Geoparser(mock_recognizer, None)
+
+        # Act
+        documents = list(geoparser.parse_stream(["A", "B", "C"], batch_size=2))
+
+        # Assert
+        assert [doc.text for doc in documents] == ["A", "B", "C"]
+
+    def test_processes_texts_in_batches(self):
+        """Test that the recognizer is called once per batch."""
+        # Arrange
+        mock_recognizer = Mock()
+        mock_recognizer.predict.side_effect = lambda texts: [[] for _ in texts]
+        geoparser = Geoparser(mock_recognizer, None)
+
+        # Act
+        list(geoparser.parse_stream(["A", "B", "C"], batch_size=2))
+
+        # Assert
+        assert [call.args[0] for call in mock_recognizer.predict.call_args_list] == [
+            ["A", "B"],
+            ["C"],
+        ]
+
+    def test_consumes_input_lazily(self):
+        """Test that texts are only consumed as batches are requested."""
+        # Arrange
+        mock_recognizer = Mock()
+        mock_recognizer.predict.side_effect = lambda texts: [[] for _ in texts]
+        geoparser = Geoparser(mock_recognizer, None)
+        consumed = []
+
+        def generate_texts():
+            for text in ["A", "B", "C", "D"]:
+                consumed.append(text)
+                yield text
+
+        # Act
+        stream = geoparser.parse_stream(generate_texts(), batch_size=2)
+        first = next(stream)
+
+        # Assert
+        assert first.text == "A"
+        assert consumed == ["A", "B"]
+
+    def test_does_not_create_project(self):
+        """Test that parse_stream does not create a project."""
+        # Arrange
+        mock_recognizer = Mock()
+        mock_recognizer.predict.side_effect = lambda texts: [[] for _ in texts]
+        geoparser = Geoparser(mock_recognizer, None)
+
+        # Act
+        with patch("geoparser.geoparser.geoparser.Project") as mock_project_class:
+            list(geoparser.parse_stream(["A"]))
+
+        # Assert
+        mock_project_class.assert_not_called()
+
+    def test_handles_empty_input(self):
+        """Test that parse_stream yields nothing for an empty iterable."""
+        # Arrange
+        mock_recognizer = Mock()
+        geoparser = Geoparser(mock_recognizer, None)
+
+        # Act
+        documents = list(geoparser.parse_stream(iter([])))
+
+        # Assert
+        assert documents == []
+        mock_recognizer.predict.assert_not_called()
+
+    def test_raises_error_for_invalid_batch_size(self):
+        """Test that parse_stream rejects non-positive batch sizes."""
+        # Arrange
+        geoparser = Geoparser(Mock(), None)
+
+        # Act & Assert
+        with pytest.raises(ValueError, match="batch_size"):
+            list(geoparser.parse_stream(["A"], batch_size=0))
+
+    def test_pipelined_stream_matches_sequential_results(self):
+        """Test that pipelined parsing yields the same results as sequential parsing."""
+        # Arrange
+        mock_recognizer = Mock()
+        mock_recognizer.predict.side_effect = lambda texts: [[(0, 1)] for _ in texts]
+        mock_resolver = Mock()
+        mock_resolver.predict.side_effect = lambda texts, references: [
+            [("geonames", text)] for text in texts
+        ]
+        geoparser = Geoparser(mock_recognizer, mock_resolver)
+        texts = ["A", "B", "C", "D", "E"]
+
+        # Act
+        sequential = list(geoparser.parse_stream(texts, batch_size=2))
+        pipelined = list(geoparser.parse_stream(texts, batch_size=2, pipelined=True))
+
+        # Assert
+        assert [doc.model_dump() for doc in pipelined] == [
+            doc.model_dump() for doc in sequential
+        ]
+        assert [doc.toponyms[0].referent for doc in pipelined] == [
+            ("geonames", text) for text in texts
+        ]
+
+
+@pytest.mark.unit
+class TestGeoparserWorkers:
+    """Test in-memory parsing with several worker threads."""
+
+    def test_raises_error_for_invalid_worker_count(self):
+        """Test that a non-positive number of workers is rejected."""
+        # Act & Assert
+        with pytest.raises(ValueError, match="workers"):
+            Geoparser(Mock(), Mock(), workers=0)
+
+    def test_splits_texts_across_threads(self):
+        """Test that the texts of a call are split into one shard per worker."""
+        # Arrange
+        mock_recognizer = Mock()
+        mock_recognizer.predict.side_effect = lambda texts: [[] for _ in texts]
+        geoparser = Geoparser(mock_recognizer, None, workers=2)
+
+        # Act
+        geoparser.parse(["A", "B", "C", "D", "E"], in_memory=True)
+
+        # Assert
+        shards = sorted(call.args[0] for call in mock_recognizer.predict.call_args_list)
+        assert shards == [["A", "B", "C"], ["D", "E"]]
+
+    def test_returns_documents_in_input_order(self):
+        """Test that results of all shards are combined in input order."""
+        # Arrange
+        mock_recognizer = Mock()
+        mock_recognizer.predict.side_effect = lambda texts: [[(0, 1)] for _ in texts]
+        mock_resolver = Mock()
+        mock_resolver.predict.side_effect = lambda texts, references: [
+            [("geonames", text)] for text in texts
+        ]
+        geoparser = Geoparser(mock_recognizer, mock_resolver, workers=3)
+        texts = [str(i) for i in range(10)]
+
+        # Act
+        documents = geoparser.parse(texts, in_memory=True)
+
+        # Assert
+        assert [doc.text for doc in documents] == texts
+        assert [doc.toponyms[0].referent for doc in documents] == [
+            ("geonames", text) for text in texts
+        ]
+
+    def test_does_not_use_threads_by_default(self):
+        """Test that a default Geoparser parses in the calling thread."""
+        # Arrange
+        threads = []
+        mock_recognizer = Mock()
+        mock_recognizer.predict.side_effect = lambda texts: (
+            threads.append(threading.current_thread()) or [[] for _ in texts]
+        )
+        geoparser = Geoparser(mock_recognizer, None)
+
+        # Act
+        geoparser.parse(["A", "B"], in_memory=True)
+
+        # Assert
+        assert threads == [threading.current_thread()]
+
+    def test_close_shuts_down_threads(self):
+        """Test that close stops the worker threads and parsing continues inline."""
+        # Arrange
+        threads = []
+        mock_recognizer = Mock()
+        mock_recognizer.predict.side_effect = lambda texts: (
+            threads.append(threading.current_thread()) or [[] for _ in texts]
+        )
+        geoparser = Geoparser(mock_recognizer, None, workers=2)
+        executor = geoparser._executor
+
+        # Act
+        geoparser.close()
+        geoparser.parse(["A", "B"], in_memory=True)
+
+        # Assert
+        assert executor._shutdown
+        assert threads == [threading.current_thread()]
+
+    def test_context_manager_closes_geoparser(self):
+        """Test that leaving the with block shuts down the worker threads."""
+        # Act
+        with Geoparser(Mock(), None, workers=2) as geoparser:
+            executor = geoparser._executor
+
+        # Assert
+        assert executor._shutdown
+        assert geoparser._executor is None
+
+    def test_shuts_down_threads_when_garbage_collected(self):
+        """Test that the worker threads are stopped with the Geoparser."""
+        # Arrange
+        import gc
+
+        geoparser = Geoparser(Mock(), None, workers=2)
+        executor = geoparser._executor
+
+        # Act
+        del geoparser
+        gc.collect()
+
+        # Assert
+        assert executor._shutdown
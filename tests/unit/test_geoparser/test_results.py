@@ -0,0 +1,95 @@
+"""
+Unit tests for geoparser/geoparser/results.py
+
+Tests the lightweight ParsedDocument and ParsedToponym result models.
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from geoparser.geoparser.results import ParsedDocument, ParsedToponym
+
+
+@pytest.mark.unit
+class TestParsedToponymLocation:
+    """Test ParsedToponym location property."""
+
+    def test_returns_none_for_unresolved_toponym(self):
+        """Test that location is None when the toponym has no referent."""
+        # Arrange
+        toponym = ParsedToponym(start=0, end=5, text="Paris")
+
+        # Act & Assert
+        assert toponym.location is None
+
+    def test_loads_feature_from_gazetteer(
+        self, gazetteer_factory, source_factory, feature_factory
+    ):
+        """Test that location loads the feature by gazetteer name and identifier."""
+        # Arrange
+        gazetteer = gazetteer_factory(name="geonames")
+        source = source_factory(gazetteer_id=gazetteer.id)
+        feature = feature_factory(location_id_value="2988507", source_id=source.id)
+        toponym = ParsedToponym(
+            start=0, end=5, text="Paris", referent=("geonames", "2988507")
+        )
+
+        # Act
+        location = toponym.location
+
+        # Assert
+        assert location is not None
+        assert location.id == feature.id
+
+    def test_returns_none_for_missing_feature(self):
+        """Test that location is None when the feature is not in the gazetteer."""
+        # Arrange
+        toponym = ParsedToponym(
+            start=0, end=5, text="Paris", referent=("geonames", "missing")
+        )
+
+        # Act & Assert
+        assert toponym.location is None
+
+    def test_caches_loaded_feature(self):
+        """Test that the feature is looked up only once."""
+        # Arrange
+        toponym = ParsedToponym(
+            start=0, end=5, text="Paris", referent=("geonames", "2988507")
+        )
+
+        with patch(
+            "geoparser.geoparser.results.FeatureRepository.get_by_gazetteer_and_identifier"
+        ) as mock_get_feature:
+            mock_get_feature.return_value = None
+
+            # Act
+            toponym.location
+            toponym.location
+
+        # Assert
+        mock_get_feature.assert_called_once()
+
+
+@pytest.mark.unit
+class TestParsedResultsStringRepresentation:
+    """Test string representations of parsed results."""
+
+    def test_toponym_str(self):
+        """Test that toponyms are represented like references."""
+        # Arrange
+        toponym = ParsedToponym(start=0, end=5, text="Paris")
+
+        # Act & Assert
+        assert str(toponym) == 'Reference("Paris")'
+        assert repr(toponym) == 'Reference("Paris")'
+
+    def test_document_str(self):
+        """Test that parsed documents are represented like documents."""
+        # Arrange
+        document = ParsedDocument(text="Paris is nice.")
+
+        # Act & Assert
+        assert str(document) == 'Document("Paris is nice.")'
+        assert repr(document) == 'Document("Paris is nice.")'
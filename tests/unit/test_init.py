@@ -0,0 +1,82 @@
+"""
+Unit tests for geoparser/__init__.py
+
+Tests the lazy-loading package initialization and that importing it is cheap.
+"""
+
+import pytest
+
+
+@pytest.mark.unit
+class TestPackageLazyLoading:
+    """Test geoparser/__init__.py lazy-loading functionality."""
+
+    @pytest.mark.parametrize("name", ["Gazetteer", "Geoparser", "Project"])
+    def test_lazy_loads_public_classes(self, name):
+        """Test that the public classes are lazy-loaded on access."""
+        # Arrange
+        import geoparser
+
+        # Act
+        cls = getattr(geoparser, name)
+
+        # Assert
+        assert cls.__name__ == name
+
+    def test_raises_attribute_error_for_unknown_attribute(self):
+        """Test that AttributeError is raised for unknown package attributes."""
+        # Arrange
+        import geoparser
+
+        # Act & Assert
+        with pytest.raises(AttributeError, match="has no attribute 'Unknown'"):
+            _ = geoparser.Unknown
+
+
+@pytest.mark.unit
+class TestPackageImportTime:
+    """Test that importing the package stays cheap."""
+
+    def test_import_does_not_load_heavy_libraries(self, run_python):
+        """Test that importing the package loads no database or model library."""
+        # Act
+        output = run_python(
+            "import sys, geoparser; "
+            "print(','.join(m for m in ('sqlalchemy', 'sqlmodel', 'pandas', "
+            "'torch', 'spacy') if m in sys.modules))"
+        )
+
+        # Assert
+        assert output == ""
+
+    def test_import_loads_only_standard_library(self, run_python):
+        """Test that importing the package loads no third-party module at all."""
+        # Act
+        output = run_python(
+            "import sys; before = set(sys.modules); import geoparser; "
+            "loaded = {m.split('.')[0] for m in set(sys.modules) - before}; "
+            "print(','.join(sorted(loaded - set(sys.stdlib_module_names) "
+            "- {'geoparser'})))"
+        )
+
+        # Assert
+        assert output == ""
+
+    def test_importing_database_module_does_not_touch_database(
+        self, tmp_path, run_python
+    ):
+        """Test that the database directory and engine are only created on use."""
+        # Arrange
+        import os
+
+        database_dir = tmp_path / "data"
+        env = dict(os.environ, DATABASE_URL=f"sqlite:///{database_dir / 'g.db'}")
+
+        # Act
+        output = run_python(
+            "import geoparser.db.db as db; print(db.engine is None)", env=env
+        )
+
+        # Assert
+        assert output == "True"
+        assert not database_dir.exists()
@@ -4,11 +4,16 @@ Unit tests for geoparser/modules/recognizers/spacy.py
 Tests the SpacyRecognizer module with mocked spaCy models.
 """
 
+import gc
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import Mock, patch
 
 import pytest
 
 from geoparser.modules.recognizers.spacy import SpacyRecognizer
+from geoparser.modules.registry import model_registry
 
 
 @pytest.mark.unit
@@ -195,6 +200,74 @@ class TestSpacyRecognizerInitialization:
         assert recognizer.nlp == mock_nlp
 
 
+@pytest.mark.unit
+class TestSpacyRecognizerModelSharing:
+    """Test sharing of spaCy pipelines between SpacyRecognizer instances."""
+
+    @patch("geoparser.modules.recognizers.spacy.spacy.load")
+    def test_shares_pipeline_between_instances(self, mock_spacy_load):
+        """Test that recognizers with the same model share one loaded pipeline."""
+        # Arrange
+        mock_spacy_load.side_effect = lambda *args, **kwargs: Mock(pipe_names=[])
+
+        # Act
+        recognizer1 = SpacyRecognizer(model_name="en_core_web_sm", entity_types=["GPE"])
+        recognizer2 = SpacyRecognizer(model_name="en_core_web_sm", entity_types=["LOC"])
+
+        # Assert
+        assert recognizer1.nlp is recognizer2.nlp
+        assert recognizer1._nlp_lock is recognizer2._nlp_lock
+        mock_spacy_load.assert_called_once()
+
+    @patch("geoparser.modules.recognizers.spacy.spacy.load")
+    def test_loads_different_models_separately(self, mock_spacy_load):
+        """Test that recognizers with different models do not share pipelines."""
+        # Arrange
+        mock_spacy_load.side_effect = lambda *args, **kwargs: Mock(pipe_names=[])
+
+        # Act
+        recognizer1 = SpacyRecognizer(model_name="en_core_web_sm")
+        recognizer2 = SpacyRecognizer(model_name="de_core_news_sm")
+
+        # Assert
+        assert recognizer1.nlp is not recognizer2.nlp
+        assert mock_spacy_load.call_count == 2
+
+    @patch("geoparser.modules.recognizers.spacy.spacy.load")
+    def test_releases_pipeline_when_garbage_collected(self, mock_spacy_load):
+        """Test that a recognizer releases its pipeline once it is collected."""
+        # Arrange
+        mock_spacy_load.return_value = Mock(pipe_names=[])
+        recognizer = SpacyRecognizer(model_name="en_core_web_sm")
+        key = ("spacy-ner", "en_core_web_sm")
+        assert model_registry.references(key) == 1
+
+        # Act
+        del recognizer
+        gc.collect()
+
+        # Assert
+        assert model_registry.references(key) == 0
+
+    @patch("geoparser.modules.recognizers.spacy.spacy.load")
+    def test_detach_model_loads_private_pipeline(self, mock_spacy_load):
+        """Test that detaching replaces the shared pipeline with a private copy."""
+        # Arrange
+        mock_spacy_load.side_effect = lambda *args, **kwargs: Mock(pipe_names=[])
+        recognizer1 = SpacyRecognizer(model_name="en_core_web_sm")
+        recognizer2 = SpacyRecognizer(model_name="en_core_web_sm")
+        shared_nlp = recognizer2.nlp
+
+        # Act
+        recognizer1._detach_model()
+
+        # Assert
+        assert recognizer1.nlp is not shared_nlp
+        assert recognizer2.nlp is shared_nlp
+        assert recognizer1._nlp_lock is not recognizer2._nlp_lock
+        assert model_registry.references(("spacy-ner", "en_core_web_sm")) == 1
+
+
 @pytest.mark.unit
 class TestSpacyRecognizerPredict:
     """Test SpacyRecognizer predict method."""
@@ -219,6 +292,38 @@ class TestSpacyRecognizerPredict:
         # Assert
         mock_nlp.pipe.assert_called_once_with(texts)
 
+    @patch("geoparser.modules.recognizers.spacy.spacy.load")
+    def test_serializes_concurrent_pipeline_calls(self, mock_spacy_load):
+        """Test that threads sharing a recognizer do not run the pipeline at once."""
+        # Arrange
+        active = []
+        overlaps = []
+        lock = threading.Lock()
+
+        def pipe(texts):
+            with lock:
+                active.append(1)
+                overlaps.append(len(active) > 1)
+            time.sleep(0.01)
+            with lock:
+                active.pop()
+            return [Mock(ents=[]) for _ in texts]
+
+        mock_nlp = Mock()
+        mock_nlp.pipe_names = []
+        mock_nlp.pipe.side_effect = pipe
+        mock_spacy_load.return_value = mock_nlp
+
+        recognizer = SpacyRecognizer()
+
+        # Act
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(executor.map(recognizer.predict, [["Text"]] * 8))
+
+        # Assert
+        assert results == [[[]]] * 8
+        assert not any(overlaps)
+
     @patch("geoparser.modules.recognizers.spacy.spacy.load")
     def test_extracts_entities_with_matching_types(self, mock_spacy_load):
         """Test that predict extracts only entities matching configured types."""
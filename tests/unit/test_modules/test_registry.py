@@ -0,0 +1,216 @@
+import threading
+import time
+from unittest.mock import Mock
+
+import pytest
+
+from geoparser.modules.registry import ModelRegistry
+
+
+@pytest.mark.unit
+class TestModelRegistryAcquire:
+    """Test acquiring models from the ModelRegistry."""
+
+    def test_loads_model_on_first_acquisition(self):
+        """Test that the model is loaded when a key is acquired for the first time."""
+        # Arrange
+        registry = ModelRegistry()
+        load = Mock(return_value="model")
+
+        # Act
+        model = registry.acquire("key", load)
+
+        # Assert
+        assert model == "model"
+        load.assert_called_once_with()
+        assert "key" in registry
+        assert registry.references("key") == 1
+
+    def test_shares_model_between_acquisitions(self):
+        """Test that later acquisitions of a key return the loaded model."""
+        # Arrange
+        registry = ModelRegistry()
+        load = Mock(side_effect=lambda: object())
+
+        # Act
+        first = registry.acquire("key", load)
+        second = registry.acquire("key", load)
+
+        # Assert
+        assert first is second
+        load.assert_called_once()
+        assert registry.references("key") == 2
+
+    def test_loads_different_keys_separately(self):
+        """Test that models of different keys are not shared."""
+        # Arrange
+        registry = ModelRegistry()
+
+        # Act
+        first = registry.acquire("a", object)
+        second = registry.acquire("b", object)
+
+        # Assert
+        assert first is not second
+        assert len(registry) == 2
+
+    def test_loads_model_once_for_concurrent_acquisitions(self):
+        """Test that concurrent acquisitions of a key load its model only once."""
+        # Arrange
+        registry = ModelRegistry()
+        calls = []
+
+        def load():
+            calls.append(None)
+            time.sleep(0.02)
+            return object()
+
+        models = []
+
+        def acquire():
+            models.append(registry.acquire("key", load))
+
+        threads = [threading.Thread(target=acquire) for _ in range(4)]
+
+        # Act
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # Assert
+        assert len(calls) == 1
+        assert all(model is models[0] for model in models)
+        assert registry.references("key") == 4
+
+    def test_does_not_register_model_when_loading_fails(self):
+        """Test that a failed load leaves the key unregistered."""
+        # Arrange
+        registry = ModelRegistry()
+
+        # Act & Assert
+        with pytest.raises(OSError):
+            registry.acquire("key", Mock(side_effect=OSError("not found")))
+        assert "key" not in registry
+        assert registry.acquire("key", lambda: "model") == "model"
+
+
+@pytest.mark.unit
+class TestModelRegistryRelease:
+    """Test releasing models of the ModelRegistry."""
+
+    def test_keeps_unused_model_for_reuse(self):
+        """Test that a released model is reused by the next acquisition."""
+        # Arrange
+        registry = ModelRegistry(max_unused=1)
+        load = Mock(side_effect=lambda: object())
+        model = registry.acquire("key", load)
+
+        # Act
+        registry.release("key", model)
+        reacquired = registry.acquire("key", load)
+
+        # Assert
+        assert reacquired is model
+        load.assert_called_once()
+
+    def test_evicts_least_recently_used_unused_models(self):
+        """Test that unused models beyond max_unused are evicted oldest first."""
+        # Arrange
+        registry = ModelRegistry(max_unused=2)
+        models = {key: registry.acquire(key, object) for key in ("a", "b", "c")}
+
+        # Act
+        for key in ("a", "b", "c"):
+            registry.release(key, models[key])
+
+        # Assert
+        assert "a" not in registry
+        assert "b" in registry
+        assert "c" in registry
+
+    def test_does_not_evict_models_in_use(self):
+        """Test that models with remaining acquisitions are never evicted."""
+        # Arrange
+        registry = ModelRegistry(max_unused=0)
+        model = registry.acquire("key", object)
+        registry.acquire("key", object)
+
+        # Act
+        registry.release("key", model)
+
+        # Assert
+        assert "key" in registry
+        assert registry.references("key") == 1
+
+    def test_evicts_immediately_without_unused_slots(self):
+        """Test that max_unused=0 evicts models as soon as they are released."""
+        # Arrange
+        registry = ModelRegistry(max_unused=0)
+        model = registry.acquire("key", object)
+
+        # Act
+        registry.release("key", model)
+
+        # Assert
+        assert "key" not in registry
+        assert registry.references("key") == 0
+
+    def test_ignores_release_of_unknown_key(self):
+        """Test that releasing a key that is not loaded has no effect."""
+        # Arrange
+        registry = ModelRegistry()
+
+        # Act
+        registry.release("missing", object())
+
+        # Assert
+        assert len(registry) == 0
+
+    def test_ignores_release_of_replaced_model(self):
+        """Test that releasing a model dropped by clear does not affect its successor."""
+        # Arrange
+        registry = ModelRegistry()
+        old_model = registry.acquire("key", object)
+        registry.clear()
+        registry.acquire("key", object)
+
+        # Act
+        registry.release("key", old_model)
+
+        # Assert
+        assert registry.references("key") == 1
+
+    def test_rejects_negative_max_unused(self):
+        """Test that a negative max_unused raises ValueError."""
+        # Act & Assert
+        with pytest.raises(ValueError, match="max_unused"):
+            ModelRegistry(max_unused=-1)
+
+
+@pytest.mark.unit
+class TestModelRegistryHelpers:
+    """Test the remaining helpers of the ModelRegistry."""
+
+    def test_returns_same_lock_per_key(self):
+        """Test that all users of a key get the same lock."""
+        # Arrange
+        registry = ModelRegistry()
+
+        # Act & Assert
+        assert registry.lock("a") is registry.lock("a")
+        assert registry.lock("a") is not registry.lock("b")
+
+    def test_clear_drops_all_models(self):
+        """Test that clear removes used and unused models."""
+        # Arrange
+        registry = ModelRegistry()
+        registry.acquire("a", object)
+        registry.release("b", registry.acquire("b", object))
+
+        # Act
+        registry.clear()
+
+        # Assert
+        assert len(registry) == 0
+        assert registry.references("a") == 0
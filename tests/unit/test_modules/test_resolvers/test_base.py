@@ -4,9 +4,13 @@ Unit tests for geoparser/modules/resolvers/base.py
 Tests the Resolver base class.
 """
 
+import asyncio
+import threading
+
 import pytest
 
 from geoparser.modules.resolvers.base import Resolver
+from geoparser.services.executors import INFERENCE_THREAD_NAME_PREFIX
 
 
 # Create a concrete implementation for testing
@@ -139,3 +143,28 @@ class TestResolverPredict:
         # Assert
         assert result[0][0] == ("geonames", "123")
         assert result[0][1] is None
+
+
+@pytest.mark.unit
+class TestResolverApredict:
+    """Test the default asynchronous prediction of Resolver."""
+
+    def test_runs_predict_on_inference_executor(self):
+        """Test that apredict returns the results of predict run on the inference executor."""
+
+        # Arrange
+        class ThreadRecordingResolver(ConcreteResolver):
+            NAME = "ThreadRecordingResolver"
+
+            def predict(self, texts, references):
+                self.thread_name = threading.current_thread().name
+                return super().predict(texts, references)
+
+        resolver = ThreadRecordingResolver()
+
+        # Act
+        result = asyncio.run(resolver.apredict(["Paris"], [[(0, 5)]]))
+
+        # Assert
+        assert result == [[("geonames", "123")]]
+        assert resolver.thread_name.startswith(INFERENCE_THREAD_NAME_PREFIX)
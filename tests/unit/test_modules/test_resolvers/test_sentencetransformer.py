@@ -4,20 +4,27 @@ Unit tests for geoparser/modules/resolvers/sentencetransformer.py
 Tests the SentenceTransformerResolver module with mocked dependencies.
 """
 
+import asyncio
+import gc
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import Mock, patch
 
 import pytest
 import torch
 
+from geoparser.db.db import DATABASE_THREAD_NAME_PREFIX
+from geoparser.modules.registry import model_registry
+from geoparser.services.executors import INFERENCE_THREAD_NAME_PREFIX
+
 
 @pytest.mark.unit
 class TestSentenceTransformerResolverInitialization:
     """Test SentenceTransformerResolver initialization."""
 
     @patch("geoparser.modules.resolvers.sentencetransformer.spacy.load")
-    @patch(
-        "geoparser.modules.resolvers.sentencetransformer.AutoTokenizer.from_pretrained"
-    )
+    @patch("transformers.AutoTokenizer.from_pretrained")
     @patch("geoparser.modules.resolvers.sentencetransformer.SentenceTransformer")
     @patch("geoparser.modules.resolvers.sentencetransformer.Gazetteer")
     def test_creates_with_default_parameters(
@@ -40,9 +47,7 @@ class TestSentenceTransformerResolverInitialization:
         assert resolver.max_tiers == 3
 
     @patch("geoparser.modules.resolvers.sentencetransformer.spacy.load")
-    @patch(
-        "geoparser.modules.resolvers.sentencetransformer.AutoTokenizer.from_pretrained"
-    )
+    @patch("transformers.AutoTokenizer.from_pretrained")
     @patch("geoparser.modules.resolvers.sentencetransformer.SentenceTransformer")
     @patch("geoparser.modules.resolvers.sentencetransformer.Gazetteer")
     def test_creates_with_custom_parameters(
@@ -78,9 +83,7 @@ class TestSentenceTransformerResolverInitialization:
         assert resolver.max_tiers == 5
 
     @patch("geoparser.modules.resolvers.sentencetransformer.spacy.load")
-    @patch(
-        "geoparser.modules.resolvers.sentencetransformer.AutoTokenizer.from_pretrained"
-    )
+    @patch("transformers.AutoTokenizer.from_pretrained")
     @patch("geoparser.modules.resolvers.sentencetransformer.SentenceTransformer")
     @patch("geoparser.modules.resolvers.sentencetransformer.Gazetteer")
     def test_config_contains_all_parameters(
@@ -116,9 +119,7 @@ class TestSentenceTransformerResolverInitialization:
         assert resolver.config["max_tiers"] == 4
 
     @patch("geoparser.modules.resolvers.sentencetransformer.spacy.load")
-    @patch(
-        "geoparser.modules.resolvers.sentencetransformer.AutoTokenizer.from_pretrained"
-    )
+    @patch("transformers.AutoTokenizer.from_pretrained")
     @patch("geoparser.modules.resolvers.sentencetransformer.SentenceTransformer")
     @patch("geoparser.modules.resolvers.sentencetransformer.Gazetteer")
     def test_loads_sentence_transformer_model(
@@ -137,15 +138,13 @@ class TestSentenceTransformerResolverInitialization:
         mock_transformer_class.assert_called_once_with("test-model")
 
     @patch("geoparser.modules.resolvers.sentencetransformer.spacy.load")
-    @patch(
-        "geoparser.modules.resolvers.sentencetransformer.AutoTokenizer.from_pretrained"
-    )
+    @patch("transformers.AutoTokenizer.from_pretrained")
     @patch("geoparser.modules.resolvers.sentencetransformer.SentenceTransformer")
     @patch("geoparser.modules.resolvers.sentencetransformer.Gazetteer")
     def test_loads_tokenizer(
         self, mock_gazetteer, mock_transformer, mock_tokenizer, mock_spacy_load
     ):
-        """Test that AutoTokenizer is loaded."""
+        """Test that the tokenizer of the transformer is reused."""
         # Arrange
         from geoparser.modules.resolvers.sentencetransformer import (
             SentenceTransformerResolver,
@@ -155,12 +154,12 @@ class TestSentenceTransformerResolverInitialization:
         resolver = SentenceTransformerResolver(model_name="test-model")
 
         # Assert
-        mock_tokenizer.assert_called_once_with("test-model")
+        assert resolver.tokenizer is mock_transformer.return_value.tokenizer
+        mock_tokenizer.assert_not_called()
+        assert model_registry.references(("tokenizer", "test-model")) == 0
 
     @patch("geoparser.modules.resolvers.sentencetransformer.spacy.load")
-    @patch(
-        "geoparser.modules.resolvers.sentencetransformer.AutoTokenizer.from_pretrained"
-    )
+    @patch("transformers.AutoTokenizer.from_pretrained")
     @patch("geoparser.modules.resolvers.sentencetransformer.SentenceTransformer")
     @patch("geoparser.modules.resolvers.sentencetransformer.Gazetteer")
     def test_loads_spacy_sentence_splitter(
@@ -179,9 +178,7 @@ class TestSentenceTransformerResolverInitialization:
         mock_spacy_load.assert_called_once_with("xx_sent_ud_sm")
 
     @patch("geoparser.modules.resolvers.sentencetransformer.spacy.load")
-    @patch(
-        "geoparser.modules.resolvers.sentencetransformer.AutoTokenizer.from_pretrained"
-    )
+    @patch("transformers.AutoTokenizer.from_pretrained")
     @patch("geoparser.modules.resolvers.sentencetransformer.SentenceTransformer")
     @patch("geoparser.modules.resolvers.sentencetransformer.Gazetteer")
     def test_initializes_gazetteer(
@@ -210,9 +207,7 @@ class TestSentenceTransformerResolverInitialization:
         mock_gazetteer_class.assert_called_once_with("test-gazetteer")
 
     @patch("geoparser.modules.resolvers.sentencetransformer.spacy.load")
-    @patch(
-        "geoparser.modules.resolvers.sentencetransformer.AutoTokenizer.from_pretrained"
-    )
+    @patch("transformers.AutoTokenizer.from_pretrained")
     @patch("geoparser.modules.resolvers.sentencetransformer.SentenceTransformer")
     @patch("geoparser.modules.resolvers.sentencetransformer.Gazetteer")
     def test_initializes_empty_caches(
@@ -234,9 +229,7 @@ class TestSentenceTransformerResolverInitialization:
         assert resolver.candidate_embeddings == {}
 
     @patch("geoparser.modules.resolvers.sentencetransformer.spacy.load")
-    @patch(
-        "geoparser.modules.resolvers.sentencetransformer.AutoTokenizer.from_pretrained"
-    )
+    @patch("transformers.AutoTokenizer.from_pretrained")
     @patch("geoparser.modules.resolvers.sentencetransformer.SentenceTransformer")
     @patch("geoparser.modules.resolvers.sentencetransformer.Gazetteer")
     def test_different_configs_produce_different_ids(
@@ -256,9 +249,7 @@ class TestSentenceTransformerResolverInitialization:
         assert resolver1.id != resolver2.id
 
     @patch("geoparser.modules.resolvers.sentencetransformer.spacy.load")
-    @patch(
-        "geoparser.modules.resolvers.sentencetransformer.AutoTokenizer.from_pretrained"
-    )
+    @patch("transformers.AutoTokenizer.from_pretrained")
     @patch("geoparser.modules.resolvers.sentencetransformer.SentenceTransformer")
     @patch("geoparser.modules.resolvers.sentencetransformer.Gazetteer")
     def test_same_config_produces_same_id(
@@ -288,9 +279,7 @@ class TestSentenceTransformerResolverInitialization:
         assert resolver1.id == resolver2.id
 
     @patch("geoparser.modules.resolvers.sentencetransformer.spacy.load")
-    @patch(
-        "geoparser.modules.resolvers.sentencetransformer.AutoTokenizer.from_pretrained"
-    )
+    @patch("transformers.AutoTokenizer.from_pretrained")
     @patch("geoparser.modules.resolvers.sentencetransformer.SentenceTransformer")
     @patch("geoparser.modules.resolvers.sentencetransformer.Gazetteer")
     def test_accepts_custom_attribute_map(
@@ -319,9 +308,7 @@ class TestSentenceTransformerResolverInitialization:
         assert resolver.attribute_map == custom_map
 
     @patch("geoparser.modules.resolvers.sentencetransformer.spacy.load")
-    @patch(
-        "geoparser.modules.resolvers.sentencetransformer.AutoTokenizer.from_pretrained"
-    )
+    @patch("transformers.AutoTokenizer.from_pretrained")
     @patch("geoparser.modules.resolvers.sentencetransformer.SentenceTransformer")
     @patch("geoparser.modules.resolvers.sentencetransformer.Gazetteer")
     def test_raises_error_for_unknown_gazetteer_without_attribute_map(
@@ -340,9 +327,7 @@ class TestSentenceTransformerResolverInitialization:
             SentenceTransformerResolver(gazetteer_name="unknown_gazetteer")
 
     @patch("geoparser.modules.resolvers.sentencetransformer.spacy.load")
-    @patch(
-        "geoparser.modules.resolvers.sentencetransformer.AutoTokenizer.from_pretrained"
-    )
+    @patch("transformers.AutoTokenizer.from_pretrained")
     @patch("geoparser.modules.resolvers.sentencetransformer.SentenceTransformer")
     @patch("geoparser.modules.resolvers.sentencetransformer.Gazetteer")
     def test_uses_gazetteer_attribute_map_when_no_custom_map(
@@ -362,9 +347,7 @@ class TestSentenceTransformerResolverInitialization:
         assert resolver.attribute_map == expected_map
 
     @patch("geoparser.modules.resolvers.sentencetransformer.spacy.load")
-    @patch(
-        "geoparser.modules.resolvers.sentencetransformer.AutoTokenizer.from_pretrained"
-    )
+    @patch("transformers.AutoTokenizer.from_pretrained")
     @patch("geoparser.modules.resolvers.sentencetransformer.SentenceTransformer")
     @patch("geoparser.modules.resolvers.sentencetransformer.Gazetteer")
     def test_validate_and_set_attribute_map_returns_custom_map(
@@ -394,9 +377,7 @@ class TestSentenceTransformerResolverInitialization:
         assert result == custom_map
 
     @patch("geoparser.modules.resolvers.sentencetransformer.spacy.load")
-    @patch(
-        "geoparser.modules.resolvers.sentencetransformer.AutoTokenizer.from_pretrained"
-    )
+    @patch("transformers.AutoTokenizer.from_pretrained")
     @patch("geoparser.modules.resolvers.sentencetransformer.SentenceTransformer")
     @patch("geoparser.modules.resolvers.sentencetransformer.Gazetteer")
     def test_validate_and_set_attribute_map_looks_up_configured_gazetteer(
@@ -417,9 +398,7 @@ class TestSentenceTransformerResolverInitialization:
         assert result == expected_map
 
     @patch("geoparser.modules.resolvers.sentencetransformer.spacy.load")
-    @patch(
-        "geoparser.modules.resolvers.sentencetransformer.AutoTokenizer.from_pretrained"
-    )
+    @patch("transformers.AutoTokenizer.from_pretrained")
     @patch("geoparser.modules.resolvers.sentencetransformer.SentenceTransformer")
     @patch("geoparser.modules.resolvers.sentencetransformer.Gazetteer")
     def test_validate_and_set_attribute_map_raises_for_unknown_gazetteer(
@@ -444,9 +423,7 @@ class TestSentenceTransformerResolverInitialization:
 
     @patch("geoparser.modules.resolvers.sentencetransformer.spacy.cli.download")
     @patch("geoparser.modules.resolvers.sentencetransformer.spacy.load")
-    @patch(
-        "geoparser.modules.resolvers.sentencetransformer.AutoTokenizer.from_pretrained"
-    )
+    @patch("transformers.AutoTokenizer.from_pretrained")
     @patch("geoparser.modules.resolvers.sentencetransformer.SentenceTransformer")
     @patch("geoparser.modules.resolvers.sentencetransformer.Gazetteer")
     def test_downloads_spacy_model_if_not_found(
@@ -477,9 +454,7 @@ class TestSentenceTransformerResolverInitialization:
         assert resolver.nlp == mock_nlp
 
     @patch("geoparser.modules.resolvers.sentencetransformer.spacy.load")
-    @patch(
-        "geoparser.modules.resolvers.sentencetransformer.AutoTokenizer.from_pretrained"
-    )
+    @patch("transformers.AutoTokenizer.from_pretrained")
     @patch("geoparser.modules.resolvers.sentencetransformer.SentenceTransformer")
     @patch("geoparser.modules.resolvers.sentencetransformer.Gazetteer")
     def test_does_not_download_spacy_model_if_exists(
@@ -503,14 +478,101 @@ class TestSentenceTransformerResolverInitialization:
         assert resolver.nlp == mock_nlp
 
 
+@pytest.mark.unit
+class TestSentenceTransformerResolverModelSharing:
+    """Test sharing of models between SentenceTransformerResolver instances."""
+
+    @patch("geoparser.modules.resolvers.sentencetransformer.spacy.load")
+    @patch("transformers.AutoTokenizer.from_pretrained")
+    @patch("geoparser.modules.resolvers.sentencetransformer.SentenceTransformer")
+    @patch("geoparser.modules.resolvers.sentencetransformer.Gazetteer")
+    def test_shares_models_between_instances(
+        self, mock_gazetteer, mock_transformer, mock_tokenizer, mock_spacy_load
+    ):
+        """Test that resolvers with the same model share transformer and spaCy model."""
+        # Arrange
+        from geoparser.modules.resolvers.sentencetransformer import (
+            SentenceTransformerResolver,
+        )
+
+        mock_transformer.side_effect = lambda *args, **kwargs: Mock()
+        mock_spacy_load.side_effect = lambda *args, **kwargs: Mock()
+
+        # Act
+        resolver1 = SentenceTransformerResolver(
+            model_name="test-model", min_similarity=0.5
+        )
+        resolver2 = SentenceTransformerResolver(
+            model_name="test-model", min_similarity=0.7
+        )
+
+        # Assert
+        assert resolver1.transformer is resolver2.transformer
+        assert resolver1.nlp is resolver2.nlp
+        assert resolver1._transformer_lock is resolver2._transformer_lock
+        mock_transformer.assert_called_once_with("test-model")
+        mock_spacy_load.assert_called_once()
+
+    @patch("geoparser.modules.resolvers.sentencetransformer.spacy.load")
+    @patch("transformers.AutoTokenizer.from_pretrained")
+    @patch("geoparser.modules.resolvers.sentencetransformer.SentenceTransformer")
+    @patch("geoparser.modules.resolvers.sentencetransformer.Gazetteer")
+    def test_releases_models_when_garbage_collected(
+        self, mock_gazetteer, mock_transformer, mock_tokenizer, mock_spacy_load
+    ):
+        """Test that a resolver releases its models once it is collected."""
+        # Arrange
+        from geoparser.modules.resolvers.sentencetransformer import (
+            SentenceTransformerResolver,
+        )
+
+        resolver = SentenceTransformerResolver(model_name="test-model")
+        transformer_key = ("sentence-transformer", "test-model")
+        nlp_key = ("spacy", "xx_sent_ud_sm")
+
+        # Act
+        del resolver
+        gc.collect()
+
+        # Assert
+        assert model_registry.references(transformer_key) == 0
+        assert model_registry.references(nlp_key) == 0
+
+    @patch("geoparser.modules.resolvers.sentencetransformer.spacy.load")
+    @patch("transformers.AutoTokenizer.from_pretrained")
+    @patch("geoparser.modules.resolvers.sentencetransformer.SentenceTransformer")
+    @patch("geoparser.modules.resolvers.sentencetransformer.Gazetteer")
+    def test_detach_model_loads_private_transformer(
+        self, mock_gazetteer, mock_transformer, mock_tokenizer, mock_spacy_load
+    ):
+        """Test that detaching replaces the shared transformer with a private copy."""
+        # Arrange
+        from geoparser.modules.resolvers.sentencetransformer import (
+            SentenceTransformerResolver,
+        )
+
+        mock_transformer.side_effect = lambda *args, **kwargs: Mock()
+        resolver1 = SentenceTransformerResolver(model_name="test-model")
+        resolver2 = SentenceTransformerResolver(model_name="test-model")
+        shared_transformer = resolver2.transformer
+
+        # Act
+        resolver1._detach_model()
+
+        # Assert
+        assert resolver1.transformer is not shared_transformer
+        assert resolver1.tokenizer is resolver1.transformer.tokenizer
+        assert resolver2.transformer is shared_transformer
+        assert resolver1.nlp is resolver2.nlp
+        assert model_registry.references(("sentence-transformer", "test-model")) == 1
+
+
 @pytest.mark.unit
 class TestSentenceTransformerResolverPredict:
     """Test SentenceTransformerResolver predict method."""
 
     @patch("geoparser.modules.resolvers.sentencetransformer.spacy.load")
-    @patch(
-        "geoparser.modules.resolvers.sentencetransformer.AutoTokenizer.from_pretrained"
-    )
+    @patch("transformers.AutoTokenizer.from_pretrained")
     @patch("geoparser.modules.resolvers.sentencetransformer.SentenceTransformer")
     @patch("geoparser.modules.resolvers.sentencetransformer.Gazetteer")
     def test_handles_empty_text_list(
@@ -531,9 +593,7 @@ class TestSentenceTransformerResolverPredict:
         assert results == []
 
     @patch("geoparser.modules.resolvers.sentencetransformer.spacy.load")
-    @patch(
-        "geoparser.modules.resolvers.sentencetransformer.AutoTokenizer.from_pretrained"
-    )
+    @patch("transformers.AutoTokenizer.from_pretrained")
     @patch("geoparser.modules.resolvers.sentencetransformer.SentenceTransformer")
     @patch("geoparser.modules.resolvers.sentencetransformer.Gazetteer")
     def test_caches_context_embeddings(
@@ -549,7 +609,7 @@ class TestSentenceTransformerResolverPredict:
         mock_transformer_instance.get_max_seq_length.return_value = 512
         mock_transformer_instance.encode.return_value = torch.tensor([[0.1, 0.2, 0.3]])
 
-        mock_tokenizer_instance = mock_tokenizer.return_value
+        mock_tokenizer_instance = mock_transformer.return_value.tokenizer
         mock_tokenizer_instance.tokenize.return_value = ["test"]
 
         # Mock gazetteer search
@@ -578,9 +638,7 @@ class TestSentenceTransformerResolverPredict:
         assert "Test" in resolver.context_embeddings
 
     @patch("geoparser.modules.resolvers.sentencetransformer.spacy.load")
-    @patch(
-        "geoparser.modules.resolvers.sentencetransformer.AutoTokenizer.from_pretrained"
-    )
+    @patch("transformers.AutoTokenizer.from_pretrained")
     @patch("geoparser.modules.resolvers.sentencetransformer.SentenceTransformer")
     @patch("geoparser.modules.resolvers.sentencetransformer.Gazetteer")
     def test_caches_candidate_embeddings(
@@ -596,7 +654,7 @@ class TestSentenceTransformerResolverPredict:
         mock_transformer_instance.get_max_seq_length.return_value = 512
         mock_transformer_instance.encode.return_value = torch.tensor([[0.1, 0.2, 0.3]])
 
-        mock_tokenizer_instance = mock_tokenizer.return_value
+        mock_tokenizer_instance = mock_transformer.return_value.tokenizer
         mock_tokenizer_instance.tokenize.return_value = ["test"]
 
         # Mock gazetteer search
@@ -621,9 +679,7 @@ class TestSentenceTransformerResolverPredict:
         assert 1 in resolver.candidate_embeddings
 
     @patch("geoparser.modules.resolvers.sentencetransformer.spacy.load")
-    @patch(
-        "geoparser.modules.resolvers.sentencetransformer.AutoTokenizer.from_pretrained"
-    )
+    @patch("transformers.AutoTokenizer.from_pretrained")
     @patch("geoparser.modules.resolvers.sentencetransformer.SentenceTransformer")
     @patch("geoparser.modules.resolvers.sentencetransformer.Gazetteer")
     def test_caches_doc_tokens(
@@ -639,7 +695,7 @@ class TestSentenceTransformerResolverPredict:
         mock_transformer_instance.get_max_seq_length.return_value = 512
         mock_transformer_instance.encode.return_value = torch.tensor([[0.1, 0.2, 0.3]])
 
-        mock_tokenizer_instance = mock_tokenizer.return_value
+        mock_tokenizer_instance = mock_transformer.return_value.tokenizer
         mock_tokenizer_instance.tokenize.return_value = ["test", "token"]
 
         # Mock gazetteer search
@@ -676,9 +732,7 @@ class TestSentenceTransformerResolverPredict:
         assert text in resolver.doc_tokens
 
     @patch("geoparser.modules.resolvers.sentencetransformer.spacy.load")
-    @patch(
-        "geoparser.modules.resolvers.sentencetransformer.AutoTokenizer.from_pretrained"
-    )
+    @patch("transformers.AutoTokenizer.from_pretrained")
     @patch("geoparser.modules.resolvers.sentencetransformer.SentenceTransformer")
     @patch("geoparser.modules.resolvers.sentencetransformer.Gazetteer")
     def test_caches_doc_objects(
@@ -694,7 +748,7 @@ class TestSentenceTransformerResolverPredict:
         mock_transformer_instance.get_max_seq_length.return_value = 512
         mock_transformer_instance.encode.return_value = torch.tensor([[0.1, 0.2, 0.3]])
 
-        mock_tokenizer_instance = mock_tokenizer.return_value
+        mock_tokenizer_instance = mock_transformer.return_value.tokenizer
         # Return many tokens to trigger sentence splitting
         mock_tokenizer_instance.tokenize.return_value = ["token"] * 600
 
@@ -741,15 +795,258 @@ class TestSentenceTransformerResolverPredict:
         assert nlp_call_count_second == nlp_call_count_first
         assert text in resolver.doc_objects
 
+    @patch("geoparser.modules.resolvers.sentencetransformer.spacy.load")
+    @patch("transformers.AutoTokenizer.from_pretrained")
+    @patch("geoparser.modules.resolvers.sentencetransformer.SentenceTransformer")
+    @patch("geoparser.modules.resolvers.sentencetransformer.Gazetteer")
+    def test_records_tracing_spans(
+        self, mock_gazetteer, mock_transformer, mock_tokenizer, mock_spacy_load
+    ):
+        """Test that predict records its steps and their counts when traced."""
+        # Arrange
+        from geoparser.modules.resolvers.sentencetransformer import (
+            SentenceTransformerResolver,
+        )
+        from geoparser.tracing import trace
+
+        mock_transformer_instance = mock_transformer.return_value
+        mock_transformer_instance.get_max_seq_length.return_value = 512
+        mock_transformer_instance.encode.return_value = torch.tensor([[0.1, 0.2, 0.3]])
+        mock_transformer_instance.tokenizer.tokenize.return_value = ["test"]
+
+        mock_candidate = Mock()
+        mock_candidate.id = 1
+        mock_candidate.location_id_value = "123"
+        mock_candidate.data = {"name": "Paris"}
+        mock_gazetteer.return_value.search.return_value = [mock_candidate]
+
+        resolver = SentenceTransformerResolver()
+
+        # Act
+        with trace() as current:
+            resolver.predict(texts=["Test"], references=[[(0, 4)]])
+
+        # Assert
+        spans = {}
+        for recorded in current.spans:
+            spans.setdefault(recorded.name, []).append(recorded)
+        assert spans["resolver.predict"][0].attributes == {
+            "texts": 1,
+            "references": 1,
+            "resolved": 1,
+        }
+        assert spans["resolver.extract_contexts"][0].attributes == {"references": 1}
+        assert spans["resolver.embed_contexts"][0].attributes == {
+            "contexts": 1,
+            "cache_hits": 0,
+            "encoded": 1,
+        }
+        assert spans["resolver.gather_candidates"][0].attributes == {
+            "method": "exact",
+            "tiers": 1,
+            "references": 1,
+            "searches": 1,
+            "candidates": 1,
+        }
+        assert spans["resolver.search"][0].attributes == {"method": "exact", "tiers": 1}
+        assert spans["resolver.embed_candidates"][0].attributes["encoded"] == 1
+        assert spans["resolver.evaluate_candidates"][0].attributes == {
+            "references": 1,
+            "resolved": 1,
+        }
+        assert len(spans["resolver.encode"]) == 2
+
+        # Spans of the background context embedding keep their parent
+        predict_id = spans["resolver.predict"][0].id
+        assert spans["resolver.embed_contexts"][0].parent_id == predict_id
+
+
+@pytest.mark.unit
+class TestSentenceTransformerResolverThreadSafety:
+    """Test sharing a SentenceTransformerResolver between threads."""
+
+    @patch("geoparser.modules.resolvers.sentencetransformer.spacy.load")
+    @patch("transformers.AutoTokenizer.from_pretrained")
+    @patch("geoparser.modules.resolvers.sentencetransformer.SentenceTransformer")
+    @patch("geoparser.modules.resolvers.sentencetransformer.Gazetteer")
+    def test_concurrent_predictions_serialize_encoding(
+        self, mock_gazetteer, mock_transformer, mock_tokenizer, mock_spacy_load
+    ):
+        """Test that concurrent predictions are correct and never encode at once."""
+        # Arrange
+        from geoparser.modules.resolvers.sentencetransformer import (
+            SentenceTransformerResolver,
+        )
+
+        active = []
+        overlaps = []
+        lock = threading.Lock()
+
+        def encode(texts, **kwargs):
+            with lock:
+                active.append(1)
+                overlaps.append(len(active) > 1)
+            time.sleep(0.005)
+            with lock:
+                active.pop()
+            return torch.tensor([[1.0, 0.0]] * len(texts))
+
+        mock_transformer_instance = mock_transformer.return_value
+        mock_transformer_instance.get_max_seq_length.return_value = 512
+        mock_transformer_instance.encode.side_effect = encode
+        mock_transformer.return_value.tokenizer.tokenize.return_value = ["token"]
+
+        def search(name, method, tiers=1):
+            candidate = Mock()
+            candidate.id = hash(name)
+            candidate.location_id_value = name
+            candidate.data = {"name": name}
+            return [candidate]
+
+        mock_gazetteer.return_value.search.side_effect = search
+
+        resolver = SentenceTransformerResolver()
+        texts = [f"Place {i}" for i in range(16)]
+
+        # Act
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(
+                executor.map(
+                    lambda text: resolver.predict([text], [[(0, len(text))]]), texts
+                )
+            )
+
+        # Assert
+        assert results == [[[("geonames", text)]] for text in texts]
+        assert not any(overlaps)
+        assert set(resolver.context_embeddings) == set(texts)
+
+    @patch("geoparser.modules.resolvers.sentencetransformer.spacy.load")
+    @patch("transformers.AutoTokenizer.from_pretrained")
+    @patch("geoparser.modules.resolvers.sentencetransformer.SentenceTransformer")
+    @patch("geoparser.modules.resolvers.sentencetransformer.Gazetteer")
+    def test_embeds_contexts_on_inference_executor(
+        self, mock_gazetteer, mock_transformer, mock_tokenizer, mock_spacy_load
+    ):
+        """Test that contexts are embedded on the shared inference executor."""
+        # Arrange
+        from geoparser.modules.resolvers.sentencetransformer import (
+            SentenceTransformerResolver,
+        )
+
+        encode_threads = []
+
+        def encode(texts, **kwargs):
+            encode_threads.append(threading.current_thread().name)
+            return torch.tensor([[1.0, 0.0]] * len(texts))
+
+        mock_transformer_instance = mock_transformer.return_value
+        mock_transformer_instance.get_max_seq_length.return_value = 512
+        mock_transformer_instance.encode.side_effect = encode
+        mock_transformer.return_value.tokenizer.tokenize.return_value = ["token"]
+        mock_gazetteer.return_value.search.return_value = []
+
+        resolver = SentenceTransformerResolver()
+
+        # Act
+        resolver.predict(["Paris"], [[(0, 5)]])
+
+        # Assert
+        assert len(encode_threads) == 1
+        assert encode_threads[0].startswith(INFERENCE_THREAD_NAME_PREFIX)
+
+    @patch("geoparser.modules.resolvers.sentencetransformer.spacy.load")
+    @patch("transformers.AutoTokenizer.from_pretrained")
+    @patch("geoparser.modules.resolvers.sentencetransformer.SentenceTransformer")
+    @patch("geoparser.modules.resolvers.sentencetransformer.Gazetteer")
+    def test_counts_tokens_under_transformer_lock(
+        self, mock_gazetteer, mock_transformer, mock_tokenizer, mock_spacy_load
+    ):
+        """Test that counting tokens waits while the transformer is in use."""
+        # Arrange
+        from geoparser.modules.resolvers.sentencetransformer import (
+            SentenceTransformerResolver,
+        )
+
+        mock_transformer.return_value.tokenizer.tokenize.return_value = ["a", "b"]
+        resolver = SentenceTransformerResolver()
+
+        # Act
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            with resolver._transformer_lock:
+                counting = executor.submit(resolver._count_tokens, "ab")
+                time.sleep(0.05)
+                counted_while_locked = counting.done()
+            count = counting.result(timeout=5)
+
+        # Assert
+        assert not counted_while_locked
+        assert count == 2
+
+
+@pytest.mark.unit
+class TestSentenceTransformerResolverApredict:
+    """Test asynchronous prediction of SentenceTransformerResolver."""
+
+    @patch("geoparser.modules.resolvers.sentencetransformer.spacy.load")
+    @patch("transformers.AutoTokenizer.from_pretrained")
+    @patch("geoparser.modules.resolvers.sentencetransformer.SentenceTransformer")
+    @patch("geoparser.modules.resolvers.sentencetransformer.Gazetteer")
+    def test_searches_on_database_executor(
+        self, mock_gazetteer, mock_transformer, mock_tokenizer, mock_spacy_load
+    ):
+        """Test that searches run on the database executor and encoding on the inference executor."""
+        # Arrange
+        from geoparser.modules.resolvers.sentencetransformer import (
+            SentenceTransformerResolver,
+        )
+
+        search_threads = []
+        encode_threads = []
+
+        def encode(texts, **kwargs):
+            encode_threads.append(threading.current_thread().name)
+            return torch.tensor([[1.0, 0.0]] * len(texts))
+
+        def search(name, method, tiers=1):
+            search_threads.append(threading.current_thread().name)
+            candidate = Mock()
+            candidate.id = hash(name)
+            candidate.location_id_value = name
+            candidate.data = {"name": name}
+            return [candidate]
+
+        mock_transformer_instance = mock_transformer.return_value
+        mock_transformer_instance.get_max_seq_length.return_value = 512
+        mock_transformer_instance.encode.side_effect = encode
+        mock_transformer.return_value.tokenizer.tokenize.return_value = ["token"]
+        mock_gazetteer.return_value.search.side_effect = search
+
+        resolver = SentenceTransformerResolver()
+        texts = ["Paris", "Berlin"]
+        references = [[(0, 5)], [(0, 6)]]
+
+        # Act
+        result = asyncio.run(resolver.apredict(texts, references))
+
+        # Assert
+        assert result == [[("geonames", "Paris")], [("geonames", "Berlin")]]
+        assert search_threads
+        assert all(
+            name.startswith(DATABASE_THREAD_NAME_PREFIX) for name in search_threads
+        )
+        assert encode_threads
+        assert all(
+            name.startswith(INFERENCE_THREAD_NAME_PREFIX) for name in encode_threads
+        )
+
 
 @pytest.mark.unit
 class TestSentenceTransformerResolverHelperMethods:
     """Test SentenceTransformerResolver helper methods."""
 
     @patch("geoparser.modules.resolvers.sentencetransformer.spacy.load")
-    @patch(
-        "geoparser.modules.resolvers.sentencetransformer.AutoTokenizer.from_pretrained"
-    )
+    @patch("transformers.AutoTokenizer.from_pretrained")
     @patch("geoparser.modules.resolvers.sentencetransformer.SentenceTransformer")
     @patch("geoparser.modules.resolvers.sentencetransformer.Gazetteer")
     def test_generate_description_geonames(
@@ -780,9 +1077,7 @@ class TestSentenceTransformerResolverHelperMethods:
         assert "France" in description
 
     @patch("geoparser.modules.resolvers.sentencetransformer.spacy.load")
-    @patch(
-        "geoparser.modules.resolvers.sentencetransformer.AutoTokenizer.from_pretrained"
-    )
+    @patch("transformers.AutoTokenizer.from_pretrained")
     @patch("geoparser.modules.resolvers.sentencetransformer.SentenceTransformer")
     @patch("geoparser.modules.resolvers.sentencetransformer.Gazetteer")
     def test_calculate_similarities_returns_list_of_floats(
@@ -815,9 +1110,7 @@ class TestSentenceTransformerResolverHelperMethods:
         assert similarities[0] > similarities[1]
 
     @patch("geoparser.modules.resolvers.sentencetransformer.spacy.load")
-    @patch(
-        "geoparser.modules.resolvers.sentencetransformer.AutoTokenizer.from_pretrained"
-    )
+    @patch("transformers.AutoTokenizer.from_pretrained")
     @patch("geoparser.modules.resolvers.sentencetransformer.SentenceTransformer")
     @patch("geoparser.modules.resolvers.sentencetransformer.Gazetteer")
     def test_calculate_similarities_handles_empty_list(
@@ -843,9 +1136,7 @@ class TestSentenceTransformerResolverHelperMethods:
         assert similarities == []
 
     @patch("geoparser.modules.resolvers.sentencetransformer.spacy.load")
-    @patch(
-        "geoparser.modules.resolvers.sentencetransformer.AutoTokenizer.from_pretrained"
-    )
+    @patch("transformers.AutoTokenizer.from_pretrained")
     @patch("geoparser.modules.resolvers.sentencetransformer.SentenceTransformer")
     @patch("geoparser.modules.resolvers.sentencetransformer.Gazetteer")
     def test_extract_context_returns_full_text_when_within_limit(
@@ -860,7 +1151,7 @@ class TestSentenceTransformerResolverHelperMethods:
         mock_transformer_instance = mock_transformer.return_value
         mock_transformer_instance.get_max_seq_length.return_value = 512
 
-        mock_tokenizer_instance = mock_tokenizer.return_value
+        mock_tokenizer_instance = mock_transformer.return_value.tokenizer
         # Short text - only 3 tokens
         mock_tokenizer_instance.tokenize.return_value = ["Paris", "is", "beautiful"]
 
@@ -875,9 +1166,7 @@ class TestSentenceTransformerResolverHelperMethods:
         assert context == text
 
     @patch("geoparser.modules.resolvers.sentencetransformer.spacy.load")
-    @patch(
-        "geoparser.modules.resolvers.sentencetransformer.AutoTokenizer.from_pretrained"
-    )
+    @patch("transformers.AutoTokenizer.from_pretrained")
     @patch("geoparser.modules.resolvers.sentencetransformer.SentenceTransformer")
     @patch("geoparser.modules.resolvers.sentencetransformer.Gazetteer")
     def test_extract_context_expands_bidirectionally(
@@ -892,7 +1181,7 @@ class TestSentenceTransformerResolverHelperMethods:
         mock_transformer_instance = mock_transformer.return_value
         mock_transformer_instance.get_max_seq_length.return_value = 512
 
-        mock_tokenizer_instance = mock_tokenizer.return_value
+        mock_tokenizer_instance = mock_transformer.return_value.tokenizer
 
         # Return different lengths for different calls
         def tokenize_side_effect(text):
@@ -932,9 +1221,7 @@ class TestSentenceTransformerResolverHelperMethods:
         assert "Paris" in context or context == text
 
     @patch("geoparser.modules.resolvers.sentencetransformer.spacy.load")
-    @patch(
-        "geoparser.modules.resolvers.sentencetransformer.AutoTokenizer.from_pretrained"
-    )
+    @patch("transformers.AutoTokenizer.from_pretrained")
     @patch("geoparser.modules.resolvers.sentencetransformer.SentenceTransformer")
     @patch("geoparser.modules.resolvers.sentencetransformer.Gazetteer")
     def test_generate_description_handles_missing_attributes(
@@ -962,9 +1249,7 @@ class TestSentenceTransformerResolverHelperMethods:
         # Should not crash, just include what's available
 
     @patch("geoparser.modules.resolvers.sentencetransformer.spacy.load")
-    @patch(
-        "geoparser.modules.resolvers.sentencetransformer.AutoTokenizer.from_pretrained"
-    )
+    @patch("transformers.AutoTokenizer.from_pretrained")
     @patch("geoparser.modules.resolvers.sentencetransformer.SentenceTransformer")
     @patch("geoparser.modules.resolvers.sentencetransformer.Gazetteer")
     def test_generate_description_includes_all_admin_levels(
@@ -999,9 +1284,7 @@ class TestSentenceTransformerResolverHelperMethods:
         assert "in" in description
 
     @patch("geoparser.modules.resolvers.sentencetransformer.spacy.load")
-    @patch(
-        "geoparser.modules.resolvers.sentencetransformer.AutoTokenizer.from_pretrained"
-    )
+    @patch("transformers.AutoTokenizer.from_pretrained")
     @patch("geoparser.modules.resolvers.sentencetransformer.SentenceTransformer")
     @patch("geoparser.modules.resolvers.sentencetransformer.Gazetteer")
     def test_generate_description_uses_custom_attribute_map(
@@ -1041,9 +1324,7 @@ class TestSentenceTransformerResolverHelperMethods:
         assert "France" in description
 
     @patch("geoparser.modules.resolvers.sentencetransformer.spacy.load")
-    @patch(
-        "geoparser.modules.resolvers.sentencetransformer.AutoTokenizer.from_pretrained"
-    )
+    @patch("transformers.AutoTokenizer.from_pretrained")
     @patch("geoparser.modules.resolvers.sentencetransformer.SentenceTransformer")
     @patch("geoparser.modules.resolvers.sentencetransformer.Gazetteer")
     def test_calculate_similarities_returns_correct_values(
@@ -1082,9 +1363,7 @@ class TestSentenceTransformerResolverPrepareTrainingData:
     """Test SentenceTransformerResolver _prepare_training_data method."""
 
     @patch("geoparser.modules.resolvers.sentencetransformer.spacy.load")
-    @patch(
-        "geoparser.modules.resolvers.sentencetransformer.AutoTokenizer.from_pretrained"
-    )
+    @patch("transformers.AutoTokenizer.from_pretrained")
     @patch("geoparser.modules.resolvers.sentencetransformer.SentenceTransformer")
     @patch("geoparser.modules.resolvers.sentencetransformer.Gazetteer")
     def test_creates_training_examples_from_referents(
@@ -1130,9 +1409,7 @@ class TestSentenceTransformerResolverPrepareTrainingData:
             assert len(training_data["label"]) > 0
 
     @patch("geoparser.modules.resolvers.sentencetransformer.spacy.load")
-    @patch(
-        "geoparser.modules.resolvers.sentencetransformer.AutoTokenizer.from_pretrained"
-    )
+    @patch("transformers.AutoTokenizer.from_pretrained")
     @patch("geoparser.modules.resolvers.sentencetransformer.SentenceTransformer")
     @patch("geoparser.modules.resolvers.sentencetransformer.Gazetteer")
     def test_creates_positive_and_negative_examples(
@@ -1175,9 +1452,7 @@ class TestSentenceTransformerResolverPrepareTrainingData:
             assert 0 in training_data["label"]  # Negative example
 
     @patch("geoparser.modules.resolvers.sentencetransformer.spacy.load")
-    @patch(
-        "geoparser.modules.resolvers.sentencetransformer.AutoTokenizer.from_pretrained"
-    )
+    @patch("transformers.AutoTokenizer.from_pretrained")
     @patch("geoparser.modules.resolvers.sentencetransformer.SentenceTransformer")
     @patch("geoparser.modules.resolvers.sentencetransformer.Gazetteer")
     def test_handles_multiple_references_in_document(
@@ -1213,9 +1488,7 @@ class TestSentenceTransformerResolverPrepareTrainingData:
             assert len(training_data["sentence1"]) >= 2
 
     @patch("geoparser.modules.resolvers.sentencetransformer.spacy.load")
-    @patch(
-        "geoparser.modules.resolvers.sentencetransformer.AutoTokenizer.from_pretrained"
-    )
+    @patch("transformers.AutoTokenizer.from_pretrained")
     @patch("geoparser.modules.resolvers.sentencetransformer.SentenceTransformer")
     @patch("geoparser.modules.resolvers.sentencetransformer.Gazetteer")
     def test_handles_multiple_documents(
@@ -1251,9 +1524,7 @@ class TestSentenceTransformerResolverPrepareTrainingData:
             assert len(training_data["sentence1"]) >= 2
 
     @patch("geoparser.modules.resolvers.sentencetransformer.spacy.load")
-    @patch(
-        "geoparser.modules.resolvers.sentencetransformer.AutoTokenizer.from_pretrained"
-    )
+    @patch("transformers.AutoTokenizer.from_pretrained")
     @patch("geoparser.modules.resolvers.sentencetransformer.SentenceTransformer")
     @patch("geoparser.modules.resolvers.sentencetransformer.Gazetteer")
     def test_extracts_context_for_each_reference(
@@ -1293,9 +1564,7 @@ class TestSentenceTransformerResolverPrepareTrainingData:
             assert all(s1 == "Extracted context" for s1 in training_data["sentence1"])
 
     @patch("geoparser.modules.resolvers.sentencetransformer.spacy.load")
-    @patch(
-        "geoparser.modules.resolvers.sentencetransformer.AutoTokenizer.from_pretrained"
-    )
+    @patch("transformers.AutoTokenizer.from_pretrained")
     @patch("geoparser.modules.resolvers.sentencetransformer.SentenceTransformer")
     @patch("geoparser.modules.resolvers.sentencetransformer.Gazetteer")
     def test_generates_descriptions_for_candidates(
@@ -1336,9 +1605,7 @@ class TestSentenceTransformerResolverPrepareTrainingData:
                 assert all(s2 == "Paris (city)" for s2 in training_data["sentence2"])
 
     @patch("geoparser.modules.resolvers.sentencetransformer.spacy.load")
-    @patch(
-        "geoparser.modules.resolvers.sentencetransformer.AutoTokenizer.from_pretrained"
-    )
+    @patch("transformers.AutoTokenizer.from_pretrained")
     @patch("geoparser.modules.resolvers.sentencetransformer.SentenceTransformer")
     @patch("geoparser.modules.resolvers.sentencetransformer.Gazetteer")
     def test_returns_correct_data_structure(
@@ -1378,3 +1645,309 @@ class TestSentenceTransformerResolverPrepareTrainingData:
             assert len(training_data["sentence1"]) == len(training_data["label"])
             # Labels should be 0 or 1
             assert all(label in [0, 1] for label in training_data["label"])
+
+
+@pytest.mark.unit
+class TestSentenceTransformerResolverFit:
+    """Test SentenceTransformerResolver fit method."""
+
+    def test_module_does_not_import_training_libraries(self):
+        """Test that the training libraries are not imported with the resolver."""
+        # Arrange
+        import geoparser.modules.resolvers.sentencetransformer as module
+
+        # Assert
+        for name in (
+            "Dataset",
+            "SentenceTransformerTrainer",
+            "ContrastiveLoss",
+            "SentenceTransformerTrainingArguments",
+        ):
+            assert not hasattr(module, name)
+
+    @patch("geoparser.modules.resolvers.sentencetransformer.spacy.load")
+    @patch("transformers.AutoTokenizer.from_pretrained")
+    @patch("geoparser.modules.resolvers.sentencetransformer.SentenceTransformer")
+    @patch("geoparser.modules.resolvers.sentencetransformer.Gazetteer")
+    @patch("geoparser.modules.resolvers.training.train_sentence_transformer")
+    def test_delegates_training_to_training_module(
+        self,
+        mock_train,
+        mock_gazetteer,
+        mock_transformer,
+        mock_tokenizer,
+        mock_spacy_load,
+    ):
+        """Test that fit trains a private transformer copy with the prepared data."""
+        # Arrange
+        from geoparser.modules.resolvers.sentencetransformer import (
+            SentenceTransformerResolver,
+        )
+
+        mock_transformer.side_effect = lambda *args, **kwargs: Mock()
+        resolver = SentenceTransformerResolver(model_name="test-model")
+        shared_transformer = resolver.transformer
+        training_data = {"sentence1": ["a"], "sentence2": ["b"], "label": [1.0]}
+
+        # Act
+        with patch.object(
+            resolver, "_prepare_training_data", return_value=training_data
+        ):
+            resolver.fit(["Paris"], [[(0, 5)]], [[("geonames", "1")]], "out", epochs=3)
+
+        # Assert
+        assert resolver.transformer is not shared_transformer
+        mock_train.assert_called_once_with(
+            resolver.transformer,
+            training_data,
+            "out",
+            epochs=3,
+            batch_size=8,
+            learning_rate=2e-5,
+            warmup_ratio=0.1,
+            save_strategy="epoch",
+        )
+
+    @patch("geoparser.modules.resolvers.sentencetransformer.spacy.load")
+    @patch("transformers.AutoTokenizer.from_pretrained")
+    @patch("geoparser.modules.resolvers.sentencetransformer.SentenceTransformer")
+    @patch("geoparser.modules.resolvers.sentencetransformer.Gazetteer")
+    @patch("geoparser.modules.resolvers.training.train_sentence_transformer")
+    def test_raises_error_without_training_examples(
+        self,
+        mock_train,
+        mock_gazetteer,
+        mock_transformer,
+        mock_tokenizer,
+        mock_spacy_load,
+    ):
+        """Test that fit raises ValueError when no training examples are created."""
+        # Arrange
+        from geoparser.modules.resolvers.sentencetransformer import (
+            SentenceTransformerResolver,
+        )
+
+        resolver = SentenceTransformerResolver(model_name="test-model")
+        training_data = {"sentence1": [], "sentence2": [], "label": []}
+
+        # Act & Assert
+        with patch.object(
+            resolver, "_prepare_training_data", return_value=training_data
+        ):
+            with pytest.raises(ValueError, match="No training examples found"):
+                resolver.fit(["Paris"], [[(0, 5)]], [[]], "out")
+        mock_train.assert_not_called()
+
+
+@pytest.mark.unit
+class TestSentenceTransformerResolverGatherCandidates:
+    """Test SentenceTransformerResolver candidate gathering."""
+
+    @patch("geoparser.modules.resolvers.sentencetransformer.spacy.load")
+    @patch("transformers.AutoTokenizer.from_pretrained")
+    @patch("geoparser.modules.resolvers.sentencetransformer.SentenceTransformer")
+    @patch("geoparser.modules.resolvers.sentencetransformer.Gazetteer")
+    def test_searches_each_reference_text_once(
+        self, mock_gazetteer, mock_transformer, mock_tokenizer, mock_spacy_load
+    ):
+        """Test that identical reference texts share one gazetteer search."""
+        # Arrange
+        from geoparser.modules.resolvers.sentencetransformer import (
+            SentenceTransformerResolver,
+        )
+
+        def search(name, method, tiers=1):
+            candidate = Mock()
+            candidate.id = name
+            return [candidate]
+
+        mock_gazetteer.return_value.search.side_effect = search
+        resolver = SentenceTransformerResolver()
+        texts = ["Paris and Rome", "Paris"]
+        references = [[(0, 5), (10, 14)], [(0, 5)]]
+        candidates = [[[], []], [[]]]
+        results = [[None, ("geonames", "1")], [None]]
+
+        # Act
+        resolver._gather_candidates(
+            texts, references, candidates, results, "exact", tiers=1
+        )
+
+        # Assert - Rome is resolved already, and Paris is searched once
+        mock_gazetteer.return_value.search.assert_called_once_with(
+            "Paris", "exact", tiers=1
+        )
+        assert [c.id for c in candidates[0][0]] == ["Paris"]
+        assert candidates[0][1] == []
+        assert [c.id for c in candidates[1][0]] == ["Paris"]
+
+    @patch("geoparser.modules.resolvers.sentencetransformer.spacy.load")
+    @patch("transformers.AutoTokenizer.from_pretrained")
+    @patch("geoparser.modules.resolvers.sentencetransformer.SentenceTransformer")
+    @patch("geoparser.modules.resolvers.sentencetransformer.Gazetteer")
+    def test_overlaps_searches_for_different_texts(
+        self, mock_gazetteer, mock_transformer, mock_tokenizer, mock_spacy_load
+    ):
+        """Test that searches for different reference texts run concurrently."""
+        # Arrange
+        from geoparser.modules.resolvers.sentencetransformer import (
+            SentenceTransformerResolver,
+        )
+
+        barrier = threading.Barrier(2, timeout=5)
+
+        def search(name, method, tiers=1):
+            # Both searches must be in progress at the same time to pass
+            barrier.wait()
+            candidate = Mock()
+            candidate.id = name
+            return [candidate]
+
+        mock_gazetteer.return_value.search.side_effect = search
+        resolver = SentenceTransformerResolver()
+        texts = ["Paris", "Rome"]
+        references = [[(0, 5)], [(0, 4)]]
+        candidates = [[[]], [[]]]
+        results = [[None], [None]]
+
+        # Act
+        resolver._gather_candidates(
+            texts, references, candidates, results, "exact", tiers=1
+        )
+
+        # Assert
+        assert [c.id for c in candidates[0][0]] == ["Paris"]
+        assert [c.id for c in candidates[1][0]] == ["Rome"]
+
+
+@pytest.mark.unit
+class TestSentenceTransformerResolverEmbeddingServer:
+    """Test SentenceTransformerResolver with an embedding server."""
+
+    @patch("geoparser.modules.resolvers.sentencetransformer.spacy.load")
+    @patch("transformers.AutoTokenizer.from_pretrained")
+    @patch("geoparser.modules.resolvers.sentencetransformer.SentenceTransformer")
+    @patch("geoparser.modules.resolvers.sentencetransformer.Gazetteer")
+    @patch("geoparser.modules.resolvers.sentencetransformer.EmbeddingClient")
+    def test_encodes_with_server_instead_of_local_model(
+        self,
+        mock_client,
+        mock_gazetteer,
+        mock_transformer,
+        mock_tokenizer,
+        mock_spacy_load,
+    ):
+        """Test that embeddings come from the server and no model is loaded."""
+        # Arrange
+        import numpy as np
+
+        from geoparser.modules.resolvers.sentencetransformer import (
+            SentenceTransformerResolver,
+        )
+
+        mock_client.return_value.info.return_value = {
+            "model_name": "dguzh/geo-all-MiniLM-L6-v2",
+            "max_seq_length": 128,
+        }
+        mock_client.return_value.encode.return_value = np.ones((1, 2), dtype=np.float32)
+
+        # Act
+        resolver = SentenceTransformerResolver(embedding_server="/tmp/e.sock")
+        embeddings = resolver._encode(["Paris"])
+
+        # Assert
+        mock_client.assert_called_once_with("/tmp/e.sock")
+        mock_transformer.assert_not_called()
+        mock_tokenizer.assert_called_once_with("dguzh/geo-all-MiniLM-L6-v2")
+        assert torch.equal(embeddings, torch.ones(1, 2))
+        assert resolver._max_seq_length() == 128
+        assert "embedding_server" not in resolver.config
+
+    @patch("geoparser.modules.resolvers.sentencetransformer.spacy.load")
+    @patch("transformers.AutoTokenizer.from_pretrained")
+    @patch("geoparser.modules.resolvers.sentencetransformer.SentenceTransformer")
+    @patch("geoparser.modules.resolvers.sentencetransformer.Gazetteer")
+    @patch("geoparser.modules.resolvers.sentencetransformer.EmbeddingClient")
+    def test_reads_server_from_environment(
+        self,
+        mock_client,
+        mock_gazetteer,
+        mock_transformer,
+        mock_tokenizer,
+        mock_spacy_load,
+        monkeypatch,
+    ):
+        """Test that the embedding server defaults to the environment variable."""
+        # Arrange
+        from geoparser.modules.resolvers.sentencetransformer import (
+            SentenceTransformerResolver,
+        )
+
+        monkeypatch.setenv("GEOPARSER_EMBEDDING_SERVER", "/tmp/env.sock")
+        mock_client.return_value.info.return_value = {
+            "model_name": "dguzh/geo-all-MiniLM-L6-v2",
+            "max_seq_length": 128,
+        }
+
+        # Act
+        SentenceTransformerResolver()
+
+        # Assert
+        mock_client.assert_called_once_with("/tmp/env.sock")
+
+    @patch("geoparser.modules.resolvers.sentencetransformer.spacy.load")
+    @patch("transformers.AutoTokenizer.from_pretrained")
+    @patch("geoparser.modules.resolvers.sentencetransformer.SentenceTransformer")
+    @patch("geoparser.modules.resolvers.sentencetransformer.Gazetteer")
+    @patch("geoparser.modules.resolvers.sentencetransformer.EmbeddingClient")
+    def test_rejects_server_with_other_model(
+        self,
+        mock_client,
+        mock_gazetteer,
+        mock_transformer,
+        mock_tokenizer,
+        mock_spacy_load,
+    ):
+        """Test that a server serving a different model raises ValueError."""
+        # Arrange
+        from geoparser.modules.resolvers.sentencetransformer import (
+            SentenceTransformerResolver,
+        )
+
+        mock_client.return_value.info.return_value = {
+            "model_name": "other-model",
+            "max_seq_length": 128,
+        }
+
+        # Act & Assert
+        with pytest.raises(ValueError, match="other-model"):
+            SentenceTransformerResolver(embedding_server="/tmp/e.sock")
+
+    @patch("geoparser.modules.resolvers.sentencetransformer.spacy.load")
+    @patch("transformers.AutoTokenizer.from_pretrained")
+    @patch("geoparser.modules.resolvers.sentencetransformer.SentenceTransformer")
+    @patch("geoparser.modules.resolvers.sentencetransformer.Gazetteer")
+    @patch("geoparser.modules.resolvers.sentencetransformer.EmbeddingClient")
+    def test_cannot_be_trained(
+        self,
+        mock_client,
+        mock_gazetteer,
+        mock_transformer,
+        mock_tokenizer,
+        mock_spacy_load,
+    ):
+        """Test that a resolver using an embedding server refuses to train."""
+        # Arrange
+        from geoparser.modules.resolvers.sentencetransformer import (
+            SentenceTransformerResolver,
+        )
+
+        mock_client.return_value.info.return_value = {
+            "model_name": "dguzh/geo-all-MiniLM-L6-v2",
+            "max_seq_length": 128,
+        }
+        resolver = SentenceTransformerResolver(embedding_server="/tmp/e.sock")
+
+        # Act & Assert
+        with pytest.raises(ValueError, match="cannot be trained"):
+            resolver.fit(["Paris"], [[(0, 5)]], [[("geonames", "1")]], "out")
@@ -0,0 +1,80 @@
+"""
+Unit tests for geoparser/modules/resolvers/training.py
+
+Tests the fine-tuning of SentenceTransformer models with mocked training libraries.
+"""
+
+from unittest.mock import Mock, patch
+
+import pytest
+
+from geoparser.modules.resolvers.training import train_sentence_transformer
+
+
+@pytest.mark.unit
+class TestTrainSentenceTransformer:
+    """Test the train_sentence_transformer function."""
+
+    @patch("geoparser.modules.resolvers.training.SentenceTransformerTrainer")
+    @patch("geoparser.modules.resolvers.training.SentenceTransformerTrainingArguments")
+    @patch("geoparser.modules.resolvers.training.ContrastiveLoss")
+    @patch("geoparser.modules.resolvers.training.Dataset")
+    def test_trains_and_saves_model(
+        self, mock_dataset, mock_loss, mock_training_args, mock_trainer
+    ):
+        """Test that the model is trained with ContrastiveLoss and saved."""
+        # Arrange
+        transformer = Mock()
+        training_data = {"sentence1": ["a"], "sentence2": ["b"], "label": [1.0]}
+
+        # Act
+        train_sentence_transformer(transformer, training_data, "out")
+
+        # Assert
+        mock_dataset.from_dict.assert_called_once_with(training_data)
+        mock_loss.assert_called_once_with(transformer)
+        mock_trainer.assert_called_once_with(
+            model=transformer,
+            args=mock_training_args.return_value,
+            train_dataset=mock_dataset.from_dict.return_value,
+            loss=mock_loss.return_value,
+        )
+        mock_trainer.return_value.train.assert_called_once()
+        transformer.save_pretrained.assert_called_once_with("out")
+
+    @patch("geoparser.modules.resolvers.training.SentenceTransformerTrainer")
+    @patch("geoparser.modules.resolvers.training.SentenceTransformerTrainingArguments")
+    @patch("geoparser.modules.resolvers.training.ContrastiveLoss")
+    @patch("geoparser.modules.resolvers.training.Dataset")
+    def test_passes_hyperparameters_to_training_arguments(
+        self, mock_dataset, mock_loss, mock_training_args, mock_trainer
+    ):
+        """Test that the hyperparameters are passed to the training arguments."""
+        # Arrange
+        training_data = {
+            "sentence1": ["a"] * 100,
+            "sentence2": ["b"] * 100,
+            "label": [1.0] * 100,
+        }
+
+        # Act
+        train_sentence_transformer(
+            Mock(),
+            training_data,
+            "out",
+            epochs=2,
+            batch_size=4,
+            learning_rate=1e-4,
+            warmup_ratio=0.2,
+            save_strategy="no",
+        )
+
+        # Assert
+        kwargs = mock_training_args.call_args.kwargs
+        assert kwargs["output_dir"] == "out"
+        assert kwargs["num_train_epochs"] == 2
+        assert kwargs["per_device_train_batch_size"] == 4
+        assert kwargs["learning_rate"] == 1e-4
+        assert kwargs["warmup_ratio"] == 0.2
+        assert kwargs["save_strategy"] == "no"
+        assert kwargs["logging_steps"] == 2
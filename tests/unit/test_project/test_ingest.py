@@ -0,0 +1,118 @@
+"""
+Unit tests for geoparser/project/ingest.py
+
+Tests streaming document texts from files and directories.
+"""
+
+import pandas as pd
+import pytest
+
+from geoparser.project.ingest import iter_texts
+
+
+@pytest.mark.unit
+class TestIterTexts:
+    """Test iter_texts function."""
+
+    def test_reads_jsonl_field(self, tmp_path):
+        """Test that the text field of each JSON line is yielded."""
+        # Arrange
+        path = tmp_path / "docs.jsonl"
+        path.write_text('{"text": "Doc 1", "id": 1}\n\n{"text": "Doc 2", "id": 2}\n')
+
+        # Act
+        texts = list(iter_texts(path))
+
+        # Assert
+        assert texts == ["Doc 1", "Doc 2"]
+
+    def test_reads_csv_column(self, tmp_path):
+        """Test that the given column of each CSV row is yielded."""
+        # Arrange
+        path = tmp_path / "docs.csv"
+        pd.DataFrame({"id": [1, 2], "body": ["Doc 1", "Doc, 2"]}).to_csv(
+            path, index=False
+        )
+
+        # Act
+        texts = list(iter_texts(path, text_field="body"))
+
+        # Assert
+        assert texts == ["Doc 1", "Doc, 2"]
+
+    def test_reads_parquet_column(self, tmp_path):
+        """Test that the given column of each Parquet row is yielded."""
+        # Arrange
+        pytest.importorskip("pyarrow")
+        path = tmp_path / "docs.parquet"
+        pd.DataFrame({"text": ["Doc 1", "Doc 2"]}).to_parquet(path)
+
+        # Act
+        texts = list(iter_texts(path))
+
+        # Assert
+        assert texts == ["Doc 1", "Doc 2"]
+
+    def test_reads_text_files_of_directory(self, tmp_path):
+        """Test that each .txt file of a directory is one document."""
+        # Arrange
+        (tmp_path / "b.txt").write_text("Doc 2")
+        (tmp_path / "a.txt").write_text("Doc 1")
+        (tmp_path / "nested").mkdir()
+        (tmp_path / "nested" / "c.txt").write_text("Doc 3")
+        (tmp_path / "notes.md").write_text("Not a document")
+
+        # Act
+        texts = list(iter_texts(tmp_path))
+
+        # Assert
+        assert texts == ["Doc 1", "Doc 2", "Doc 3"]
+
+    def test_reads_lazily(self, tmp_path):
+        """Test that nothing is read until texts are consumed."""
+        # Arrange
+        path = tmp_path / "docs.jsonl"
+        path.write_text('{"text": "Doc 1"}\nnot json\n')
+
+        # Act
+        texts = iter_texts(path)
+
+        # Assert
+        assert next(texts) == "Doc 1"
+
+    def test_raises_error_for_missing_path(self, tmp_path):
+        """Test that a missing path raises FileNotFoundError."""
+        with pytest.raises(FileNotFoundError):
+            list(iter_texts(tmp_path / "missing.jsonl"))
+
+    def test_raises_error_for_unsupported_format(self, tmp_path):
+        """Test that unsupported file formats raise ValueError."""
+        # Arrange
+        path = tmp_path / "docs.xml"
+        path.write_text("<docs/>")
+
+        # Act & Assert
+        with pytest.raises(ValueError, match="Unsupported file format"):
+            list(iter_texts(path))
+
+    @pytest.mark.parametrize("line", ['{"id": 2}', '{"text": null, "id": 2}'])
+    def test_raises_error_for_jsonl_line_without_text(self, tmp_path, line):
+        """Test that a missing or null JSON text field names the line."""
+        # Arrange
+        path = tmp_path / "docs.jsonl"
+        path.write_text(f'{{"text": "Doc 1", "id": 1}}\n{line}\n')
+
+        # Act & Assert
+        with pytest.raises(ValueError, match=r"Line 2 of .*docs\.jsonl"):
+            list(iter_texts(path))
+
+    def test_raises_error_for_parquet_row_without_text(self, tmp_path):
+        """Test that a null Parquet text value names the row."""
+        # Arrange
+        pytest.importorskip("pyarrow")
+        path = tmp_path / "docs.parquet"
+        pd.DataFrame({"text": ["Doc 1", None]}).to_parquet(path)
+
+        # Act & Assert
+        with pytest.raises(ValueError, match=r"Row 2 of .*docs\.parquet"):
+            list(iter_texts(path))
@@ -0,0 +1,185 @@
+"""
+Unit tests for geoparser/project/parallel.py
+
+Tests the ModulePool class and Project.run_parallel with real worker processes.
+"""
+
+import typing as t
+
+import pytest
+
+from geoparser.db.crud import RecognitionRepository
+from geoparser.modules.recognizers import Recognizer
+from geoparser.modules.recognizers.manual import ManualRecognizer
+from geoparser.modules.resolvers import Resolver
+from geoparser.project import Project
+from geoparser.project.parallel import ModulePool, _shard
+
+
+class FirstWordRecognizer(Recognizer):
+    """Recognizer that marks the first word of each text as a reference."""
+
+    NAME = "FirstWordRecognizer"
+
+    def __init__(self, label: str = "test"):
+        super().__init__(label=label)
+
+    def predict(self, texts: t.List[str]) -> t.List[t.List[t.Tuple[int, int]]]:
+        return [[(0, len(text.split()[0]))] for text in texts]
+
+
+class FixedResolver(Resolver):
+    """Resolver that resolves every reference to the same feature."""
+
+    NAME = "FixedResolver"
+
+    def __init__(self, gazetteer_name: str = "geonames", identifier: str = "1"):
+        super().__init__(gazetteer_name=gazetteer_name, identifier=identifier)
+        self.gazetteer_name = gazetteer_name
+        self.identifier = identifier
+
+    def predict(
+        self, texts: t.List[str], references: t.List[t.List[t.Tuple[int, int]]]
+    ) -> t.List[t.List[t.Tuple[str, str]]]:
+        return [
+            [(self.gazetteer_name, self.identifier) for _ in doc_references]
+            for doc_references in references
+        ]
+
+
+@pytest.mark.unit
+class TestShard:
+    """Test the _shard helper function."""
+
+    def test_splits_into_nearly_equal_contiguous_shards(self):
+        """Test that items are split into contiguous shards of similar size."""
+        # Act
+        shards = _shard(10, 3)
+
+        # Assert
+        assert shards == [slice(0, 3), slice(3, 6), slice(6, 10)]
+
+    def test_uses_at_most_one_shard_per_item(self):
+        """Test that no empty shards are created for few items."""
+        # Act
+        shards = _shard(2, 4)
+
+        # Assert
+        assert shards == [slice(0, 1), slice(1, 2)]
+
+    def test_returns_no_shards_for_no_items(self):
+        """Test that no shards are created for zero items."""
+        # Act & Assert
+        assert _shard(0, 4) == []
+
+
+@pytest.mark.unit
+class TestModulePool:
+    """Test the ModulePool class."""
+
+    def test_exposes_module_identity(self):
+        """Test that the pool has the ID, name and config of its module."""
+        # Arrange
+        recognizer = FirstWordRecognizer(label="a")
+
+        # Act
+        with ModulePool(recognizer, workers=2) as pool:
+            # Assert
+            assert pool.id == recognizer.id
+            assert pool.name == recognizer.name
+            assert pool.config == recognizer.config
+
+    def test_predicts_in_worker_processes_in_order(self):
+        """Test that sharded predictions are combined in the original order."""
+        # Arrange
+        texts = ["Paris is nice", "Berlin", "Rome wasn't built in a day"]
+        recognizer = FirstWordRecognizer()
+
+        # Act
+        with ModulePool(recognizer, workers=2) as pool:
+            predictions = pool.predict(texts)
+
+        # Assert
+        assert predictions == recognizer.predict(texts)
+
+    def test_passes_per_document_arguments(self):
+        """Test that further per-document arguments are sharded with the texts."""
+        # Arrange
+        texts = ["Paris", "Berlin Rome", "Zurich"]
+        references = [[(0, 5)], [(0, 6), (7, 11)], []]
+        resolver = FixedResolver(identifier="42")
+
+        # Act
+        with ModulePool(resolver, workers=2) as pool:
+            predictions = pool.predict(texts, references)
+
+        # Assert
+        assert predictions == [
+            [("geonames", "42")],
+            [("geonames", "42"), ("geonames", "42")],
+            [],
+        ]
+
+    def test_raises_error_for_module_not_rebuildable_from_config(self):
+        """Test that modules whose constructor does not accept their config are rejected."""
+        # Arrange
+        recognizer = ManualRecognizer(label="manual", texts=["A"], references=[[]])
+
+        # Act & Assert
+        with pytest.raises(ValueError, match="cannot be rebuilt from its config"):
+            ModulePool(recognizer, workers=2)
+
+    def test_raises_error_for_invalid_worker_count(self):
+        """Test that a non-positive number of workers is rejected."""
+        # Act & Assert
+        with pytest.raises(ValueError, match="workers"):
+            ModulePool(FirstWordRecognizer(), workers=0)
+
+
+@pytest.mark.unit
+class TestProjectRunParallel:
+    """Test Project run_parallel method."""
+
+    def test_records_results_of_worker_predictions(
+        self, test_session, gazetteer_factory, source_factory, feature_factory
+    ):
+        """Test that predictions made in worker processes are stored in the project."""
+        # Arrange
+        gazetteer = gazetteer_factory(name="geonames")
+        source = source_factory(gazetteer_id=gazetteer.id)
+        feature_factory(location_id_value="1", source_id=source.id)
+
+        project = Project("TestProject")
+        project.create_documents(["Paris is nice", "Berlin too", "Rome as well"])
+
+        # Act
+        project.run_parallel(
+            FirstWordRecognizer(), FixedResolver(), workers=2, batch_size=2
+        )
+
+        # Assert
+        documents = project.get_documents()
+        toponyms = sorted(
+            (toponym.text, toponym.location.location_id_value)
+            for document in documents
+            for toponym in document.toponyms
+        )
+        assert toponyms == [("Berlin", "1"), ("Paris", "1"), ("Rome", "1")]
+
+    def test_validates_both_modules_before_running(self, test_session):
+        """Test that an invalid resolver is rejected before recognition starts."""
+        # Arrange
+        project = Project("TestProject")
+        project.create_documents(["Paris"])
+        resolver = FixedResolver()
+        resolver.config = {"unknown": True}
+
+        recognizer = FirstWordRecognizer()
+
+        # Act & Assert
+        with pytest.raises(ValueError, match="cannot be rebuilt"):
+            project.run_parallel(recognizer, resolver, workers=2)
+
+        assert (
+            RecognitionRepository.get_by_recognizer(test_session, recognizer.id) == []
+        )
@@ -0,0 +1,145 @@
+"""
+Unit tests for geoparser/project/pipeline.py
+
+Tests the threaded pipeline executor.
+"""
+
+import threading
+import time
+
+import pytest
+
+from geoparser.project.pipeline import run_pipeline
+
+
+@pytest.mark.unit
+class TestRunPipeline:
+    """Test the run_pipeline function."""
+
+    def test_applies_stages_in_order(self):
+        """Test that each batch passes through all stages in order."""
+        # Arrange
+        stages = [lambda x: x + 1, lambda x: x * 10]
+
+        # Act
+        results = list(run_pipeline([1, 2, 3], stages))
+
+        # Assert
+        assert results == [20, 30, 40]
+
+    def test_preserves_batch_order(self):
+        """Test that results are yielded in input order despite varying durations."""
+
+        # Arrange
+        def slow_for_small(x):
+            time.sleep(0.01 * (3 - x))
+            return x
+
+        # Act
+        results = list(run_pipeline(range(3), [slow_for_small, slow_for_small]))
+
+        # Assert
+        assert results == [0, 1, 2]
+
+    def test_handles_empty_input(self):
+        """Test that an empty input yields nothing."""
+        # Act
+        results = list(run_pipeline([], [lambda x: x]))
+
+        # Assert
+        assert results == []
+
+    def test_overlaps_stages(self):
+        """Test that the first stage runs on the next batch while the second is busy."""
+        # Arrange
+        second_stage_busy = threading.Event()
+        first_stage_overlapped = threading.Event()
+
+        def first_stage(x):
+            if x == 2:
+                # Process the second batch while the second stage holds the first
+                second_stage_busy.wait(timeout=5)
+                first_stage_overlapped.set()
+            return x
+
+        def second_stage(x):
+            if x == 1:
+                second_stage_busy.set()
+                first_stage_overlapped.wait(timeout=5)
+            return x
+
+        # Act
+        results = list(run_pipeline([1, 2], [first_stage, second_stage]))
+
+        # Assert
+        assert results == [1, 2]
+        assert first_stage_overlapped.is_set()
+
+    def test_bounds_number_of_buffered_batches(self):
+        """Test that the input is not read far ahead of a slow consumer."""
+        # Arrange
+        consumed = []
+
+        def generate_batches():
+            for i in range(100):
+                consumed.append(i)
+                yield i
+
+        # Act
+        pipeline = run_pipeline(generate_batches(), [lambda x: x], queue_size=1)
+        next(pipeline)
+        time.sleep(0.2)
+        read_ahead = len(consumed)
+        pipeline.close()
+
+        # Assert - one batch per queue, one per worker and the yielded batch
+        assert read_ahead <= 6
+
+    def test_reraises_stage_errors(self):
+        """Test that an exception in a stage is raised to the caller."""
+
+        # Arrange
+        def failing_stage(x):
+            if x == 2:
+                raise RuntimeError("Stage failed")
+            return x
+
+        results = []
+
+        # Act & Assert
+        with pytest.raises(RuntimeError, match="Stage failed"):
+            for result in run_pipeline([1, 2, 3], [failing_stage]):
+                results.append(result)
+
+        assert results == [1]
+
+    def test_reraises_input_errors(self):
+        """Test that an exception while reading the input is raised to the caller."""
+
+        # Arrange
+        def generate_batches():
+            yield 1
+            raise ValueError("Bad input")
+
+        # Act & Assert
+        with pytest.raises(ValueError, match="Bad input"):
+            list(run_pipeline(generate_batches(), [lambda x: x]))
+
+    def test_stops_workers_when_closed_early(self):
+        """Test that worker threads finish when the caller stops iterating."""
+        # Arrange
+        threads_before = threading.active_count()
+        pipeline = run_pipeline(iter(range(1000)), [lambda x: x, lambda x: x])
+
+        # Act
+        next(pipeline)
+        pipeline.close()
+
+        # Assert
+        assert threading.active_count() == threads_before
+
+    def test_raises_error_for_invalid_queue_size(self):
+        """Test that a non-positive queue size is rejected."""
+        # Act & Assert
+        with pytest.raises(ValueError, match="queue_size"):
+            list(run_pipeline([1], [lambda x: x], queue_size=0))
@@ -4,11 +4,13 @@ Unit tests for geoparser/project/project.py
 Tests the Project class with mocked dependencies.
 """
 
-from unittest.mock import ANY, Mock, patch
+import asyncio
+from unittest.mock import ANY, AsyncMock, Mock, patch
 from uuid import UUID
 
 import pytest
 
+from geoparser.db.crud import DocumentRepository
 from geoparser.project.project import Project
 
 
@@ -72,10 +74,10 @@ class TestProjectCreateDocuments:
         project.create_documents("Test document text")
 
         # Assert
-        mock_doc_repo.create.assert_called_once()
-        call_args = mock_doc_repo.create.call_args[0]
-        assert call_args[1].text == "Test document text"
-        assert call_args[1].project_id == project.id
+        mock_doc_repo.create_many.assert_called_once()
+        (document_create,) = mock_doc_repo.create_many.call_args[0][1]
+        assert document_create.text == "Test document text"
+        assert document_create.project_id == project.id
 
     @patch("geoparser.project.project.ProjectRepository")
     @patch("geoparser.project.project.DocumentRepository")
@@ -92,14 +94,101 @@ class TestProjectCreateDocuments:
         # Act
         project.create_documents(["Doc 1", "Doc 2", "Doc 3"])
 
+        # Assert - All documents are inserted in a single bulk insert
+        mock_doc_repo.create_many.assert_called_once()
+        document_creates = mock_doc_repo.create_many.call_args[0][1]
+        assert [doc.text for doc in document_creates] == ["Doc 1", "Doc 2", "Doc 3"]
+
+
+@pytest.mark.unit
+class TestProjectIngestDocuments:
+    """Test Project ingest_documents method."""
+
+    def test_inserts_texts_in_batches(self, test_session):
+        """Test that texts are inserted with one bulk insert per batch."""
+        # Arrange
+        project = Project("TestProject")
+
+        # Act
+        with patch(
+            "geoparser.project.project.DocumentRepository.create_many",
+            wraps=DocumentRepository.create_many,
+        ) as mock_create_many:
+            count = project.ingest_documents(
+                (f"Doc {i}" for i in range(5)), batch_size=2
+            )
+
+        # Assert
+        assert count == 5
+        assert mock_create_many.call_count == 3
+        texts = [doc.text for doc in project.get_documents()]
+        assert sorted(texts) == [f"Doc {i}" for i in range(5)]
+
+    def test_reads_texts_from_path(self, test_session, tmp_path):
+        """Test that a path is streamed with the given text field."""
+        # Arrange
+        path = tmp_path / "docs.jsonl"
+        path.write_text('{"body": "Doc 1"}\n{"body": "Doc 2"}\n')
+        project = Project("TestProject")
+
+        # Act
+        count = project.ingest_documents(str(path), text_field="body")
+
         # Assert
-        assert mock_doc_repo.create.call_count == 3
-        call_args_list = [
-            call[0][1].text for call in mock_doc_repo.create.call_args_list
+        assert count == 2
+        assert sorted(doc.text for doc in project.get_documents()) == [
+            "Doc 1",
+            "Doc 2",
         ]
-        assert "Doc 1" in call_args_list
-        assert "Doc 2" in call_args_list
-        assert "Doc 3" in call_args_list
+
+    def test_skips_duplicates_when_deduplicating(self, test_session):
+        """Test that content already in the project or source is skipped."""
+        # Arrange
+        project = Project("TestProject")
+        project.create_documents(["Doc 1"])
+
+        # Act
+        count = project.ingest_documents(
+            ["Doc 1", "Doc 2", "Doc 2", "Doc 3"], deduplicate=True
+        )
+
+        # Assert
+        assert count == 2
+        assert sorted(doc.text for doc in project.get_documents()) == [
+            "Doc 1",
+            "Doc 2",
+            "Doc 3",
+        ]
+
+    def test_deduplicates_across_batches(self, test_session):
+        """Test that duplicates in different batches are skipped."""
+        # Arrange
+        project = Project("TestProject")
+        project.create_documents(["Doc 1"])
+
+        # Act
+        count = project.ingest_documents(
+            ["Doc 2", "Doc 1", "Doc 3", "Doc 2"], batch_size=1, deduplicate=True
+        )
+
+        # Assert
+        assert count == 2
+        assert sorted(doc.text for doc in project.get_documents()) == [
+            "Doc 1",
+            "Doc 2",
+            "Doc 3",
+        ]
+
+    def test_keeps_duplicates_by_default(self, test_session):
+        """Test that duplicates are inserted unless deduplication is enabled."""
+        # Arrange
+        project = Project("TestProject")
+
+        # Act
+        count = project.ingest_documents(["Doc 1", "Doc 1"])
+
+        # Assert
+        assert count == 2
 
 
 @pytest.mark.unit
@@ -203,6 +292,55 @@ class TestProjectGetDocuments:
         mock_ref2._set_resolver_context.assert_called_once_with("test_resolver")
 
 
+@pytest.mark.unit
+class TestProjectIterDocuments:
+    """Test Project iter_documents method."""
+
+    def test_yields_all_documents_across_pages(self, test_session):
+        """Test that paging by ID yields every document exactly once."""
+        # Arrange
+        project = Project("TestProject")
+        project.create_documents([f"Doc {i}" for i in range(5)])
+
+        # Act
+        with patch(
+            "geoparser.project.project.DocumentRepository.get_page_by_project",
+            wraps=DocumentRepository.get_page_by_project,
+        ) as mock_get_page:
+            documents = list(project.iter_documents(batch_size=2))
+
+        # Assert
+        assert sorted(doc.text for doc in documents) == [f"Doc {i}" for i in range(5)]
+        assert mock_get_page.call_count == 3
+        after_ids = [call.kwargs["after_id"] for call in mock_get_page.call_args_list]
+        assert after_ids[0] is None
+        assert after_ids[1] < after_ids[2]
+
+    def test_sets_context_for_tag(self, test_session):
+        """Test that the recognizer context of the tag is set on documents."""
+        # Arrange
+        project = Project("TestProject")
+        project.create_documents(["Doc 1"])
+
+        # Act
+        with patch.object(
+            project.context, "get_recognizer_context", return_value="test_recognizer"
+        ) as mock_get_context:
+            (document,) = project.iter_documents(tag="test_tag")
+
+        # Assert
+        mock_get_context.assert_called_once_with("test_tag")
+        assert document._recognizer_id == "test_recognizer"
+
+    def test_yields_nothing_for_empty_project(self, test_session):
+        """Test that an empty project yields no documents."""
+        # Arrange
+        project = Project("TestProject")
+
+        # Act & Assert
+        assert list(project.iter_documents()) == []
+
+
 @pytest.mark.unit
 class TestProjectRunRecognizer:
     """Test Project run_recognizer method."""
@@ -225,7 +363,7 @@ class TestProjectRunRecognizer:
         mock_doc1.references = []
         mock_doc2 = Mock()
         mock_doc2.references = []
-        mock_doc_repo.get_by_project.return_value = [mock_doc1, mock_doc2]
+        mock_doc_repo.get_page_by_project.return_value = [mock_doc1, mock_doc2]
 
         mock_recognizer = Mock()
         mock_recognizer.id = "test_recognizer_id"
@@ -270,7 +408,7 @@ class TestProjectRunResolver:
         mock_doc1.references = []
         mock_doc2 = Mock()
         mock_doc2.references = []
-        mock_doc_repo.get_by_project.return_value = [mock_doc1, mock_doc2]
+        mock_doc_repo.get_page_by_project.return_value = [mock_doc1, mock_doc2]
 
         mock_resolver = Mock()
         mock_resolver.id = "test_resolver_id"
@@ -293,6 +431,256 @@ class TestProjectRunResolver:
         assert len(called_docs) == 2
 
 
+@pytest.mark.unit
+class TestProjectRunInChunks:
+    """Test chunked execution of run_recognizer and run_resolver."""
+
+    def test_predicts_and_reports_each_chunk(self, test_session):
+        """Test that each chunk is predicted and reported to the callback."""
+        # Arrange
+        project = Project("TestProject")
+        project.create_documents([f"Doc {i}" for i in range(5)])
+
+        mock_recognizer = Mock()
+        mock_recognizer.id = "test_recognizer_id"
+        progress = []
+
+        # Act
+        with patch("geoparser.project.project.RecognitionService") as mock_service:
+            with patch.object(project.context, "update_recognizer_context"):
+                project.run_recognizer(
+                    mock_recognizer, batch_size=2, callback=progress.append
+                )
+
+        # Assert
+        chunks = [
+            call[0][0] for call in mock_service.return_value.predict.call_args_list
+        ]
+        assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+        assert [p.chunk for p in progress] == [0, 1, 2]
+        assert [p.documents for p in progress] == [2, 2, 1]
+        assert [p.total_documents for p in progress] == [2, 4, 5]
+        assert all(p.seconds >= 0 for p in progress)
+
+    def test_resumes_without_reprocessing_documents(self, test_session):
+        """Test that a rerun after a failed chunk only processes the rest."""
+        # Arrange
+        from geoparser.db.crud import RecognitionRepository
+
+        project = Project("TestProject")
+        project.create_documents([f"Doc {i}" for i in range(4)])
+
+        mock_recognizer = Mock()
+        mock_recognizer.id = "test_recognizer_id"
+        mock_recognizer.name = "TestRecognizer"
+        mock_recognizer.config = {}
+        calls = []
+
+        def predict(texts):
+            calls.append(len(texts))
+            if len(calls) == 2:
+                raise RuntimeError("Interrupted")
+            return [[] for _ in texts]
+
+        mock_recognizer.predict.side_effect = predict
+
+        # Act
+        with pytest.raises(RuntimeError):
+            project.run_recognizer(mock_recognizer, batch_size=2)
+        project.run_recognizer(mock_recognizer, batch_size=2)
+
+        # Assert - The first chunk was committed and is skipped on rerun
+        assert calls == [2, 2, 2]
+        assert (
+            len(
+                RecognitionRepository.get_by_recognizer(
+                    test_session, "test_recognizer_id"
+                )
+            )
+            == 4
+        )
+
+
+@pytest.mark.unit
+class TestProjectRunPipeline:
+    """Test Project run_pipeline method."""
+
+    def test_resolves_references_recognized_in_each_chunk(self, file_db):
+        """Test that the resolver receives the references recognized in each chunk."""
+        # Arrange
+        project = Project("TestProject")
+        project.create_documents([f"Paris {i}" for i in range(3)])
+
+        mock_recognizer = Mock()
+        mock_recognizer.id = "test_recognizer_id"
+        mock_recognizer.name = "TestRecognizer"
+        mock_recognizer.config = {}
+        mock_recognizer.predict.side_effect = lambda texts: [[(0, 5)] for _ in texts]
+
+        mock_resolver = Mock()
+        mock_resolver.id = "test_resolver_id"
+        mock_resolver.name = "TestResolver"
+        mock_resolver.config = {}
+        mock_resolver.predict.side_effect = lambda texts, references: [
+            [None for _ in refs] for refs in references
+        ]
+        progress = []
+
+        # Act
+        project.run_pipeline(
+            mock_recognizer, mock_resolver, batch_size=2, callback=progress.append
+        )
+
+        # Assert
+        resolved_texts = [
+            text for call in mock_resolver.predict.call_args_list for text in call[0][0]
+        ]
+        resolved_references = [
+            refs for call in mock_resolver.predict.call_args_list for refs in call[0][1]
+        ]
+        assert sorted(resolved_texts) == ["Paris 0", "Paris 1", "Paris 2"]
+        assert resolved_references == [[(0, 5)]] * 3
+        assert [p.documents for p in progress] == [2, 1]
+        assert [p.total_documents for p in progress] == [2, 3]
+
+    def test_updates_context_for_both_modules(self, file_db):
+        """Test that run_pipeline tags both the recognizer and the resolver."""
+        # Arrange
+        project = Project("TestProject")
+
+        mock_recognizer = Mock()
+        mock_recognizer.id = "test_recognizer_id"
+        mock_resolver = Mock()
+        mock_resolver.id = "test_resolver_id"
+
+        # Act
+        with patch("geoparser.project.project.RecognitionService"):
+            with patch("geoparser.project.project.ResolutionService"):
+                with patch.object(
+                    project.context, "update_recognizer_context"
+                ) as mock_update_recognizer:
+                    with patch.object(
+                        project.context, "update_resolver_context"
+                    ) as mock_update_resolver:
+                        project.run_pipeline(mock_recognizer, mock_resolver, tag="v1")
+
+        # Assert
+        mock_update_recognizer.assert_called_once_with("v1", "test_recognizer_id")
+        mock_update_resolver.assert_called_once_with("v1", "test_resolver_id")
+
+    def test_raises_stage_errors(self, file_db):
+        """Test that errors in a stage are raised and no context is updated."""
+        # Arrange
+        project = Project("TestProject")
+        project.create_documents(["Doc"])
+
+        mock_recognizer = Mock()
+        mock_recognizer.id = "test_recognizer_id"
+        mock_resolver = Mock()
+        mock_resolver.id = "test_resolver_id"
+
+        # Act & Assert
+        with patch("geoparser.project.project.RecognitionService") as mock_service:
+            mock_service.return_value.predict.side_effect = RuntimeError("Failed")
+            with patch("geoparser.project.project.ResolutionService"):
+                with patch.object(
+                    project.context, "update_recognizer_context"
+                ) as mock_update_recognizer:
+                    with pytest.raises(RuntimeError, match="Failed"):
+                        project.run_pipeline(mock_recognizer, mock_resolver)
+
+        mock_update_recognizer.assert_not_called()
+
+
+@pytest.mark.unit
+class TestProjectAsyncRun:
+    """Test Project arun_recognizer and arun_resolver methods."""
+
+    def test_recognizes_and_resolves_all_documents(self, file_db):
+        """Test that the async runners process all documents and update contexts."""
+        # Arrange
+        project = Project("TestProject")
+        project.create_documents([f"Paris {i}" for i in range(3)])
+
+        mock_recognizer = Mock()
+        mock_recognizer.id = "test_recognizer_id"
+        mock_recognizer.name = "TestRecognizer"
+        mock_recognizer.config = {}
+        mock_recognizer.predict.side_effect = lambda texts: [[(0, 5)] for _ in texts]
+
+        mock_resolver = Mock()
+        mock_resolver.id = "test_resolver_id"
+        mock_resolver.name = "TestResolver"
+        mock_resolver.config = {}
+        mock_resolver.apredict = AsyncMock(
+            side_effect=lambda texts, references: [
+                [None for _ in refs] for refs in references
+            ]
+        )
+        progress = []
+
+        async def main():
+            await project.arun_recognizer(
+                mock_recognizer, tag="v1", batch_size=2, callback=progress.append
+            )
+            await project.arun_resolver(mock_resolver, tag="v1", batch_size=2)
+
+        # Act
+        asyncio.run(main())
+
+        # Assert
+        resolved_texts = [
+            text
+            for call in mock_resolver.apredict.call_args_list
+            for text in call[0][0]
+        ]
+        assert sorted(resolved_texts) == ["Paris 0", "Paris 1", "Paris 2"]
+        assert [p.documents for p in progress] == [2, 1]
+        assert project.context.get_recognizer_context("v1") == "test_recognizer_id"
+        assert project.context.get_resolver_context("v1") == "test_resolver_id"
+
+    def test_registers_module_on_empty_project(self, file_db):
+        """Test that the async runner registers the module without documents."""
+        # Arrange
+        project = Project("TestProject")
+        mock_recognizer = Mock()
+        mock_recognizer.id = "test_recognizer_id"
+        mock_recognizer.name = "TestRecognizer"
+        mock_recognizer.config = {}
+
+        # Act
+        asyncio.run(project.arun_recognizer(mock_recognizer))
+
+        # Assert
+        mock_recognizer.predict.assert_not_called()
+        assert project.context.get_recognizer_context("latest") == "test_recognizer_id"
+
+
+@pytest.mark.unit
+class TestChunkProgress:
+    """Test ChunkProgress model."""
+
+    def test_computes_documents_per_second(self):
+        """Test that throughput is derived from documents and seconds."""
+        # Arrange
+        from geoparser.project import ChunkProgress
+
+        progress = ChunkProgress(chunk=0, documents=50, total_documents=50, seconds=2.0)
+
+        # Act & Assert
+        assert progress.documents_per_second == 25.0
+
+    def test_handles_zero_duration(self):
+        """Test that a zero duration does not divide by zero."""
+        # Arrange
+        from geoparser.project import ChunkProgress
+
+        progress = ChunkProgress(chunk=0, documents=1, total_documents=1, seconds=0.0)
+
+        # Act & Assert
+        assert progress.documents_per_second == 0.0
+
+
 @pytest.mark.unit
 class TestProjectDelete:
     """Test Project delete method."""
@@ -0,0 +1,192 @@
+"""
+Unit tests for geoparser/server/app.py
+
+Tests the geoparsing web service.
+"""
+
+import asyncio
+from unittest.mock import Mock
+
+import pytest
+
+from geoparser.geoparser.results import ParsedDocument, ParsedToponym
+from geoparser.server.app import ParseRequest, create_app, serve
+
+
+def get_endpoint(app, path):
+    """Get the endpoint function of a route."""
+    return next(route.endpoint for route in app.routes if route.path == path)
+
+
+@pytest.fixture
+def mock_geoparser():
+    """Create a mock geoparser parsing each text into a document."""
+    geoparser = Mock()
+    geoparser.parse.side_effect = lambda texts, in_memory: [
+        ParsedDocument(
+            text=text,
+            toponyms=[ParsedToponym(start=0, end=len(text), text=text)],
+        )
+        for text in texts
+    ]
+    return geoparser
+
+
+@pytest.mark.unit
+class TestCreateApp:
+    """Test create_app() function."""
+
+    def test_parse_endpoint_returns_documents(self, mock_geoparser):
+        """Test that the parse endpoint returns a document per text."""
+        # Arrange
+        app = create_app(mock_geoparser, max_wait=0.01)
+        parse = get_endpoint(app, "/parse")
+
+        async def main():
+            async with app.router.lifespan_context(app):
+                return await parse(ParseRequest(texts=["Paris", "Rome", "Paris"]))
+
+        # Act
+        response = asyncio.run(main())
+
+        # Assert
+        assert [doc.text for doc in response.documents] == ["Paris", "Rome", "Paris"]
+        mock_geoparser.parse.assert_called_once_with(["Paris", "Rome"], in_memory=True)
+
+    def test_parse_endpoint_records_metrics(self, mock_geoparser):
+        """Test that the parse endpoint records request metrics."""
+        # Arrange
+        app = create_app(mock_geoparser, max_wait=0.01)
+        parse = get_endpoint(app, "/parse")
+
+        async def main():
+            async with app.router.lifespan_context(app):
+                await parse(ParseRequest(texts=["Paris", "Rome"]))
+
+        # Act
+        asyncio.run(main())
+
+        # Assert
+        metrics = app.state.metrics
+        assert metrics.requests.value == 1
+        assert metrics.texts.value == 2
+        assert metrics.request_latency.count == 1
+
+    def test_metrics_endpoint_returns_text_format(self, mock_geoparser):
+        """Test that the metrics endpoint returns the Prometheus text format."""
+        # Arrange
+        app = create_app(mock_geoparser)
+        get_metrics = get_endpoint(app, "/metrics")
+
+        # Act
+        response = asyncio.run(get_metrics())
+
+        # Assert
+        assert response.media_type == "text/plain; version=0.0.4"
+        assert b"geoparser_requests_total 0" in response.body
+
+    def test_health_endpoint(self, mock_geoparser):
+        """Test that the health endpoint reports ok."""
+        # Arrange
+        app = create_app(mock_geoparser)
+        health = get_endpoint(app, "/health")
+
+        # Act
+        response = asyncio.run(health())
+
+        # Assert
+        assert response == {"status": "ok"}
+
+
+@pytest.mark.unit
+class TestServe:
+    """Test serve() function."""
+
+    def test_rejects_invalid_workers(self, mock_geoparser):
+        """Test that a non-positive number of workers raises ValueError."""
+        # Act & Assert
+        with pytest.raises(ValueError, match="workers"):
+            serve(mock_geoparser, workers=0)
+
+    def test_forwards_sigterm_to_workers(self, mock_geoparser):
+        """Test that terminating the main process terminates the workers."""
+        import signal
+        from unittest.mock import patch
+
+        # Arrange
+        waited = []
+
+        def waitpid(pid, options):
+            # Deliver SIGTERM to the main process while it waits for the workers
+            if not waited:
+                signal.getsignal(signal.SIGTERM)(signal.SIGTERM, None)
+            waited.append(pid)
+            return pid, 0
+
+        with patch("geoparser.server.app.os.fork", side_effect=[101, 102]), patch(
+            "geoparser.server.app.os.waitpid", side_effect=waitpid
+        ), patch("geoparser.server.app.os.kill") as mock_kill, patch(
+            "geoparser.server.app.gc"
+        ):
+            previous_handler = signal.getsignal(signal.SIGTERM)
+
+            # Act
+            serve(mock_geoparser, port=0, workers=2)
+
+        # Assert
+        assert [call.args for call in mock_kill.call_args_list] == [
+            (101, signal.SIGTERM),
+            (102, signal.SIGTERM),
+        ]
+        assert waited == [101, 102]
+        assert signal.getsignal(signal.SIGTERM) is previous_handler
+
+
+@pytest.mark.unit
+class TestRunWorker:
+    """Test _run_worker() function."""
+
+    def test_drops_inherited_connections_before_parsing(self, mock_geoparser):
+        """Test that a worker disposes the inherited pool before using the database."""
+        from unittest.mock import patch
+
+        from geoparser.server.app import _run_worker
+
+        # Arrange
+        calls = []
+        mock_geoparser.parse.side_effect = lambda *args, **kwargs: calls.append("parse")
+
+        with patch(
+            "geoparser.server.app.dispose_after_fork",
+            side_effect=lambda: calls.append("dispose"),
+        ), patch("geoparser.server.app.uvicorn.Server") as mock_server:
+            sock = Mock()
+
+            # Act
+            _run_worker(mock_geoparser, Mock(), sock)
+
+        # Assert
+        assert calls == ["dispose", "parse"]
+        mock_server.return_value.run.assert_called_once_with(sockets=[sock])
+
+    def test_closes_inherited_embedding_connection(self, mock_geoparser):
+        """Test that a worker closes the resolver's inherited embedding connection."""
+        from unittest.mock import patch
+
+        from geoparser.server.app import _run_worker
+
+        # Arrange
+        calls = []
+        mock_geoparser.resolver.embedding_client.close.side_effect = (
+            lambda: calls.append("close")
+        )
+        mock_geoparser.parse.side_effect = lambda *args, **kwargs: calls.append("parse")
+
+        with patch("geoparser.server.app.dispose_after_fork"), patch(
+            "geoparser.server.app.uvicorn.Server"
+        ):
+            # Act
+            _run_worker(mock_geoparser, Mock(), Mock())
+
+        # Assert
+        assert calls == ["close", "parse"]
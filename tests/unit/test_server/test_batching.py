@@ -0,0 +1,176 @@
+"""
+Unit tests for geoparser/server/batching.py
+
+Tests the coalescing of concurrent parse requests into micro-batches.
+"""
+
+import asyncio
+import threading
+
+import pytest
+
+from geoparser.server.batching import MicroBatcher
+from geoparser.server.metrics import ServerMetrics
+
+
+def upper(texts):
+    """Parse function returning the upper-cased texts."""
+    return [text.upper() for text in texts]
+
+
+@pytest.mark.unit
+class TestMicroBatcher:
+    """Test MicroBatcher class."""
+
+    def test_rejects_invalid_max_batch_size(self):
+        """Test that a non-positive max_batch_size raises ValueError."""
+        # Act & Assert
+        with pytest.raises(ValueError, match="max_batch_size"):
+            MicroBatcher(upper, max_batch_size=0)
+
+    def test_rejects_negative_max_wait(self):
+        """Test that a negative max_wait raises ValueError."""
+        # Act & Assert
+        with pytest.raises(ValueError, match="max_wait"):
+            MicroBatcher(upper, max_wait=-1)
+
+    def test_coalesces_concurrent_texts(self):
+        """Test that concurrently submitted texts are parsed as one batch."""
+        # Arrange
+        batches = []
+
+        def parse(texts):
+            batches.append(texts)
+            return upper(texts)
+
+        batcher = MicroBatcher(parse, max_batch_size=10, max_wait=0.05)
+
+        async def main():
+            return await asyncio.gather(*(batcher.parse(t) for t in ["a", "b", "c"]))
+
+        # Act
+        results = asyncio.run(main())
+        batcher.close()
+
+        # Assert
+        assert results == ["A", "B", "C"]
+        assert batches == [["a", "b", "c"]]
+
+    def test_flushes_full_batch(self):
+        """Test that a batch is started as soon as max_batch_size is reached."""
+        # Arrange
+        batches = []
+
+        def parse(texts):
+            batches.append(texts)
+            return upper(texts)
+
+        batcher = MicroBatcher(parse, max_batch_size=2, max_wait=10)
+
+        async def main():
+            return await asyncio.wait_for(
+                asyncio.gather(*(batcher.parse(t) for t in ["a", "b", "c", "d"])),
+                timeout=5,
+            )
+
+        # Act
+        results = asyncio.run(main())
+        batcher.close()
+
+        # Assert
+        assert results == ["A", "B", "C", "D"]
+        assert batches == [["a", "b"], ["c", "d"]]
+
+    def test_deduplicates_identical_texts(self):
+        """Test that identical waiting texts are parsed once."""
+        # Arrange
+        batches = []
+
+        def parse(texts):
+            batches.append(texts)
+            return upper(texts)
+
+        metrics = ServerMetrics()
+        batcher = MicroBatcher(parse, max_wait=0.01, metrics=metrics)
+
+        async def main():
+            return await asyncio.gather(*(batcher.parse(t) for t in ["a", "a", "b"]))
+
+        # Act
+        results = asyncio.run(main())
+        batcher.close()
+
+        # Assert
+        assert results == ["A", "A", "B"]
+        assert batches == [["a", "b"]]
+        assert metrics.deduplicated_texts.value == 1
+
+    def test_deduplicates_texts_in_flight(self):
+        """Test that a text being parsed is not parsed again."""
+        # Arrange
+        started = threading.Event()
+        release = threading.Event()
+        batches = []
+
+        def parse(texts):
+            batches.append(texts)
+            started.set()
+            release.wait(timeout=5)
+            return upper(texts)
+
+        batcher = MicroBatcher(parse, max_wait=0)
+
+        async def main():
+            first = asyncio.ensure_future(batcher.parse("a"))
+            await asyncio.get_running_loop().run_in_executor(None, started.wait, 5)
+            second = asyncio.ensure_future(batcher.parse("a"))
+            await asyncio.sleep(0)
+            release.set()
+            return await asyncio.gather(first, second)
+
+        # Act
+        results = asyncio.run(main())
+        batcher.close()
+
+        # Assert
+        assert results == ["A", "A"]
+        assert batches == [["a"]]
+
+    def test_propagates_errors_to_all_requests(self):
+        """Test that an error while parsing is raised for every text of the batch."""
+
+        # Arrange
+        def parse(texts):
+            raise RuntimeError("model failed")
+
+        batcher = MicroBatcher(parse, max_wait=0.01)
+
+        async def main():
+            return await asyncio.gather(
+                batcher.parse("a"), batcher.parse("b"), return_exceptions=True
+            )
+
+        # Act
+        results = asyncio.run(main())
+        batcher.close()
+
+        # Assert
+        assert all(isinstance(result, RuntimeError) for result in results)
+
+    def test_records_batch_metrics(self):
+        """Test that batch sizes and latencies are recorded."""
+        # Arrange
+        metrics = ServerMetrics()
+        batcher = MicroBatcher(upper, max_wait=0.01, metrics=metrics)
+
+        async def main():
+            await asyncio.gather(batcher.parse("a"), batcher.parse("b"))
+
+        # Act
+        asyncio.run(main())
+        batcher.close()
+
+        # Assert
+        assert metrics.batch_size.count == 1
+        assert metrics.batch_size.sum == 2
+        assert metrics.batch_latency.count == 1
@@ -0,0 +1,80 @@
+"""
+Unit tests for geoparser/server/metrics.py
+
+Tests the Prometheus text format metrics of the server.
+"""
+
+import pytest
+
+from geoparser.server.metrics import Counter, Histogram, ServerMetrics
+
+
+@pytest.mark.unit
+class TestCounter:
+    """Test Counter class."""
+
+    def test_renders_value(self):
+        """Test that the counter renders help, type and value."""
+        # Arrange
+        counter = Counter("requests_total", "Number of requests.")
+
+        # Act
+        counter.inc()
+        counter.inc(2)
+
+        # Assert
+        assert counter.render() == [
+            "# HELP requests_total Number of requests.",
+            "# TYPE requests_total counter",
+            "requests_total 3",
+        ]
+
+
+@pytest.mark.unit
+class TestHistogram:
+    """Test Histogram class."""
+
+    def test_renders_cumulative_buckets(self):
+        """Test that bucket counts are cumulative and include +Inf."""
+        # Arrange
+        histogram = Histogram("latency_seconds", "Latency.", [0.1, 1.0])
+
+        # Act
+        for value in [0.05, 0.1, 0.5, 3.0]:
+            histogram.observe(value)
+
+        # Assert
+        assert histogram.render() == [
+            "# HELP latency_seconds Latency.",
+            "# TYPE latency_seconds histogram",
+            'latency_seconds_bucket{le="0.1"} 2',
+            'latency_seconds_bucket{le="1"} 3',
+            'latency_seconds_bucket{le="+Inf"} 4',
+            "latency_seconds_sum 3.65",
+            "latency_seconds_count 4",
+        ]
+
+
+@pytest.mark.unit
+class TestServerMetrics:
+    """Test ServerMetrics class."""
+
+    def test_renders_all_metrics(self):
+        """Test that all server metrics are rendered."""
+        # Arrange
+        metrics = ServerMetrics()
+
+        # Act
+        text = metrics.render()
+
+        # Assert
+        assert text.endswith("\n")
+        for name in [
+            "geoparser_requests_total",
+            "geoparser_texts_total",
+            "geoparser_deduplicated_texts_total",
+            "geoparser_request_latency_seconds",
+            "geoparser_batch_latency_seconds",
+            "geoparser_batch_size",
+        ]:
+            assert f"# TYPE {name} " in text
@@ -0,0 +1,124 @@
+"""
+Unit tests for geoparser/services/executors.py
+
+Tests the shared executors for model inference and database access.
+"""
+
+import asyncio
+import threading
+
+import pytest
+
+from geoparser.db.db import DATABASE_THREAD_NAME_PREFIX
+from geoparser.services.executors import (
+    INFERENCE_THREAD_NAME_PREFIX,
+    get_inference_executor,
+    run_database,
+    run_inference,
+    submit_inference,
+)
+
+
+def current_thread_name(*args, **kwargs):
+    """Return the arguments together with the name of the current thread."""
+    return threading.current_thread().name, args, kwargs
+
+
+@pytest.mark.unit
+class TestGetInferenceExecutor:
+    """Test get_inference_executor() function."""
+
+    def test_returns_shared_executor(self):
+        """Test that the same executor is returned on every call."""
+        # Act & Assert
+        assert get_inference_executor() is get_inference_executor()
+
+
+@pytest.mark.unit
+class TestRunInference:
+    """Test run_inference() function."""
+
+    def test_runs_on_inference_executor(self):
+        """Test that the function runs on an inference thread with its arguments."""
+        # Act
+        name, args, kwargs = asyncio.run(run_inference(current_thread_name, 1, b=2))
+
+        # Assert
+        assert name.startswith(INFERENCE_THREAD_NAME_PREFIX)
+        assert args == (1,)
+        assert kwargs == {"b": 2}
+
+
+@pytest.mark.unit
+class TestSubmitInference:
+    """Test submit_inference() function."""
+
+    def test_runs_on_inference_executor(self):
+        """Test that the function runs on an inference thread with its arguments."""
+        # Act
+        name, args, kwargs = submit_inference(current_thread_name, 1, b=2).result()
+
+        # Assert
+        assert name.startswith(INFERENCE_THREAD_NAME_PREFIX)
+        assert args == (1,)
+        assert kwargs == {"b": 2}
+
+    def test_runs_immediately_on_inference_thread(self):
+        """Test that submitting from an inference thread does not wait for the executor."""
+
+        # Arrange
+        def submit_nested():
+            return submit_inference(current_thread_name).result(timeout=5)
+
+        # Act
+        outer = threading.current_thread().name
+        name, _, _ = submit_inference(submit_nested).result(timeout=5)
+
+        # Assert
+        assert name.startswith(INFERENCE_THREAD_NAME_PREFIX)
+        assert name != outer
+
+    def test_propagates_exceptions_on_inference_thread(self):
+        """Test that exceptions of immediately run functions are set on the future."""
+
+        # Arrange
+        def fail():
+            raise ValueError("failed")
+
+        def submit_nested():
+            return submit_inference(fail).exception(timeout=5)
+
+        # Act
+        error = submit_inference(submit_nested).result(timeout=5)
+
+        # Assert
+        assert isinstance(error, ValueError)
+
+
+@pytest.mark.unit
+class TestRunDatabase:
+    """Test run_database() function."""
+
+    def test_runs_on_database_executor(self):
+        """Test that the function runs on a database thread with its arguments."""
+        # Act
+        name, args, kwargs = asyncio.run(run_database(current_thread_name, 1, b=2))
+
+        # Assert
+        assert name.startswith(DATABASE_THREAD_NAME_PREFIX)
+        assert args == (1,)
+        assert kwargs == {"b": 2}
+
+    def test_does_not_block_event_loop(self):
+        """Test that other coroutines run while the function blocks."""
+        # Arrange
+        release = threading.Event()
+
+        async def main():
+            blocked = asyncio.ensure_future(run_database(release.wait, 5))
+            await asyncio.sleep(0.01)
+            release.set()
+            return await blocked
+
+        # Act & Assert
+        assert asyncio.run(main()) is True
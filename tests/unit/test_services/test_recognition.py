@@ -4,8 +4,12 @@ Unit tests for geoparser/services/recognition.py
 Tests the RecognitionService class with mocked recognizers.
 """
 
+import asyncio
+import threading
+
 import pytest
 
+from geoparser.services.executors import INFERENCE_THREAD_NAME_PREFIX
 from geoparser.services.recognition import RecognitionService
 
 
@@ -203,3 +207,104 @@ class TestRecognitionServicePredict:
         statement2 = select(Reference).where(Reference.document_id == doc2.id)
         refs2 = test_session.exec(statement2).unique().all()
         assert len(refs2) == 1
+
+    def test_records_tracing_spans(
+        self, test_session, mock_spacy_recognizer, document_factory
+    ):
+        """Test that predict records its steps and the rows written when traced."""
+        # Arrange
+        from geoparser.tracing import trace
+
+        document = document_factory(text="Test document")
+        mock_spacy_recognizer.predict.return_value = [[(0, 4), (5, 13)]]
+        service = RecognitionService(mock_spacy_recognizer)
+
+        # Act
+        with trace() as current:
+            service.predict([document])
+
+        # Assert
+        spans = {s.name: s for s in current.spans}
+        assert set(spans) == {
+            "recognition.predict",
+            "recognition.inference",
+            "recognition.store",
+        }
+        assert spans["recognition.predict"].attributes == {
+            "documents": 1,
+            "unprocessed": 1,
+        }
+        assert spans["recognition.store"].attributes["rows"] == 3
+        assert (
+            spans["recognition.inference"].parent_id == spans["recognition.predict"].id
+        )
+
+
+@pytest.mark.unit
+class TestRecognitionServiceApredict:
+    """Test RecognitionService apredict method."""
+
+    def test_creates_references_in_database(
+        self, test_session, mock_spacy_recognizer, document_factory
+    ):
+        """Test that apredict creates reference and recognition records."""
+        # Arrange
+        document = document_factory(text="Test document")
+        mock_spacy_recognizer.predict.return_value = [[(0, 4), (5, 13)]]
+        service = RecognitionService(mock_spacy_recognizer)
+
+        # Act
+        asyncio.run(service.apredict([document]))
+
+        # Assert
+        from sqlmodel import select
+
+        from geoparser.db.crud import RecognitionRepository
+        from geoparser.db.models import Reference
+
+        statement = select(Reference).where(Reference.document_id == document.id)
+        references = test_session.exec(statement).unique().all()
+        assert [(ref.start, ref.end) for ref in references] == [(0, 4), (5, 13)]
+        assert (
+            RecognitionRepository.get_by_document_and_recognizer(
+                test_session, document.id, mock_spacy_recognizer.id
+            )
+            is not None
+        )
+
+    def test_runs_recognizer_on_inference_executor(
+        self, test_session, mock_spacy_recognizer, document_factory
+    ):
+        """Test that the recognizer runs on the inference executor."""
+        # Arrange
+        document = document_factory(text="Test")
+        threads = []
+
+        def predict(texts):
+            threads.append(threading.current_thread().name)
+            return [[(0, 4)]]
+
+        mock_spacy_recognizer.predict.side_effect = predict
+        service = RecognitionService(mock_spacy_recognizer)
+
+        # Act
+        asyncio.run(service.apredict([document]))
+
+        # Assert
+        assert threads[0].startswith(INFERENCE_THREAD_NAME_PREFIX)
+
+    def test_skips_already_processed_documents(
+        self, test_session, mock_spacy_recognizer, document_factory
+    ):
+        """Test that apredict does not run the recognizer twice on a document."""
+        # Arrange
+        document = document_factory(text="Test")
+        mock_spacy_recognizer.predict.return_value = [[(0, 4)]]
+        service = RecognitionService(mock_spacy_recognizer)
+        service.predict([document])
+
+        # Act
+        asyncio.run(service.apredict([document]))
+
+        # Assert
+        mock_spacy_recognizer.predict.assert_called_once()
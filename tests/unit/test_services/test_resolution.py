@@ -4,6 +4,7 @@ Unit tests for geoparser/services/resolution.py
 Tests the ResolutionService class with mocked resolvers.
 """
 
+import asyncio
 from unittest.mock import patch
 
 import pytest
@@ -101,9 +102,9 @@ class TestResolutionServicePredict:
 
         # Mock feature repository to return our created feature
         with patch(
-            "geoparser.services.resolution.FeatureRepository.get_by_gazetteer_and_identifier"
-        ) as mock_get_feature:
-            mock_get_feature.return_value = feature
+            "geoparser.services.resolution.FeatureRepository.get_ids_by_gazetteer_and_identifiers"
+        ) as mock_get_feature_ids:
+            mock_get_feature_ids.return_value = {("geonames", "123456"): feature.id}
 
             # Act
             service.predict([document])
@@ -116,6 +117,48 @@ class TestResolutionServicePredict:
         )
         assert resolution is not None
 
+    def test_records_tracing_spans(
+        self,
+        test_session,
+        mock_sentencetransformer_resolver,
+        document_factory,
+        reference_factory,
+        feature_factory,
+    ):
+        """Test that predict records its steps and the rows written when traced."""
+        # Arrange
+        from geoparser.tracing import trace
+
+        document = document_factory(text="Test")
+        reference_factory(start=0, end=4, document_id=document.id)
+        test_session.refresh(document)
+        feature = feature_factory(location_id_value="123456")
+
+        mock_sentencetransformer_resolver.predict.return_value = [
+            [("geonames", "123456")]
+        ]
+        service = ResolutionService(mock_sentencetransformer_resolver)
+
+        with patch(
+            "geoparser.services.resolution.FeatureRepository.get_ids_by_gazetteer_and_identifiers"
+        ) as mock_get_feature_ids:
+            mock_get_feature_ids.return_value = {("geonames", "123456"): feature.id}
+
+            # Act
+            with trace() as current:
+                service.predict([document])
+
+        # Assert
+        spans = {s.name: s for s in current.spans}
+        assert set(spans) == {
+            "resolution.predict",
+            "resolution.collect",
+            "resolution.inference",
+            "resolution.store",
+        }
+        assert spans["resolution.collect"].attributes["references"] == 1
+        assert spans["resolution.store"].attributes == {"references": 1, "rows": 2}
+
     def test_skips_references_when_resolver_returns_none(
         self,
         test_session,
@@ -144,6 +187,78 @@ class TestResolutionServicePredict:
         )
         assert resolution is None
 
+    def test_raises_error_for_unknown_feature(
+        self,
+        test_session,
+        mock_sentencetransformer_resolver,
+        document_factory,
+        reference_factory,
+    ):
+        """Test that predict fails without writing when a feature does not exist."""
+        # Arrange
+        document = document_factory(text="Test")
+        reference = reference_factory(start=0, end=4, document_id=document.id)
+        test_session.refresh(document)
+
+        mock_sentencetransformer_resolver.predict.return_value = [
+            [("geonames", "999999")]
+        ]
+        service = ResolutionService(mock_sentencetransformer_resolver)
+
+        # Act & Assert
+        with pytest.raises(ValueError, match="999999"):
+            service.predict([document])
+
+        from geoparser.db.crud import ResolutionRepository
+
+        resolution = ResolutionRepository.get_by_reference_and_resolver(
+            test_session, reference.id, mock_sentencetransformer_resolver.id
+        )
+        assert resolution is None
+
+    @pytest.mark.parametrize(
+        "referent",
+        [["geonames", "123456"], ("geonames", 123456)],
+        ids=["list", "int-identifier"],
+    )
+    def test_normalizes_predicted_referents(
+        self,
+        test_session,
+        mock_sentencetransformer_resolver,
+        document_factory,
+        reference_factory,
+        feature_factory,
+        referent,
+    ):
+        """Test that list referents and non-string identifiers are resolved."""
+        # Arrange
+        document = document_factory(text="Test")
+        reference = reference_factory(start=0, end=4, document_id=document.id)
+        test_session.refresh(document)
+        feature = feature_factory(location_id_value="123456")
+
+        mock_sentencetransformer_resolver.predict.return_value = [[referent]]
+        service = ResolutionService(mock_sentencetransformer_resolver)
+
+        with patch(
+            "geoparser.services.resolution.FeatureRepository.get_ids_by_gazetteer_and_identifiers"
+        ) as mock_get_feature_ids:
+            mock_get_feature_ids.return_value = {("geonames", "123456"): feature.id}
+
+            # Act
+            service.predict([document])
+
+        # Assert
+        mock_get_feature_ids.assert_called_once()
+        assert mock_get_feature_ids.call_args[0][1] == [("geonames", "123456")]
+
+        from geoparser.db.crud import ResolutionRepository
+
+        resolution = ResolutionRepository.get_by_reference_and_resolver(
+            test_session, reference.id, mock_sentencetransformer_resolver.id
+        )
+        assert resolution is not None
+
     def test_skips_already_processed_references(
         self,
         test_session,
@@ -256,9 +371,9 @@ class TestResolutionServicePredict:
 
         # Mock feature repository to return our created feature
         with patch(
-            "geoparser.services.resolution.FeatureRepository.get_by_gazetteer_and_identifier"
-        ) as mock_get_feature:
-            mock_get_feature.return_value = feature
+            "geoparser.services.resolution.FeatureRepository.get_ids_by_gazetteer_and_identifiers"
+        ) as mock_get_feature_ids:
+            mock_get_feature_ids.return_value = {("geonames", "123456"): feature.id}
 
             # Act
             service.predict([doc1, doc2])
@@ -309,3 +424,65 @@ class TestResolutionServiceFit:
         # For now, we just test that it doesn't error with empty documents
         # Act & Assert - Should not raise error
         service.fit([], output_path="/tmp/model")
+
+
+@pytest.mark.unit
+class TestResolutionServiceApredict:
+    """Test ResolutionService apredict method."""
+
+    def test_creates_referent_and_resolution_records(
+        self,
+        test_session,
+        mock_sentencetransformer_resolver,
+        document_factory,
+        reference_factory,
+        feature_factory,
+    ):
+        """Test that apredict records the predicted referents."""
+        # Arrange
+        document = document_factory(text="Test")
+        reference = reference_factory(start=0, end=4, document_id=document.id)
+        test_session.refresh(document)
+        feature = feature_factory(location_id_value="123456")
+
+        mock_sentencetransformer_resolver.apredict.return_value = [
+            [("geonames", "123456")]
+        ]
+        service = ResolutionService(mock_sentencetransformer_resolver)
+
+        with patch(
+            "geoparser.services.resolution.FeatureRepository.get_ids_by_gazetteer_and_identifiers"
+        ) as mock_get_feature_ids:
+            mock_get_feature_ids.return_value = {("geonames", "123456"): feature.id}
+
+            # Act
+            asyncio.run(service.apredict([document]))
+
+        # Assert
+        from geoparser.db.crud import ReferentRepository, ResolutionRepository
+
+        mock_sentencetransformer_resolver.apredict.assert_awaited_once_with(
+            ["Test"], [[(0, 4)]]
+        )
+        assert (
+            ResolutionRepository.get_by_reference_and_resolver(
+                test_session, reference.id, mock_sentencetransformer_resolver.id
+            )
+            is not None
+        )
+        referents = ReferentRepository.get_by_reference(test_session, reference.id)
+        assert [referent.feature_id for referent in referents] == [feature.id]
+
+    def test_skips_documents_without_references(
+        self, test_session, mock_sentencetransformer_resolver, document_factory
+    ):
+        """Test that apredict does not call the resolver without references."""
+        # Arrange
+        document = document_factory(text="Test")
+        service = ResolutionService(mock_sentencetransformer_resolver)
+
+        # Act
+        asyncio.run(service.apredict([document]))
+
+        # Assert
+        mock_sentencetransformer_resolver.apredict.assert_not_called()
@@ -0,0 +1,220 @@
+"""
+Unit tests for geoparser/tracing/tracer.py
+
+Tests recording spans and exporting traces.
+"""
+
+import asyncio
+import json
+import threading
+
+import pytest
+
+from geoparser.services.executors import run_database
+from geoparser.tracing import Trace, span, trace
+from geoparser.tracing.tracer import _DISABLED_SPAN
+
+
+@pytest.mark.unit
+class TestSpanDisabled:
+    """Test spans while tracing is disabled."""
+
+    def test_returns_shared_disabled_span(self):
+        """Test that span returns the same no-op span without an active trace."""
+        # Act
+        first = span("first", count=1)
+        second = span("second")
+
+        # Assert
+        assert first is _DISABLED_SPAN
+        assert second is _DISABLED_SPAN
+
+    def test_disabled_span_ignores_attributes(self):
+        """Test that the disabled span can be used like a recording span."""
+        # Act
+        with span("work") as work_span:
+            work_span.set("rows", 3)
+            work_span.add("hits")
+
+        # Assert
+        assert not hasattr(work_span, "attributes")
+
+
+@pytest.mark.unit
+class TestSpanRecording:
+    """Test recording spans while tracing is enabled."""
+
+    def test_records_span_with_duration(self):
+        """Test that a closed span is recorded with its name and duration."""
+        # Act
+        with trace() as current:
+            with span("work"):
+                pass
+
+        # Assert
+        assert [s.name for s in current.spans] == ["work"]
+        assert current.spans[0].duration >= 0
+
+    def test_records_attributes(self):
+        """Test that initial, set and added attributes are recorded."""
+        # Act
+        with trace() as current:
+            with span("work", method="exact") as work_span:
+                work_span.set("rows", 3)
+                work_span.add("hits")
+                work_span.add("hits", 2)
+
+        # Assert
+        assert current.spans[0].attributes == {"method": "exact", "rows": 3, "hits": 3}
+
+    def test_links_nested_spans_to_parent(self):
+        """Test that spans opened inside another span record it as parent."""
+        # Act
+        with trace() as current:
+            with span("outer") as outer:
+                with span("inner") as inner:
+                    pass
+
+        # Assert
+        assert outer.parent_id is None
+        assert inner.parent_id == outer.id
+
+    def test_records_error_of_failing_span(self):
+        """Test that a span closed by an exception records the error type."""
+        # Act
+        with trace() as current:
+            with pytest.raises(ValueError):
+                with span("work"):
+                    raise ValueError("failed")
+
+        # Assert
+        assert current.spans[0].attributes["error"] == "ValueError"
+
+    def test_collects_spans_of_all_threads(self):
+        """Test that spans of other threads are recorded in the same trace."""
+
+        # Arrange
+        def work():
+            with span("thread"):
+                pass
+
+        # Act
+        with trace() as current:
+            threads = [threading.Thread(target=work) for _ in range(3)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        # Assert
+        assert [s.name for s in current.spans] == ["thread"] * 3
+
+    def test_links_spans_on_executor_threads_to_parent(self):
+        """Test that spans of functions run on the executors keep their parent."""
+
+        # Arrange
+        def work():
+            with span("database") as database_span:
+                return database_span
+
+        async def main():
+            with span("request") as request_span:
+                database_span = await run_database(work)
+            return request_span, database_span
+
+        # Act
+        with trace():
+            request_span, database_span = asyncio.run(main())
+
+        # Assert
+        assert database_span.parent_id == request_span.id
+
+    def test_stops_recording_after_trace(self):
+        """Test that spans opened after the trace block are not recorded."""
+        # Arrange
+        with trace() as current:
+            pass
+
+        # Act
+        with span("late"):
+            pass
+
+        # Assert
+        assert current.spans == []
+
+
+@pytest.mark.unit
+class TestTrace:
+    """Test the trace context manager and Trace exports."""
+
+    def test_rejects_nested_traces(self):
+        """Test that enabling tracing twice raises RuntimeError."""
+        # Act & Assert
+        with trace():
+            with pytest.raises(RuntimeError, match="already enabled"):
+                with trace():
+                    pass
+
+    def test_rejects_unsupported_format(self, tmp_path):
+        """Test that an unsupported format raises ValueError before tracing."""
+        # Act & Assert
+        with pytest.raises(ValueError, match="Unsupported trace format"):
+            with trace(tmp_path / "trace.xml", format="xml"):
+                pass
+
+    def test_exports_json_on_exit(self, tmp_path):
+        """Test that the trace is written as a list of spans when a path is given."""
+        # Arrange
+        path = tmp_path / "trace.json"
+
+        # Act
+        with trace(path):
+            with span("outer", texts=2):
+                with span("inner"):
+                    pass
+
+        # Assert
+        spans = json.loads(path.read_text())
+        assert [s["name"] for s in spans] == ["outer", "inner"]
+        assert spans[0]["attributes"] == {"texts": 2}
+        assert spans[1]["parent_id"] == spans[0]["id"]
+        assert spans[1]["start"] >= spans[0]["start"]
+
+    def test_exports_chrome_trace_on_exit(self, tmp_path):
+        """Test that the trace is written as complete Chrome trace events."""
+        # Arrange
+        path = tmp_path / "trace.json"
+
+        # Act
+        with trace(path, format="chrome"):
+            with span("work", rows=5):
+                pass
+
+        # Assert
+        data = json.loads(path.read_text())
+        (event,) = data["traceEvents"]
+        assert event["name"] == "work"
+        assert event["ph"] == "X"
+        assert event["dur"] >= 0
+        assert event["args"] == {"rows": 5}
+
+    def test_exports_trace_when_block_raises(self, tmp_path):
+        """Test that the spans recorded before an exception are still written."""
+        # Arrange
+        path = tmp_path / "trace.json"
+
+        # Act
+        with pytest.raises(KeyError):
+            with trace(path):
+                with span("work"):
+                    raise KeyError("missing")
+
+        # Assert
+        spans = json.loads(path.read_text())
+        assert spans[0]["attributes"]["error"] == "KeyError"
+
+    def test_export_rejects_unsupported_format(self, tmp_path):
+        """Test that Trace.export raises ValueError for unsupported formats."""
+        # Act & Assert
+        with pytest.raises(ValueError, match="Unsupported trace format"):
+            Trace().export(tmp_path / "trace.csv", format="csv")